@@ -176,6 +176,15 @@ def generate_python_code(*, package_name: str, package_version: str, package_url
     )
 
 
+def post_process_python_files():
+    '''Post-process the files that the generator does not pass to the post-process script.'''
+    # the generator only post-processes `.py` files
+    subprocess.run(
+        [sys.executable, str(CWD / 'post-process/python.py'), 'python/pyproject.toml'],
+        check=True,
+    )
+
+
 def generate_typescript_code(*, npm_name: str, npm_version: str, repository_url: str):
     '''Run the generator.'''
 
@@ -229,6 +238,7 @@ def main():
             package_version=config.python_package_version,
             package_url=config.github_url,
         )
+        post_process_python_files()
     elif args.language == 'typescript':
         generate_typescript_code(
             npm_name=config.typescript_package_name,
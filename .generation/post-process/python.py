@@ -4,6 +4,8 @@
 Post-processing of generated code.
 '''
 
+import json
+import re
 import sys
 from pathlib import Path
 from typing import Generator, List
@@ -13,17 +15,58 @@ from util import pairwise, modify_file, version
 INDENT = '    '
 HALF_INDENT = '  '
 
+# Note: optional dependencies as `(extra, package, package extras, minimum version)`
+OPTIONAL_DEPENDENCIES = [
+    ('asyncio', 'aiohttp', [], '3.8'),
+    ('orjson', 'orjson', [], '3.6'),
+    ('arrow', 'pyarrow', [], '8'),
+    ('geotiff', 'rasterio', [], '1.2'),
+    ('zstd', 'zstandard', [], '0.18'),
+    ('http2', 'httpx', ['http2'], '0.26'),
+    ('opentelemetry', 'opentelemetry-api', [], '1.12'),
+]
+
 def api_client_py(file_contents: List[str]) -> Generator[str, None, None]:
     '''Modify the api_client.py file.'''
+    coalesced_call = False
+    # the parts of `__call_api`: 'before', 'prepare', 'request' and 'response'
+    call_api_part = 'before'
     for (prev_line, line) in pairwise(file_contents):
         dedented_line = dedent(line)
         dedented_prev_line = dedent(prev_line)
 
+        if call_api_part == 'request':
+            # Note: the request is sent by `__call_api`, see below
+            if not dedented_line.startswith('self.last_response = response_data'):
+                continue
+            call_api_part = 'response'
+            line = indent(dedent('''\
+            return (url, header_params, query_params, post_params, body)
+            '''), 2 * INDENT) + '\n' + indent(dedent('''\
+            def _handle_response(self, response_data, response_types_map, _return_http_data_only,
+                                 _preload_content, metrics=None, streaming_response=StreamingResponse):
+                """Deserializes the data of a response, or wraps a response that is
+                not preloaded into a `streaming_response`."""
+
+                config = self.configuration
+            '''), INDENT)
+
+        elif coalesced_call:
+            # Note: align the arguments of the coalesced call
+            coalesced_call = not dedented_line.startswith('_request_auth')
+            line = '   ' + line
+
         if dedented_line.startswith('self.user_agent = '):
             line = indent(dedent(f'''\
             self.user_agent = 'geoengine/openapi-client/python/{version('python')}'
             '''), 2 * INDENT)
 
+        elif dedented_line.startswith('def close(self):'):
+            line = line + indent(dedent('''\
+            # Note: close the connections when the `ApiClient` is closed
+            self.rest_client.close()
+            '''), 2 * INDENT)
+
         elif dedented_prev_line.startswith('response_data.data = response_data.data') \
             and dedented_line.startswith('else:'):
             line = indent(dedent('''\
@@ -31,6 +74,208 @@ def api_client_py(file_contents: List[str]) -> Generator[str, None, None]:
                 # Note: fixed handling of empty responses
             '''), 2 * INDENT + HALF_INDENT)
 
+        elif dedented_line.startswith('from geoengine_openapi_client import rest'):
+            line = line + dedent('''\
+            # Note: stream bodies of responses that are not preloaded
+            from geoengine_openapi_client.streaming import StreamingResponse
+            # Note: stream files of multipart bodies instead of reading them
+            from geoengine_openapi_client.multipart import MultipartFile
+            ''')
+
+        elif dedented_line.startswith('return_data = None # assuming derialization is not needed'):
+            line = indent(dedent('''\
+            # Note: do not read the body of responses that are not preloaded
+            if not _preload_content:
+                return ApiResponse(status_code = response_data.status,
+                                   headers = response_data.headers,
+                                   raw_data = streaming_response(response_data))
+
+            '''), 2 * INDENT) + line
+
+        elif dedented_line.startswith('response_data.data = response_data.data.decode(encoding)'):
+            line = indent(dedent('''\
+            # Note: the json codec parses utf-8 encoded bytes directly
+            if not _return_http_data_only or encoding.lower() not in ('utf-8', 'utf8'):
+                response_data.data = response_data.data.decode(encoding)
+            '''), 3 * INDENT + HALF_INDENT)
+
+        elif dedented_line.startswith('data = json.loads(response.data)'):
+            line = indent(dedent('''\
+            # Note: decode with the configured json codec
+            data = self.configuration.json_codec.loads(response.data)
+            '''), 3 * INDENT)
+
+        elif dedented_prev_line.startswith('except ValueError:') \
+            and dedented_line.startswith('data = response.data'):
+            line = line + indent(dedent('''\
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            '''), 3 * INDENT)
+
+        elif dedented_line.startswith('from geoengine_openapi_client.exceptions import ApiValueError'):
+            line = line + dedent('''\
+            # Note: skip validation of trusted responses
+            from geoengine_openapi_client.construct import construct_model
+            # Note: retry transient errors according to the retry policy
+            from geoengine_openapi_client.retry import call_with_retries
+            # Note: share the results of identical concurrent GET requests
+            from geoengine_openapi_client.single_flight import SingleFlight, coalesced_call_api
+            # Note: selectable HTTP/2 transport
+            from geoengine_openapi_client.http2 import Http2RESTClientObject
+            # Note: per-operation metrics and instrumentation hooks
+            from geoengine_openapi_client.instrumentation import RequestMetrics, decoded, queued
+            ''')
+
+        elif dedented_line.startswith('return klass.from_dict(data)'):
+            line = indent(dedent('''\
+            # Note: skip validation of trusted responses
+            if self.configuration.trusted_responses:
+                return construct_model(klass, data)
+            '''), 2 * INDENT) + line
+
+        elif dedented_line.startswith('import datetime'):
+            line = line + dedent('''\
+            # Note: send the values of enums in query strings
+            from enum import Enum
+            ''')
+
+        elif dedented_line.startswith('if isinstance(v, (int, float)):'):
+            line = indent(dedent('''\
+            # Note: send the values of enums in query strings
+            if isinstance(v, Enum):
+                v = v.value
+            '''), 3 * INDENT) + line
+
+        elif dedented_line.startswith('filedata = f.read()'):
+            line = indent(dedent('''\
+            # Note: stream files of multipart bodies instead of reading them
+            filedata = MultipartFile(n)
+            '''), 6 * INDENT)
+
+        elif dedented_line.startswith('_request_timeout=None, _host=None, _request_auth=None):'):
+            line = indent(dedent('''\
+            _request_timeout=None, _host=None, _request_auth=None,
+            # Note: name the operation for retry policies and instrumentation
+            _operation=None):
+            '''), 4 * INDENT + ' ')
+
+        elif dedented_line == '_request_auth=None):\n':
+            line = indent(dedent('''\
+            _request_auth=None, _operation=None):
+            '''), 3 * INDENT)
+
+        elif dedented_line == '_request_auth)\n':
+            line = indent(dedent('''\
+            _request_auth, _operation)
+            '''), 9 * INDENT + HALF_INDENT)
+
+        elif dedented_line == '_host, _request_auth))\n':
+            line = indent(dedent('''\
+            _host, _request_auth,
+            _operation))
+            '''), 13 * INDENT + HALF_INDENT + ' ')
+
+        elif dedented_line == 'config = self.configuration\n' and call_api_part == 'before':
+            call_api_part = 'prepare'
+            line = line + indent(dedent('''\
+
+            # Note: build requests and handle responses in helpers shared with the AsyncApiClient
+            (url, header_params, query_params, post_params, body) = self._prepare_request(
+                resource_path, method, path_params, query_params, header_params, body,
+                post_params, files, auth_settings, collection_formats, _host, _request_auth)
+
+            try:
+                # perform request and return response
+                # Note: record traffic for replays
+                request = self.request
+                if config.traffic_recorder is not None:
+                    request = config.traffic_recorder.recording(request, _host or config.host, _operation)
+                # Note: per-operation metrics and instrumentation hooks
+                metrics = None
+                if config.instrumentation is not None:
+                    metrics = RequestMetrics(_operation, method, url)
+                    request = config.instrumentation.instrument_request(request, metrics)
+                # Note: retry transient errors according to the retry policy
+                response_data = call_with_retries(
+                    config.retry_policy, _operation, request,
+                    method, url,
+                    query_params=query_params,
+                    headers=header_params,
+                    post_params=post_params, body=body,
+                    _preload_content=_preload_content,
+                    _request_timeout=_request_timeout)
+            except ApiException as e:
+                if e.body:
+                    e.body = e.body.decode('utf-8')
+                raise e
+
+            self.last_response = response_data
+
+            return self._handle_response(response_data, response_types_map, _return_http_data_only,
+                                         _preload_content, metrics)
+
+            '''), 2 * INDENT) + indent(dedent('''\
+            def _prepare_request(self, resource_path, method, path_params, query_params, header_params, body,
+                                 post_params, files, auth_settings, collection_formats, _host, _request_auth):
+                """Serializes the parameters of a request and builds its url.
+
+                :return: the url, headers, query parameters, post parameters and body.
+                """
+
+                config = self.configuration
+            '''), INDENT)
+
+        elif call_api_part == 'prepare' and dedented_line == 'try:\n':
+            call_api_part = 'request'
+            continue
+
+        elif dedented_line.startswith('return self.__call_api(resource_path, method,'):
+            line = indent(dedent('''\
+            # Note: share the results of identical concurrent GET requests
+            return coalesced_call_api(self, self.__call_api,
+                                      resource_path, method,
+            '''), 3 * INDENT)
+            coalesced_call = True
+
+        elif dedented_line.startswith('self.rest_client = rest.RESTClientObject(configuration)'):
+            line = indent(dedent('''\
+            # Note: selectable HTTP/2 transport
+            if configuration.http2:
+                self.rest_client = Http2RESTClientObject(configuration)
+            else:
+                self.rest_client = rest.RESTClientObject(configuration)
+            '''), 2 * INDENT)
+
+        elif dedented_line.startswith('self.client_side_validation = configuration.client_side_validation'):
+            line = line + indent(dedent('''\
+            # Note: share the results of identical concurrent GET requests
+            self.single_flight = SingleFlight()
+            '''), 2 * INDENT)
+
+        elif dedented_line.startswith('return_data = self.deserialize(response_data, response_type)'):
+            line = indent(dedent('''\
+            # Note: per-operation metrics and instrumentation hooks
+            if metrics is not None:
+                return_data = config.instrumentation.deserialize(
+                    self.deserialize, response_data, response_type, metrics)
+            else:
+                return_data = self.deserialize(response_data, response_type)
+            '''), 3 * INDENT + HALF_INDENT)
+
+        elif dedented_line.startswith('return self.__deserialize(data, response_type)'):
+            line = indent(dedent('''\
+            # Note: per-operation metrics and instrumentation hooks
+            decoded()
+
+            '''), 2 * INDENT) + line
+
+        elif dedented_line.startswith('return self.pool.apply_async(self.__call_api, (resource_path,'):
+            line = indent(dedent('''\
+            # Note: per-operation metrics and instrumentation hooks
+            queued_call_api = queued(self.__call_api, self.configuration.instrumentation)
+            return self.pool.apply_async(queued_call_api, (resource_path,
+            '''), 2 * INDENT)
+
         elif dedented_line.startswith('if not async_req:'):
             line = indent(dedent('''\
             # Note: remove query string in path part for ogc endpoints
@@ -39,6 +284,86 @@ def api_client_py(file_contents: List[str]) -> Generator[str, None, None]:
 
         yield line
 
+def configuration_py(file_contents: List[str]) -> Generator[str, None, None]:
+    '''Modify the configuration.py file.'''
+    for line in file_contents:
+        dedented_line = dedent(line)
+
+        if dedented_line.startswith('import urllib3'):
+            line = line + dedent('''\
+            # Note: pluggable json codec
+            from geoengine_openapi_client.json_codec import StdlibJsonCodec
+            # Note: compression of request and response bodies
+            from geoengine_openapi_client.compression import DEFAULT_MIN_SIZE, default_accept_encoding
+            ''')
+
+        elif dedented_line.startswith('def __deepcopy__(self, memo):'):
+            line = indent(dedent('''\
+            # Note: pluggable json codec
+            self.json_codec = StdlibJsonCodec()
+            """Codec for request and response bodies, e.g. `OrjsonCodec` for speed
+            """
+
+            # Note: skip validation of trusted responses
+            self.trusted_responses = False
+            """Build response models without validation, only for trusted servers
+            """
+
+            # Note: stream files of multipart bodies instead of reading them
+            self.upload_progress = None
+            """Called with the bytes sent and the total bytes of multipart request bodies
+            """
+
+            # Note: retry transient errors according to the retry policy
+            self.retry_policy = None
+            """`RetryPolicy` for failed requests, in addition to the urllib3 `retries`
+            """
+
+            # Note: share the results of identical concurrent GET requests
+            self.coalesce_requests = False
+            """Send identical concurrent GET requests once and share their result
+            """
+
+            # Note: conditional requests for GET responses
+            self.http_cache = None
+            """`HttpCache` for conditional GET requests with `ETag` and `Last-Modified`
+            """
+
+            # Note: compression of request and response bodies
+            self.accept_encoding = default_accept_encoding()
+            """Content codings of responses to accept, or None to not send `Accept-Encoding`
+            """
+            self.request_compression = None
+            """Content coding of large JSON request bodies, `gzip`, `deflate` or `zstd`
+            """
+            self.request_compression_min_size = DEFAULT_MIN_SIZE
+            """Minimum size in bytes of JSON request bodies to compress
+            """
+
+            # Note: selectable HTTP/2 transport
+            self.http2 = False
+            """Multiplex requests over HTTP/2 connections, requires `httpx[http2]`
+            """
+
+            # Note: pluggable transports
+            self.transport = None
+            """`Transport` that sends the requests instead of a urllib3 `PoolManager`
+            """
+
+            # Note: record traffic for replays
+            self.traffic_recorder = None
+            """`TrafficRecorder` that logs all requests and their responses
+            """
+
+            # Note: per-operation metrics and instrumentation hooks
+            self.instrumentation = None
+            """`Instrumentation` with hooks called for every api call, e.g. a `MetricsCollector`
+            """
+
+            '''), 2 * INDENT) + line
+
+        yield line
+
 def exceptions_py(file_contents: List[str]) -> Generator[str, None, None]:
     '''Modify the exceptions.py file.'''
     for line in file_contents:
@@ -53,6 +378,128 @@ def exceptions_py(file_contents: List[str]) -> Generator[str, None, None]:
 
         yield line
 
+def rest_py(file_contents: List[str]) -> Generator[str, None, None]:
+    '''Modify the rest.py file.'''
+    skip_lines = 0
+    for (i, line) in enumerate(file_contents):
+        dedented_line = dedent(line)
+
+        if skip_lines:
+            skip_lines -= 1
+            continue
+
+        if dedented_line.startswith('import urllib3'):
+            line = line + dedent('''\
+            # Note: stream files of multipart bodies instead of reading them
+            from geoengine_openapi_client.multipart import MultipartEncoder
+            # Note: compression of request and response bodies
+            from geoengine_openapi_client.compression import compress_request_body
+            # Note: per-operation metrics and instrumentation hooks
+            from geoengine_openapi_client.instrumentation import observe_bytes_out
+            ''')
+
+        elif dedented_line.startswith('# cert_reqs'):
+            line = indent(dedent('''\
+            # Note: pluggable json codec
+            self.json_codec = configuration.json_codec
+
+            # Note: stream files of multipart bodies instead of reading them
+            self.upload_progress = configuration.upload_progress
+
+            # Note: conditional requests for GET responses
+            self.http_cache = configuration.http_cache
+
+            # Note: compression of request and response bodies
+            self.accept_encoding = configuration.accept_encoding
+            self.request_compression = configuration.request_compression
+            self.request_compression_min_size = configuration.request_compression_min_size
+
+            # Note: pluggable transports
+            transport = self.create_transport(configuration, maxsize)
+            if transport is not None:
+                self.pool_manager = transport
+                return
+
+            '''), 2 * INDENT) + line
+
+        elif dedented_line.startswith('def request(self, method, url, query_params=None, headers=None,'):
+            line = indent(dedent('''\
+            # Note: pluggable transports
+            def create_transport(self, configuration, maxsize):
+                """Returns the transport that replaces the urllib3 pool manager, or None."""
+                return configuration.transport
+
+            # Note: close the connections when the `ApiClient` is closed
+            def close(self) -> None:
+                """Closes the connections of the transport."""
+                self.pool_manager.clear()
+
+            '''), INDENT) + line
+
+        elif dedented_line.startswith('headers = headers or {}'):
+            line = indent(dedent('''\
+            # Note: copy the headers, retries send them again
+            headers = dict(headers or {})
+            # Note: compression of request and response bodies
+            if self.accept_encoding and 'Accept-Encoding' not in headers:
+                headers['Accept-Encoding'] = self.accept_encoding
+
+            '''), 2 * INDENT)
+
+        elif dedented_line.startswith('query_params = {}'):
+            line = line + '\n' + indent(dedent('''\
+            # Note: conditional requests for GET responses
+            use_http_cache = self.http_cache is not None and method == 'GET' and _preload_content
+            if use_http_cache:
+                cached_response = self.http_cache.before_request(url, headers)
+                if cached_response is not None:
+                    return cached_response
+            '''), 2 * INDENT)
+
+        elif dedented_line.startswith('logger.debug("response body: %s", r.data)'):
+            line = line + '\n' + indent(dedent('''\
+            # Note: conditional requests for GET responses
+            if use_http_cache:
+                r = self.http_cache.after_response(url, headers, r)
+                if r is None:
+                    return self.request(method, url, headers=self.http_cache.without_validators(headers),
+                                        _preload_content=_preload_content, _request_timeout=_request_timeout)
+            '''), 3 * INDENT)
+
+        elif dedented_line.startswith('request_body = json.dumps(body)'):
+            line = indent(dedent('''\
+            # Note: encode with the configured json codec
+            request_body = self.json_codec.dumps(body)
+            # Note: compression of request and response bodies
+            request_body = compress_request_body(request_body, headers, self.request_compression,
+                                                 self.request_compression_min_size)
+            # Note: per-operation metrics and instrumentation hooks
+            observe_bytes_out(len(request_body))
+            '''), 6 * INDENT)
+
+        elif dedented_line.startswith("elif headers['Content-Type'] == 'multipart/form-data':"):
+            # replace the branch up to the end of its request
+            skip_lines = next(
+                j for (j, following_line) in enumerate(file_contents[i + 1:], start=1)
+                if following_line.strip() == 'headers=headers)'
+            )
+            line = line + indent(dedent('''\
+            # Note: stream files of multipart bodies instead of reading them
+            request_body = MultipartEncoder(post_params, progress=self.upload_progress)
+            headers['Content-Type'] = request_body.content_type
+            headers['Content-Length'] = str(request_body.content_length)
+            # Note: per-operation metrics and instrumentation hooks
+            observe_bytes_out(request_body.content_length)
+            r = self.pool_manager.request(
+                method, url,
+                body=request_body,
+                preload_content=_preload_content,
+                timeout=timeout,
+                headers=headers)
+            '''), 5 * INDENT)
+
+        yield line
+
 def palette_colorizer_py(file_contents: List[str]) -> Generator[str, None, None]:
     '''Modify the palette_colorizer.py file.'''
     for line in file_contents:
@@ -110,19 +557,253 @@ def task_status_with_id_py(file_contents: List[str]) -> Generator[str, None, Non
 
         yield line
 
+def one_of_model_py(file_contents: List[str]) -> Generator[str, None, None]:
+    '''Modify the files of `oneOf` models.'''
+    model_name = None
+    constant_prefix = None
+    candidates = []
+    discriminator = None
+    mapping = []
+    for (prev_line, line) in pairwise(file_contents):
+        dedented_line = dedent(line)
+        model_match = re.match(r'class (\w+)\(BaseModel\):', dedented_line)
+        schemas_match = re.match(r'(\w+)_ONE_OF_SCHEMAS = ', dedented_line)
+        candidate_match = re.match(r'# deserialize data into (\w+)$', dedented_line)
+        discriminator_match = re.match(
+            r'_data_type = json.loads\(json_str\).get\("(\w+)"\)', dedented_line)
+        mapping_match = re.match(
+            r'instance.actual_instance = (\w+).from_json\(json_str\)', dedented_line)
+        value_match = re.match(r'if _data_type == "(.+)":', dedent(prev_line))
+
+        if model_match:
+            model_name = model_match.group(1)
+        elif schemas_match:
+            constant_prefix = schemas_match.group(1)
+        elif candidate_match:
+            candidates.append(candidate_match.group(1))
+        elif discriminator_match:
+            discriminator = discriminator_match.group(1)
+        elif mapping_match and value_match:
+            mapping.append((value_match.group(1), mapping_match.group(1)))
+
+    schemas_line = next(i for (i, line) in enumerate(file_contents)
+                        if line.startswith(f'{constant_prefix}_ONE_OF_SCHEMAS = '))
+    last_import_line = max(i for (i, line) in enumerate(file_contents[:schemas_line])
+                           if line.strip())
+
+    dispatcher_args = [f'"{model_name}"', f'[{", ".join(candidates)}]']
+    if discriminator:
+        dispatcher_args.append(f'discriminator="{discriminator}"')
+        dispatcher_args.append('mapping={' + ''.join(
+            f'\n{2 * INDENT}"{value}": {class_name},'
+            for (value, class_name) in mapping
+            if class_name in candidates  # skip classes that are not imported
+        ) + f'\n{INDENT}}}')
+
+    skip_lines = False
+    for (i, line) in enumerate(file_contents):
+        dedented_line = dedent(line)
+
+        if skip_lines:
+            if not line.startswith(f'{INDENT}def to_json'):
+                continue
+            skip_lines = False
+            line = '\n' + line
+
+        if i == last_import_line:
+            line = line + dedent('''\
+            # Note: deserialize `oneOf` models with a dispatcher
+            from geoengine_openapi_client.one_of import OneOfDispatcher
+            ''')
+
+        elif i == schemas_line:
+            line = line + '\n' + dedent('''\
+            # Note: lookup table for deserializing without trying every schema
+            ''') + f'{constant_prefix}_ONE_OF_DISPATCHER = OneOfDispatcher(' + ''.join(
+                f'\n{INDENT}{arg},' for arg in dispatcher_args
+            ) + '\n)\n'
+
+        elif dedented_line.startswith('return cls.from_json(json.dumps(obj))'):
+            line = indent(dedent(f'''\
+            # Note: deserialize the dict directly with a precomputed dispatcher
+            return {constant_prefix}_ONE_OF_DISPATCHER.from_dict(cls, obj)
+            '''), 2 * INDENT)
+
+        elif dedented_line.startswith('"""Returns the object represented by the json string"""'):
+            line = line + indent(dedent('''\
+            # Note: decode once and dispatch on the dict
+            return cls.from_dict(json.loads(json_str))
+            '''), 2 * INDENT)
+            skip_lines = True
+
+        yield line
+
+def init_py(file_contents: List[str]) -> Generator[str, None, None]:
+    '''Modify the `__init__.py` files of the package, the apis and the models.'''
+    lazy_imports = []
+    in_import_block = False
+    for line in file_contents:
+        import_match = re.match(
+            r'from (geoengine_openapi_client\.(?:api|models)\.\w+) import (\w+)$', line)
+
+        if line.startswith('# import ') and not lazy_imports and not in_import_block:
+            line = dedent('''\
+            # Note: import apis and models lazily on first access
+            from typing import TYPE_CHECKING
+            from geoengine_openapi_client.lazy_imports import lazy_attributes
+
+            ''') + line
+
+        if import_match:
+            if not in_import_block:
+                yield 'if TYPE_CHECKING:\n'
+            in_import_block = True
+            lazy_imports.append((import_match.group(2), import_match.group(1)))
+            line = INDENT + line
+        else:
+            in_import_block = False
+
+        yield line
+
+    yield '\n' + dedent('''\
+    # Note: import apis and models lazily on first access
+    __getattr__, __dir__ = lazy_attributes(__name__, {
+    ''') + ''.join(
+        f'{INDENT}"{name}": "{module}",\n' for (name, module) in lazy_imports
+    ) + dedent('''\
+    })
+    __all__ = [name for name in __dir__() if not name.startswith('_')]
+    ''')
+
+def api_py(file_contents: List[str]) -> Generator[str, None, None]:
+    '''Modify the files of the api classes.'''
+    resource_path = None
+    query_params = []
+    operation = None
+    skip_lines = 0
+    for (i, line) in enumerate(file_contents):
+        dedented_line = dedent(line)
+
+        if skip_lines:
+            skip_lines -= 1
+            continue
+
+        operation_match = re.match(r'def (\w+)_with_http_info\(', dedented_line)
+        if operation_match:
+            operation = operation_match.group(1)
+
+        if dedented_line.startswith('# process the path parameters'):
+            resource_path = next(
+                match.group(1) for match in (
+                    re.match(r"'(/[^']*)', '\w+',$", dedent(following_line).strip())
+                    for following_line in file_contents[i:]
+                ) if match
+            )
+            query_params = []
+
+        path_param_match = re.match(r"_path_params\['(\w+)'\] = _params\['(\w+)'\]", dedent(
+            file_contents[i + 1] if i + 1 < len(file_contents) else ''))
+        if dedented_line.startswith('if _params[') and path_param_match \
+            and '{' + path_param_match.group(1) + '}' not in resource_path \
+            and '?' not in resource_path:
+            # parameters of the OpenAPI document that are wrongly declared as path parameters
+            query_params.append(path_param_match.groups())
+            skip_lines = 2 if not file_contents[i + 2].strip() else 1
+            continue
+
+        if dedented_line.startswith('_query_params = []') and query_params:
+            line = line + indent(dedent('''\
+            # Note: send parameters without placeholder in the path as query parameters
+            '''), 2 * INDENT) + ''.join(indent(dedent(f'''\
+            if _params.get('{param}') is not None:  # noqa: E501
+                _query_params.append(('{name}', _params['{param}']))
+
+            '''), 2 * INDENT) for (name, param) in query_params)
+            query_params = []
+
+        if dedented_line.startswith("_request_auth=_params.get('_request_auth'))"):
+            line = indent(dedent(f'''\
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='{operation}')
+            '''), 3 * INDENT)
+
+        yield line
+
+def setup_py(file_contents: List[str]) -> Generator[str, None, None]:
+    '''Modify the setup.py file.'''
+    for line in file_contents:
+        if line.startswith('setup('):
+            line = dedent('''\
+            # Note: optional dependencies
+            EXTRAS_REQUIRE = {
+            ''') + ''.join(
+                f'    "{extra}": ["{package}{format_extras(package_extras)} >= {minimum_version}"],\n'
+                for (extra, package, package_extras, minimum_version) in OPTIONAL_DEPENDENCIES
+            ) + '}\n\n' + line
+
+        elif dedent(line).startswith('install_requires=REQUIRES,'):
+            line = line + indent(dedent('''\
+            extras_require=EXTRAS_REQUIRE,
+            '''), INDENT)
+
+        yield line
+
+def pyproject_toml(file_contents: List[str]) -> Generator[str, None, None]:
+    '''Modify the pyproject.toml file.'''
+    section = None
+    for line in file_contents:
+        if line.startswith('['):
+            if section == '[tool.poetry.dependencies]':
+                line = '# Note: optional dependencies\n' + ''.join(
+                    f'{package} = {{ version = ">={minimum_version}", optional = true'
+                    + (f', extras = {json.dumps(package_extras)}' if package_extras else '') + ' }\n'
+                    for (_extra, package, package_extras, minimum_version) in OPTIONAL_DEPENDENCIES
+                ) + '\n[tool.poetry.extras]\n' + ''.join(
+                    f'{extra} = ["{package}"]\n'
+                    for (extra, package, _package_extras, _minimum_version) in OPTIONAL_DEPENDENCIES
+                ) + '\n' + line
+            section = line.strip()
+
+        yield line
+
+def format_extras(package_extras: List[str]) -> str:
+    '''Format the extras of a requirement, e.g. `[http2]`.'''
+    return f"[{','.join(package_extras)}]" if package_extras else ''
+
+def is_one_of_model(input_path: Path) -> bool:
+    '''Check if the file contains a `oneOf` model.'''
+    with open(input_path, 'r', encoding='utf-8') as f:
+        return '_ONE_OF_SCHEMAS = ' in f.read()
+
 
 input_file = Path(sys.argv[1])
 
 if input_file.name == 'api_client.py':
     modify_file(input_file, api_client_py)
+elif input_file.name == 'configuration.py':
+    modify_file(input_file, configuration_py)
 elif input_file.name == 'exceptions.py':
     modify_file(input_file, exceptions_py)
+elif input_file.name == 'rest.py':
+    modify_file(input_file, rest_py)
 elif input_file.name == 'palette_colorizer.py':
     modify_file(input_file, palette_colorizer_py)
 elif input_file.name == 'raster_dataset_from_workflow.py':
     modify_file(input_file, raster_dataset_from_workflow_py)
 elif input_file.name == 'task_status_with_id.py':
     modify_file(input_file, task_status_with_id_py)
+elif input_file.name == 'setup.py':
+    modify_file(input_file, setup_py)
+elif input_file.name == 'pyproject.toml':
+    modify_file(input_file, pyproject_toml)
+elif input_file.name == '__init__.py' \
+    and input_file.parent.name in ('geoengine_openapi_client', 'api', 'models'):
+    modify_file(input_file, init_py)
+elif input_file.parent.name == 'api' and input_file.name.endswith('_api.py'):
+    modify_file(input_file, api_py)
+elif input_file.parent.name == 'models' and is_one_of_model(input_file):
+    modify_file(input_file, one_of_model_py)
 else:
     pass # leave file untouched
 
@@ -0,0 +1,32 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+    Native asyncio support for the Geo Engine API client.
+
+    Requires the optional `aiohttp` dependency.
+"""  # noqa: E501
+
+
+from geoengine_openapi_client.aio.api_client import AsyncApiClient
+from geoengine_openapi_client.aio.rest import AsyncRESTClientObject
+from geoengine_openapi_client.aio.streaming import AsyncStreamingResponse
+from geoengine_openapi_client.aio.pagination import paginate
+from geoengine_openapi_client.aio.raster_stream import raster_stream
+
+from geoengine_openapi_client.aio.api import AsyncDatasetsApi
+from geoengine_openapi_client.aio.api import AsyncGeneralApi
+from geoengine_openapi_client.aio.api import AsyncLayersApi
+from geoengine_openapi_client.aio.api import AsyncOGCWCSApi
+from geoengine_openapi_client.aio.api import AsyncOGCWFSApi
+from geoengine_openapi_client.aio.api import AsyncOGCWMSApi
+from geoengine_openapi_client.aio.api import AsyncPermissionsApi
+from geoengine_openapi_client.aio.api import AsyncPlotsApi
+from geoengine_openapi_client.aio.api import AsyncProjectsApi
+from geoengine_openapi_client.aio.api import AsyncSessionApi
+from geoengine_openapi_client.aio.api import AsyncSpatialReferencesApi
+from geoengine_openapi_client.aio.api import AsyncTasksApi
+from geoengine_openapi_client.aio.api import AsyncUploadsApi
+from geoengine_openapi_client.aio.api import AsyncUserApi
+from geoengine_openapi_client.aio.api import AsyncWorkflowsApi
@@ -0,0 +1,164 @@
+# coding: utf-8
+
+"""
+    Awaitable counterparts of the generated `*Api` classes.
+
+    Each class behaves like its synchronous base class, but defaults to the
+    `AsyncApiClient` and all endpoint methods return coroutines.
+
+    >>> async with AsyncApiClient(configuration) as api_client:
+    ...     workflow = await AsyncWorkflowsApi(api_client).load_workflow_handler(id)
+"""  # noqa: E501
+
+
+from geoengine_openapi_client.api.datasets_api import DatasetsApi
+from geoengine_openapi_client.api.general_api import GeneralApi
+from geoengine_openapi_client.api.layers_api import LayersApi
+from geoengine_openapi_client.api.ogcwcs_api import OGCWCSApi
+from geoengine_openapi_client.api.ogcwfs_api import OGCWFSApi
+from geoengine_openapi_client.api.ogcwms_api import OGCWMSApi
+from geoengine_openapi_client.api.permissions_api import PermissionsApi
+from geoengine_openapi_client.api.plots_api import PlotsApi
+from geoengine_openapi_client.api.projects_api import ProjectsApi
+from geoengine_openapi_client.api.session_api import SessionApi
+from geoengine_openapi_client.api.spatial_references_api import SpatialReferencesApi
+from geoengine_openapi_client.api.tasks_api import TasksApi
+from geoengine_openapi_client.api.uploads_api import UploadsApi
+from geoengine_openapi_client.api.user_api import UserApi
+from geoengine_openapi_client.api.workflows_api import WorkflowsApi
+from geoengine_openapi_client.aio.api_client import AsyncApiClient
+
+
+class AsyncDatasetsApi(DatasetsApi):
+    """Awaitable counterpart of `DatasetsApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncGeneralApi(GeneralApi):
+    """Awaitable counterpart of `GeneralApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncLayersApi(LayersApi):
+    """Awaitable counterpart of `LayersApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncOGCWCSApi(OGCWCSApi):
+    """Awaitable counterpart of `OGCWCSApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncOGCWFSApi(OGCWFSApi):
+    """Awaitable counterpart of `OGCWFSApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncOGCWMSApi(OGCWMSApi):
+    """Awaitable counterpart of `OGCWMSApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncPermissionsApi(PermissionsApi):
+    """Awaitable counterpart of `PermissionsApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncPlotsApi(PlotsApi):
+    """Awaitable counterpart of `PlotsApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncProjectsApi(ProjectsApi):
+    """Awaitable counterpart of `ProjectsApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncSessionApi(SessionApi):
+    """Awaitable counterpart of `SessionApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncSpatialReferencesApi(SpatialReferencesApi):
+    """Awaitable counterpart of `SpatialReferencesApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncTasksApi(TasksApi):
+    """Awaitable counterpart of `TasksApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncUploadsApi(UploadsApi):
+    """Awaitable counterpart of `UploadsApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncUserApi(UserApi):
+    """Awaitable counterpart of `UserApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
+
+
+class AsyncWorkflowsApi(WorkflowsApi):
+    """Awaitable counterpart of `WorkflowsApi`."""
+
+    def __init__(self, api_client=None) -> None:
+        if api_client is None:
+            api_client = AsyncApiClient.get_default()
+        super().__init__(api_client)
@@ -0,0 +1,146 @@
+# coding: utf-8
+
+"""
+    Asynchronous API client.
+
+    `AsyncApiClient` can be passed to every generated `*Api` class. Their
+    methods then return coroutines instead of results, so that many requests
+    can be in flight on a single event loop.
+"""  # noqa: E501
+
+
+from geoengine_openapi_client import __version__
+from geoengine_openapi_client.api_client import ApiClient
+from geoengine_openapi_client.aio.rest import AsyncRESTClientObject
+from geoengine_openapi_client.aio.streaming import AsyncStreamingResponse
+from geoengine_openapi_client.configuration import Configuration
+from geoengine_openapi_client.exceptions import ApiValueError, ApiException
+from geoengine_openapi_client.instrumentation import RequestMetrics
+from geoengine_openapi_client.retry import async_call_with_retries
+
+
+class AsyncApiClient(ApiClient):
+    """API client that performs requests on an asyncio event loop.
+
+    Serialization, authentication and deserialization are shared with
+    `ApiClient`; only the transport is replaced by `AsyncRESTClientObject`.
+    The `http_cache`, `coalesce_requests`, `http2` and `transport` settings
+    of the `Configuration` only apply to `ApiClient`, and `aiohttp`
+    negotiates the compression of responses itself.
+
+    :param configuration: .Configuration object for this client
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to
+        the API.
+    :param cookie: a cookie to include in the header when making calls
+        to the API
+    """
+
+    _default = None
+
+    def __init__(self, configuration=None, header_name=None, header_value=None,
+                 cookie=None) -> None:
+        # unlike `ApiClient.__init__`, neither a urllib3 pool nor a thread pool is set up
+        if configuration is None:
+            configuration = Configuration.get_default()
+        self.configuration = configuration
+        self.pool_threads = None
+
+        self.rest_client = AsyncRESTClientObject(configuration)
+        self.default_headers = {}
+        if header_name is not None:
+            self.default_headers[header_name] = header_value
+        self.cookie = cookie
+        self.user_agent = f'geoengine/openapi-client/python/{__version__}'
+        self.client_side_validation = configuration.client_side_validation
+
+    def __enter__(self):
+        raise TypeError("Use `async with` for AsyncApiClient")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        await self.rest_client.close()
+
+    @classmethod
+    def get_default(cls):
+        """Return new instance of AsyncApiClient.
+
+        This method returns newly created, based on default constructor,
+        object of AsyncApiClient class or returns a copy of default
+        AsyncApiClient.
+
+        :return: The AsyncApiClient object.
+        """
+        if cls._default is None:
+            cls._default = AsyncApiClient()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, default):
+        """Set default instance of AsyncApiClient.
+
+        It stores default AsyncApiClient.
+
+        :param default: object of AsyncApiClient.
+        """
+        cls._default = default
+
+    async def call_api(self, resource_path, method,
+                       path_params=None, query_params=None, header_params=None,
+                       body=None, post_params=None, files=None,
+                       response_types_map=None, auth_settings=None,
+                       async_req=None, _return_http_data_only=None,
+                       collection_formats=None, _preload_content=True,
+                       _request_timeout=None, _host=None, _request_auth=None,
+                       _operation=None):
+        """Makes the HTTP request and returns deserialized data.
+
+        Takes the same parameters as `ApiClient.call_api`, except that
+        `async_req` is not supported, since the call itself is awaitable.
+        """
+        if async_req:
+            raise ApiValueError(
+                "`async_req` is not supported by AsyncApiClient, await the call instead."
+            )
+
+        # Note: remove query string in path part for ogc endpoints
+        resource_path = resource_path.partition("?")[0]
+
+        config = self.configuration
+
+        (url, header_params, query_params, post_params, body) = self._prepare_request(
+            resource_path, method, path_params, query_params, header_params, body,
+            post_params, files, auth_settings, collection_formats, _host, _request_auth)
+
+        try:
+            # perform request and return response
+            request = self.rest_client.request
+            if config.traffic_recorder is not None:
+                request = config.traffic_recorder.recording_async(request, _host or config.host, _operation)
+            metrics = None
+            if config.instrumentation is not None:
+                metrics = RequestMetrics(_operation, method, url)
+                request = config.instrumentation.instrument_request_async(request, metrics)
+            response_data = await async_call_with_retries(
+                config.retry_policy, _operation, request,
+                method, url,
+                query_params=query_params,
+                headers=header_params,
+                post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+        except ApiException as e:
+            if e.body:
+                e.body = e.body.decode('utf-8')
+            raise e
+
+        self.last_response = response_data
+
+        # the caller is responsible for reading and releasing streamed responses
+        return self._handle_response(response_data, response_types_map, _return_http_data_only,
+                                     _preload_content, metrics, AsyncStreamingResponse)
@@ -0,0 +1,65 @@
+# coding: utf-8
+
+"""
+    Iteration over paginated endpoints for the asynchronous client.
+
+    Counterpart of `geoengine_openapi_client.pagination` for the `Async*Api`
+    classes, where the next page is prefetched as an `asyncio` task.
+"""  # noqa: E501
+
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from geoengine_openapi_client.pagination import DEFAULT_PAGE_SIZE, page_items
+
+
+async def paginate(method: Callable[..., Awaitable[Any]], *args,
+                   page_size: int = DEFAULT_PAGE_SIZE,
+                   prefetch: bool = False,
+                   offset: int = 0,
+                   **kwargs) -> AsyncIterator[Any]:
+    """Yields the items of all pages of a paginated API coroutine method.
+
+    :param method: an async API method with `offset` and `limit` parameters.
+    :param args: positional arguments of `method`.
+    :param page_size: the `limit` of each request.
+    :param prefetch: request the next page while the current one is consumed.
+    :param offset: offset of the first item.
+    :param kwargs: further keyword arguments of `method`.
+    :return: an async iterator over the items of all pages.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+
+    def request(page_offset):
+        return method(*args, offset=page_offset, limit=page_size, **kwargs)
+
+    items = page_items(await request(offset))
+    next_page = None
+    try:
+        while True:
+            # a short page is the last one
+            has_next_page = len(items) >= page_size
+            offset += len(items)
+
+            if has_next_page and prefetch:
+                next_page = asyncio.ensure_future(request(offset))
+
+            for item in items:
+                yield item
+
+            if not has_next_page:
+                return
+
+            if next_page is not None:
+                items = page_items(await next_page)
+                next_page = None
+            else:
+                items = page_items(await request(offset))
+
+            if not items:
+                return
+    finally:
+        if next_page is not None:
+            next_page.cancel()
@@ -0,0 +1,150 @@
+# coding: utf-8
+
+"""
+    WebSocket consumer of `/workflow/{id}/rasterStream`.
+
+    The generated `WorkflowsApi.raster_stream_websocket` only performs a plain
+    GET. `raster_stream` opens the WebSocket instead and yields the tiles of
+    the raster stream as they arrive. A tile is requested by sending `NEXT`,
+    so the server never produces more tiles than the consumer asks for.
+
+    Requires the optional `aiohttp` dependency, and `pyarrow` for decoding
+    the tiles.
+"""  # noqa: E501
+
+
+import json
+from typing import AsyncIterator, Iterable, Union
+from urllib.parse import quote
+
+from geoengine_openapi_client.aio.api_client import AsyncApiClient
+from geoengine_openapi_client.exceptions import ApiException
+from geoengine_openapi_client.models.raster_stream_websocket_result_type import RasterStreamWebsocketResultType
+from geoengine_openapi_client.models.spatial_partition2_d import SpatialPartition2D
+from geoengine_openapi_client.models.spatial_resolution import SpatialResolution
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+
+def spatial_bounds_param(spatial_bounds: Union[SpatialPartition2D, str]) -> str:
+    """Formats spatial bounds as `xmin,ymin,xmax,ymax`."""
+    if isinstance(spatial_bounds, str):
+        return spatial_bounds
+    return ",".join(str(value) for value in (
+        spatial_bounds.upper_left_coordinate.x,
+        spatial_bounds.lower_right_coordinate.y,
+        spatial_bounds.lower_right_coordinate.x,
+        spatial_bounds.upper_left_coordinate.y,
+    ))
+
+
+def spatial_resolution_param(spatial_resolution: Union[SpatialResolution, str]) -> str:
+    """Formats a spatial resolution as `x,y`."""
+    if isinstance(spatial_resolution, str):
+        return spatial_resolution
+    return f"{spatial_resolution.x},{spatial_resolution.y}"
+
+
+def attributes_param(attributes: Union[str, Iterable[int]]) -> str:
+    """Formats band indices as a comma-separated list."""
+    if isinstance(attributes, str):
+        return attributes
+    return ",".join(str(attribute) for attribute in attributes)
+
+
+def decode_arrow_tile(data: bytes):
+    """Decodes a tile in the Arrow IPC file format without copying its buffers."""
+    if pyarrow is None:
+        raise ImportError(
+            "Decoding Arrow tiles requires `pyarrow`. "
+            "Install it with `pip install pyarrow`.")
+
+    return pyarrow.ipc.open_file(pyarrow.py_buffer(data)).get_batch(0)
+
+
+def _stream_error(message: str) -> ApiException:
+    """Creates an `ApiException` from an error message of the server."""
+    exception = ApiException(status=0, reason=message)
+    try:
+        body = json.loads(message)
+        if "error" not in body or "message" not in body:
+            raise ValueError()
+    except (ValueError, TypeError):
+        body = {"error": "RasterStreamError", "message": message}
+    exception.body = json.dumps(body)
+    return exception
+
+
+async def raster_stream(api_client: AsyncApiClient, workflow_id: str,
+                        spatial_bounds: Union[SpatialPartition2D, str],
+                        time_interval: str,
+                        spatial_resolution: Union[SpatialResolution, str],
+                        attributes: Union[str, Iterable[int]],
+                        result_type: RasterStreamWebsocketResultType = RasterStreamWebsocketResultType.ARROW,
+                        decode: bool = True,
+                        prefetch: bool = True) -> AsyncIterator:
+    """Yields the tiles of a raster workflow.
+
+    :param api_client: the `AsyncApiClient` with the server and session.
+    :param workflow_id: id of the raster workflow.
+    :param spatial_bounds: the query rectangle.
+    :param time_interval: the query time, e.g. `2014-04-01T12:00:00.000Z`.
+    :param spatial_resolution: the query resolution.
+    :param attributes: indices of the bands to stream.
+    :param result_type: encoding of the tiles.
+    :param decode: yield `pyarrow.RecordBatch`es instead of the raw bytes.
+    :param prefetch: request the next tile while the current one is consumed.
+    :return: an async iterator over the tiles.
+    """
+    if aiohttp is None:
+        raise ImportError(
+            "The raster stream requires `aiohttp`. "
+            "Install it with `pip install aiohttp`.")
+
+    resource_path = '/workflow/{id}/rasterStream'.replace(
+        '{id}', quote(workflow_id, safe=api_client.configuration.safe_chars_for_path_param))
+    query_params = [
+        ('spatialBounds', spatial_bounds_param(spatial_bounds)),
+        ('timeInterval', time_interval),
+        ('spatialResolution', spatial_resolution_param(spatial_resolution)),
+        ('attributes', attributes_param(attributes)),
+        ('resultType', RasterStreamWebsocketResultType(result_type).value),
+    ]
+    headers = dict(api_client.default_headers)
+    api_client.update_params_for_auth(headers, query_params, ['session_token'], resource_path, 'GET', None)
+    url = api_client.configuration.host + resource_path + "?" + \
+        api_client.parameters_to_url_query(query_params, None)
+
+    try:
+        websocket = await api_client.rest_client.session.ws_connect(
+            url, headers=headers, max_msg_size=0, proxy=api_client.rest_client.proxy,
+        )
+    except aiohttp.WSServerHandshakeError as e:
+        raise ApiException(status=e.status, reason=e.message) from e
+
+    async with websocket:
+        await websocket.send_str("NEXT")
+        while True:
+            message = await websocket.receive()
+            if message.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED):
+                return
+            if message.type == aiohttp.WSMsgType.ERROR:
+                raise _stream_error(str(message.data))
+            if message.type == aiohttp.WSMsgType.TEXT:
+                raise _stream_error(message.data)
+
+            if prefetch:
+                await websocket.send_str("NEXT")
+
+            yield decode_arrow_tile(message.data) if decode else message.data
+
+            if not prefetch:
+                await websocket.send_str("NEXT")
@@ -0,0 +1,220 @@
+# coding: utf-8
+
+"""
+    Asynchronous REST transport based on `aiohttp`.
+
+    Mirrors `geoengine_openapi_client.rest.RESTClientObject`, but performs all
+    requests on an asyncio event loop instead of blocking a thread per request.
+"""  # noqa: E501
+
+
+import logging
+import re
+import ssl
+
+from geoengine_openapi_client.compression import compress_request_body
+from geoengine_openapi_client.exceptions import ApiException, UnauthorizedException, ForbiddenException, NotFoundException, ServiceException, ApiValueError, BadRequestException
+from geoengine_openapi_client.instrumentation import observe_bytes_out
+from geoengine_openapi_client.multipart import MultipartFile
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRESTResponse:
+
+    def __init__(self, resp, data) -> None:
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data = data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class AsyncRESTClientObject:
+
+    def __init__(self, configuration, maxsize=None) -> None:
+        if aiohttp is None:
+            raise ImportError(
+                "The asynchronous client requires `aiohttp`. "
+                "Install it with `pip install aiohttp`.")
+
+        # maxsize is the number of requests to host that are allowed in parallel
+        if maxsize is None:
+            if configuration.connection_pool_maxsize is not None:
+                maxsize = configuration.connection_pool_maxsize
+            else:
+                maxsize = 100
+
+        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        if not configuration.verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.maxsize = maxsize
+        self.ssl_context = ssl_context
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+        self.json_codec = configuration.json_codec
+        # aiohttp negotiates and decodes compressed responses itself
+        self.request_compression = configuration.request_compression
+        self.request_compression_min_size = configuration.request_compression_min_size
+        # the session must be created within a running event loop
+        self._session = None
+
+    @property
+    def session(self):
+        """Create the `aiohttp.ClientSession` on first request."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.maxsize, ssl=self.ssl_context)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the underlying session and all pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: if False, the aiohttp.ClientResponse object
+                                 will be returned without reading the
+                                 response data. Default is True.
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        # retries send the headers again
+        headers = dict(headers or {})
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif (isinstance(_request_timeout, tuple) and
+                  len(_request_timeout) == 2):
+                timeout = aiohttp.ClientTimeout(
+                    sock_connect=_request_timeout[0], sock_read=_request_timeout[1])
+
+        args = {
+            "method": method,
+            "url": url,
+            "timeout": timeout,
+            "headers": headers,
+        }
+
+        if self.proxy:
+            args["proxy"] = self.proxy
+        if self.proxy_headers:
+            args["proxy_headers"] = self.proxy_headers
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            # no content type provided or payload is json
+            if not headers.get('Content-Type') or re.search('json', headers['Content-Type'], re.IGNORECASE):
+                if body is not None:
+                    args["data"] = compress_request_body(self.json_codec.dumps(body), headers,
+                                                         self.request_compression,
+                                                         self.request_compression_min_size)
+                    observe_bytes_out(len(args["data"]))
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
+                args["data"] = aiohttp.FormData(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by aiohttp will be
+                # overwritten.
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for k, v in post_params:
+                    if isinstance(v, tuple) and len(v) == 3:
+                        # aiohttp streams and closes opened files
+                        data.add_field(k,
+                                       value=v[1].open() if isinstance(v[1], MultipartFile) else v[1],
+                                       filename=v[0],
+                                       content_type=v[2])
+                    else:
+                        data.add_field(k, v)
+                args["data"] = data
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is provided
+            # in serialized form
+            elif isinstance(body, (str, bytes)):
+                args["data"] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        try:
+            r = await self.session.request(**args)
+        except aiohttp.ClientSSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+        if _preload_content or not 200 <= r.status <= 299:
+            data = await r.read()
+            r = AsyncRESTResponse(r, data)
+
+            # log response body
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            if r.status == 400:
+                raise BadRequestException(http_resp=r)
+
+            if r.status == 401:
+                raise UnauthorizedException(http_resp=r)
+
+            if r.status == 403:
+                raise ForbiddenException(http_resp=r)
+
+            if r.status == 404:
+                raise NotFoundException(http_resp=r)
+
+            if 500 <= r.status <= 599:
+                raise ServiceException(http_resp=r)
+
+            raise ApiException(http_resp=r)
+
+        return r
@@ -0,0 +1,73 @@
+# coding: utf-8
+
+"""
+    Streaming access to response bodies for the asynchronous client.
+
+    Counterpart of `geoengine_openapi_client.streaming` for `AsyncApiClient`.
+"""  # noqa: E501
+
+
+import os
+from typing import AsyncIterator, BinaryIO, Union
+
+from geoengine_openapi_client.streaming import DEFAULT_CHUNK_SIZE
+
+
+class AsyncStreamingResponse:
+    """A response whose body has not been read yet.
+
+    :param resp: the unread `aiohttp.ClientResponse`.
+    """
+
+    def __init__(self, resp) -> None:
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.aiohttp_response.headers.get(name, default)
+
+    async def read(self, size: int = -1) -> bytes:
+        """Reads up to `size` bytes of the body, or the rest if `size` is negative."""
+        return await self.aiohttp_response.content.read(size)
+
+    async def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Iterates over the body in chunks of at most `chunk_size` bytes."""
+        async for chunk in self.aiohttp_response.content.iter_chunked(chunk_size):
+            yield chunk
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.iter_chunks()
+
+    async def write_to(self, target: Union[str, os.PathLike, BinaryIO],
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Writes the body to a file path or a binary file object.
+
+        :param target: path of the output file or a writable binary file object.
+        :param chunk_size: maximum number of bytes held in memory at once.
+        :return: the number of bytes written.
+        """
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, 'wb') as f:
+                return await self.write_to(f, chunk_size)
+
+        written = 0
+        async for chunk in self.iter_chunks(chunk_size):
+            target.write(chunk)
+            written += len(chunk)
+        return written
+
+    def close(self) -> None:
+        """Releases the connection back to the pool."""
+        self.aiohttp_response.release()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
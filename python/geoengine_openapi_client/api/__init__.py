@@ -1,19 +1,44 @@
 # flake8: noqa
 
+# Note: import apis and models lazily on first access
+from typing import TYPE_CHECKING
+from geoengine_openapi_client.lazy_imports import lazy_attributes
+
 # import apis into api package
-from geoengine_openapi_client.api.datasets_api import DatasetsApi
-from geoengine_openapi_client.api.general_api import GeneralApi
-from geoengine_openapi_client.api.layers_api import LayersApi
-from geoengine_openapi_client.api.ogcwcs_api import OGCWCSApi
-from geoengine_openapi_client.api.ogcwfs_api import OGCWFSApi
-from geoengine_openapi_client.api.ogcwms_api import OGCWMSApi
-from geoengine_openapi_client.api.permissions_api import PermissionsApi
-from geoengine_openapi_client.api.plots_api import PlotsApi
-from geoengine_openapi_client.api.projects_api import ProjectsApi
-from geoengine_openapi_client.api.session_api import SessionApi
-from geoengine_openapi_client.api.spatial_references_api import SpatialReferencesApi
-from geoengine_openapi_client.api.tasks_api import TasksApi
-from geoengine_openapi_client.api.uploads_api import UploadsApi
-from geoengine_openapi_client.api.user_api import UserApi
-from geoengine_openapi_client.api.workflows_api import WorkflowsApi
+if TYPE_CHECKING:
+    from geoengine_openapi_client.api.datasets_api import DatasetsApi
+    from geoengine_openapi_client.api.general_api import GeneralApi
+    from geoengine_openapi_client.api.layers_api import LayersApi
+    from geoengine_openapi_client.api.ogcwcs_api import OGCWCSApi
+    from geoengine_openapi_client.api.ogcwfs_api import OGCWFSApi
+    from geoengine_openapi_client.api.ogcwms_api import OGCWMSApi
+    from geoengine_openapi_client.api.permissions_api import PermissionsApi
+    from geoengine_openapi_client.api.plots_api import PlotsApi
+    from geoengine_openapi_client.api.projects_api import ProjectsApi
+    from geoengine_openapi_client.api.session_api import SessionApi
+    from geoengine_openapi_client.api.spatial_references_api import SpatialReferencesApi
+    from geoengine_openapi_client.api.tasks_api import TasksApi
+    from geoengine_openapi_client.api.uploads_api import UploadsApi
+    from geoengine_openapi_client.api.user_api import UserApi
+    from geoengine_openapi_client.api.workflows_api import WorkflowsApi
+
 
+# Note: import apis and models lazily on first access
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "DatasetsApi": "geoengine_openapi_client.api.datasets_api",
+    "GeneralApi": "geoengine_openapi_client.api.general_api",
+    "LayersApi": "geoengine_openapi_client.api.layers_api",
+    "OGCWCSApi": "geoengine_openapi_client.api.ogcwcs_api",
+    "OGCWFSApi": "geoengine_openapi_client.api.ogcwfs_api",
+    "OGCWMSApi": "geoengine_openapi_client.api.ogcwms_api",
+    "PermissionsApi": "geoengine_openapi_client.api.permissions_api",
+    "PlotsApi": "geoengine_openapi_client.api.plots_api",
+    "ProjectsApi": "geoengine_openapi_client.api.projects_api",
+    "SessionApi": "geoengine_openapi_client.api.session_api",
+    "SpatialReferencesApi": "geoengine_openapi_client.api.spatial_references_api",
+    "TasksApi": "geoengine_openapi_client.api.tasks_api",
+    "UploadsApi": "geoengine_openapi_client.api.uploads_api",
+    "UserApi": "geoengine_openapi_client.api.user_api",
+    "WorkflowsApi": "geoengine_openapi_client.api.workflows_api",
+})
+__all__ = [name for name in __dir__() if not name.startswith('_')]
@@ -207,7 +207,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='auto_create_dataset_handler')
 
     @validate_arguments
     def create_dataset_handler(self, create_dataset : CreateDataset, **kwargs) -> CreateDatasetHandler200Response:  # noqa: E501
@@ -359,7 +361,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='create_dataset_handler')
 
     @validate_arguments
     def delete_dataset_handler(self, dataset : Annotated[StrictStr, Field(..., description="Dataset id")], **kwargs) -> None:  # noqa: E501
@@ -497,7 +501,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='delete_dataset_handler')
 
     @validate_arguments
     def get_dataset_handler(self, dataset : Annotated[StrictStr, Field(..., description="Dataset Name")], **kwargs) -> Dataset:  # noqa: E501
@@ -639,7 +645,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='get_dataset_handler')
 
     @validate_arguments
     def get_loading_info_handler(self, dataset : Annotated[StrictStr, Field(..., description="Dataset Name")], **kwargs) -> MetaDataDefinition:  # noqa: E501
@@ -779,7 +787,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='get_loading_info_handler')
 
     @validate_arguments
     def list_datasets_handler(self, order : OrderBy, offset : conint(strict=True, ge=0), limit : conint(strict=True, ge=0), filter : Optional[StrictStr] = None, tags : Optional[conlist(StrictStr)] = None, **kwargs) -> List[DatasetListing]:  # noqa: E501
@@ -954,7 +964,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='list_datasets_handler')
 
     @validate_arguments
     def list_volumes_handler(self, **kwargs) -> List[Volume]:  # noqa: E501
@@ -1087,7 +1099,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='list_volumes_handler')
 
     @validate_arguments
     def suggest_meta_data_handler(self, suggest_meta_data : SuggestMetaData, **kwargs) -> MetaDataSuggestion:  # noqa: E501
@@ -1236,7 +1250,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='suggest_meta_data_handler')
 
     @validate_arguments
     def update_dataset_handler(self, dataset : Annotated[StrictStr, Field(..., description="Dataset Name")], update_dataset : UpdateDataset, **kwargs) -> None:  # noqa: E501
@@ -1389,7 +1405,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='update_dataset_handler')
 
     @validate_arguments
     def update_dataset_provenance_handler(self, dataset : Annotated[StrictStr, Field(..., description="Dataset Name")], provenances : Provenances, **kwargs) -> None:  # noqa: E501
@@ -1540,7 +1558,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='update_dataset_provenance_handler')
 
     @validate_arguments
     def update_dataset_symbology_handler(self, dataset : Annotated[StrictStr, Field(..., description="Dataset Name")], symbology : Symbology, **kwargs) -> None:  # noqa: E501
@@ -1693,7 +1713,9 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='update_dataset_symbology_handler')
 
     @validate_arguments
     def update_loading_info_handler(self, dataset : Annotated[StrictStr, Field(..., description="Dataset Name")], meta_data_definition : MetaDataDefinition, **kwargs) -> None:  # noqa: E501
@@ -1846,4 +1868,6 @@ class DatasetsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='update_loading_info_handler')
@@ -165,7 +165,9 @@ class GeneralApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='available_handler')
 
     @validate_arguments
     def server_info_handler(self, **kwargs) -> ServerInfo:  # noqa: E501
@@ -297,4 +299,6 @@ class GeneralApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='server_info_handler')
@@ -206,7 +206,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='add_collection')
 
     @validate_arguments
     def add_existing_collection_to_collection(self, parent : Annotated[StrictStr, Field(..., description="Parent layer collection id")], collection : Annotated[StrictStr, Field(..., description="Layer collection id")], **kwargs) -> None:  # noqa: E501
@@ -348,7 +350,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='add_existing_collection_to_collection')
 
     @validate_arguments
     def add_existing_layer_to_collection(self, collection : Annotated[StrictStr, Field(..., description="Layer collection id")], layer : Annotated[StrictStr, Field(..., description="Layer id")], **kwargs) -> None:  # noqa: E501
@@ -490,7 +494,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='add_existing_layer_to_collection')
 
     @validate_arguments
     def add_layer(self, collection : Annotated[StrictStr, Field(..., description="Layer collection id")], add_layer : AddLayer, **kwargs) -> AddCollection200Response:  # noqa: E501
@@ -645,7 +651,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='add_layer')
 
     @validate_arguments
     def autocomplete_handler(self, provider : Annotated[StrictStr, Field(..., description="Data provider id")], collection : Annotated[StrictStr, Field(..., description="Layer collection id")], search_type : SearchType, search_string : StrictStr, limit : conint(strict=True, ge=0), offset : conint(strict=True, ge=0), **kwargs) -> List[str]:  # noqa: E501
@@ -825,7 +833,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='autocomplete_handler')
 
     @validate_arguments
     def layer_handler(self, provider : Annotated[StrictStr, Field(..., description="Data provider id")], layer : Annotated[StrictStr, Field(..., description="Layer id")], **kwargs) -> Layer:  # noqa: E501
@@ -973,7 +983,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='layer_handler')
 
     @validate_arguments
     def layer_to_dataset(self, provider : Annotated[StrictStr, Field(..., description="Data provider id")], layer : Annotated[StrictStr, Field(..., description="Layer id")], **kwargs) -> TaskResponse:  # noqa: E501
@@ -1121,7 +1133,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='layer_to_dataset')
 
     @validate_arguments
     def layer_to_workflow_id_handler(self, provider : Annotated[StrictStr, Field(..., description="Data provider id")], layer : Annotated[StrictStr, Field(..., description="Layer id")], **kwargs) -> AddCollection200Response:  # noqa: E501
@@ -1269,7 +1283,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='layer_to_workflow_id_handler')
 
     @validate_arguments
     def list_collection_handler(self, provider : Annotated[StrictStr, Field(..., description="Data provider id")], collection : Annotated[StrictStr, Field(..., description="Layer collection id")], offset : conint(strict=True, ge=0), limit : conint(strict=True, ge=0), **kwargs) -> LayerCollection:  # noqa: E501
@@ -1433,7 +1449,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='list_collection_handler')
 
     @validate_arguments
     def list_root_collections_handler(self, offset : conint(strict=True, ge=0), limit : conint(strict=True, ge=0), **kwargs) -> LayerCollection:  # noqa: E501
@@ -1581,7 +1599,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='list_root_collections_handler')
 
     @validate_arguments
     def provider_capabilities_handler(self, provider : Annotated[StrictStr, Field(..., description="Data provider id")], **kwargs) -> ProviderCapabilities:  # noqa: E501
@@ -1719,7 +1739,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='provider_capabilities_handler')
 
     @validate_arguments
     def remove_collection(self, collection : Annotated[StrictStr, Field(..., description="Layer collection id")], **kwargs) -> None:  # noqa: E501
@@ -1853,7 +1875,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='remove_collection')
 
     @validate_arguments
     def remove_collection_from_collection(self, parent : Annotated[StrictStr, Field(..., description="Parent layer collection id")], collection : Annotated[StrictStr, Field(..., description="Layer collection id")], **kwargs) -> None:  # noqa: E501
@@ -1995,7 +2019,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='remove_collection_from_collection')
 
     @validate_arguments
     def remove_layer_from_collection(self, collection : Annotated[StrictStr, Field(..., description="Layer collection id")], layer : Annotated[StrictStr, Field(..., description="Layer id")], **kwargs) -> None:  # noqa: E501
@@ -2137,7 +2163,9 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='remove_layer_from_collection')
 
     @validate_arguments
     def search_handler(self, provider : Annotated[StrictStr, Field(..., description="Data provider id")], collection : Annotated[StrictStr, Field(..., description="Layer collection id")], search_type : SearchType, search_string : StrictStr, limit : conint(strict=True, ge=0), offset : conint(strict=True, ge=0), **kwargs) -> LayerCollection:  # noqa: E501
@@ -2317,4 +2345,6 @@ class LayersApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='search_handler')
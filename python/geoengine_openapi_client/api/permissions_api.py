@@ -186,7 +186,9 @@ class PermissionsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='add_permission_handler')
 
     @validate_arguments
     def get_resource_permissions_handler(self, resource_type : Annotated[StrictStr, Field(..., description="Resource Type")], resource_id : Annotated[StrictStr, Field(..., description="Resource Id")], limit : conint(strict=True, ge=0), offset : conint(strict=True, ge=0), **kwargs) -> List[PermissionListing]:  # noqa: E501
@@ -350,7 +352,9 @@ class PermissionsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='get_resource_permissions_handler')
 
     @validate_arguments
     def remove_permission_handler(self, permission_request : PermissionRequest, **kwargs) -> None:  # noqa: E501
@@ -491,4 +495,6 @@ class PermissionsApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='remove_permission_handler')
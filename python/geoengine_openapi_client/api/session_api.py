@@ -175,7 +175,9 @@ class SessionApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='anonymous_handler')
 
     @validate_arguments
     def login_handler(self, user_credentials : UserCredentials, **kwargs) -> UserSession:  # noqa: E501
@@ -322,7 +324,9 @@ class SessionApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='login_handler')
 
     @validate_arguments
     def logout_handler(self, **kwargs) -> None:  # noqa: E501
@@ -448,7 +452,9 @@ class SessionApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='logout_handler')
 
     @validate_arguments
     def oidc_init(self, **kwargs) -> AuthCodeRequestURL:  # noqa: E501
@@ -580,7 +586,9 @@ class SessionApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='oidc_init')
 
     @validate_arguments
     def oidc_login(self, auth_code_response : AuthCodeResponse, **kwargs) -> UserSession:  # noqa: E501
@@ -727,7 +735,9 @@ class SessionApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='oidc_login')
 
     @validate_arguments
     def register_user_handler(self, user_registration : UserRegistration, **kwargs) -> str:  # noqa: E501
@@ -874,7 +884,9 @@ class SessionApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='register_user_handler')
 
     @validate_arguments
     def session_handler(self, **kwargs) -> UserSession:  # noqa: E501
@@ -1006,4 +1018,6 @@ class SessionApi:
             _preload_content=_params.get('_preload_content', True),
             _request_timeout=_params.get('_request_timeout'),
             collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+            _request_auth=_params.get('_request_auth'),
+            # Note: name the operation for retry policies and instrumentation
+            _operation='session_handler')
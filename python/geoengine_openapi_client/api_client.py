@@ -14,6 +14,8 @@
 
 import atexit
 import datetime
+# Note: send the values of enums in query strings
+from enum import Enum
 from dateutil.parser import parse
 import json
 import mimetypes
@@ -28,7 +30,21 @@ from geoengine_openapi_client.configuration import Configuration
 from geoengine_openapi_client.api_response import ApiResponse
 import geoengine_openapi_client.models
 from geoengine_openapi_client import rest
+# Note: stream bodies of responses that are not preloaded
+from geoengine_openapi_client.streaming import StreamingResponse
+# Note: stream files of multipart bodies instead of reading them
+from geoengine_openapi_client.multipart import MultipartFile
 from geoengine_openapi_client.exceptions import ApiValueError, ApiException
+# Note: skip validation of trusted responses
+from geoengine_openapi_client.construct import construct_model
+# Note: retry transient errors according to the retry policy
+from geoengine_openapi_client.retry import call_with_retries
+# Note: share the results of identical concurrent GET requests
+from geoengine_openapi_client.single_flight import SingleFlight, coalesced_call_api
+# Note: selectable HTTP/2 transport
+from geoengine_openapi_client.http2 import Http2RESTClientObject
+# Note: per-operation metrics and instrumentation hooks
+from geoengine_openapi_client.instrumentation import RequestMetrics, decoded, queued
 
 
 class ApiClient:
@@ -70,7 +86,11 @@ class ApiClient:
         self.configuration = configuration
         self.pool_threads = pool_threads
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        # Note: selectable HTTP/2 transport
+        if configuration.http2:
+            self.rest_client = Http2RESTClientObject(configuration)
+        else:
+            self.rest_client = rest.RESTClientObject(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -78,6 +98,8 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'geoengine/openapi-client/python/0.0.10'
         self.client_side_validation = configuration.client_side_validation
+        # Note: share the results of identical concurrent GET requests
+        self.single_flight = SingleFlight()
 
     def __enter__(self):
         return self
@@ -86,6 +108,8 @@ class ApiClient:
         self.close()
 
     def close(self):
+        # Note: close the connections when the `ApiClient` is closed
+        self.rest_client.close()
         if self._pool:
             self._pool.close()
             self._pool.join()
@@ -148,7 +172,51 @@ class ApiClient:
             files=None, response_types_map=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
             _preload_content=True, _request_timeout=None, _host=None,
-            _request_auth=None):
+            _request_auth=None, _operation=None):
+
+        config = self.configuration
+
+        # Note: build requests and handle responses in helpers shared with the AsyncApiClient
+        (url, header_params, query_params, post_params, body) = self._prepare_request(
+            resource_path, method, path_params, query_params, header_params, body,
+            post_params, files, auth_settings, collection_formats, _host, _request_auth)
+
+        try:
+            # perform request and return response
+            # Note: record traffic for replays
+            request = self.request
+            if config.traffic_recorder is not None:
+                request = config.traffic_recorder.recording(request, _host or config.host, _operation)
+            # Note: per-operation metrics and instrumentation hooks
+            metrics = None
+            if config.instrumentation is not None:
+                metrics = RequestMetrics(_operation, method, url)
+                request = config.instrumentation.instrument_request(request, metrics)
+            # Note: retry transient errors according to the retry policy
+            response_data = call_with_retries(
+                config.retry_policy, _operation, request,
+                method, url,
+                query_params=query_params,
+                headers=header_params,
+                post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+        except ApiException as e:
+            if e.body:
+                e.body = e.body.decode('utf-8')
+            raise e
+
+        self.last_response = response_data
+
+        return self._handle_response(response_data, response_types_map, _return_http_data_only,
+                                     _preload_content, metrics)
+
+    def _prepare_request(self, resource_path, method, path_params, query_params, header_params, body,
+                         post_params, files, auth_settings, collection_formats, _host, _request_auth):
+        """Serializes the parameters of a request and builds its url.
+
+        :return: the url, headers, query parameters, post parameters and body.
+        """
 
         config = self.configuration
 
@@ -206,21 +274,20 @@ class ApiClient:
                                                      collection_formats)
             url += "?" + url_query
 
-        try:
-            # perform request and return response
-            response_data = self.request(
-                method, url,
-                query_params=query_params,
-                headers=header_params,
-                post_params=post_params, body=body,
-                _preload_content=_preload_content,
-                _request_timeout=_request_timeout)
-        except ApiException as e:
-            if e.body:
-                e.body = e.body.decode('utf-8')
-            raise e
+        return (url, header_params, query_params, post_params, body)
 
-        self.last_response = response_data
+    def _handle_response(self, response_data, response_types_map, _return_http_data_only,
+                         _preload_content, metrics=None, streaming_response=StreamingResponse):
+        """Deserializes the data of a response, or wraps a response that is
+        not preloaded into a `streaming_response`."""
+
+        config = self.configuration
+
+        # Note: do not read the body of responses that are not preloaded
+        if not _preload_content:
+            return ApiResponse(status_code = response_data.status,
+                               headers = response_data.headers,
+                               raw_data = streaming_response(response_data))
 
         return_data = None # assuming derialization is not needed
         # data needs deserialization or returns HTTP data (deserialized) only
@@ -239,13 +306,20 @@ class ApiClient:
               if content_type is not None:
                   match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
               encoding = match.group(1) if match else "utf-8"
-              response_data.data = response_data.data.decode(encoding)
+              # Note: the json codec parses utf-8 encoded bytes directly
+              if not _return_http_data_only or encoding.lower() not in ('utf-8', 'utf8'):
+                  response_data.data = response_data.data.decode(encoding)
 
           # deserialize response data
           if response_type == "bytearray":
               return_data = response_data.data
           elif response_type:
-              return_data = self.deserialize(response_data, response_type)
+              # Note: per-operation metrics and instrumentation hooks
+              if metrics is not None:
+                  return_data = config.instrumentation.deserialize(
+                      self.deserialize, response_data, response_type, metrics)
+              else:
+                  return_data = self.deserialize(response_data, response_type)
           else:
               return_data = None
 
@@ -313,9 +387,15 @@ class ApiClient:
 
         # fetch data from response object
         try:
-            data = json.loads(response.data)
+            # Note: decode with the configured json codec
+            data = self.configuration.json_codec.loads(response.data)
         except ValueError:
             data = response.data
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+
+        # Note: per-operation metrics and instrumentation hooks
+        decoded()
 
         return self.__deserialize(data, response_type)
 
@@ -364,7 +444,9 @@ class ApiClient:
                  response_types_map=None, auth_settings=None,
                  async_req=None, _return_http_data_only=None,
                  collection_formats=None, _preload_content=True,
-                 _request_timeout=None, _host=None, _request_auth=None):
+                 _request_timeout=None, _host=None, _request_auth=None,
+                 # Note: name the operation for retry policies and instrumentation
+                 _operation=None):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
         To make an async_req request, set the async_req parameter.
@@ -410,15 +492,19 @@ class ApiClient:
         resource_path = resource_path.partition("?")[0]
 
         if not async_req:
-            return self.__call_api(resource_path, method,
-                                   path_params, query_params, header_params,
-                                   body, post_params, files,
-                                   response_types_map, auth_settings,
-                                   _return_http_data_only, collection_formats,
-                                   _preload_content, _request_timeout, _host,
-                                   _request_auth)
-
-        return self.pool.apply_async(self.__call_api, (resource_path,
+            # Note: share the results of identical concurrent GET requests
+            return coalesced_call_api(self, self.__call_api,
+                                      resource_path, method,
+                                      path_params, query_params, header_params,
+                                      body, post_params, files,
+                                      response_types_map, auth_settings,
+                                      _return_http_data_only, collection_formats,
+                                      _preload_content, _request_timeout, _host,
+                                      _request_auth, _operation)
+
+        # Note: per-operation metrics and instrumentation hooks
+        queued_call_api = queued(self.__call_api, self.configuration.instrumentation)
+        return self.pool.apply_async(queued_call_api, (resource_path,
                                                        method, path_params,
                                                        query_params,
                                                        header_params, body,
@@ -429,7 +515,8 @@ class ApiClient:
                                                        collection_formats,
                                                        _preload_content,
                                                        _request_timeout,
-                                                       _host, _request_auth))
+                                                       _host, _request_auth,
+                                                       _operation))
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
@@ -531,6 +618,9 @@ class ApiClient:
         if collection_formats is None:
             collection_formats = {}
         for k, v in params.items() if isinstance(params, dict) else params:  # noqa: E501
+            # Note: send the values of enums in query strings
+            if isinstance(v, Enum):
+                v = v.value
             if isinstance(v, (int, float)):
                 v = str(v)
             if isinstance(v, bool):
@@ -574,7 +664,8 @@ class ApiClient:
                 for n in file_names:
                     with open(n, 'rb') as f:
                         filename = os.path.basename(f.name)
-                        filedata = f.read()
+                        # Note: stream files of multipart bodies instead of reading them
+                        filedata = MultipartFile(n)
                         mimetype = (mimetypes.guess_type(filename)[0] or
                                     'application/octet-stream')
                         params.append(
@@ -759,4 +850,7 @@ class ApiClient:
         :return: model object.
         """
 
+        # Note: skip validation of trusted responses
+        if self.configuration.trusted_responses:
+            return construct_model(klass, data)
         return klass.from_dict(data)
@@ -0,0 +1,72 @@
+# coding: utf-8
+
+"""
+    Compression of request and response bodies.
+
+    `RESTClientObject` sends `Configuration.accept_encoding` as the
+    `Accept-Encoding` of every request. By default this lists the codings
+    urllib3 can decode: `gzip` and `deflate`, `br` if `brotli` is installed
+    and `zstd` if `zstandard` is installed. urllib3 decodes responses while
+    they are read, so streamed responses, see `StreamingResponse`, are
+    decompressed in chunks and memory stays bounded.
+
+    JSON request bodies of at least `Configuration.request_compression_min_size`
+    bytes are compressed with `Configuration.request_compression`, e.g.
+
+    >>> configuration.request_compression = "gzip"
+    >>> datasets_api.create_dataset_handler(create_dataset)  # sent with `Content-Encoding: gzip`
+
+    Only enable this for servers that decode compressed request bodies.
+"""  # noqa: E501
+
+
+import gzip
+from typing import Dict, Optional, Union
+import zlib
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+DEFAULT_MIN_SIZE = 64 * 1024
+REQUEST_ENCODINGS = ('gzip', 'deflate', 'zstd')
+
+
+def default_accept_encoding() -> str:
+    """Returns the content codings urllib3 can decode."""
+    return ACCEPT_ENCODING
+
+
+def compress(data: Union[str, bytes], encoding: str) -> bytes:
+    """Compresses data with a content coding.
+
+    :param encoding: `gzip`, `deflate` or `zstd`.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if encoding == 'deflate':
+        return zlib.compress(data, 6)
+    if encoding == 'zstd':
+        if zstandard is None:
+            raise ImportError("zstd compression requires the `zstandard` package.")
+        return zstandard.ZstdCompressor().compress(data)
+    raise ValueError(f"unsupported content coding {encoding!r}, expected one of {REQUEST_ENCODINGS}")
+
+
+def compress_request_body(body: Union[str, bytes], headers: Dict[str, str],
+                          encoding: Optional[str], min_size: int = DEFAULT_MIN_SIZE) -> Union[str, bytes]:
+    """Compresses a request body of at least `min_size` bytes and sets its `Content-Encoding`.
+
+    :param encoding: the content coding, or None to send the body as it is.
+    """
+    if encoding is None or body is None or len(body) < min_size or 'Content-Encoding' in headers:
+        return body
+
+    headers['Content-Encoding'] = encoding
+    return compress(body, encoding)
@@ -18,6 +18,10 @@ import logging
 import multiprocessing
 import sys
 import urllib3
+# Note: pluggable json codec
+from geoengine_openapi_client.json_codec import StdlibJsonCodec
+# Note: compression of request and response bodies
+from geoengine_openapi_client.compression import DEFAULT_MIN_SIZE, default_accept_encoding
 
 import http.client as httplib
 
@@ -184,6 +188,67 @@ class Configuration:
         """date format
         """
 
+        # Note: pluggable json codec
+        self.json_codec = StdlibJsonCodec()
+        """Codec for request and response bodies, e.g. `OrjsonCodec` for speed
+        """
+
+        # Note: skip validation of trusted responses
+        self.trusted_responses = False
+        """Build response models without validation, only for trusted servers
+        """
+
+        # Note: stream files of multipart bodies instead of reading them
+        self.upload_progress = None
+        """Called with the bytes sent and the total bytes of multipart request bodies
+        """
+
+        # Note: retry transient errors according to the retry policy
+        self.retry_policy = None
+        """`RetryPolicy` for failed requests, in addition to the urllib3 `retries`
+        """
+
+        # Note: share the results of identical concurrent GET requests
+        self.coalesce_requests = False
+        """Send identical concurrent GET requests once and share their result
+        """
+
+        # Note: conditional requests for GET responses
+        self.http_cache = None
+        """`HttpCache` for conditional GET requests with `ETag` and `Last-Modified`
+        """
+
+        # Note: compression of request and response bodies
+        self.accept_encoding = default_accept_encoding()
+        """Content codings of responses to accept, or None to not send `Accept-Encoding`
+        """
+        self.request_compression = None
+        """Content coding of large JSON request bodies, `gzip`, `deflate` or `zstd`
+        """
+        self.request_compression_min_size = DEFAULT_MIN_SIZE
+        """Minimum size in bytes of JSON request bodies to compress
+        """
+
+        # Note: selectable HTTP/2 transport
+        self.http2 = False
+        """Multiplex requests over HTTP/2 connections, requires `httpx[http2]`
+        """
+
+        # Note: pluggable transports
+        self.transport = None
+        """`Transport` that sends the requests instead of a urllib3 `PoolManager`
+        """
+
+        # Note: record traffic for replays
+        self.traffic_recorder = None
+        """`TrafficRecorder` that logs all requests and their responses
+        """
+
+        # Note: per-operation metrics and instrumentation hooks
+        self.instrumentation = None
+        """`Instrumentation` with hooks called for every api call, e.g. a `MetricsCollector`
+        """
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(cls)
@@ -0,0 +1,138 @@
+# coding: utf-8
+
+"""
+    Deserialization of trusted responses without validation.
+
+    `Model.from_dict` validates every field with pydantic. If
+    `Configuration.trusted_responses` is set, `ApiClient` builds models with
+    `construct_model` instead. It walks the pydantic fields of a model and uses
+    the non-validating `BaseModel.construct` for the model, its nested models
+    and the actual instances of `oneOf` models.
+"""  # noqa: E501
+
+
+import copy
+from enum import Enum
+import functools
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+from pydantic.fields import ModelField, SHAPE_SINGLETON, MAPPING_LIKE_SHAPES
+
+from geoengine_openapi_client.one_of import dispatcher_for
+
+# leaf types whose JSON values can be used as they are
+_JSON_TYPES = (str, int, float, bool, dict, list)
+
+
+def construct_model(klass: Type[BaseModel], obj: Any) -> Optional[BaseModel]:
+    """Creates an instance of `klass` from a dict without validating it.
+
+    Like the generated `from_dict`, all fields count as set and missing
+    properties fall back to their defaults.
+    """
+    if obj is None:
+        return None
+
+    if not isinstance(obj, dict):
+        # e.g. `oneOf` models of enums
+        return klass.from_dict(obj)
+
+    plan = _PLANS.get(klass)
+    if plan is None:
+        plan = _PLANS[klass] = _ModelPlan(klass)
+
+    values = {}
+    for (name, alias, default, convert) in plan.fields:
+        value = obj.get(alias)
+        if value is None:
+            values[name] = None if default is None else copy.deepcopy(default)
+        elif convert is None:
+            values[name] = value
+        else:
+            values[name] = convert(value)
+
+    if plan.dispatcher is None:
+        return klass.construct(**values)
+
+    candidate = plan.dispatcher.candidate_for(obj)
+    if candidate is None:
+        groups = plan.dispatcher.possible_candidates(obj)
+        if not groups or len(groups[0]) != 1:
+            # ambiguous without validating the candidates
+            return klass.from_dict(obj)
+        candidate = groups[0][0]
+
+    return klass.construct(actual_instance=construct_model(candidate, obj), **values)
+
+
+class _ModelPlan:
+    """Fields of a model and how to construct their values, computed once per model."""
+
+    def __init__(self, klass: Type[BaseModel]) -> None:
+        one_of_model, self.dispatcher = _one_of_dispatcher(klass)
+        self.fields = [
+            (name, field.alias, field.default, _converter(field))
+            for (name, field) in klass.__fields__.items()
+            # the fields of `oneOf` models are set by the dispatcher, but models
+            # may extend them, e.g. `TaskStatusWithId.task_id`
+            if one_of_model is None or name not in one_of_model.__fields__
+        ]
+
+
+_PLANS: Dict[Type[BaseModel], _ModelPlan] = {}
+
+
+def _one_of_dispatcher(klass: Type[BaseModel]):
+    """Returns the `oneOf` model that `klass` is or extends, and its dispatcher."""
+    for base in klass.__mro__:
+        if isinstance(base, type) and issubclass(base, BaseModel):
+            dispatcher = dispatcher_for(base)
+            if dispatcher is not None:
+                return base, dispatcher
+    return None, None
+
+
+def _converter(field: ModelField) -> Optional[Callable[[Any], Any]]:
+    """Returns a function that constructs a non-null JSON value of a field
+    without validating it, or None if the value can be used as it is.
+    """
+    if field.shape in MAPPING_LIKE_SHAPES:
+        convert_value = _converter(field.sub_fields[0])
+        if convert_value is None:
+            return None
+        return lambda value: {
+            k: None if v is None else convert_value(v) for (k, v) in value.items()
+        }
+
+    if field.shape != SHAPE_SINGLETON:
+        convert_item = _converter(field.sub_fields[0])
+        if convert_item is None:
+            return None
+        return lambda value: [None if v is None else convert_item(v) for v in value]
+
+    type_ = field.type_
+    if field.sub_fields:
+        # unions of primitive types, e.g. `Union[StrictFloat, StrictInt]`
+        if all(_is_json_type(sub_field.type_) for sub_field in field.sub_fields):
+            return None
+    elif type_ is Any or _is_json_type(type_):
+        return None
+    elif isinstance(type_, type) and issubclass(type_, BaseModel):
+        return functools.partial(construct_model, type_)
+    elif isinstance(type_, type) and issubclass(type_, Enum):
+        return type_
+
+    def validate(value):
+        # e.g. datetimes, that pydantic parses from strings
+        value, error = field.validate(value, {}, loc=field.alias)
+        if error:
+            raise ValueError(str(error.exc))
+        return value
+
+    return validate
+
+
+def _is_json_type(type_: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, _JSON_TYPES) \
+        and not issubclass(type_, Enum)
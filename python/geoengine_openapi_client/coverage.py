@@ -0,0 +1,321 @@
+# coding: utf-8
+
+"""
+    Tiled download of large WCS coverages.
+
+    `OGCWCSApi.wcs_get_coverage_handler` returns the whole coverage as one
+    response. `CoverageDownloader` splits the requested bounds into tiles that
+    are aligned to the pixel grid, fetches them concurrently over the
+    connection pool of the `ApiClient` and writes their pixels into a
+    preallocated, memory-mapped file, e.g.
+
+    >>> downloader = CoverageDownloader(wcs_api, workflow_id, "urn:ogc:def:crs:EPSG::4326",
+    ...                                 RasterDataType.F32, workers=8)
+    >>> grid = downloader.download("ndvi.raw", (-180, -90, 180, 90), (0.01, 0.01),
+    ...                            time="2014-04-01T12:00:00.000Z")
+    >>> pixels = numpy.memmap("ndvi.raw", dtype="float32", shape=grid.shape)
+
+    The output file holds the samples of the first band row by row, north up,
+    in native byte order. Failed tiles are retried individually. Tiles that
+    still fail are reported with a `CoverageDownloadError` and can be fetched
+    again into the same file.
+"""  # noqa: E501
+
+
+from concurrent.futures import ThreadPoolExecutor
+import math
+import mmap
+import os
+from time import sleep
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from urllib3.exceptions import HTTPError
+
+from geoengine_openapi_client.api.ogcwcs_api import OGCWCSApi
+from geoengine_openapi_client.exceptions import ApiException, OpenApiException
+from geoengine_openapi_client.models.get_coverage_format import GetCoverageFormat
+from geoengine_openapi_client.models.get_coverage_request import GetCoverageRequest
+from geoengine_openapi_client.models.raster_data_type import RasterDataType
+from geoengine_openapi_client.models.spatial_partition2_d import SpatialPartition2D
+from geoengine_openapi_client.models.spatial_resolution import SpatialResolution
+from geoengine_openapi_client.models.wcs_service import WcsService
+from geoengine_openapi_client.models.wcs_version import WcsVersion
+from geoengine_openapi_client.tasks import AdaptiveBackoff
+
+try:
+    import rasterio.io
+except ImportError:  # pragma: no cover - optional dependency
+    rasterio = None
+
+DEFAULT_TILE_SIZE = 512
+
+SAMPLE_SIZES = {
+    RasterDataType.U8: 1,
+    RasterDataType.I8: 1,
+    RasterDataType.U16: 2,
+    RasterDataType.I16: 2,
+    RasterDataType.U32: 4,
+    RasterDataType.I32: 4,
+    RasterDataType.F32: 4,
+    RasterDataType.U64: 8,
+    RasterDataType.I64: 8,
+    RasterDataType.F64: 8,
+}
+
+NUMPY_DTYPES = {
+    RasterDataType.U8: 'uint8',
+    RasterDataType.I8: 'int8',
+    RasterDataType.U16: 'uint16',
+    RasterDataType.I16: 'int16',
+    RasterDataType.U32: 'uint32',
+    RasterDataType.I32: 'int32',
+    RasterDataType.F32: 'float32',
+    RasterDataType.U64: 'uint64',
+    RasterDataType.I64: 'int64',
+    RasterDataType.F64: 'float64',
+}
+
+# Note: sub-pixel remainders of the bounds below this fraction of a pixel are
+#       considered rounding errors and do not add a row or column
+_PIXEL_EPSILON = 1e-6
+
+Bounds = Union[SpatialPartition2D, Tuple[float, float, float, float]]
+Resolution = Union[SpatialResolution, Tuple[float, float]]
+
+
+class CoverageTile(NamedTuple):
+    """A window of the coverage, in pixels."""
+
+    column: int
+    row: int
+    x_offset: int
+    y_offset: int
+    width: int
+    height: int
+
+
+class CoverageGrid:
+    """The pixel grid of a coverage, split into tiles.
+
+    :param bounds: `xmin, ymin, xmax, ymax` or a `SpatialPartition2D`.
+    :param resolution: `resx, resy` or a `SpatialResolution`.
+    :param tile_size: width and height of the tiles in pixels.
+    """
+
+    def __init__(self, bounds: Bounds, resolution: Resolution, tile_size: int = DEFAULT_TILE_SIZE) -> None:
+        if isinstance(bounds, SpatialPartition2D):
+            bounds = (bounds.upper_left_coordinate.x, bounds.lower_right_coordinate.y,
+                      bounds.lower_right_coordinate.x, bounds.upper_left_coordinate.y)
+        if isinstance(resolution, SpatialResolution):
+            resolution = (resolution.x, resolution.y)
+
+        (self.xmin, self.ymin, self.xmax, self.ymax) = bounds
+        (self.resx, self.resy) = resolution
+        if self.xmax <= self.xmin or self.ymax <= self.ymin:
+            raise ValueError("expected xmin < xmax and ymin < ymax")
+        if self.resx <= 0 or self.resy <= 0 or tile_size < 1:
+            raise ValueError("resolution and tile size must be positive")
+
+        self.tile_size = tile_size
+        self.width = math.ceil((self.xmax - self.xmin) / self.resx - _PIXEL_EPSILON)
+        self.height = math.ceil((self.ymax - self.ymin) / self.resy - _PIXEL_EPSILON)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.height, self.width)
+
+    def tiles(self) -> Iterator[CoverageTile]:
+        """Yields the tiles row by row."""
+        for row, y_offset in enumerate(range(0, self.height, self.tile_size)):
+            for column, x_offset in enumerate(range(0, self.width, self.tile_size)):
+                yield CoverageTile(
+                    column, row, x_offset, y_offset,
+                    min(self.tile_size, self.width - x_offset),
+                    min(self.tile_size, self.height - y_offset),
+                )
+
+    def tile_bounds(self, tile: CoverageTile) -> Tuple[float, float, float, float]:
+        """Returns `xmin, ymin, xmax, ymax` of the pixels of a tile."""
+        xmin = self.xmin + tile.x_offset * self.resx
+        ymax = self.ymax - tile.y_offset * self.resy
+        return (xmin, ymax - tile.height * self.resy, xmin + tile.width * self.resx, ymax)
+
+
+class CoverageDownloadError(OpenApiException):
+    """Raised if tiles could not be downloaded after all retries.
+
+    The other tiles are written to the output file, so `failures` can be
+    passed as `tiles` to `CoverageDownloader.download` to complete it.
+    """
+
+    def __init__(self, failures: Dict[CoverageTile, Exception]) -> None:
+        super().__init__(f"{len(failures)} tile(s) failed, e.g. {next(iter(failures.values()))}")
+        self.failures = failures
+
+
+def decode_geotiff(data: bytes, tile: CoverageTile, data_type: RasterDataType) -> bytes:
+    """Returns the samples of the first band of a GeoTIFF, row by row."""
+    if rasterio is None:
+        raise ImportError(
+            "Decoding GeoTIFF tiles requires `rasterio`. "
+            "Install it with `pip install rasterio` or pass a `decode` function.")
+
+    with rasterio.io.MemoryFile(data) as memory_file, memory_file.open() as dataset:
+        return dataset.read(1).astype(NUMPY_DTYPES[data_type], copy=False).tobytes()
+
+
+def _is_retryable(exception: Exception) -> bool:
+    if isinstance(exception, ApiException):
+        status = exception.status or 0
+        return not 400 <= status < 500 or status == 429
+    return isinstance(exception, HTTPError)
+
+
+def _format_axes(crs: str, swap_axes: Optional[bool], *values: float) -> str:
+    """Formats x/y pairs, in y/x order for CRSs with a latitude first axis."""
+    if swap_axes is None:
+        swap_axes = crs.upper().replace('::', ':').endswith('EPSG:4326')
+    pairs = [values[i:i + 2] for i in range(0, len(values), 2)]
+    if swap_axes:
+        pairs = [pair[::-1] for pair in pairs]
+    return ",".join(repr(float(value)) for pair in pairs for value in pair)
+
+
+class CoverageDownloader:
+    """Downloads coverages tile by tile into a memory-mapped file.
+
+    :param wcs_api: the `OGCWCSApi` to request the tiles with.
+    :param workflow_id: id of the raster workflow.
+    :param crs: the CRS of the bounds, e.g. `urn:ogc:def:crs:EPSG::4326`.
+    :param data_type: the data type of the samples in the output file.
+    :param workers: maximum number of tiles that are requested in parallel,
+                    at most the `connection_pool_maxsize` of the configuration.
+    :param tile_size: width and height of the tiles in pixels.
+    :param retries: additional attempts per tile after an error.
+    :param backoff: creates the delays between the attempts of a tile.
+    :param nodatavalue: the no-data value of the coverage, or None.
+    :param decode: turns a response into the samples of the tile, row by row,
+                   with `decode(data, tile, data_type)`. Defaults to decoding
+                   GeoTIFF with `rasterio`.
+    :param swap_axes: whether the CRS has a latitude first axis. Defaults to
+                      True for EPSG:4326.
+    """
+
+    def __init__(self, wcs_api: OGCWCSApi, workflow_id: str, crs: str,
+                 data_type: RasterDataType,
+                 workers: int = 4,
+                 tile_size: int = DEFAULT_TILE_SIZE,
+                 retries: int = 3,
+                 backoff: Callable[[], AdaptiveBackoff] = AdaptiveBackoff,
+                 nodatavalue: Optional[float] = None,
+                 decode: Callable[[bytes, CoverageTile, RasterDataType], bytes] = decode_geotiff,
+                 swap_axes: Optional[bool] = None) -> None:
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if retries < 0:
+            raise ValueError("retries must not be negative")
+
+        self.wcs_api = wcs_api
+        self.workflow_id = workflow_id
+        self.crs = crs
+        self.data_type = RasterDataType(data_type)
+        self.workers = workers
+        self.tile_size = tile_size
+        self.retries = retries
+        self.backoff = backoff
+        self.nodatavalue = nodatavalue
+        self.decode = decode
+        self.swap_axes = swap_axes
+
+    def download(self, path: Union[str, os.PathLike], bounds: Bounds, resolution: Resolution,
+                 time: Optional[str] = None,
+                 tiles: Optional[Iterable[CoverageTile]] = None) -> CoverageGrid:
+        """Downloads a coverage into `path`.
+
+        :param path: the output file, which is created or replaced.
+        :param bounds: `xmin, ymin, xmax, ymax` or a `SpatialPartition2D`.
+        :param resolution: `resx, resy` or a `SpatialResolution`.
+        :param time: the WCS time parameter, or None.
+        :param tiles: only download these tiles into the existing output file,
+                      e.g. the failures of a `CoverageDownloadError`.
+        :return: the grid of the coverage.
+        """
+        grid = CoverageGrid(bounds, resolution, self.tile_size)
+        sample_size = SAMPLE_SIZES[self.data_type]
+        size = grid.width * grid.height * sample_size
+
+        if tiles is None:
+            tiles = list(grid.tiles())
+            with open(path, 'wb') as f:
+                f.truncate(size)
+        elif os.path.getsize(path) != size:
+            raise ValueError("the existing output file does not match the coverage")
+
+        failures: Dict[CoverageTile, Exception] = {}
+        with open(path, 'r+b') as f, mmap.mmap(f.fileno(), size) as output:
+            with ThreadPoolExecutor(max_workers=min(self.workers, self._pool_maxsize())) as executor:
+                futures = {
+                    tile: executor.submit(self._download_tile, output, grid, tile, time)
+                    for tile in tiles
+                }
+                for (tile, future) in futures.items():
+                    exception = future.exception()
+                    if exception is not None:
+                        failures[tile] = exception
+            output.flush()
+
+        if failures:
+            raise CoverageDownloadError(failures)
+
+        return grid
+
+    def fetch_tile(self, grid: CoverageGrid, tile: CoverageTile,
+                   time: Optional[str] = None) -> bytes:
+        """Requests the samples of a tile, row by row."""
+        (xmin, ymin, xmax, ymax) = grid.tile_bounds(tile)
+        data = self.wcs_api.wcs_get_coverage_handler(
+            workflow=self.workflow_id,
+            version=WcsVersion.ENUM_1_DOT_1_DOT_1,
+            service=WcsService.WCS,
+            request=GetCoverageRequest.GETCOVERAGE,
+            format=GetCoverageFormat.IMAGE_SLASH_TIFF,
+            identifier=self.workflow_id,
+            boundingbox=_format_axes(self.crs, self.swap_axes, xmin, ymin, xmax, ymax) + "," + self.crs,
+            gridbasecrs=self.crs,
+            gridorigin=_format_axes(self.crs, self.swap_axes, xmin, ymax),
+            gridoffsets=_format_axes(self.crs, self.swap_axes, grid.resx, -grid.resy),
+            time=time,
+            nodatavalue=self.nodatavalue,
+        )
+        samples = self.decode(bytes(data), tile, self.data_type)
+
+        if len(samples) != tile.width * tile.height * SAMPLE_SIZES[self.data_type]:
+            raise ValueError(f"tile {tile.column},{tile.row} has an unexpected size of {len(samples)} bytes")
+
+        return samples
+
+    def _pool_maxsize(self) -> int:
+        # more workers than pooled connections would open connections that
+        # are discarded after each request
+        return self.wcs_api.api_client.configuration.connection_pool_maxsize or 4
+
+    def _download_tile(self, output: mmap.mmap, grid: CoverageGrid, tile: CoverageTile,
+                       time: Optional[str]) -> None:
+        backoff = self.backoff()
+        attempt = 0
+        while True:
+            try:
+                samples = self.fetch_tile(grid, tile, time)
+                break
+            except Exception as e:  # pylint: disable=broad-except
+                attempt += 1
+                if attempt > self.retries or not _is_retryable(e):
+                    raise
+                sleep(backoff.next_delay(progress=False))
+
+        sample_size = SAMPLE_SIZES[self.data_type]
+        row_size = tile.width * sample_size
+        samples = memoryview(samples)
+        for y in range(tile.height):
+            start = ((tile.y_offset + y) * grid.width + tile.x_offset) * sample_size
+            output[start:start + row_size] = samples[y * row_size:(y + 1) * row_size]
@@ -0,0 +1,175 @@
+# coding: utf-8
+
+"""
+    Parallel crawling of the layer collection tree.
+
+    `LayerCollectionCrawler` walks the layer collections breadth-first with a
+    bounded number of worker threads and yields every collection as soon as
+    all its pages are loaded, e.g.
+
+    >>> crawler = LayerCollectionCrawler(layers_api, workers=8,
+    ...                                  checkpoint_path="catalog.checkpoint.json")
+    >>> for crawled in crawler.crawl():
+    ...     export(crawled.collection)
+
+    Collections that are reachable by several paths are visited once. With a
+    checkpoint, an interrupted crawl resumes with the collections that were
+    not yielded yet.
+"""  # noqa: E501
+
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import json
+import os
+from typing import Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from geoengine_openapi_client.api.layers_api import LayersApi
+from geoengine_openapi_client.models.layer_collection import LayerCollection
+from geoengine_openapi_client.models.layer_collection_listing_with_type import LayerCollectionListingWithType
+from geoengine_openapi_client.models.provider_layer_collection_id import ProviderLayerCollectionId
+from geoengine_openapi_client.pagination import DEFAULT_PAGE_SIZE, paginate
+
+
+class CrawledCollection(NamedTuple):
+    """A layer collection with the items of all its pages."""
+
+    collection: LayerCollection
+    parent: Optional[ProviderLayerCollectionId]
+    depth: int
+
+
+class _Job(NamedTuple):
+    """A collection to load. The root collection has no id."""
+
+    collection_id: Optional[ProviderLayerCollectionId]
+    parent: Optional[ProviderLayerCollectionId]
+    depth: int
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.collection_id.to_dict() if self.collection_id else None,
+            "parent": self.parent.to_dict() if self.parent else None,
+            "depth": self.depth,
+        }
+
+    @classmethod
+    def from_dict(cls, obj: dict) -> '_Job':
+        return cls(
+            ProviderLayerCollectionId.from_dict(obj["id"]),
+            ProviderLayerCollectionId.from_dict(obj["parent"]),
+            obj["depth"],
+        )
+
+
+def _key(collection_id: ProviderLayerCollectionId) -> Tuple[str, str]:
+    return (collection_id.provider_id, collection_id.collection_id)
+
+
+class LayerCollectionCrawler:
+    """Crawls the layer collection tree breadth-first.
+
+    :param layers_api: the `LayersApi` to load collections with.
+    :param workers: maximum number of collections that are loaded in parallel.
+    :param page_size: number of items requested per page.
+    :param checkpoint_path: file to store the progress in, or None.
+    """
+
+    def __init__(self, layers_api: LayersApi, workers: int = 4,
+                 page_size: int = DEFAULT_PAGE_SIZE,
+                 checkpoint_path: Optional[str] = None) -> None:
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        self.layers_api = layers_api
+        self.workers = workers
+        self.page_size = page_size
+        self.checkpoint_path = checkpoint_path
+
+    def crawl(self, start: Optional[ProviderLayerCollectionId] = None) -> Iterator[CrawledCollection]:
+        """Yields all collections below `start`, or below the root collection.
+
+        If a checkpoint exists, the crawl resumes from it and `start` is
+        ignored. The checkpoint is updated after each yielded collection and
+        removed once the crawl is complete.
+        """
+        checkpoint = self.load_checkpoint()
+        if checkpoint is not None:
+            done, pending = checkpoint
+        else:
+            done, pending = set(), deque([_Job(start, None, 0)])
+        seen = done | {_key(job.collection_id) for job in pending if job.collection_id}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            running = {}
+            while pending or running:
+                while pending and len(running) < self.workers:
+                    job = pending.popleft()
+                    running[executor.submit(self.load_collection, job.collection_id)] = job
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = running.pop(future)
+                    collection = future.result()
+
+                    seen.add(_key(collection.id))
+                    done.add(_key(collection.id))
+                    for item in collection.items:
+                        listing = item.actual_instance
+                        if isinstance(listing, LayerCollectionListingWithType) \
+                                and _key(listing.id) not in seen:
+                            seen.add(_key(listing.id))
+                            pending.append(_Job(listing.id, collection.id, job.depth + 1))
+
+                    yield CrawledCollection(collection, job.parent, job.depth)
+
+                    # only store the progress once the consumer asks for more
+                    self.save_checkpoint(done, list(pending) + list(running.values()))
+
+        self.remove_checkpoint()
+
+    def load_collection(self, collection_id: Optional[ProviderLayerCollectionId]) -> LayerCollection:
+        """Loads a collection with the items of all its pages."""
+        if collection_id is None:
+            method = self.layers_api.list_root_collections_handler
+            args = ()
+        else:
+            method = self.layers_api.list_collection_handler
+            args = (collection_id.provider_id, collection_id.collection_id)
+
+        first_page = method(*args, offset=0, limit=self.page_size)
+        items = list(first_page.items)
+        if len(items) >= self.page_size:
+            items.extend(paginate(method, *args, page_size=self.page_size, offset=len(items)))
+
+        return first_page.copy(update={"items": items})
+
+    def load_checkpoint(self) -> Optional[Tuple[Set[Tuple[str, str]], Deque[_Job]]]:
+        """Returns the visited collections and the pending jobs, if there is a checkpoint."""
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return None
+
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+
+        done = {tuple(key) for key in checkpoint["done"]}
+        pending = deque(_Job.from_dict(job) for job in checkpoint["pending"])
+        return done, pending
+
+    def save_checkpoint(self, done: Iterable[Tuple[str, str]], pending: List[_Job]) -> None:
+        """Atomically replaces the checkpoint."""
+        if self.checkpoint_path is None:
+            return
+
+        checkpoint: Dict[str, list] = {
+            "done": sorted(done),
+            "pending": [job.to_dict() for job in pending],
+        }
+        temp_path = self.checkpoint_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def remove_checkpoint(self) -> None:
+        if self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
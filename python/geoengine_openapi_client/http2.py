@@ -0,0 +1,192 @@
+# coding: utf-8
+
+"""
+    HTTP/2 transport.
+
+    The default `RESTClientObject` sends each concurrent request over its own
+    urllib3 connection. With `Configuration.http2` set, `ApiClient` uses an
+    `Http2RESTClientObject` instead, which multiplexes concurrent requests as
+    streams over a few HTTP/2 connections per host, e.g.
+
+    >>> configuration.http2 = True
+    >>> wms_api = OGCWMSApi(ApiClient(configuration, pool_threads=64))
+    >>> images = [wms_api.wms_map_handler(..., async_req=True) for bbox in bboxes]
+
+    It requires `httpx` 0.26 or later with HTTP/2 support, e.g. from the
+    `http2` extra of this package, which is imported once the first HTTP/2
+    client is created. HTTP/2 is negotiated with ALPN, so servers and proxies
+    without HTTP/2 support and plain `http` hosts are still spoken to with
+    HTTP/1.1.
+
+    The TLS, proxy, `socket_options` and `tls_server_name` settings of the
+    `Configuration` apply to both transports. `assert_hostname` can only
+    disable the hostname check, and urllib3 `retries` are not supported, use
+    `Configuration.retry_policy` instead.
+
+    `Http2RESTClientObject` only replaces the pool manager of a
+    `RESTClientObject`, so request encoding, error handling, caching and
+    compression are the same for both transports.
+"""  # noqa: E501
+
+
+import io
+import ssl
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+import urllib3
+
+from geoengine_openapi_client.rest import RESTClientObject
+from geoengine_openapi_client.transport import DEFAULT_CHUNK_SIZE, TransportResponse
+
+
+
+def _httpx():
+    """Imports `httpx`, which is only needed by HTTP/2 clients."""
+    try:
+        import httpx  # pylint: disable=import-outside-toplevel
+    except ImportError as e:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "The HTTP/2 transport requires `httpx` and `h2`. "
+            "Install them with `pip install 'httpx[http2] >= 0.26'`.") from e
+    return httpx
+
+
+class Http2Response(TransportResponse):
+    """An `httpx.Response` with the interface of a `urllib3.HTTPResponse`.
+
+    :param response: the streamed `httpx.Response`.
+    :param preload_content: read the whole body right away.
+    """
+
+    def __init__(self, response: 'httpx.Response', preload_content: bool = True) -> None:
+        self.httpx_response = response
+        super().__init__(response.status_code, response.headers.multi_items(),
+                         response.iter_bytes(DEFAULT_CHUNK_SIZE), reason=response.reason_phrase,
+                         preload_content=preload_content)
+
+    def close(self) -> None:
+        self.httpx_response.close()
+        super().close()
+
+
+def _httpx_timeout(timeout: Optional[urllib3.Timeout]) -> 'httpx.Timeout':
+    httpx = _httpx()
+    if timeout is None:
+        return httpx.Timeout(None)
+    if timeout.total is not None:
+        return httpx.Timeout(timeout.total)
+    return httpx.Timeout(None, connect=timeout.connect_timeout, read=timeout.read_timeout)
+
+
+class Http2PoolManager:
+    """Sends the requests of a `RESTClientObject` with an HTTP/2 `httpx.Client`.
+
+    The client is created on first request and closed by `clear`.
+
+    :param configuration: the `Configuration` with the TLS and proxy settings.
+    :param maxsize: maximum number of idle connections.
+    :raises ValueError: for settings of the `Configuration` that httpx does not support.
+    """
+
+    def __init__(self, configuration, maxsize: int) -> None:
+        if configuration.retries is not None:
+            raise ValueError("The HTTP/2 transport does not support `Configuration.retries`, "
+                             "use `Configuration.retry_policy` instead.")
+        if configuration.assert_hostname not in (None, False):
+            raise ValueError("The HTTP/2 transport only supports `Configuration.assert_hostname = False`.")
+
+        self.configuration = configuration
+        self.maxsize = maxsize
+        self.extensions = {}
+        if configuration.tls_server_name:
+            self.extensions['sni_hostname'] = configuration.tls_server_name
+        self._lock = threading.Lock()
+        self._client: Optional['httpx.Client'] = None
+
+    @property
+    def client(self) -> 'httpx.Client':
+        with self._lock:
+            if self._client is None:
+                self._client = self._create_client()
+            return self._client
+
+    def _create_client(self) -> 'httpx.Client':
+        httpx = _httpx()
+        configuration = self.configuration
+
+        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(configuration.cert_file, keyfile=configuration.key_file)
+        if configuration.assert_hostname is False:
+            ssl_context.check_hostname = False
+        if not configuration.verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+
+        proxy = None
+        if configuration.proxy:
+            proxy = httpx.Proxy(configuration.proxy, headers=configuration.proxy_headers)
+
+        # Like a non-blocking urllib3 pool, requests never wait for a free
+        # connection and at most `maxsize` connections are kept alive.
+        transport = httpx.HTTPTransport(
+            http2=True,
+            verify=ssl_context,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=self.maxsize),
+            proxy=proxy,
+            socket_options=configuration.socket_options,
+            trust_env=False,
+        )
+        return httpx.Client(transport=transport, trust_env=False)
+
+    def request(self, method: str, url: str, body=None, fields=None, encode_multipart: bool = True,
+                preload_content: bool = True, timeout: Optional[urllib3.Timeout] = None,
+                headers: Optional[Dict[str, str]] = None) -> Http2Response:
+        """Sends a request like `urllib3.PoolManager.request`."""
+        httpx = _httpx()
+        if fields and not encode_multipart:
+            body = urlencode(fields)
+        if isinstance(body, io.IOBase):
+            # e.g. a `MultipartEncoder` with a known `Content-Length`
+            reader = body
+            body = iter(lambda: reader.read(DEFAULT_CHUNK_SIZE), b"")
+
+        client = self.client
+        request = client.build_request(method, url, content=body, headers=headers,
+                                       timeout=_httpx_timeout(timeout), extensions=self.extensions)
+        try:
+            response = client.send(request, stream=True)
+        except httpx.TimeoutException as e:
+            raise urllib3.exceptions.TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise urllib3.exceptions.ProtocolError(str(e)) from e
+        return Http2Response(response, preload_content)
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+class Http2RESTClientObject(RESTClientObject):
+    """A `RESTClientObject` that multiplexes requests over HTTP/2 connections.
+
+    :param configuration: the `Configuration` of the client.
+    :param maxsize: maximum number of idle connections.
+    """
+
+    def __init__(self, configuration, pools_size=4, maxsize=None) -> None:
+        # fails early if `httpx` is missing
+        _httpx()
+        super().__init__(configuration, pools_size, maxsize)
+
+    def create_transport(self, configuration, maxsize):
+        """Returns the configured transport or an `Http2PoolManager`."""
+        if configuration.transport is not None:
+            return configuration.transport
+        if maxsize is None:
+            maxsize = configuration.connection_pool_maxsize or 4
+        return Http2PoolManager(configuration, maxsize)
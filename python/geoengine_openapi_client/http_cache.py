@@ -0,0 +1,230 @@
+# coding: utf-8
+
+"""
+    Conditional requests for GET responses.
+
+    If `Configuration.http_cache` is an `HttpCache`, `RESTClientObject` keeps
+    the bodies of GET responses with a `Cache-Control: max-age`, an `Expires`,
+    an `ETag` or a `Last-Modified` header. Fresh responses are answered from
+    the cache without a request. Stale ones are revalidated with
+    `If-None-Match` and `If-Modified-Since`, and a `304 Not Modified` returns
+    the cached body, e.g.
+
+    >>> configuration.http_cache = HttpCache(max_entries=256)
+    >>> ogc_wms_api = OGCWMSApi(ApiClient(configuration))
+    >>> ogc_wms_api.wms_capabilities_handler(workflow, ...)  # 200 OK
+    >>> ogc_wms_api.wms_capabilities_handler(workflow, ...)  # 304 Not Modified
+    >>> configuration.http_cache.stats
+    HttpCacheStats(hits=0, revalidations=1, misses=1)
+
+    This helps with polled resources like the capabilities documents of the
+    OGC apis and `list_volumes_handler`. Responses are cached per URL and
+    `Authorization` header and respect `Vary`, `no-store` and `no-cache`.
+
+    The cache keeps the response bodies, not the models. Every hit is
+    deserialized anew, so the returned models can be modified, like those of
+    `ResourceCache`. A hit saves the request, or the transfer of the body for
+    a revalidation, but not the deserialization.
+"""  # noqa: E501
+
+
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+import io
+import re
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+try:
+    from urllib3 import HTTPHeaderDict
+except ImportError:  # urllib3 < 2
+    from urllib3._collections import HTTPHeaderDict
+
+DEFAULT_MAX_ENTRIES = 256
+
+_DIRECTIVE = re.compile(r'\s*([\w-]+)\s*(?:=\s*"?([^",]*)"?)?\s*(?:,|$)')
+
+
+class HttpCacheStats(NamedTuple):
+    """Counters of an `HttpCache`."""
+
+    hits: int
+    revalidations: int
+    misses: int
+
+
+class CachedResponse(io.IOBase):
+    """A `RESTResponse` with a cached body."""
+
+    def __init__(self, status: int, reason: str, headers: HTTPHeaderDict, data: bytes) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.data = data
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+class _Entry:
+    """A cached response and the request headers it varies on."""
+
+    def __init__(self, response, vary: Dict[str, Optional[str]]) -> None:
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = HTTPHeaderDict(response.getheaders())
+        self.data = response.data
+        self.vary = vary
+        self.stored_at = time.time()
+
+    def response(self) -> CachedResponse:
+        return CachedResponse(self.status, self.reason, HTTPHeaderDict(self.headers), self.data)
+
+    def revalidated(self, response) -> None:
+        for name in ('Cache-Control', 'Date', 'ETag', 'Expires', 'Last-Modified'):
+            if response.getheader(name) is not None:
+                self.headers[name] = response.getheader(name)
+        self.stored_at = time.time()
+
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < freshness_lifetime(self.headers)
+
+
+def cache_control(headers) -> Dict[str, Optional[str]]:
+    """Parses the `Cache-Control` directives of headers."""
+    value = headers.get('Cache-Control') or ''
+    return {name.lower(): argument for (name, argument) in _DIRECTIVE.findall(value) if name}
+
+
+def freshness_lifetime(headers) -> float:
+    """Returns the seconds a response is fresh, from `max-age` or `Expires`."""
+    directives = cache_control(headers)
+    if 'no-cache' in directives:
+        return 0.0
+
+    try:
+        age = float(headers.get('Age') or 0)
+    except ValueError:
+        age = 0.0
+    if directives.get('max-age') is not None:
+        try:
+            return int(directives['max-age']) - age
+        except ValueError:
+            return 0.0
+
+    if headers.get('Expires') is not None:
+        try:
+            expires = parsedate_to_datetime(headers['Expires'])
+            date = parsedate_to_datetime(headers['Date']) if headers.get('Date') else None
+        except (TypeError, ValueError):
+            return 0.0
+        if date is None:
+            return expires.timestamp() - time.time()
+        return (expires - date).total_seconds() - age
+    return 0.0
+
+
+class HttpCache:
+    """A bounded LRU cache of GET responses for conditional requests.
+
+    :param max_entries: maximum number of cached responses.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple[str, Optional[str]], _Entry]' = OrderedDict()
+        self._counters = dict.fromkeys(HttpCacheStats._fields, 0)
+
+    def __deepcopy__(self, memo):
+        # copies of a `Configuration` share the state
+        return self
+
+    @property
+    def stats(self) -> HttpCacheStats:
+        with self._lock:
+            return HttpCacheStats(**self._counters)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _key(url: str, headers: Dict[str, str]) -> Tuple[str, Optional[str]]:
+        return (url, HTTPHeaderDict(headers).get('Authorization'))
+
+    def _entry(self, url: str, headers: Dict[str, str]) -> Optional[_Entry]:
+        key = self._key(url, headers)
+        entry = self._entries.get(key)
+        request_headers = HTTPHeaderDict(headers)
+        if entry is None or any(request_headers.get(name) != value for (name, value) in entry.vary.items()):
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def before_request(self, url: str, headers: Dict[str, str]) -> Optional[CachedResponse]:
+        """Returns a fresh cached response, or adds the validators of a stale one to `headers`."""
+        with self._lock:
+            entry = self._entry(url, headers)
+            if entry is None:
+                return None
+            if entry.is_fresh():
+                self._counters['hits'] += 1
+                return entry.response()
+
+            if entry.headers.get('ETag') is not None:
+                headers['If-None-Match'] = entry.headers['ETag']
+            if entry.headers.get('Last-Modified') is not None:
+                headers['If-Modified-Since'] = entry.headers['Last-Modified']
+            return None
+
+    def after_response(self, url: str, headers: Dict[str, str], response):
+        """Returns the cached response for a `304 Not Modified` and stores cacheable responses.
+
+        Returns None for a `304 Not Modified` whose response is no longer
+        cached, e.g. because it was evicted since `before_request`. The
+        request has to be sent again `without_validators`.
+        """
+        with self._lock:
+            if response.status == 304:
+                entry = self._entry(url, headers)
+                if entry is None:
+                    return None
+                entry.revalidated(response)
+                self._counters['revalidations'] += 1
+                return entry.response()
+
+            self._counters['misses'] += 1
+            if response.status == 200 and self._is_cacheable(response):
+                vary = [name.strip() for name in (response.getheader('Vary') or '').split(',') if name.strip()]
+                if '*' not in vary:
+                    key = self._key(url, headers)
+                    request_headers = HTTPHeaderDict(headers)
+                    self._entries[key] = _Entry(response, {name: request_headers.get(name) for name in vary})
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            return response
+
+    @staticmethod
+    def without_validators(headers: Dict[str, str]) -> Dict[str, str]:
+        """Returns a copy of request headers without `If-None-Match` and `If-Modified-Since`."""
+        return {name: value for (name, value) in headers.items()
+                if name.lower() not in ('if-none-match', 'if-modified-since')}
+
+    @staticmethod
+    def _is_cacheable(response) -> bool:
+        headers = response.getheaders()
+        if 'no-store' in cache_control(headers):
+            return False
+        return headers.get('ETag') is not None or headers.get('Last-Modified') is not None \
+            or freshness_lifetime(headers) > 0
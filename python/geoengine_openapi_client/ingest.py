@@ -0,0 +1,244 @@
+# coding: utf-8
+
+"""
+    Pipelined bulk ingestion of datasets.
+
+    `BulkIngester` uploads files with `UploadsApi.upload_handler` and creates
+    a dataset from each upload, either with
+    `DatasetsApi.suggest_meta_data_handler` and `create_dataset_handler` or
+    with `auto_create_dataset_handler`. Both stages have their own bounded
+    worker pool, so the next files are uploaded while datasets are created
+    from the previous ones, e.g.
+
+    >>> ingester = BulkIngester(uploads_api, datasets_api, upload_workers=2, create_workers=4)
+    >>> report = ingester.ingest(glob.glob("scenes/*.tif"))
+    >>> with open("report.json", "w") as f:
+    ...     f.write(report.to_json())
+
+    A failure only affects its own dataset and is recorded in the report
+    together with the stage it occurred in.
+"""  # noqa: E501
+
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import json
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from geoengine_openapi_client.api.datasets_api import DatasetsApi
+from geoengine_openapi_client.api.uploads_api import UploadsApi
+from geoengine_openapi_client.models.add_dataset import AddDataset
+from geoengine_openapi_client.models.auto_create_dataset import AutoCreateDataset
+from geoengine_openapi_client.models.create_dataset import CreateDataset
+from geoengine_openapi_client.models.data_path import DataPath
+from geoengine_openapi_client.models.data_path_one_of1 import DataPathOneOf1
+from geoengine_openapi_client.models.dataset_definition import DatasetDefinition
+from geoengine_openapi_client.models.meta_data_suggestion import MetaDataSuggestion
+from geoengine_openapi_client.models.suggest_meta_data import SuggestMetaData
+
+UPLOAD_STAGE = "upload"
+CREATE_STAGE = "create"
+
+
+class IngestItem(NamedTuple):
+    """The files of one dataset. The first file is the main file."""
+
+    files: Sequence[str]
+    dataset_name: str
+
+    @property
+    def main_file(self) -> str:
+        return os.path.basename(self.files[0])
+
+
+class IngestResult(NamedTuple):
+    """The outcome for one dataset, with either a dataset name or an error."""
+
+    item: IngestItem
+    upload_id: Optional[str]
+    dataset_name: Optional[str]
+    stage: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class IngestReport(NamedTuple):
+    """The outcomes of a bulk ingestion."""
+
+    results: List[IngestResult]
+
+    @property
+    def created(self) -> Dict[str, str]:
+        """The created dataset names by main file path."""
+        return {r.item.files[0]: r.dataset_name for r in self.results if r.ok}
+
+    @property
+    def failures(self) -> List[IngestResult]:
+        return [r for r in self.results if not r.ok]
+
+    def to_dict(self) -> dict:
+        return {
+            "created": [
+                {"files": list(r.item.files), "upload": r.upload_id, "datasetName": r.dataset_name}
+                for r in self.results if r.ok
+            ],
+            "failures": [
+                {"files": list(r.item.files), "upload": r.upload_id, "stage": r.stage,
+                 "error": type(r.error).__name__, "message": str(r.error)}
+                for r in self.results if not r.ok
+            ],
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+
+def default_dataset_name(path: str) -> str:
+    """Names a dataset after its main file without extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def default_source_operator(suggestion: MetaDataSuggestion) -> str:
+    """Returns the source operator that loads the suggested meta data."""
+    meta_data_type = suggestion.meta_data.actual_instance.type
+    if meta_data_type.startswith("Gdal"):
+        return "GdalSource"
+    if meta_data_type.startswith("Ogr"):
+        return "OgrSource"
+    return "MockPointSource"
+
+
+class BulkIngester:
+    """Uploads files and creates datasets from them in two pipelined stages.
+
+    :param uploads_api: the `UploadsApi` to upload the files with.
+    :param datasets_api: the `DatasetsApi` to create the datasets with.
+    :param upload_workers: maximum number of uploads in parallel.
+    :param create_workers: maximum number of datasets created in parallel.
+    :param auto_create: use `auto_create_dataset_handler` instead of
+                        suggesting the meta data and creating the dataset.
+    :param dataset_properties: builds the `AddDataset` of a dataset from the
+                               suggested meta data, if not `auto_create`.
+    :param description: the description of the datasets.
+    :param tags: the tags of the datasets.
+    """
+
+    def __init__(self, uploads_api: UploadsApi, datasets_api: DatasetsApi,
+                 upload_workers: int = 2,
+                 create_workers: int = 4,
+                 auto_create: bool = False,
+                 dataset_properties: Optional[Callable[[IngestItem, MetaDataSuggestion], AddDataset]] = None,
+                 description: str = "",
+                 tags: Optional[List[str]] = None) -> None:
+        if upload_workers < 1 or create_workers < 1:
+            raise ValueError("workers must be positive")
+
+        self.uploads_api = uploads_api
+        self.datasets_api = datasets_api
+        self.upload_workers = upload_workers
+        self.create_workers = create_workers
+        self.auto_create = auto_create
+        self.dataset_properties = dataset_properties or self.default_dataset_properties
+        self.description = description
+        self.tags = tags
+
+    def ingest(self, datasets: Iterable[Union[str, Sequence[str], IngestItem]],
+               dataset_name: Callable[[str], str] = default_dataset_name) -> IngestReport:
+        """Ingests datasets and returns the report once all are done.
+
+        See `ingest_iter` for the parameters.
+        """
+        return IngestReport(list(self.ingest_iter(datasets, dataset_name)))
+
+    def ingest_iter(self, datasets: Iterable[Union[str, Sequence[str], IngestItem]],
+                    dataset_name: Callable[[str], str] = default_dataset_name) -> Iterator[IngestResult]:
+        """Ingests datasets and yields their results as they finish.
+
+        :param datasets: a file path, the file paths of a dataset with the main
+                         file first, or an `IngestItem` per dataset.
+        :param dataset_name: names a dataset after the path of its main file.
+        """
+        items = (self._item(dataset, dataset_name) for dataset in datasets)
+
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as upload_executor, \
+                ThreadPoolExecutor(max_workers=self.create_workers) as create_executor:
+            uploading: Dict[Future, IngestItem] = {}
+            # future -> item and upload id
+            creating: Dict[Future, Tuple[IngestItem, str]] = {}
+            exhausted = False
+            while uploading or creating or not exhausted:
+                # only upload ahead while the create stage keeps up
+                while not exhausted and len(uploading) < self.upload_workers \
+                        and len(creating) < 2 * self.create_workers:
+                    item = next(items, None)
+                    if item is None:
+                        exhausted = True
+                    else:
+                        uploading[upload_executor.submit(self.upload, item)] = item
+                if not uploading and not creating:
+                    continue
+
+                finished, _ = wait(list(uploading) + list(creating), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if future in uploading:
+                        item = uploading.pop(future)
+                        if future.exception() is not None:
+                            yield IngestResult(item, None, None, UPLOAD_STAGE, future.exception())
+                        else:
+                            upload_id = future.result()
+                            creating[create_executor.submit(self.create, item, upload_id)] = (item, upload_id)
+                    else:
+                        (item, upload_id) = creating.pop(future)
+                        if future.exception() is not None:
+                            yield IngestResult(item, upload_id, None, CREATE_STAGE, future.exception())
+                        else:
+                            yield IngestResult(item, upload_id, future.result())
+
+    def default_dataset_properties(self, item: IngestItem, suggestion: MetaDataSuggestion) -> AddDataset:
+        """Names the dataset after the item and loads it with the suggested source operator."""
+        return AddDataset(
+            name=item.dataset_name,
+            display_name=item.dataset_name,
+            description=self.description,
+            source_operator=default_source_operator(suggestion),
+            tags=self.tags,
+        )
+
+    def upload(self, item: IngestItem) -> str:
+        """Uploads the files of a dataset and returns the upload id."""
+        return self.uploads_api.upload_handler(list(item.files)).id
+
+    def create(self, item: IngestItem, upload_id: str) -> str:
+        """Creates a dataset from an upload and returns the dataset name."""
+        if self.auto_create:
+            return self.datasets_api.auto_create_dataset_handler(AutoCreateDataset(
+                dataset_name=item.dataset_name,
+                dataset_description=self.description,
+                main_file=item.main_file,
+                upload=upload_id,
+                tags=self.tags,
+            )).dataset_name
+
+        data_path = DataPath(DataPathOneOf1(upload=upload_id))
+        suggestion = self.datasets_api.suggest_meta_data_handler(SuggestMetaData(
+            data_path=data_path,
+            main_file=item.main_file,
+        ))
+        return self.datasets_api.create_dataset_handler(CreateDataset(
+            data_path=data_path,
+            definition=DatasetDefinition(
+                meta_data=suggestion.meta_data,
+                properties=self.dataset_properties(item, suggestion),
+            ),
+        )).dataset_name
+
+    @staticmethod
+    def _item(dataset: Union[str, Sequence[str], IngestItem], dataset_name: Callable[[str], str]) -> IngestItem:
+        if isinstance(dataset, IngestItem):
+            return dataset
+        files = (dataset,) if isinstance(dataset, (str, os.PathLike)) else tuple(dataset)
+        files = tuple(os.fspath(f) for f in files)
+        return IngestItem(files, dataset_name(files[0]))
@@ -0,0 +1,408 @@
+# coding: utf-8
+
+"""
+    Per-operation metrics and instrumentation hooks.
+
+    An `Instrumentation` in `Configuration.instrumentation` is called for
+    every api call with the `RequestMetrics` of the call:
+
+    - `pre_request` and `post_response` around every attempt of the request,
+      including retries and failed attempts,
+    - `pre_deserialize` and `post_deserialize` around the deserialization of
+      the response.
+
+    `MetricsCollector` keeps counters and histograms per operation, i.e. per
+    api method, of the network, decode, validation and pool wait times and
+    of the request and response sizes, e.g.
+
+    >>> metrics = MetricsCollector()
+    >>> configuration.instrumentation = metrics
+    >>> wms_api.wms_map_handler(...)
+    >>> metrics.histogram("network_seconds", "wms_map_handler").count
+    1
+    >>> print(metrics.to_prometheus())  # the Prometheus text format
+
+    `OpenTelemetryInstrumentation` records the requests as OpenTelemetry
+    spans and requires `opentelemetry-api`. Use `CombinedInstrumentation`
+    for both.
+
+    The decode time is the time to parse the response body, the validation
+    time the time to build the models from it. The pool wait time is the
+    time that calls with `async_req` wait for a thread of the `ApiClient`.
+"""  # noqa: E501
+
+
+from bisect import bisect_left
+from contextvars import ContextVar
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from geoengine_openapi_client.exceptions import ApiException
+from geoengine_openapi_client.traffic import response_size
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None
+
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = tuple(float(4 ** exponent) for exponent in range(4, 14))  # 256 B to 64 MiB
+
+_current_metrics: ContextVar[Optional['RequestMetrics']] = ContextVar('current_metrics', default=None)
+_pool_wait: ContextVar[float] = ContextVar('pool_wait', default=0.0)
+
+
+class RequestMetrics:
+    """The measurements of an api call, in seconds and bytes.
+
+    The status, error, times and sizes of the request are those of the
+    latest attempt. `state` holds the state of instrumentations, e.g. spans.
+    """
+
+    def __init__(self, operation: Optional[str], method: str, url: str) -> None:
+        self.operation = operation
+        self.method = method
+        self.url = url
+        self.attempt = 0
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.pool_wait = _pool_wait.get()
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.validation_time = 0.0
+        self.bytes_out = 0
+        self.bytes_in: Optional[int] = None
+        self.state: Dict[Any, Any] = {}
+        self._mark = time.monotonic()
+
+    def lap(self) -> float:
+        """Returns the time since the previous lap."""
+        now = time.monotonic()
+        (elapsed, self._mark) = (now - self._mark, now)
+        return elapsed
+
+
+def observe_bytes_out(size: int) -> None:
+    """Sets the size of the encoded body of the current request."""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.bytes_out = size
+
+
+def decoded() -> None:
+    """Marks the end of decoding the response of the current call."""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.decode_time = metrics.lap()
+
+
+def queued(function: Callable, instrumentation: Optional['Instrumentation']) -> Callable:
+    """Wraps a function submitted to a thread pool to measure its wait for a thread."""
+    if instrumentation is None:
+        return function
+
+    queued_at = time.monotonic()
+
+    def dequeued(*args):
+        token = _pool_wait.set(time.monotonic() - queued_at)
+        try:
+            return function(*args)
+        finally:
+            _pool_wait.reset(token)
+
+    return dequeued
+
+
+class Instrumentation:
+    """Hooks called for every api call, override the ones you need."""
+
+    def pre_request(self, metrics: RequestMetrics) -> None:
+        """Called before every attempt of the request."""
+
+    def post_response(self, metrics: RequestMetrics) -> None:
+        """Called after every attempt of the request, also if it failed."""
+
+    def pre_deserialize(self, metrics: RequestMetrics) -> None:
+        """Called before the response is deserialized."""
+
+    def post_deserialize(self, metrics: RequestMetrics) -> None:
+        """Called after the response is deserialized."""
+
+    def instrument_request(self, request: Callable, metrics: RequestMetrics) -> Callable:
+        """Wraps `ApiClient.request` to call the request hooks."""
+        def instrumented_request(method: str, url: str, **kwargs):
+            token = self._start_attempt(metrics)
+            try:
+                response = request(method, url, **kwargs)
+                metrics.status = response.status
+                metrics.bytes_in = response_size(response, kwargs.get('_preload_content', True))
+                return response
+            except BaseException as e:
+                self._fail_attempt(metrics, e)
+                raise
+            finally:
+                self._end_attempt(metrics, token)
+
+        return instrumented_request
+
+    def instrument_request_async(self, request: Callable, metrics: RequestMetrics) -> Callable:
+        """Wraps `AsyncRESTClientObject.request` to call the request hooks."""
+        async def instrumented_request(method: str, url: str, **kwargs):
+            token = self._start_attempt(metrics)
+            try:
+                response = await request(method, url, **kwargs)
+                metrics.status = response.status
+                metrics.bytes_in = response_size(response, kwargs.get('_preload_content', True))
+                return response
+            except BaseException as e:
+                self._fail_attempt(metrics, e)
+                raise
+            finally:
+                self._end_attempt(metrics, token)
+
+        return instrumented_request
+
+    def _start_attempt(self, metrics: RequestMetrics):
+        metrics.attempt += 1
+        if metrics.attempt > 1:
+            metrics.pool_wait = 0.0
+        (metrics.status, metrics.error, metrics.bytes_out, metrics.bytes_in) = (None, None, 0, None)
+        self.pre_request(metrics)
+        metrics.lap()
+        return _current_metrics.set(metrics)
+
+    @staticmethod
+    def _fail_attempt(metrics: RequestMetrics, error: BaseException) -> None:
+        metrics.error = error
+        if isinstance(error, ApiException):
+            (metrics.status, metrics.bytes_in) = (error.status, len(error.body or b""))
+
+    def _end_attempt(self, metrics: RequestMetrics, token) -> None:
+        metrics.network_time = metrics.lap()
+        _current_metrics.reset(token)
+        self.post_response(metrics)
+
+    def deserialize(self, deserialize: Callable, response, response_type, metrics: RequestMetrics):
+        """Calls `ApiClient.deserialize` with the deserialization hooks."""
+        self.pre_deserialize(metrics)
+        token = _current_metrics.set(metrics)
+        metrics.lap()
+        try:
+            return deserialize(response, response_type)
+        finally:
+            # `ApiClient.deserialize` laps when the body is decoded
+            metrics.validation_time = metrics.lap()
+            _current_metrics.reset(token)
+            self.post_deserialize(metrics)
+
+    def __deepcopy__(self, memo) -> 'Instrumentation':
+        # copies of a `Configuration` share the instrumentation
+        return self
+
+
+class CombinedInstrumentation(Instrumentation):
+    """Calls the hooks of several instrumentations in order."""
+
+    def __init__(self, *instrumentations: Instrumentation) -> None:
+        self.instrumentations = instrumentations
+
+    def pre_request(self, metrics: RequestMetrics) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.pre_request(metrics)
+
+    def post_response(self, metrics: RequestMetrics) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.post_response(metrics)
+
+    def pre_deserialize(self, metrics: RequestMetrics) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.pre_deserialize(metrics)
+
+    def post_deserialize(self, metrics: RequestMetrics) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.post_deserialize(metrics)
+
+
+class Histogram:
+    """Counts of observations in buckets with the upper bounds `buckets`."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        """Returns the number of observations up to each bound, the last bound is infinity."""
+        (counts, total) = ([], 0)
+        for (bound, count) in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            counts.append((bound, total))
+        return counts
+
+    def copy(self) -> 'Histogram':
+        histogram = Histogram(self.buckets)
+        (histogram.counts, histogram.count, histogram.sum) = (list(self.counts), self.count, self.sum)
+        return histogram
+
+
+class MetricsCollector(Instrumentation):
+    """Counters and histograms per operation.
+
+    :param time_buckets: bucket bounds of the time histograms in seconds.
+    :param size_buckets: bucket bounds of the size histograms in bytes.
+    """
+
+    HISTOGRAMS = {
+        'network_seconds': "Time of requests until their response is read.",
+        'pool_wait_seconds': "Time requests waited for a thread of the client.",
+        'decode_seconds': "Time to parse response bodies.",
+        'validation_seconds': "Time to build models from parsed response bodies.",
+        'request_bytes': "Size of encoded request bodies.",
+        'response_bytes': "Size of decoded response bodies.",
+    }
+
+    def __init__(self, time_buckets: Sequence[float] = TIME_BUCKETS,
+                 size_buckets: Sequence[float] = SIZE_BUCKETS) -> None:
+        self.time_buckets = tuple(time_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self._requests: Dict[Tuple[str, int], int] = {}
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def post_response(self, metrics: RequestMetrics) -> None:
+        operation = metrics.operation or 'unknown'
+        with self._lock:
+            key = (operation, metrics.status or 0)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._observe('network_seconds', operation, metrics.network_time)
+            self._observe('pool_wait_seconds', operation, metrics.pool_wait)
+            self._observe('request_bytes', operation, metrics.bytes_out)
+            if metrics.bytes_in is not None:
+                self._observe('response_bytes', operation, metrics.bytes_in)
+
+    def post_deserialize(self, metrics: RequestMetrics) -> None:
+        operation = metrics.operation or 'unknown'
+        with self._lock:
+            self._observe('decode_seconds', operation, metrics.decode_time)
+            self._observe('validation_seconds', operation, metrics.validation_time)
+
+    def _observe(self, name: str, operation: str, value: float) -> None:
+        histogram = self._histograms.get((name, operation))
+        if histogram is None:
+            histogram = Histogram(self.size_buckets if name.endswith('_bytes') else self.time_buckets)
+            self._histograms[(name, operation)] = histogram
+        histogram.observe(value)
+
+    def requests(self) -> Dict[Tuple[str, int], int]:
+        """Returns the number of requests per operation and status, 0 for connection errors."""
+        with self._lock:
+            return dict(self._requests)
+
+    def histogram(self, name: str, operation: str) -> Histogram:
+        """Returns a copy of a histogram of an operation.
+
+        :param name: one of `MetricsCollector.HISTOGRAMS`.
+        """
+        with self._lock:
+            histogram = self._histograms.get((name, operation))
+            if histogram is None:
+                return Histogram(self.size_buckets if name.endswith('_bytes') else self.time_buckets)
+            return histogram.copy()
+
+    def to_prometheus(self, prefix: str = 'geoengine_client') -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            requests = sorted(self._requests.items())
+            histograms = {key: histogram.copy() for (key, histogram) in self._histograms.items()}
+
+        lines = [
+            f"# HELP {prefix}_requests_total Requests by operation and response status.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        for ((operation, status), count) in requests:
+            lines.append(f'{prefix}_requests_total{{operation="{_escape(operation)}",status="{status}"}} {count}')
+
+        for (name, description) in self.HISTOGRAMS.items():
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for ((histogram_name, operation), histogram) in sorted(histograms.items()):
+                if histogram_name != name:
+                    continue
+                label = f'operation="{_escape(operation)}"'
+                for (bound, count) in histogram.cumulative_counts():
+                    lines.append(f'{prefix}_{name}_bucket{{{label},le="{_format_bound(bound)}"}} {count}')
+                lines.append(f'{prefix}_{name}_sum{{{label}}} {histogram.sum}')
+                lines.append(f'{prefix}_{name}_count{{{label}}} {histogram.count}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_bound(bound: float) -> str:
+    if bound == float('inf'):
+        return "+Inf"
+    return repr(bound)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Records requests and deserializations as OpenTelemetry spans.
+
+    Spans are children of the current span. A request span is recorded for
+    every attempt, following the semantic conventions for HTTP clients.
+
+    :param tracer: the tracer, by default the tracer of the global provider.
+    """
+
+    def __init__(self, tracer=None) -> None:
+        if trace is None:
+            raise ImportError(
+                "The OpenTelemetry instrumentation requires `opentelemetry-api`. "
+                "Install it with `pip install opentelemetry-api`.")
+        self.tracer = tracer if tracer is not None else trace.get_tracer(__name__)
+
+    def pre_request(self, metrics: RequestMetrics) -> None:
+        attributes = {
+            'http.request.method': metrics.method,
+            'url.full': metrics.url,
+            'geoengine.operation': metrics.operation or 'unknown',
+        }
+        if metrics.attempt > 1:
+            attributes['http.request.resend_count'] = metrics.attempt - 1
+        metrics.state[(self, 'request')] = self.tracer.start_span(
+            metrics.method, kind=SpanKind.CLIENT, attributes=attributes)
+
+    def post_response(self, metrics: RequestMetrics) -> None:
+        span = metrics.state.pop((self, 'request'))
+        if metrics.status:
+            span.set_attribute('http.response.status_code', metrics.status)
+        span.set_attribute('http.request.body.size', metrics.bytes_out)
+        if metrics.bytes_in is not None:
+            span.set_attribute('http.response.body.size', metrics.bytes_in)
+        span.set_attribute('geoengine.pool_wait', metrics.pool_wait)
+        if metrics.error is not None:
+            span.record_exception(metrics.error)
+            span.set_attribute('error.type', str(metrics.status) if metrics.status else type(metrics.error).__name__)
+            span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+    def pre_deserialize(self, metrics: RequestMetrics) -> None:
+        metrics.state[(self, 'deserialize')] = self.tracer.start_span(
+            f"deserialize {metrics.operation or 'unknown'}",
+            attributes={'geoengine.operation': metrics.operation or 'unknown'})
+
+    def post_deserialize(self, metrics: RequestMetrics) -> None:
+        span = metrics.state.pop((self, 'deserialize'))
+        span.set_attribute('geoengine.decode_time', metrics.decode_time)
+        span.set_attribute('geoengine.validation_time', metrics.validation_time)
+        span.end()
@@ -0,0 +1,81 @@
+# coding: utf-8
+
+"""
+    JSON codecs for request and response bodies.
+
+    `Configuration.json_codec` encodes request bodies and decodes response
+    bodies. It defaults to `StdlibJsonCodec`. The faster `OrjsonCodec` is
+    opt-in, since `orjson` differs from the `json` module for some documents,
+    see `OrjsonCodec`. Codecs decode UTF-8 encoded bytes directly, so response
+    bodies are not decoded to `str` first.
+
+    >>> from geoengine_openapi_client.json_codec import OrjsonCodec
+    >>> configuration.json_codec = OrjsonCodec()
+"""  # noqa: E501
+
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class JsonCodec:
+    """Interface of a JSON codec."""
+
+    name = None
+
+    def dumps(self, obj: Any) -> Union[str, bytes]:
+        """Encodes an object of JSON types."""
+        raise NotImplementedError()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes a JSON document.
+
+        :raises ValueError: if `data` is not valid JSON.
+        """
+        raise NotImplementedError()
+
+    def __deepcopy__(self, memo):
+        # codecs are stateless, so they can be shared between configurations
+        return self
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Codec using the `json` module of the standard library."""
+
+    name = 'json'
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec using `orjson`, which encodes to and decodes from bytes.
+
+    Unlike the `json` module, `orjson` rejects `NaN` and `Infinity` when
+    decoding and encodes them as `null`, and it only supports integers of
+    up to 64 bits.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "The `orjson` codec requires `orjson`. "
+                "Install it with `pip install orjson`.")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # `orjson.JSONDecodeError` is a subclass of `ValueError`
+        return orjson.loads(data)
+
@@ -0,0 +1,39 @@
+# coding: utf-8
+
+"""
+    Lazy loading of package attributes.
+
+    Importing all models and APIs eagerly constructs hundreds of pydantic
+    classes. The package `__init__` modules instead resolve these names on
+    first access via a module-level `__getattr__` (PEP 562).
+"""  # noqa: E501
+
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(module_name: str, lazy_imports: Dict[str, str]
+                    ) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Creates `__getattr__` and `__dir__` functions for a module.
+
+    :param module_name: the `__name__` of the module.
+    :param lazy_imports: maps attribute names to the modules defining them.
+    :return: the `__getattr__` and `__dir__` functions of the module.
+    """
+
+    def __getattr__(name: str) -> Any:
+        defining_module = lazy_imports.get(name)
+        if defining_module is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(defining_module), name)
+        # cache the value so that `__getattr__` is not called again
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(lazy_imports))
+
+    return __getattr__, __dir__
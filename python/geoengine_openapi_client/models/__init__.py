@@ -14,236 +14,478 @@
 """  # noqa: E501
 
 
+# Note: import apis and models lazily on first access
+from typing import TYPE_CHECKING
+from geoengine_openapi_client.lazy_imports import lazy_attributes
+
 # import models into model package
-from geoengine_openapi_client.models.aborted_task_status import AbortedTaskStatus
-from geoengine_openapi_client.models.add_collection200_response import AddCollection200Response
-from geoengine_openapi_client.models.add_dataset import AddDataset
-from geoengine_openapi_client.models.add_layer import AddLayer
-from geoengine_openapi_client.models.add_layer_collection import AddLayerCollection
-from geoengine_openapi_client.models.add_role import AddRole
-from geoengine_openapi_client.models.auth_code_request_url import AuthCodeRequestURL
-from geoengine_openapi_client.models.auth_code_response import AuthCodeResponse
-from geoengine_openapi_client.models.auto_create_dataset import AutoCreateDataset
-from geoengine_openapi_client.models.auto_ogr_source_time_format import AutoOgrSourceTimeFormat
-from geoengine_openapi_client.models.axis_order import AxisOrder
-from geoengine_openapi_client.models.bounding_box2_d import BoundingBox2D
-from geoengine_openapi_client.models.breakpoint import Breakpoint
-from geoengine_openapi_client.models.classification_measurement import ClassificationMeasurement
-from geoengine_openapi_client.models.classification_measurement_with_type import ClassificationMeasurementWithType
-from geoengine_openapi_client.models.collection_item import CollectionItem
-from geoengine_openapi_client.models.collection_type import CollectionType
-from geoengine_openapi_client.models.color_param import ColorParam
-from geoengine_openapi_client.models.colorizer import Colorizer
-from geoengine_openapi_client.models.completed_task_status import CompletedTaskStatus
-from geoengine_openapi_client.models.continuous_measurement import ContinuousMeasurement
-from geoengine_openapi_client.models.continuous_measurement_with_type import ContinuousMeasurementWithType
-from geoengine_openapi_client.models.coordinate2_d import Coordinate2D
-from geoengine_openapi_client.models.create_dataset import CreateDataset
-from geoengine_openapi_client.models.create_dataset_handler200_response import CreateDatasetHandler200Response
-from geoengine_openapi_client.models.create_project import CreateProject
-from geoengine_openapi_client.models.csv_header import CsvHeader
-from geoengine_openapi_client.models.custom_ogr_source_time_format import CustomOgrSourceTimeFormat
-from geoengine_openapi_client.models.data_id import DataId
-from geoengine_openapi_client.models.data_path import DataPath
-from geoengine_openapi_client.models.data_path_one_of import DataPathOneOf
-from geoengine_openapi_client.models.data_path_one_of1 import DataPathOneOf1
-from geoengine_openapi_client.models.dataset import Dataset
-from geoengine_openapi_client.models.dataset_definition import DatasetDefinition
-from geoengine_openapi_client.models.dataset_id_resource_id import DatasetIdResourceId
-from geoengine_openapi_client.models.dataset_listing import DatasetListing
-from geoengine_openapi_client.models.dataset_resource import DatasetResource
-from geoengine_openapi_client.models.date_time import DateTime
-from geoengine_openapi_client.models.date_time_parse_format import DateTimeParseFormat
-from geoengine_openapi_client.models.derived_color import DerivedColor
-from geoengine_openapi_client.models.derived_color_with_type import DerivedColorWithType
-from geoengine_openapi_client.models.derived_number import DerivedNumber
-from geoengine_openapi_client.models.derived_number_with_type import DerivedNumberWithType
-from geoengine_openapi_client.models.describe_coverage_request import DescribeCoverageRequest
-from geoengine_openapi_client.models.error_response import ErrorResponse
-from geoengine_openapi_client.models.external_data_id import ExternalDataId
-from geoengine_openapi_client.models.external_data_id_with_type import ExternalDataIdWithType
-from geoengine_openapi_client.models.failed_task_status import FailedTaskStatus
-from geoengine_openapi_client.models.feature_data_type import FeatureDataType
-from geoengine_openapi_client.models.file_not_found_handling import FileNotFoundHandling
-from geoengine_openapi_client.models.format_specifics import FormatSpecifics
-from geoengine_openapi_client.models.format_specifics_one_of import FormatSpecificsOneOf
-from geoengine_openapi_client.models.format_specifics_one_of_csv import FormatSpecificsOneOfCsv
-from geoengine_openapi_client.models.gdal_dataset_geo_transform import GdalDatasetGeoTransform
-from geoengine_openapi_client.models.gdal_dataset_parameters import GdalDatasetParameters
-from geoengine_openapi_client.models.gdal_loading_info_temporal_slice import GdalLoadingInfoTemporalSlice
-from geoengine_openapi_client.models.gdal_meta_data_list import GdalMetaDataList
-from geoengine_openapi_client.models.gdal_meta_data_list_with_type import GdalMetaDataListWithType
-from geoengine_openapi_client.models.gdal_meta_data_regular import GdalMetaDataRegular
-from geoengine_openapi_client.models.gdal_meta_data_regular_with_type import GdalMetaDataRegularWithType
-from geoengine_openapi_client.models.gdal_meta_data_static import GdalMetaDataStatic
-from geoengine_openapi_client.models.gdal_meta_data_static_with_type import GdalMetaDataStaticWithType
-from geoengine_openapi_client.models.gdal_metadata_mapping import GdalMetadataMapping
-from geoengine_openapi_client.models.gdal_metadata_net_cdf_cf import GdalMetadataNetCdfCf
-from geoengine_openapi_client.models.gdal_metadata_net_cdf_cf_with_type import GdalMetadataNetCdfCfWithType
-from geoengine_openapi_client.models.gdal_source_time_placeholder import GdalSourceTimePlaceholder
-from geoengine_openapi_client.models.geo_json import GeoJson
-from geoengine_openapi_client.models.get_capabilities_format import GetCapabilitiesFormat
-from geoengine_openapi_client.models.get_capabilities_request import GetCapabilitiesRequest
-from geoengine_openapi_client.models.get_coverage_format import GetCoverageFormat
-from geoengine_openapi_client.models.get_coverage_request import GetCoverageRequest
-from geoengine_openapi_client.models.get_feature_request import GetFeatureRequest
-from geoengine_openapi_client.models.get_legend_graphic_request import GetLegendGraphicRequest
-from geoengine_openapi_client.models.get_map_exception_format import GetMapExceptionFormat
-from geoengine_openapi_client.models.get_map_format import GetMapFormat
-from geoengine_openapi_client.models.get_map_request import GetMapRequest
-from geoengine_openapi_client.models.infinite_ogr_source_duration_spec import InfiniteOgrSourceDurationSpec
-from geoengine_openapi_client.models.internal_data_id import InternalDataId
-from geoengine_openapi_client.models.layer import Layer
-from geoengine_openapi_client.models.layer_collection import LayerCollection
-from geoengine_openapi_client.models.layer_collection_listing import LayerCollectionListing
-from geoengine_openapi_client.models.layer_collection_listing_with_type import LayerCollectionListingWithType
-from geoengine_openapi_client.models.layer_collection_resource import LayerCollectionResource
-from geoengine_openapi_client.models.layer_collection_resource_id import LayerCollectionResourceId
-from geoengine_openapi_client.models.layer_listing import LayerListing
-from geoengine_openapi_client.models.layer_listing_with_type import LayerListingWithType
-from geoengine_openapi_client.models.layer_resource import LayerResource
-from geoengine_openapi_client.models.layer_resource_id import LayerResourceId
-from geoengine_openapi_client.models.layer_update import LayerUpdate
-from geoengine_openapi_client.models.layer_visibility import LayerVisibility
-from geoengine_openapi_client.models.line_symbology import LineSymbology
-from geoengine_openapi_client.models.line_symbology_with_type import LineSymbologyWithType
-from geoengine_openapi_client.models.linear_gradient import LinearGradient
-from geoengine_openapi_client.models.linear_gradient_with_type import LinearGradientWithType
-from geoengine_openapi_client.models.logarithmic_gradient import LogarithmicGradient
-from geoengine_openapi_client.models.logarithmic_gradient_with_type import LogarithmicGradientWithType
-from geoengine_openapi_client.models.measurement import Measurement
-from geoengine_openapi_client.models.meta_data_definition import MetaDataDefinition
-from geoengine_openapi_client.models.meta_data_suggestion import MetaDataSuggestion
-from geoengine_openapi_client.models.mock_dataset_data_source_loading_info import MockDatasetDataSourceLoadingInfo
-from geoengine_openapi_client.models.mock_meta_data import MockMetaData
-from geoengine_openapi_client.models.mock_meta_data_with_type import MockMetaDataWithType
-from geoengine_openapi_client.models.model_id_resource_id import ModelIdResourceId
-from geoengine_openapi_client.models.multi_line_string import MultiLineString
-from geoengine_openapi_client.models.multi_point import MultiPoint
-from geoengine_openapi_client.models.multi_polygon import MultiPolygon
-from geoengine_openapi_client.models.none_ogr_source_dataset_time_type import NoneOgrSourceDatasetTimeType
-from geoengine_openapi_client.models.number_param import NumberParam
-from geoengine_openapi_client.models.ogr_meta_data import OgrMetaData
-from geoengine_openapi_client.models.ogr_meta_data_with_type import OgrMetaDataWithType
-from geoengine_openapi_client.models.ogr_source_column_spec import OgrSourceColumnSpec
-from geoengine_openapi_client.models.ogr_source_dataset import OgrSourceDataset
-from geoengine_openapi_client.models.ogr_source_dataset_time_type import OgrSourceDatasetTimeType
-from geoengine_openapi_client.models.ogr_source_duration_spec import OgrSourceDurationSpec
-from geoengine_openapi_client.models.ogr_source_error_spec import OgrSourceErrorSpec
-from geoengine_openapi_client.models.ogr_source_time_format import OgrSourceTimeFormat
-from geoengine_openapi_client.models.order_by import OrderBy
-from geoengine_openapi_client.models.palette_colorizer import PaletteColorizer
-from geoengine_openapi_client.models.permission import Permission
-from geoengine_openapi_client.models.permission_list_options import PermissionListOptions
-from geoengine_openapi_client.models.permission_listing import PermissionListing
-from geoengine_openapi_client.models.permission_request import PermissionRequest
-from geoengine_openapi_client.models.plot import Plot
-from geoengine_openapi_client.models.plot_output_format import PlotOutputFormat
-from geoengine_openapi_client.models.plot_query_rectangle import PlotQueryRectangle
-from geoengine_openapi_client.models.plot_result_descriptor import PlotResultDescriptor
-from geoengine_openapi_client.models.plot_result_descriptor_with_type import PlotResultDescriptorWithType
-from geoengine_openapi_client.models.plot_update import PlotUpdate
-from geoengine_openapi_client.models.point_symbology import PointSymbology
-from geoengine_openapi_client.models.point_symbology_with_type import PointSymbologyWithType
-from geoengine_openapi_client.models.polygon_symbology import PolygonSymbology
-from geoengine_openapi_client.models.polygon_symbology_with_type import PolygonSymbologyWithType
-from geoengine_openapi_client.models.project import Project
-from geoengine_openapi_client.models.project_layer import ProjectLayer
-from geoengine_openapi_client.models.project_listing import ProjectListing
-from geoengine_openapi_client.models.project_resource import ProjectResource
-from geoengine_openapi_client.models.project_resource_id import ProjectResourceId
-from geoengine_openapi_client.models.project_update_token import ProjectUpdateToken
-from geoengine_openapi_client.models.project_version import ProjectVersion
-from geoengine_openapi_client.models.provenance import Provenance
-from geoengine_openapi_client.models.provenance_entry import ProvenanceEntry
-from geoengine_openapi_client.models.provenance_output import ProvenanceOutput
-from geoengine_openapi_client.models.provenances import Provenances
-from geoengine_openapi_client.models.provider_capabilities import ProviderCapabilities
-from geoengine_openapi_client.models.provider_layer_collection_id import ProviderLayerCollectionId
-from geoengine_openapi_client.models.provider_layer_id import ProviderLayerId
-from geoengine_openapi_client.models.quota import Quota
-from geoengine_openapi_client.models.raster_band_descriptor import RasterBandDescriptor
-from geoengine_openapi_client.models.raster_colorizer import RasterColorizer
-from geoengine_openapi_client.models.raster_data_type import RasterDataType
-from geoengine_openapi_client.models.raster_dataset_from_workflow import RasterDatasetFromWorkflow
-from geoengine_openapi_client.models.raster_dataset_from_workflow_result import RasterDatasetFromWorkflowResult
-from geoengine_openapi_client.models.raster_properties_entry_type import RasterPropertiesEntryType
-from geoengine_openapi_client.models.raster_properties_key import RasterPropertiesKey
-from geoengine_openapi_client.models.raster_query_rectangle import RasterQueryRectangle
-from geoengine_openapi_client.models.raster_result_descriptor import RasterResultDescriptor
-from geoengine_openapi_client.models.raster_result_descriptor_with_type import RasterResultDescriptorWithType
-from geoengine_openapi_client.models.raster_stream_websocket_result_type import RasterStreamWebsocketResultType
-from geoengine_openapi_client.models.raster_symbology import RasterSymbology
-from geoengine_openapi_client.models.raster_symbology_with_type import RasterSymbologyWithType
-from geoengine_openapi_client.models.resource import Resource
-from geoengine_openapi_client.models.resource_id import ResourceId
-from geoengine_openapi_client.models.rgba_colorizer import RgbaColorizer
-from geoengine_openapi_client.models.role import Role
-from geoengine_openapi_client.models.role_description import RoleDescription
-from geoengine_openapi_client.models.running_task_status import RunningTaskStatus
-from geoengine_openapi_client.models.st_rectangle import STRectangle
-from geoengine_openapi_client.models.search_capabilities import SearchCapabilities
-from geoengine_openapi_client.models.search_type import SearchType
-from geoengine_openapi_client.models.search_types import SearchTypes
-from geoengine_openapi_client.models.server_info import ServerInfo
-from geoengine_openapi_client.models.single_band_raster_colorizer import SingleBandRasterColorizer
-from geoengine_openapi_client.models.spatial_partition2_d import SpatialPartition2D
-from geoengine_openapi_client.models.spatial_reference_authority import SpatialReferenceAuthority
-from geoengine_openapi_client.models.spatial_reference_specification import SpatialReferenceSpecification
-from geoengine_openapi_client.models.spatial_resolution import SpatialResolution
-from geoengine_openapi_client.models.start_duration_ogr_source_dataset_time_type import StartDurationOgrSourceDatasetTimeType
-from geoengine_openapi_client.models.start_end_ogr_source_dataset_time_type import StartEndOgrSourceDatasetTimeType
-from geoengine_openapi_client.models.start_ogr_source_dataset_time_type import StartOgrSourceDatasetTimeType
-from geoengine_openapi_client.models.static_color_param import StaticColorParam
-from geoengine_openapi_client.models.static_number_param import StaticNumberParam
-from geoengine_openapi_client.models.stroke_param import StrokeParam
-from geoengine_openapi_client.models.suggest_meta_data import SuggestMetaData
-from geoengine_openapi_client.models.symbology import Symbology
-from geoengine_openapi_client.models.task_abort_options import TaskAbortOptions
-from geoengine_openapi_client.models.task_filter import TaskFilter
-from geoengine_openapi_client.models.task_list_options import TaskListOptions
-from geoengine_openapi_client.models.task_response import TaskResponse
-from geoengine_openapi_client.models.task_status import TaskStatus
-from geoengine_openapi_client.models.task_status_with_id import TaskStatusWithId
-from geoengine_openapi_client.models.text_symbology import TextSymbology
-from geoengine_openapi_client.models.time_granularity import TimeGranularity
-from geoengine_openapi_client.models.time_interval import TimeInterval
-from geoengine_openapi_client.models.time_reference import TimeReference
-from geoengine_openapi_client.models.time_step import TimeStep
-from geoengine_openapi_client.models.time_step_with_type import TimeStepWithType
-from geoengine_openapi_client.models.typed_geometry import TypedGeometry
-from geoengine_openapi_client.models.typed_geometry_one_of import TypedGeometryOneOf
-from geoengine_openapi_client.models.typed_geometry_one_of1 import TypedGeometryOneOf1
-from geoengine_openapi_client.models.typed_geometry_one_of2 import TypedGeometryOneOf2
-from geoengine_openapi_client.models.typed_geometry_one_of3 import TypedGeometryOneOf3
-from geoengine_openapi_client.models.typed_operator import TypedOperator
-from geoengine_openapi_client.models.typed_operator_operator import TypedOperatorOperator
-from geoengine_openapi_client.models.typed_result_descriptor import TypedResultDescriptor
-from geoengine_openapi_client.models.unitless_measurement import UnitlessMeasurement
-from geoengine_openapi_client.models.unix_time_stamp_ogr_source_time_format import UnixTimeStampOgrSourceTimeFormat
-from geoengine_openapi_client.models.unix_time_stamp_type import UnixTimeStampType
-from geoengine_openapi_client.models.update_dataset import UpdateDataset
-from geoengine_openapi_client.models.update_project import UpdateProject
-from geoengine_openapi_client.models.update_quota import UpdateQuota
-from geoengine_openapi_client.models.upload_file_layers_response import UploadFileLayersResponse
-from geoengine_openapi_client.models.upload_files_response import UploadFilesResponse
-from geoengine_openapi_client.models.user_credentials import UserCredentials
-from geoengine_openapi_client.models.user_info import UserInfo
-from geoengine_openapi_client.models.user_registration import UserRegistration
-from geoengine_openapi_client.models.user_session import UserSession
-from geoengine_openapi_client.models.vector_column_info import VectorColumnInfo
-from geoengine_openapi_client.models.vector_data_type import VectorDataType
-from geoengine_openapi_client.models.vector_query_rectangle import VectorQueryRectangle
-from geoengine_openapi_client.models.vector_result_descriptor import VectorResultDescriptor
-from geoengine_openapi_client.models.vector_result_descriptor_with_type import VectorResultDescriptorWithType
-from geoengine_openapi_client.models.volume import Volume
-from geoengine_openapi_client.models.wcs_boundingbox import WcsBoundingbox
-from geoengine_openapi_client.models.wcs_service import WcsService
-from geoengine_openapi_client.models.wcs_version import WcsVersion
-from geoengine_openapi_client.models.wfs_service import WfsService
-from geoengine_openapi_client.models.wfs_version import WfsVersion
-from geoengine_openapi_client.models.wms_service import WmsService
-from geoengine_openapi_client.models.wms_version import WmsVersion
-from geoengine_openapi_client.models.workflow import Workflow
-from geoengine_openapi_client.models.wrapped_plot_output import WrappedPlotOutput
-from geoengine_openapi_client.models.zero_ogr_source_duration_spec import ZeroOgrSourceDurationSpec
+if TYPE_CHECKING:
+    from geoengine_openapi_client.models.aborted_task_status import AbortedTaskStatus
+    from geoengine_openapi_client.models.add_collection200_response import AddCollection200Response
+    from geoengine_openapi_client.models.add_dataset import AddDataset
+    from geoengine_openapi_client.models.add_layer import AddLayer
+    from geoengine_openapi_client.models.add_layer_collection import AddLayerCollection
+    from geoengine_openapi_client.models.add_role import AddRole
+    from geoengine_openapi_client.models.auth_code_request_url import AuthCodeRequestURL
+    from geoengine_openapi_client.models.auth_code_response import AuthCodeResponse
+    from geoengine_openapi_client.models.auto_create_dataset import AutoCreateDataset
+    from geoengine_openapi_client.models.auto_ogr_source_time_format import AutoOgrSourceTimeFormat
+    from geoengine_openapi_client.models.axis_order import AxisOrder
+    from geoengine_openapi_client.models.bounding_box2_d import BoundingBox2D
+    from geoengine_openapi_client.models.breakpoint import Breakpoint
+    from geoengine_openapi_client.models.classification_measurement import ClassificationMeasurement
+    from geoengine_openapi_client.models.classification_measurement_with_type import ClassificationMeasurementWithType
+    from geoengine_openapi_client.models.collection_item import CollectionItem
+    from geoengine_openapi_client.models.collection_type import CollectionType
+    from geoengine_openapi_client.models.color_param import ColorParam
+    from geoengine_openapi_client.models.colorizer import Colorizer
+    from geoengine_openapi_client.models.completed_task_status import CompletedTaskStatus
+    from geoengine_openapi_client.models.continuous_measurement import ContinuousMeasurement
+    from geoengine_openapi_client.models.continuous_measurement_with_type import ContinuousMeasurementWithType
+    from geoengine_openapi_client.models.coordinate2_d import Coordinate2D
+    from geoengine_openapi_client.models.create_dataset import CreateDataset
+    from geoengine_openapi_client.models.create_dataset_handler200_response import CreateDatasetHandler200Response
+    from geoengine_openapi_client.models.create_project import CreateProject
+    from geoengine_openapi_client.models.csv_header import CsvHeader
+    from geoengine_openapi_client.models.custom_ogr_source_time_format import CustomOgrSourceTimeFormat
+    from geoengine_openapi_client.models.data_id import DataId
+    from geoengine_openapi_client.models.data_path import DataPath
+    from geoengine_openapi_client.models.data_path_one_of import DataPathOneOf
+    from geoengine_openapi_client.models.data_path_one_of1 import DataPathOneOf1
+    from geoengine_openapi_client.models.dataset import Dataset
+    from geoengine_openapi_client.models.dataset_definition import DatasetDefinition
+    from geoengine_openapi_client.models.dataset_id_resource_id import DatasetIdResourceId
+    from geoengine_openapi_client.models.dataset_listing import DatasetListing
+    from geoengine_openapi_client.models.dataset_resource import DatasetResource
+    from geoengine_openapi_client.models.date_time import DateTime
+    from geoengine_openapi_client.models.date_time_parse_format import DateTimeParseFormat
+    from geoengine_openapi_client.models.derived_color import DerivedColor
+    from geoengine_openapi_client.models.derived_color_with_type import DerivedColorWithType
+    from geoengine_openapi_client.models.derived_number import DerivedNumber
+    from geoengine_openapi_client.models.derived_number_with_type import DerivedNumberWithType
+    from geoengine_openapi_client.models.describe_coverage_request import DescribeCoverageRequest
+    from geoengine_openapi_client.models.error_response import ErrorResponse
+    from geoengine_openapi_client.models.external_data_id import ExternalDataId
+    from geoengine_openapi_client.models.external_data_id_with_type import ExternalDataIdWithType
+    from geoengine_openapi_client.models.failed_task_status import FailedTaskStatus
+    from geoengine_openapi_client.models.feature_data_type import FeatureDataType
+    from geoengine_openapi_client.models.file_not_found_handling import FileNotFoundHandling
+    from geoengine_openapi_client.models.format_specifics import FormatSpecifics
+    from geoengine_openapi_client.models.format_specifics_one_of import FormatSpecificsOneOf
+    from geoengine_openapi_client.models.format_specifics_one_of_csv import FormatSpecificsOneOfCsv
+    from geoengine_openapi_client.models.gdal_dataset_geo_transform import GdalDatasetGeoTransform
+    from geoengine_openapi_client.models.gdal_dataset_parameters import GdalDatasetParameters
+    from geoengine_openapi_client.models.gdal_loading_info_temporal_slice import GdalLoadingInfoTemporalSlice
+    from geoengine_openapi_client.models.gdal_meta_data_list import GdalMetaDataList
+    from geoengine_openapi_client.models.gdal_meta_data_list_with_type import GdalMetaDataListWithType
+    from geoengine_openapi_client.models.gdal_meta_data_regular import GdalMetaDataRegular
+    from geoengine_openapi_client.models.gdal_meta_data_regular_with_type import GdalMetaDataRegularWithType
+    from geoengine_openapi_client.models.gdal_meta_data_static import GdalMetaDataStatic
+    from geoengine_openapi_client.models.gdal_meta_data_static_with_type import GdalMetaDataStaticWithType
+    from geoengine_openapi_client.models.gdal_metadata_mapping import GdalMetadataMapping
+    from geoengine_openapi_client.models.gdal_metadata_net_cdf_cf import GdalMetadataNetCdfCf
+    from geoengine_openapi_client.models.gdal_metadata_net_cdf_cf_with_type import GdalMetadataNetCdfCfWithType
+    from geoengine_openapi_client.models.gdal_source_time_placeholder import GdalSourceTimePlaceholder
+    from geoengine_openapi_client.models.geo_json import GeoJson
+    from geoengine_openapi_client.models.get_capabilities_format import GetCapabilitiesFormat
+    from geoengine_openapi_client.models.get_capabilities_request import GetCapabilitiesRequest
+    from geoengine_openapi_client.models.get_coverage_format import GetCoverageFormat
+    from geoengine_openapi_client.models.get_coverage_request import GetCoverageRequest
+    from geoengine_openapi_client.models.get_feature_request import GetFeatureRequest
+    from geoengine_openapi_client.models.get_legend_graphic_request import GetLegendGraphicRequest
+    from geoengine_openapi_client.models.get_map_exception_format import GetMapExceptionFormat
+    from geoengine_openapi_client.models.get_map_format import GetMapFormat
+    from geoengine_openapi_client.models.get_map_request import GetMapRequest
+    from geoengine_openapi_client.models.infinite_ogr_source_duration_spec import InfiniteOgrSourceDurationSpec
+    from geoengine_openapi_client.models.internal_data_id import InternalDataId
+    from geoengine_openapi_client.models.layer import Layer
+    from geoengine_openapi_client.models.layer_collection import LayerCollection
+    from geoengine_openapi_client.models.layer_collection_listing import LayerCollectionListing
+    from geoengine_openapi_client.models.layer_collection_listing_with_type import LayerCollectionListingWithType
+    from geoengine_openapi_client.models.layer_collection_resource import LayerCollectionResource
+    from geoengine_openapi_client.models.layer_collection_resource_id import LayerCollectionResourceId
+    from geoengine_openapi_client.models.layer_listing import LayerListing
+    from geoengine_openapi_client.models.layer_listing_with_type import LayerListingWithType
+    from geoengine_openapi_client.models.layer_resource import LayerResource
+    from geoengine_openapi_client.models.layer_resource_id import LayerResourceId
+    from geoengine_openapi_client.models.layer_update import LayerUpdate
+    from geoengine_openapi_client.models.layer_visibility import LayerVisibility
+    from geoengine_openapi_client.models.line_symbology import LineSymbology
+    from geoengine_openapi_client.models.line_symbology_with_type import LineSymbologyWithType
+    from geoengine_openapi_client.models.linear_gradient import LinearGradient
+    from geoengine_openapi_client.models.linear_gradient_with_type import LinearGradientWithType
+    from geoengine_openapi_client.models.logarithmic_gradient import LogarithmicGradient
+    from geoengine_openapi_client.models.logarithmic_gradient_with_type import LogarithmicGradientWithType
+    from geoengine_openapi_client.models.measurement import Measurement
+    from geoengine_openapi_client.models.meta_data_definition import MetaDataDefinition
+    from geoengine_openapi_client.models.meta_data_suggestion import MetaDataSuggestion
+    from geoengine_openapi_client.models.mock_dataset_data_source_loading_info import MockDatasetDataSourceLoadingInfo
+    from geoengine_openapi_client.models.mock_meta_data import MockMetaData
+    from geoengine_openapi_client.models.mock_meta_data_with_type import MockMetaDataWithType
+    from geoengine_openapi_client.models.model_id_resource_id import ModelIdResourceId
+    from geoengine_openapi_client.models.multi_line_string import MultiLineString
+    from geoengine_openapi_client.models.multi_point import MultiPoint
+    from geoengine_openapi_client.models.multi_polygon import MultiPolygon
+    from geoengine_openapi_client.models.none_ogr_source_dataset_time_type import NoneOgrSourceDatasetTimeType
+    from geoengine_openapi_client.models.number_param import NumberParam
+    from geoengine_openapi_client.models.ogr_meta_data import OgrMetaData
+    from geoengine_openapi_client.models.ogr_meta_data_with_type import OgrMetaDataWithType
+    from geoengine_openapi_client.models.ogr_source_column_spec import OgrSourceColumnSpec
+    from geoengine_openapi_client.models.ogr_source_dataset import OgrSourceDataset
+    from geoengine_openapi_client.models.ogr_source_dataset_time_type import OgrSourceDatasetTimeType
+    from geoengine_openapi_client.models.ogr_source_duration_spec import OgrSourceDurationSpec
+    from geoengine_openapi_client.models.ogr_source_error_spec import OgrSourceErrorSpec
+    from geoengine_openapi_client.models.ogr_source_time_format import OgrSourceTimeFormat
+    from geoengine_openapi_client.models.order_by import OrderBy
+    from geoengine_openapi_client.models.palette_colorizer import PaletteColorizer
+    from geoengine_openapi_client.models.permission import Permission
+    from geoengine_openapi_client.models.permission_list_options import PermissionListOptions
+    from geoengine_openapi_client.models.permission_listing import PermissionListing
+    from geoengine_openapi_client.models.permission_request import PermissionRequest
+    from geoengine_openapi_client.models.plot import Plot
+    from geoengine_openapi_client.models.plot_output_format import PlotOutputFormat
+    from geoengine_openapi_client.models.plot_query_rectangle import PlotQueryRectangle
+    from geoengine_openapi_client.models.plot_result_descriptor import PlotResultDescriptor
+    from geoengine_openapi_client.models.plot_result_descriptor_with_type import PlotResultDescriptorWithType
+    from geoengine_openapi_client.models.plot_update import PlotUpdate
+    from geoengine_openapi_client.models.point_symbology import PointSymbology
+    from geoengine_openapi_client.models.point_symbology_with_type import PointSymbologyWithType
+    from geoengine_openapi_client.models.polygon_symbology import PolygonSymbology
+    from geoengine_openapi_client.models.polygon_symbology_with_type import PolygonSymbologyWithType
+    from geoengine_openapi_client.models.project import Project
+    from geoengine_openapi_client.models.project_layer import ProjectLayer
+    from geoengine_openapi_client.models.project_listing import ProjectListing
+    from geoengine_openapi_client.models.project_resource import ProjectResource
+    from geoengine_openapi_client.models.project_resource_id import ProjectResourceId
+    from geoengine_openapi_client.models.project_update_token import ProjectUpdateToken
+    from geoengine_openapi_client.models.project_version import ProjectVersion
+    from geoengine_openapi_client.models.provenance import Provenance
+    from geoengine_openapi_client.models.provenance_entry import ProvenanceEntry
+    from geoengine_openapi_client.models.provenance_output import ProvenanceOutput
+    from geoengine_openapi_client.models.provenances import Provenances
+    from geoengine_openapi_client.models.provider_capabilities import ProviderCapabilities
+    from geoengine_openapi_client.models.provider_layer_collection_id import ProviderLayerCollectionId
+    from geoengine_openapi_client.models.provider_layer_id import ProviderLayerId
+    from geoengine_openapi_client.models.quota import Quota
+    from geoengine_openapi_client.models.raster_band_descriptor import RasterBandDescriptor
+    from geoengine_openapi_client.models.raster_colorizer import RasterColorizer
+    from geoengine_openapi_client.models.raster_data_type import RasterDataType
+    from geoengine_openapi_client.models.raster_dataset_from_workflow import RasterDatasetFromWorkflow
+    from geoengine_openapi_client.models.raster_dataset_from_workflow_result import RasterDatasetFromWorkflowResult
+    from geoengine_openapi_client.models.raster_properties_entry_type import RasterPropertiesEntryType
+    from geoengine_openapi_client.models.raster_properties_key import RasterPropertiesKey
+    from geoengine_openapi_client.models.raster_query_rectangle import RasterQueryRectangle
+    from geoengine_openapi_client.models.raster_result_descriptor import RasterResultDescriptor
+    from geoengine_openapi_client.models.raster_result_descriptor_with_type import RasterResultDescriptorWithType
+    from geoengine_openapi_client.models.raster_stream_websocket_result_type import RasterStreamWebsocketResultType
+    from geoengine_openapi_client.models.raster_symbology import RasterSymbology
+    from geoengine_openapi_client.models.raster_symbology_with_type import RasterSymbologyWithType
+    from geoengine_openapi_client.models.resource import Resource
+    from geoengine_openapi_client.models.resource_id import ResourceId
+    from geoengine_openapi_client.models.rgba_colorizer import RgbaColorizer
+    from geoengine_openapi_client.models.role import Role
+    from geoengine_openapi_client.models.role_description import RoleDescription
+    from geoengine_openapi_client.models.running_task_status import RunningTaskStatus
+    from geoengine_openapi_client.models.st_rectangle import STRectangle
+    from geoengine_openapi_client.models.search_capabilities import SearchCapabilities
+    from geoengine_openapi_client.models.search_type import SearchType
+    from geoengine_openapi_client.models.search_types import SearchTypes
+    from geoengine_openapi_client.models.server_info import ServerInfo
+    from geoengine_openapi_client.models.single_band_raster_colorizer import SingleBandRasterColorizer
+    from geoengine_openapi_client.models.spatial_partition2_d import SpatialPartition2D
+    from geoengine_openapi_client.models.spatial_reference_authority import SpatialReferenceAuthority
+    from geoengine_openapi_client.models.spatial_reference_specification import SpatialReferenceSpecification
+    from geoengine_openapi_client.models.spatial_resolution import SpatialResolution
+    from geoengine_openapi_client.models.start_duration_ogr_source_dataset_time_type import StartDurationOgrSourceDatasetTimeType
+    from geoengine_openapi_client.models.start_end_ogr_source_dataset_time_type import StartEndOgrSourceDatasetTimeType
+    from geoengine_openapi_client.models.start_ogr_source_dataset_time_type import StartOgrSourceDatasetTimeType
+    from geoengine_openapi_client.models.static_color_param import StaticColorParam
+    from geoengine_openapi_client.models.static_number_param import StaticNumberParam
+    from geoengine_openapi_client.models.stroke_param import StrokeParam
+    from geoengine_openapi_client.models.suggest_meta_data import SuggestMetaData
+    from geoengine_openapi_client.models.symbology import Symbology
+    from geoengine_openapi_client.models.task_abort_options import TaskAbortOptions
+    from geoengine_openapi_client.models.task_filter import TaskFilter
+    from geoengine_openapi_client.models.task_list_options import TaskListOptions
+    from geoengine_openapi_client.models.task_response import TaskResponse
+    from geoengine_openapi_client.models.task_status import TaskStatus
+    from geoengine_openapi_client.models.task_status_with_id import TaskStatusWithId
+    from geoengine_openapi_client.models.text_symbology import TextSymbology
+    from geoengine_openapi_client.models.time_granularity import TimeGranularity
+    from geoengine_openapi_client.models.time_interval import TimeInterval
+    from geoengine_openapi_client.models.time_reference import TimeReference
+    from geoengine_openapi_client.models.time_step import TimeStep
+    from geoengine_openapi_client.models.time_step_with_type import TimeStepWithType
+    from geoengine_openapi_client.models.typed_geometry import TypedGeometry
+    from geoengine_openapi_client.models.typed_geometry_one_of import TypedGeometryOneOf
+    from geoengine_openapi_client.models.typed_geometry_one_of1 import TypedGeometryOneOf1
+    from geoengine_openapi_client.models.typed_geometry_one_of2 import TypedGeometryOneOf2
+    from geoengine_openapi_client.models.typed_geometry_one_of3 import TypedGeometryOneOf3
+    from geoengine_openapi_client.models.typed_operator import TypedOperator
+    from geoengine_openapi_client.models.typed_operator_operator import TypedOperatorOperator
+    from geoengine_openapi_client.models.typed_result_descriptor import TypedResultDescriptor
+    from geoengine_openapi_client.models.unitless_measurement import UnitlessMeasurement
+    from geoengine_openapi_client.models.unix_time_stamp_ogr_source_time_format import UnixTimeStampOgrSourceTimeFormat
+    from geoengine_openapi_client.models.unix_time_stamp_type import UnixTimeStampType
+    from geoengine_openapi_client.models.update_dataset import UpdateDataset
+    from geoengine_openapi_client.models.update_project import UpdateProject
+    from geoengine_openapi_client.models.update_quota import UpdateQuota
+    from geoengine_openapi_client.models.upload_file_layers_response import UploadFileLayersResponse
+    from geoengine_openapi_client.models.upload_files_response import UploadFilesResponse
+    from geoengine_openapi_client.models.user_credentials import UserCredentials
+    from geoengine_openapi_client.models.user_info import UserInfo
+    from geoengine_openapi_client.models.user_registration import UserRegistration
+    from geoengine_openapi_client.models.user_session import UserSession
+    from geoengine_openapi_client.models.vector_column_info import VectorColumnInfo
+    from geoengine_openapi_client.models.vector_data_type import VectorDataType
+    from geoengine_openapi_client.models.vector_query_rectangle import VectorQueryRectangle
+    from geoengine_openapi_client.models.vector_result_descriptor import VectorResultDescriptor
+    from geoengine_openapi_client.models.vector_result_descriptor_with_type import VectorResultDescriptorWithType
+    from geoengine_openapi_client.models.volume import Volume
+    from geoengine_openapi_client.models.wcs_boundingbox import WcsBoundingbox
+    from geoengine_openapi_client.models.wcs_service import WcsService
+    from geoengine_openapi_client.models.wcs_version import WcsVersion
+    from geoengine_openapi_client.models.wfs_service import WfsService
+    from geoengine_openapi_client.models.wfs_version import WfsVersion
+    from geoengine_openapi_client.models.wms_service import WmsService
+    from geoengine_openapi_client.models.wms_version import WmsVersion
+    from geoengine_openapi_client.models.workflow import Workflow
+    from geoengine_openapi_client.models.wrapped_plot_output import WrappedPlotOutput
+    from geoengine_openapi_client.models.zero_ogr_source_duration_spec import ZeroOgrSourceDurationSpec
+
+# Note: import apis and models lazily on first access
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "AbortedTaskStatus": "geoengine_openapi_client.models.aborted_task_status",
+    "AddCollection200Response": "geoengine_openapi_client.models.add_collection200_response",
+    "AddDataset": "geoengine_openapi_client.models.add_dataset",
+    "AddLayer": "geoengine_openapi_client.models.add_layer",
+    "AddLayerCollection": "geoengine_openapi_client.models.add_layer_collection",
+    "AddRole": "geoengine_openapi_client.models.add_role",
+    "AuthCodeRequestURL": "geoengine_openapi_client.models.auth_code_request_url",
+    "AuthCodeResponse": "geoengine_openapi_client.models.auth_code_response",
+    "AutoCreateDataset": "geoengine_openapi_client.models.auto_create_dataset",
+    "AutoOgrSourceTimeFormat": "geoengine_openapi_client.models.auto_ogr_source_time_format",
+    "AxisOrder": "geoengine_openapi_client.models.axis_order",
+    "BoundingBox2D": "geoengine_openapi_client.models.bounding_box2_d",
+    "Breakpoint": "geoengine_openapi_client.models.breakpoint",
+    "ClassificationMeasurement": "geoengine_openapi_client.models.classification_measurement",
+    "ClassificationMeasurementWithType": "geoengine_openapi_client.models.classification_measurement_with_type",
+    "CollectionItem": "geoengine_openapi_client.models.collection_item",
+    "CollectionType": "geoengine_openapi_client.models.collection_type",
+    "ColorParam": "geoengine_openapi_client.models.color_param",
+    "Colorizer": "geoengine_openapi_client.models.colorizer",
+    "CompletedTaskStatus": "geoengine_openapi_client.models.completed_task_status",
+    "ContinuousMeasurement": "geoengine_openapi_client.models.continuous_measurement",
+    "ContinuousMeasurementWithType": "geoengine_openapi_client.models.continuous_measurement_with_type",
+    "Coordinate2D": "geoengine_openapi_client.models.coordinate2_d",
+    "CreateDataset": "geoengine_openapi_client.models.create_dataset",
+    "CreateDatasetHandler200Response": "geoengine_openapi_client.models.create_dataset_handler200_response",
+    "CreateProject": "geoengine_openapi_client.models.create_project",
+    "CsvHeader": "geoengine_openapi_client.models.csv_header",
+    "CustomOgrSourceTimeFormat": "geoengine_openapi_client.models.custom_ogr_source_time_format",
+    "DataId": "geoengine_openapi_client.models.data_id",
+    "DataPath": "geoengine_openapi_client.models.data_path",
+    "DataPathOneOf": "geoengine_openapi_client.models.data_path_one_of",
+    "DataPathOneOf1": "geoengine_openapi_client.models.data_path_one_of1",
+    "Dataset": "geoengine_openapi_client.models.dataset",
+    "DatasetDefinition": "geoengine_openapi_client.models.dataset_definition",
+    "DatasetIdResourceId": "geoengine_openapi_client.models.dataset_id_resource_id",
+    "DatasetListing": "geoengine_openapi_client.models.dataset_listing",
+    "DatasetResource": "geoengine_openapi_client.models.dataset_resource",
+    "DateTime": "geoengine_openapi_client.models.date_time",
+    "DateTimeParseFormat": "geoengine_openapi_client.models.date_time_parse_format",
+    "DerivedColor": "geoengine_openapi_client.models.derived_color",
+    "DerivedColorWithType": "geoengine_openapi_client.models.derived_color_with_type",
+    "DerivedNumber": "geoengine_openapi_client.models.derived_number",
+    "DerivedNumberWithType": "geoengine_openapi_client.models.derived_number_with_type",
+    "DescribeCoverageRequest": "geoengine_openapi_client.models.describe_coverage_request",
+    "ErrorResponse": "geoengine_openapi_client.models.error_response",
+    "ExternalDataId": "geoengine_openapi_client.models.external_data_id",
+    "ExternalDataIdWithType": "geoengine_openapi_client.models.external_data_id_with_type",
+    "FailedTaskStatus": "geoengine_openapi_client.models.failed_task_status",
+    "FeatureDataType": "geoengine_openapi_client.models.feature_data_type",
+    "FileNotFoundHandling": "geoengine_openapi_client.models.file_not_found_handling",
+    "FormatSpecifics": "geoengine_openapi_client.models.format_specifics",
+    "FormatSpecificsOneOf": "geoengine_openapi_client.models.format_specifics_one_of",
+    "FormatSpecificsOneOfCsv": "geoengine_openapi_client.models.format_specifics_one_of_csv",
+    "GdalDatasetGeoTransform": "geoengine_openapi_client.models.gdal_dataset_geo_transform",
+    "GdalDatasetParameters": "geoengine_openapi_client.models.gdal_dataset_parameters",
+    "GdalLoadingInfoTemporalSlice": "geoengine_openapi_client.models.gdal_loading_info_temporal_slice",
+    "GdalMetaDataList": "geoengine_openapi_client.models.gdal_meta_data_list",
+    "GdalMetaDataListWithType": "geoengine_openapi_client.models.gdal_meta_data_list_with_type",
+    "GdalMetaDataRegular": "geoengine_openapi_client.models.gdal_meta_data_regular",
+    "GdalMetaDataRegularWithType": "geoengine_openapi_client.models.gdal_meta_data_regular_with_type",
+    "GdalMetaDataStatic": "geoengine_openapi_client.models.gdal_meta_data_static",
+    "GdalMetaDataStaticWithType": "geoengine_openapi_client.models.gdal_meta_data_static_with_type",
+    "GdalMetadataMapping": "geoengine_openapi_client.models.gdal_metadata_mapping",
+    "GdalMetadataNetCdfCf": "geoengine_openapi_client.models.gdal_metadata_net_cdf_cf",
+    "GdalMetadataNetCdfCfWithType": "geoengine_openapi_client.models.gdal_metadata_net_cdf_cf_with_type",
+    "GdalSourceTimePlaceholder": "geoengine_openapi_client.models.gdal_source_time_placeholder",
+    "GeoJson": "geoengine_openapi_client.models.geo_json",
+    "GetCapabilitiesFormat": "geoengine_openapi_client.models.get_capabilities_format",
+    "GetCapabilitiesRequest": "geoengine_openapi_client.models.get_capabilities_request",
+    "GetCoverageFormat": "geoengine_openapi_client.models.get_coverage_format",
+    "GetCoverageRequest": "geoengine_openapi_client.models.get_coverage_request",
+    "GetFeatureRequest": "geoengine_openapi_client.models.get_feature_request",
+    "GetLegendGraphicRequest": "geoengine_openapi_client.models.get_legend_graphic_request",
+    "GetMapExceptionFormat": "geoengine_openapi_client.models.get_map_exception_format",
+    "GetMapFormat": "geoengine_openapi_client.models.get_map_format",
+    "GetMapRequest": "geoengine_openapi_client.models.get_map_request",
+    "InfiniteOgrSourceDurationSpec": "geoengine_openapi_client.models.infinite_ogr_source_duration_spec",
+    "InternalDataId": "geoengine_openapi_client.models.internal_data_id",
+    "Layer": "geoengine_openapi_client.models.layer",
+    "LayerCollection": "geoengine_openapi_client.models.layer_collection",
+    "LayerCollectionListing": "geoengine_openapi_client.models.layer_collection_listing",
+    "LayerCollectionListingWithType": "geoengine_openapi_client.models.layer_collection_listing_with_type",
+    "LayerCollectionResource": "geoengine_openapi_client.models.layer_collection_resource",
+    "LayerCollectionResourceId": "geoengine_openapi_client.models.layer_collection_resource_id",
+    "LayerListing": "geoengine_openapi_client.models.layer_listing",
+    "LayerListingWithType": "geoengine_openapi_client.models.layer_listing_with_type",
+    "LayerResource": "geoengine_openapi_client.models.layer_resource",
+    "LayerResourceId": "geoengine_openapi_client.models.layer_resource_id",
+    "LayerUpdate": "geoengine_openapi_client.models.layer_update",
+    "LayerVisibility": "geoengine_openapi_client.models.layer_visibility",
+    "LineSymbology": "geoengine_openapi_client.models.line_symbology",
+    "LineSymbologyWithType": "geoengine_openapi_client.models.line_symbology_with_type",
+    "LinearGradient": "geoengine_openapi_client.models.linear_gradient",
+    "LinearGradientWithType": "geoengine_openapi_client.models.linear_gradient_with_type",
+    "LogarithmicGradient": "geoengine_openapi_client.models.logarithmic_gradient",
+    "LogarithmicGradientWithType": "geoengine_openapi_client.models.logarithmic_gradient_with_type",
+    "Measurement": "geoengine_openapi_client.models.measurement",
+    "MetaDataDefinition": "geoengine_openapi_client.models.meta_data_definition",
+    "MetaDataSuggestion": "geoengine_openapi_client.models.meta_data_suggestion",
+    "MockDatasetDataSourceLoadingInfo": "geoengine_openapi_client.models.mock_dataset_data_source_loading_info",
+    "MockMetaData": "geoengine_openapi_client.models.mock_meta_data",
+    "MockMetaDataWithType": "geoengine_openapi_client.models.mock_meta_data_with_type",
+    "ModelIdResourceId": "geoengine_openapi_client.models.model_id_resource_id",
+    "MultiLineString": "geoengine_openapi_client.models.multi_line_string",
+    "MultiPoint": "geoengine_openapi_client.models.multi_point",
+    "MultiPolygon": "geoengine_openapi_client.models.multi_polygon",
+    "NoneOgrSourceDatasetTimeType": "geoengine_openapi_client.models.none_ogr_source_dataset_time_type",
+    "NumberParam": "geoengine_openapi_client.models.number_param",
+    "OgrMetaData": "geoengine_openapi_client.models.ogr_meta_data",
+    "OgrMetaDataWithType": "geoengine_openapi_client.models.ogr_meta_data_with_type",
+    "OgrSourceColumnSpec": "geoengine_openapi_client.models.ogr_source_column_spec",
+    "OgrSourceDataset": "geoengine_openapi_client.models.ogr_source_dataset",
+    "OgrSourceDatasetTimeType": "geoengine_openapi_client.models.ogr_source_dataset_time_type",
+    "OgrSourceDurationSpec": "geoengine_openapi_client.models.ogr_source_duration_spec",
+    "OgrSourceErrorSpec": "geoengine_openapi_client.models.ogr_source_error_spec",
+    "OgrSourceTimeFormat": "geoengine_openapi_client.models.ogr_source_time_format",
+    "OrderBy": "geoengine_openapi_client.models.order_by",
+    "PaletteColorizer": "geoengine_openapi_client.models.palette_colorizer",
+    "Permission": "geoengine_openapi_client.models.permission",
+    "PermissionListOptions": "geoengine_openapi_client.models.permission_list_options",
+    "PermissionListing": "geoengine_openapi_client.models.permission_listing",
+    "PermissionRequest": "geoengine_openapi_client.models.permission_request",
+    "Plot": "geoengine_openapi_client.models.plot",
+    "PlotOutputFormat": "geoengine_openapi_client.models.plot_output_format",
+    "PlotQueryRectangle": "geoengine_openapi_client.models.plot_query_rectangle",
+    "PlotResultDescriptor": "geoengine_openapi_client.models.plot_result_descriptor",
+    "PlotResultDescriptorWithType": "geoengine_openapi_client.models.plot_result_descriptor_with_type",
+    "PlotUpdate": "geoengine_openapi_client.models.plot_update",
+    "PointSymbology": "geoengine_openapi_client.models.point_symbology",
+    "PointSymbologyWithType": "geoengine_openapi_client.models.point_symbology_with_type",
+    "PolygonSymbology": "geoengine_openapi_client.models.polygon_symbology",
+    "PolygonSymbologyWithType": "geoengine_openapi_client.models.polygon_symbology_with_type",
+    "Project": "geoengine_openapi_client.models.project",
+    "ProjectLayer": "geoengine_openapi_client.models.project_layer",
+    "ProjectListing": "geoengine_openapi_client.models.project_listing",
+    "ProjectResource": "geoengine_openapi_client.models.project_resource",
+    "ProjectResourceId": "geoengine_openapi_client.models.project_resource_id",
+    "ProjectUpdateToken": "geoengine_openapi_client.models.project_update_token",
+    "ProjectVersion": "geoengine_openapi_client.models.project_version",
+    "Provenance": "geoengine_openapi_client.models.provenance",
+    "ProvenanceEntry": "geoengine_openapi_client.models.provenance_entry",
+    "ProvenanceOutput": "geoengine_openapi_client.models.provenance_output",
+    "Provenances": "geoengine_openapi_client.models.provenances",
+    "ProviderCapabilities": "geoengine_openapi_client.models.provider_capabilities",
+    "ProviderLayerCollectionId": "geoengine_openapi_client.models.provider_layer_collection_id",
+    "ProviderLayerId": "geoengine_openapi_client.models.provider_layer_id",
+    "Quota": "geoengine_openapi_client.models.quota",
+    "RasterBandDescriptor": "geoengine_openapi_client.models.raster_band_descriptor",
+    "RasterColorizer": "geoengine_openapi_client.models.raster_colorizer",
+    "RasterDataType": "geoengine_openapi_client.models.raster_data_type",
+    "RasterDatasetFromWorkflow": "geoengine_openapi_client.models.raster_dataset_from_workflow",
+    "RasterDatasetFromWorkflowResult": "geoengine_openapi_client.models.raster_dataset_from_workflow_result",
+    "RasterPropertiesEntryType": "geoengine_openapi_client.models.raster_properties_entry_type",
+    "RasterPropertiesKey": "geoengine_openapi_client.models.raster_properties_key",
+    "RasterQueryRectangle": "geoengine_openapi_client.models.raster_query_rectangle",
+    "RasterResultDescriptor": "geoengine_openapi_client.models.raster_result_descriptor",
+    "RasterResultDescriptorWithType": "geoengine_openapi_client.models.raster_result_descriptor_with_type",
+    "RasterStreamWebsocketResultType": "geoengine_openapi_client.models.raster_stream_websocket_result_type",
+    "RasterSymbology": "geoengine_openapi_client.models.raster_symbology",
+    "RasterSymbologyWithType": "geoengine_openapi_client.models.raster_symbology_with_type",
+    "Resource": "geoengine_openapi_client.models.resource",
+    "ResourceId": "geoengine_openapi_client.models.resource_id",
+    "RgbaColorizer": "geoengine_openapi_client.models.rgba_colorizer",
+    "Role": "geoengine_openapi_client.models.role",
+    "RoleDescription": "geoengine_openapi_client.models.role_description",
+    "RunningTaskStatus": "geoengine_openapi_client.models.running_task_status",
+    "STRectangle": "geoengine_openapi_client.models.st_rectangle",
+    "SearchCapabilities": "geoengine_openapi_client.models.search_capabilities",
+    "SearchType": "geoengine_openapi_client.models.search_type",
+    "SearchTypes": "geoengine_openapi_client.models.search_types",
+    "ServerInfo": "geoengine_openapi_client.models.server_info",
+    "SingleBandRasterColorizer": "geoengine_openapi_client.models.single_band_raster_colorizer",
+    "SpatialPartition2D": "geoengine_openapi_client.models.spatial_partition2_d",
+    "SpatialReferenceAuthority": "geoengine_openapi_client.models.spatial_reference_authority",
+    "SpatialReferenceSpecification": "geoengine_openapi_client.models.spatial_reference_specification",
+    "SpatialResolution": "geoengine_openapi_client.models.spatial_resolution",
+    "StartDurationOgrSourceDatasetTimeType": "geoengine_openapi_client.models.start_duration_ogr_source_dataset_time_type",
+    "StartEndOgrSourceDatasetTimeType": "geoengine_openapi_client.models.start_end_ogr_source_dataset_time_type",
+    "StartOgrSourceDatasetTimeType": "geoengine_openapi_client.models.start_ogr_source_dataset_time_type",
+    "StaticColorParam": "geoengine_openapi_client.models.static_color_param",
+    "StaticNumberParam": "geoengine_openapi_client.models.static_number_param",
+    "StrokeParam": "geoengine_openapi_client.models.stroke_param",
+    "SuggestMetaData": "geoengine_openapi_client.models.suggest_meta_data",
+    "Symbology": "geoengine_openapi_client.models.symbology",
+    "TaskAbortOptions": "geoengine_openapi_client.models.task_abort_options",
+    "TaskFilter": "geoengine_openapi_client.models.task_filter",
+    "TaskListOptions": "geoengine_openapi_client.models.task_list_options",
+    "TaskResponse": "geoengine_openapi_client.models.task_response",
+    "TaskStatus": "geoengine_openapi_client.models.task_status",
+    "TaskStatusWithId": "geoengine_openapi_client.models.task_status_with_id",
+    "TextSymbology": "geoengine_openapi_client.models.text_symbology",
+    "TimeGranularity": "geoengine_openapi_client.models.time_granularity",
+    "TimeInterval": "geoengine_openapi_client.models.time_interval",
+    "TimeReference": "geoengine_openapi_client.models.time_reference",
+    "TimeStep": "geoengine_openapi_client.models.time_step",
+    "TimeStepWithType": "geoengine_openapi_client.models.time_step_with_type",
+    "TypedGeometry": "geoengine_openapi_client.models.typed_geometry",
+    "TypedGeometryOneOf": "geoengine_openapi_client.models.typed_geometry_one_of",
+    "TypedGeometryOneOf1": "geoengine_openapi_client.models.typed_geometry_one_of1",
+    "TypedGeometryOneOf2": "geoengine_openapi_client.models.typed_geometry_one_of2",
+    "TypedGeometryOneOf3": "geoengine_openapi_client.models.typed_geometry_one_of3",
+    "TypedOperator": "geoengine_openapi_client.models.typed_operator",
+    "TypedOperatorOperator": "geoengine_openapi_client.models.typed_operator_operator",
+    "TypedResultDescriptor": "geoengine_openapi_client.models.typed_result_descriptor",
+    "UnitlessMeasurement": "geoengine_openapi_client.models.unitless_measurement",
+    "UnixTimeStampOgrSourceTimeFormat": "geoengine_openapi_client.models.unix_time_stamp_ogr_source_time_format",
+    "UnixTimeStampType": "geoengine_openapi_client.models.unix_time_stamp_type",
+    "UpdateDataset": "geoengine_openapi_client.models.update_dataset",
+    "UpdateProject": "geoengine_openapi_client.models.update_project",
+    "UpdateQuota": "geoengine_openapi_client.models.update_quota",
+    "UploadFileLayersResponse": "geoengine_openapi_client.models.upload_file_layers_response",
+    "UploadFilesResponse": "geoengine_openapi_client.models.upload_files_response",
+    "UserCredentials": "geoengine_openapi_client.models.user_credentials",
+    "UserInfo": "geoengine_openapi_client.models.user_info",
+    "UserRegistration": "geoengine_openapi_client.models.user_registration",
+    "UserSession": "geoengine_openapi_client.models.user_session",
+    "VectorColumnInfo": "geoengine_openapi_client.models.vector_column_info",
+    "VectorDataType": "geoengine_openapi_client.models.vector_data_type",
+    "VectorQueryRectangle": "geoengine_openapi_client.models.vector_query_rectangle",
+    "VectorResultDescriptor": "geoengine_openapi_client.models.vector_result_descriptor",
+    "VectorResultDescriptorWithType": "geoengine_openapi_client.models.vector_result_descriptor_with_type",
+    "Volume": "geoengine_openapi_client.models.volume",
+    "WcsBoundingbox": "geoengine_openapi_client.models.wcs_boundingbox",
+    "WcsService": "geoengine_openapi_client.models.wcs_service",
+    "WcsVersion": "geoengine_openapi_client.models.wcs_version",
+    "WfsService": "geoengine_openapi_client.models.wfs_service",
+    "WfsVersion": "geoengine_openapi_client.models.wfs_version",
+    "WmsService": "geoengine_openapi_client.models.wms_service",
+    "WmsVersion": "geoengine_openapi_client.models.wms_version",
+    "Workflow": "geoengine_openapi_client.models.workflow",
+    "WrappedPlotOutput": "geoengine_openapi_client.models.wrapped_plot_output",
+    "ZeroOgrSourceDurationSpec": "geoengine_openapi_client.models.zero_ogr_source_duration_spec",
+})
+__all__ = [name for name in __dir__() if not name.startswith('_')]
@@ -25,9 +25,24 @@ from geoengine_openapi_client.models.layer_collection_listing_with_type import L
 from geoengine_openapi_client.models.layer_listing_with_type import LayerListingWithType
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 COLLECTIONITEM_ONE_OF_SCHEMAS = ["LayerCollectionListingWithType", "LayerListingWithType"]
 
+# Note: lookup table for deserializing without trying every schema
+COLLECTIONITEM_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "CollectionItem",
+    [LayerCollectionListingWithType, LayerListingWithType],
+    discriminator="type",
+    mapping={
+        "LayerCollectionListingWithType": LayerCollectionListingWithType,
+        "LayerListingWithType": LayerListingWithType,
+        "collection": LayerCollectionListingWithType,
+        "layer": LayerListingWithType,
+    },
+)
+
 class CollectionItem(BaseModel):
     """
     CollectionItem
@@ -84,61 +99,14 @@ class CollectionItem(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> CollectionItem:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return COLLECTIONITEM_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> CollectionItem:
         """Returns the object represented by the json string"""
-        instance = CollectionItem.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `LayerCollectionListingWithType`
-        if _data_type == "LayerCollectionListingWithType":
-            instance.actual_instance = LayerCollectionListingWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerListingWithType`
-        if _data_type == "LayerListingWithType":
-            instance.actual_instance = LayerListingWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerCollectionListingWithType`
-        if _data_type == "collection":
-            instance.actual_instance = LayerCollectionListingWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerListingWithType`
-        if _data_type == "layer":
-            instance.actual_instance = LayerListingWithType.from_json(json_str)
-            return instance
-
-        # deserialize data into LayerCollectionListingWithType
-        try:
-            instance.actual_instance = LayerCollectionListingWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into LayerListingWithType
-        try:
-            instance.actual_instance = LayerListingWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into CollectionItem with oneOf schemas: LayerCollectionListingWithType, LayerListingWithType. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into CollectionItem with oneOf schemas: LayerCollectionListingWithType, LayerListingWithType. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
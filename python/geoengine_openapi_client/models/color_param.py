@@ -25,9 +25,24 @@ from geoengine_openapi_client.models.derived_color_with_type import DerivedColor
 from geoengine_openapi_client.models.static_color_param import StaticColorParam
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 COLORPARAM_ONE_OF_SCHEMAS = ["DerivedColorWithType", "StaticColorParam"]
 
+# Note: lookup table for deserializing without trying every schema
+COLORPARAM_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "ColorParam",
+    [StaticColorParam, DerivedColorWithType],
+    discriminator="type",
+    mapping={
+        "DerivedColorWithType": DerivedColorWithType,
+        "StaticColorParam": StaticColorParam,
+        "derived": DerivedColorWithType,
+        "static": StaticColorParam,
+    },
+)
+
 class ColorParam(BaseModel):
     """
     ColorParam
@@ -84,61 +99,14 @@ class ColorParam(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> ColorParam:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return COLORPARAM_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> ColorParam:
         """Returns the object represented by the json string"""
-        instance = ColorParam.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `DerivedColorWithType`
-        if _data_type == "DerivedColorWithType":
-            instance.actual_instance = DerivedColorWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `StaticColorParam`
-        if _data_type == "StaticColorParam":
-            instance.actual_instance = StaticColorParam.from_json(json_str)
-            return instance
-
-        # check if data type is `DerivedColorWithType`
-        if _data_type == "derived":
-            instance.actual_instance = DerivedColorWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `StaticColorParam`
-        if _data_type == "static":
-            instance.actual_instance = StaticColorParam.from_json(json_str)
-            return instance
-
-        # deserialize data into StaticColorParam
-        try:
-            instance.actual_instance = StaticColorParam.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into DerivedColorWithType
-        try:
-            instance.actual_instance = DerivedColorWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into ColorParam with oneOf schemas: DerivedColorWithType, StaticColorParam. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into ColorParam with oneOf schemas: DerivedColorWithType, StaticColorParam. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
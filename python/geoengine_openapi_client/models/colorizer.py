@@ -27,9 +27,28 @@ from geoengine_openapi_client.models.palette_colorizer import PaletteColorizer
 from geoengine_openapi_client.models.rgba_colorizer import RgbaColorizer
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 COLORIZER_ONE_OF_SCHEMAS = ["LinearGradientWithType", "LogarithmicGradientWithType", "PaletteColorizer", "RgbaColorizer"]
 
+# Note: lookup table for deserializing without trying every schema
+COLORIZER_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "Colorizer",
+    [LinearGradientWithType, LogarithmicGradientWithType, PaletteColorizer, RgbaColorizer],
+    discriminator="type",
+    mapping={
+        "LinearGradientWithType": LinearGradientWithType,
+        "LogarithmicGradientWithType": LogarithmicGradientWithType,
+        "PaletteColorizer": PaletteColorizer,
+        "RgbaColorizer": RgbaColorizer,
+        "linearGradient": LinearGradientWithType,
+        "logarithmicGradient": LogarithmicGradientWithType,
+        "palette": PaletteColorizer,
+        "rgba": RgbaColorizer,
+    },
+)
+
 class Colorizer(BaseModel):
     """
     Colorizer
@@ -100,93 +119,14 @@ class Colorizer(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> Colorizer:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return COLORIZER_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> Colorizer:
         """Returns the object represented by the json string"""
-        instance = Colorizer.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `LinearGradientWithType`
-        if _data_type == "LinearGradientWithType":
-            instance.actual_instance = LinearGradientWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `LogarithmicGradientWithType`
-        if _data_type == "LogarithmicGradientWithType":
-            instance.actual_instance = LogarithmicGradientWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `PaletteColorizer`
-        if _data_type == "PaletteColorizer":
-            instance.actual_instance = PaletteColorizer.from_json(json_str)
-            return instance
-
-        # check if data type is `RgbaColorizer`
-        if _data_type == "RgbaColorizer":
-            instance.actual_instance = RgbaColorizer.from_json(json_str)
-            return instance
-
-        # check if data type is `LinearGradientWithType`
-        if _data_type == "linearGradient":
-            instance.actual_instance = LinearGradientWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `LogarithmicGradientWithType`
-        if _data_type == "logarithmicGradient":
-            instance.actual_instance = LogarithmicGradientWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `PaletteColorizer`
-        if _data_type == "palette":
-            instance.actual_instance = PaletteColorizer.from_json(json_str)
-            return instance
-
-        # check if data type is `RgbaColorizer`
-        if _data_type == "rgba":
-            instance.actual_instance = RgbaColorizer.from_json(json_str)
-            return instance
-
-        # deserialize data into LinearGradientWithType
-        try:
-            instance.actual_instance = LinearGradientWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into LogarithmicGradientWithType
-        try:
-            instance.actual_instance = LogarithmicGradientWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into PaletteColorizer
-        try:
-            instance.actual_instance = PaletteColorizer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into RgbaColorizer
-        try:
-            instance.actual_instance = RgbaColorizer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into Colorizer with oneOf schemas: LinearGradientWithType, LogarithmicGradientWithType, PaletteColorizer, RgbaColorizer. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into Colorizer with oneOf schemas: LinearGradientWithType, LogarithmicGradientWithType, PaletteColorizer, RgbaColorizer. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -25,9 +25,24 @@ from geoengine_openapi_client.models.external_data_id_with_type import ExternalD
 from geoengine_openapi_client.models.internal_data_id import InternalDataId
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 DATAID_ONE_OF_SCHEMAS = ["ExternalDataIdWithType", "InternalDataId"]
 
+# Note: lookup table for deserializing without trying every schema
+DATAID_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "DataId",
+    [InternalDataId, ExternalDataIdWithType],
+    discriminator="type",
+    mapping={
+        "ExternalDataIdWithType": ExternalDataIdWithType,
+        "InternalDataId": InternalDataId,
+        "external": ExternalDataIdWithType,
+        "internal": InternalDataId,
+    },
+)
+
 class DataId(BaseModel):
     """
     DataId
@@ -84,61 +99,14 @@ class DataId(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> DataId:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return DATAID_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> DataId:
         """Returns the object represented by the json string"""
-        instance = DataId.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `ExternalDataIdWithType`
-        if _data_type == "ExternalDataIdWithType":
-            instance.actual_instance = ExternalDataIdWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `InternalDataId`
-        if _data_type == "InternalDataId":
-            instance.actual_instance = InternalDataId.from_json(json_str)
-            return instance
-
-        # check if data type is `ExternalDataIdWithType`
-        if _data_type == "external":
-            instance.actual_instance = ExternalDataIdWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `InternalDataId`
-        if _data_type == "internal":
-            instance.actual_instance = InternalDataId.from_json(json_str)
-            return instance
-
-        # deserialize data into InternalDataId
-        try:
-            instance.actual_instance = InternalDataId.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into ExternalDataIdWithType
-        try:
-            instance.actual_instance = ExternalDataIdWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into DataId with oneOf schemas: ExternalDataIdWithType, InternalDataId. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into DataId with oneOf schemas: ExternalDataIdWithType, InternalDataId. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -25,9 +25,17 @@ from geoengine_openapi_client.models.data_path_one_of import DataPathOneOf
 from geoengine_openapi_client.models.data_path_one_of1 import DataPathOneOf1
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 DATAPATH_ONE_OF_SCHEMAS = ["DataPathOneOf", "DataPathOneOf1"]
 
+# Note: lookup table for deserializing without trying every schema
+DATAPATH_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "DataPath",
+    [DataPathOneOf, DataPathOneOf1],
+)
+
 class DataPath(BaseModel):
     """
     DataPath
@@ -81,36 +89,14 @@ class DataPath(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> DataPath:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return DATAPATH_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> DataPath:
         """Returns the object represented by the json string"""
-        instance = DataPath.construct()
-        error_messages = []
-        match = 0
-
-        # deserialize data into DataPathOneOf
-        try:
-            instance.actual_instance = DataPathOneOf.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into DataPathOneOf1
-        try:
-            instance.actual_instance = DataPathOneOf1.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into DataPath with oneOf schemas: DataPathOneOf, DataPathOneOf1. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into DataPath with oneOf schemas: DataPathOneOf, DataPathOneOf1. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
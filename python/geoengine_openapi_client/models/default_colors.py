@@ -25,9 +25,17 @@ from geoengine_openapi_client.models.default_colors_one_of import DefaultColorsO
 from geoengine_openapi_client.models.over_under_colors import OverUnderColors
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 DEFAULTCOLORS_ONE_OF_SCHEMAS = ["DefaultColorsOneOf", "OverUnderColors"]
 
+# Note: lookup table for deserializing without trying every schema
+DEFAULTCOLORS_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "DefaultColors",
+    [DefaultColorsOneOf, OverUnderColors],
+)
+
 class DefaultColors(BaseModel):
     """
     DefaultColors
@@ -81,36 +89,14 @@ class DefaultColors(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> DefaultColors:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return DEFAULTCOLORS_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> DefaultColors:
         """Returns the object represented by the json string"""
-        instance = DefaultColors.construct()
-        error_messages = []
-        match = 0
-
-        # deserialize data into DefaultColorsOneOf
-        try:
-            instance.actual_instance = DefaultColorsOneOf.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into OverUnderColors
-        try:
-            instance.actual_instance = OverUnderColors.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into DefaultColors with oneOf schemas: DefaultColorsOneOf, OverUnderColors. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into DefaultColors with oneOf schemas: DefaultColorsOneOf, OverUnderColors. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -24,9 +24,17 @@ from pydantic import BaseModel, Field, StrictStr, ValidationError, validator
 from geoengine_openapi_client.models.format_specifics_one_of import FormatSpecificsOneOf
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 FORMATSPECIFICS_ONE_OF_SCHEMAS = ["FormatSpecificsOneOf"]
 
+# Note: lookup table for deserializing without trying every schema
+FORMATSPECIFICS_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "FormatSpecifics",
+    [FormatSpecificsOneOf],
+)
+
 class FormatSpecifics(BaseModel):
     """
     FormatSpecifics
@@ -73,30 +81,14 @@ class FormatSpecifics(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> FormatSpecifics:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return FORMATSPECIFICS_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> FormatSpecifics:
         """Returns the object represented by the json string"""
-        instance = FormatSpecifics.construct()
-        error_messages = []
-        match = 0
-
-        # deserialize data into FormatSpecificsOneOf
-        try:
-            instance.actual_instance = FormatSpecificsOneOf.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into FormatSpecifics with oneOf schemas: FormatSpecificsOneOf. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into FormatSpecifics with oneOf schemas: FormatSpecificsOneOf. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -25,9 +25,17 @@ from geoengine_openapi_client.models.project_layer import ProjectLayer
 from geoengine_openapi_client.models.project_update_token import ProjectUpdateToken
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 LAYERUPDATE_ONE_OF_SCHEMAS = ["ProjectLayer", "ProjectUpdateToken"]
 
+# Note: lookup table for deserializing without trying every schema
+LAYERUPDATE_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "LayerUpdate",
+    [ProjectUpdateToken, ProjectLayer],
+)
+
 class LayerUpdate(BaseModel):
     """
     LayerUpdate
@@ -81,36 +89,14 @@ class LayerUpdate(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> LayerUpdate:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return LAYERUPDATE_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> LayerUpdate:
         """Returns the object represented by the json string"""
-        instance = LayerUpdate.construct()
-        error_messages = []
-        match = 0
-
-        # deserialize data into ProjectUpdateToken
-        try:
-            instance.actual_instance = ProjectUpdateToken.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into ProjectLayer
-        try:
-            instance.actual_instance = ProjectLayer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into LayerUpdate with oneOf schemas: ProjectLayer, ProjectUpdateToken. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into LayerUpdate with oneOf schemas: ProjectLayer, ProjectUpdateToken. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -26,9 +26,26 @@ from geoengine_openapi_client.models.continuous_measurement_with_type import Con
 from geoengine_openapi_client.models.unitless_measurement import UnitlessMeasurement
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 MEASUREMENT_ONE_OF_SCHEMAS = ["ClassificationMeasurementWithType", "ContinuousMeasurementWithType", "UnitlessMeasurement"]
 
+# Note: lookup table for deserializing without trying every schema
+MEASUREMENT_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "Measurement",
+    [UnitlessMeasurement, ContinuousMeasurementWithType, ClassificationMeasurementWithType],
+    discriminator="type",
+    mapping={
+        "ClassificationMeasurementWithType": ClassificationMeasurementWithType,
+        "ContinuousMeasurementWithType": ContinuousMeasurementWithType,
+        "UnitlessMeasurement": UnitlessMeasurement,
+        "classification": ClassificationMeasurementWithType,
+        "continuous": ContinuousMeasurementWithType,
+        "unitless": UnitlessMeasurement,
+    },
+)
+
 class Measurement(BaseModel):
     """
     Measurement
@@ -92,77 +109,14 @@ class Measurement(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> Measurement:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return MEASUREMENT_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> Measurement:
         """Returns the object represented by the json string"""
-        instance = Measurement.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `ClassificationMeasurementWithType`
-        if _data_type == "ClassificationMeasurementWithType":
-            instance.actual_instance = ClassificationMeasurementWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `ContinuousMeasurementWithType`
-        if _data_type == "ContinuousMeasurementWithType":
-            instance.actual_instance = ContinuousMeasurementWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `UnitlessMeasurement`
-        if _data_type == "UnitlessMeasurement":
-            instance.actual_instance = UnitlessMeasurement.from_json(json_str)
-            return instance
-
-        # check if data type is `ClassificationMeasurementWithType`
-        if _data_type == "classification":
-            instance.actual_instance = ClassificationMeasurementWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `ContinuousMeasurementWithType`
-        if _data_type == "continuous":
-            instance.actual_instance = ContinuousMeasurementWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `UnitlessMeasurement`
-        if _data_type == "unitless":
-            instance.actual_instance = UnitlessMeasurement.from_json(json_str)
-            return instance
-
-        # deserialize data into UnitlessMeasurement
-        try:
-            instance.actual_instance = UnitlessMeasurement.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into ContinuousMeasurementWithType
-        try:
-            instance.actual_instance = ContinuousMeasurementWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into ClassificationMeasurementWithType
-        try:
-            instance.actual_instance = ClassificationMeasurementWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into Measurement with oneOf schemas: ClassificationMeasurementWithType, ContinuousMeasurementWithType, UnitlessMeasurement. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into Measurement with oneOf schemas: ClassificationMeasurementWithType, ContinuousMeasurementWithType, UnitlessMeasurement. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
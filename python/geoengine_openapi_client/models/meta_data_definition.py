@@ -29,9 +29,32 @@ from geoengine_openapi_client.models.mock_meta_data_with_type import MockMetaDat
 from geoengine_openapi_client.models.ogr_meta_data_with_type import OgrMetaDataWithType
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 METADATADEFINITION_ONE_OF_SCHEMAS = ["GdalMetaDataListWithType", "GdalMetaDataRegularWithType", "GdalMetaDataStaticWithType", "GdalMetadataNetCdfCfWithType", "MockMetaDataWithType", "OgrMetaDataWithType"]
 
+# Note: lookup table for deserializing without trying every schema
+METADATADEFINITION_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "MetaDataDefinition",
+    [MockMetaDataWithType, OgrMetaDataWithType, GdalMetaDataRegularWithType, GdalMetaDataStaticWithType, GdalMetadataNetCdfCfWithType, GdalMetaDataListWithType],
+    discriminator="type",
+    mapping={
+        "GdalMetaDataList": GdalMetaDataListWithType,
+        "GdalMetaDataListWithType": GdalMetaDataListWithType,
+        "GdalMetaDataRegular": GdalMetaDataRegularWithType,
+        "GdalMetaDataRegularWithType": GdalMetaDataRegularWithType,
+        "GdalMetaDataStaticWithType": GdalMetaDataStaticWithType,
+        "GdalMetadataNetCdfCf": GdalMetadataNetCdfCfWithType,
+        "GdalMetadataNetCdfCfWithType": GdalMetadataNetCdfCfWithType,
+        "GdalStatic": GdalMetaDataStaticWithType,
+        "MockMetaData": MockMetaDataWithType,
+        "MockMetaDataWithType": MockMetaDataWithType,
+        "OgrMetaData": OgrMetaDataWithType,
+        "OgrMetaDataWithType": OgrMetaDataWithType,
+    },
+)
+
 class MetaDataDefinition(BaseModel):
     """
     MetaDataDefinition
@@ -116,125 +139,14 @@ class MetaDataDefinition(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> MetaDataDefinition:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return METADATADEFINITION_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> MetaDataDefinition:
         """Returns the object represented by the json string"""
-        instance = MetaDataDefinition.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `GdalMetaDataListWithType`
-        if _data_type == "GdalMetaDataList":
-            instance.actual_instance = GdalMetaDataListWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `GdalMetaDataListWithType`
-        if _data_type == "GdalMetaDataListWithType":
-            instance.actual_instance = GdalMetaDataListWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `GdalMetaDataRegularWithType`
-        if _data_type == "GdalMetaDataRegular":
-            instance.actual_instance = GdalMetaDataRegularWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `GdalMetaDataRegularWithType`
-        if _data_type == "GdalMetaDataRegularWithType":
-            instance.actual_instance = GdalMetaDataRegularWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `GdalMetaDataStaticWithType`
-        if _data_type == "GdalMetaDataStaticWithType":
-            instance.actual_instance = GdalMetaDataStaticWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `GdalMetadataNetCdfCfWithType`
-        if _data_type == "GdalMetadataNetCdfCf":
-            instance.actual_instance = GdalMetadataNetCdfCfWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `GdalMetadataNetCdfCfWithType`
-        if _data_type == "GdalMetadataNetCdfCfWithType":
-            instance.actual_instance = GdalMetadataNetCdfCfWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `GdalMetaDataStaticWithType`
-        if _data_type == "GdalStatic":
-            instance.actual_instance = GdalMetaDataStaticWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `MockMetaDataWithType`
-        if _data_type == "MockMetaData":
-            instance.actual_instance = MockMetaDataWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `MockMetaDataWithType`
-        if _data_type == "MockMetaDataWithType":
-            instance.actual_instance = MockMetaDataWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `OgrMetaDataWithType`
-        if _data_type == "OgrMetaData":
-            instance.actual_instance = OgrMetaDataWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `OgrMetaDataWithType`
-        if _data_type == "OgrMetaDataWithType":
-            instance.actual_instance = OgrMetaDataWithType.from_json(json_str)
-            return instance
-
-        # deserialize data into MockMetaDataWithType
-        try:
-            instance.actual_instance = MockMetaDataWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into OgrMetaDataWithType
-        try:
-            instance.actual_instance = OgrMetaDataWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into GdalMetaDataRegularWithType
-        try:
-            instance.actual_instance = GdalMetaDataRegularWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into GdalMetaDataStaticWithType
-        try:
-            instance.actual_instance = GdalMetaDataStaticWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into GdalMetadataNetCdfCfWithType
-        try:
-            instance.actual_instance = GdalMetadataNetCdfCfWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into GdalMetaDataListWithType
-        try:
-            instance.actual_instance = GdalMetaDataListWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into MetaDataDefinition with oneOf schemas: GdalMetaDataListWithType, GdalMetaDataRegularWithType, GdalMetaDataStaticWithType, GdalMetadataNetCdfCfWithType, MockMetaDataWithType, OgrMetaDataWithType. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into MetaDataDefinition with oneOf schemas: GdalMetaDataListWithType, GdalMetaDataRegularWithType, GdalMetaDataStaticWithType, GdalMetadataNetCdfCfWithType, MockMetaDataWithType, OgrMetaDataWithType. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
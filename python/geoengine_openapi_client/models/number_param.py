@@ -25,9 +25,24 @@ from geoengine_openapi_client.models.derived_number_with_type import DerivedNumb
 from geoengine_openapi_client.models.static_number_param import StaticNumberParam
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 NUMBERPARAM_ONE_OF_SCHEMAS = ["DerivedNumberWithType", "StaticNumberParam"]
 
+# Note: lookup table for deserializing without trying every schema
+NUMBERPARAM_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "NumberParam",
+    [StaticNumberParam, DerivedNumberWithType],
+    discriminator="type",
+    mapping={
+        "DerivedNumberWithType": DerivedNumberWithType,
+        "StaticNumberParam": StaticNumberParam,
+        "derived": DerivedNumberWithType,
+        "static": StaticNumberParam,
+    },
+)
+
 class NumberParam(BaseModel):
     """
     NumberParam
@@ -84,61 +99,14 @@ class NumberParam(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> NumberParam:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return NUMBERPARAM_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> NumberParam:
         """Returns the object represented by the json string"""
-        instance = NumberParam.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `DerivedNumberWithType`
-        if _data_type == "DerivedNumberWithType":
-            instance.actual_instance = DerivedNumberWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `StaticNumberParam`
-        if _data_type == "StaticNumberParam":
-            instance.actual_instance = StaticNumberParam.from_json(json_str)
-            return instance
-
-        # check if data type is `DerivedNumberWithType`
-        if _data_type == "derived":
-            instance.actual_instance = DerivedNumberWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `StaticNumberParam`
-        if _data_type == "static":
-            instance.actual_instance = StaticNumberParam.from_json(json_str)
-            return instance
-
-        # deserialize data into StaticNumberParam
-        try:
-            instance.actual_instance = StaticNumberParam.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into DerivedNumberWithType
-        try:
-            instance.actual_instance = DerivedNumberWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into NumberParam with oneOf schemas: DerivedNumberWithType, StaticNumberParam. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into NumberParam with oneOf schemas: DerivedNumberWithType, StaticNumberParam. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -27,9 +27,28 @@ from geoengine_openapi_client.models.start_end_ogr_source_dataset_time_type impo
 from geoengine_openapi_client.models.start_ogr_source_dataset_time_type import StartOgrSourceDatasetTimeType
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 OGRSOURCEDATASETTIMETYPE_ONE_OF_SCHEMAS = ["NoneOgrSourceDatasetTimeType", "StartDurationOgrSourceDatasetTimeType", "StartEndOgrSourceDatasetTimeType", "StartOgrSourceDatasetTimeType"]
 
+# Note: lookup table for deserializing without trying every schema
+OGRSOURCEDATASETTIMETYPE_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "OgrSourceDatasetTimeType",
+    [NoneOgrSourceDatasetTimeType, StartOgrSourceDatasetTimeType, StartEndOgrSourceDatasetTimeType, StartDurationOgrSourceDatasetTimeType],
+    discriminator="type",
+    mapping={
+        "NoneOgrSourceDatasetTimeType": NoneOgrSourceDatasetTimeType,
+        "StartDurationOgrSourceDatasetTimeType": StartDurationOgrSourceDatasetTimeType,
+        "StartEndOgrSourceDatasetTimeType": StartEndOgrSourceDatasetTimeType,
+        "StartOgrSourceDatasetTimeType": StartOgrSourceDatasetTimeType,
+        "none": NoneOgrSourceDatasetTimeType,
+        "start": StartOgrSourceDatasetTimeType,
+        "startDuration": StartDurationOgrSourceDatasetTimeType,
+        "startEnd": StartEndOgrSourceDatasetTimeType,
+    },
+)
+
 class OgrSourceDatasetTimeType(BaseModel):
     """
     OgrSourceDatasetTimeType
@@ -100,93 +119,14 @@ class OgrSourceDatasetTimeType(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> OgrSourceDatasetTimeType:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return OGRSOURCEDATASETTIMETYPE_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> OgrSourceDatasetTimeType:
         """Returns the object represented by the json string"""
-        instance = OgrSourceDatasetTimeType.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `NoneOgrSourceDatasetTimeType`
-        if _data_type == "NoneOgrSourceDatasetTimeType":
-            instance.actual_instance = NoneOgrSourceDatasetTimeType.from_json(json_str)
-            return instance
-
-        # check if data type is `StartDurationOgrSourceDatasetTimeType`
-        if _data_type == "StartDurationOgrSourceDatasetTimeType":
-            instance.actual_instance = StartDurationOgrSourceDatasetTimeType.from_json(json_str)
-            return instance
-
-        # check if data type is `StartEndOgrSourceDatasetTimeType`
-        if _data_type == "StartEndOgrSourceDatasetTimeType":
-            instance.actual_instance = StartEndOgrSourceDatasetTimeType.from_json(json_str)
-            return instance
-
-        # check if data type is `StartOgrSourceDatasetTimeType`
-        if _data_type == "StartOgrSourceDatasetTimeType":
-            instance.actual_instance = StartOgrSourceDatasetTimeType.from_json(json_str)
-            return instance
-
-        # check if data type is `NoneOgrSourceDatasetTimeType`
-        if _data_type == "none":
-            instance.actual_instance = NoneOgrSourceDatasetTimeType.from_json(json_str)
-            return instance
-
-        # check if data type is `StartOgrSourceDatasetTimeType`
-        if _data_type == "start":
-            instance.actual_instance = StartOgrSourceDatasetTimeType.from_json(json_str)
-            return instance
-
-        # check if data type is `StartDurationOgrSourceDatasetTimeType`
-        if _data_type == "startDuration":
-            instance.actual_instance = StartDurationOgrSourceDatasetTimeType.from_json(json_str)
-            return instance
-
-        # check if data type is `StartEndOgrSourceDatasetTimeType`
-        if _data_type == "startEnd":
-            instance.actual_instance = StartEndOgrSourceDatasetTimeType.from_json(json_str)
-            return instance
-
-        # deserialize data into NoneOgrSourceDatasetTimeType
-        try:
-            instance.actual_instance = NoneOgrSourceDatasetTimeType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into StartOgrSourceDatasetTimeType
-        try:
-            instance.actual_instance = StartOgrSourceDatasetTimeType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into StartEndOgrSourceDatasetTimeType
-        try:
-            instance.actual_instance = StartEndOgrSourceDatasetTimeType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into StartDurationOgrSourceDatasetTimeType
-        try:
-            instance.actual_instance = StartDurationOgrSourceDatasetTimeType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into OgrSourceDatasetTimeType with oneOf schemas: NoneOgrSourceDatasetTimeType, StartDurationOgrSourceDatasetTimeType, StartEndOgrSourceDatasetTimeType, StartOgrSourceDatasetTimeType. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into OgrSourceDatasetTimeType with oneOf schemas: NoneOgrSourceDatasetTimeType, StartDurationOgrSourceDatasetTimeType, StartEndOgrSourceDatasetTimeType, StartOgrSourceDatasetTimeType. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
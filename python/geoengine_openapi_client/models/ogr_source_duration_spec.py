@@ -26,9 +26,26 @@ from geoengine_openapi_client.models.time_step_with_type import TimeStepWithType
 from geoengine_openapi_client.models.zero_ogr_source_duration_spec import ZeroOgrSourceDurationSpec
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 OGRSOURCEDURATIONSPEC_ONE_OF_SCHEMAS = ["InfiniteOgrSourceDurationSpec", "TimeStepWithType", "ZeroOgrSourceDurationSpec"]
 
+# Note: lookup table for deserializing without trying every schema
+OGRSOURCEDURATIONSPEC_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "OgrSourceDurationSpec",
+    [InfiniteOgrSourceDurationSpec, ZeroOgrSourceDurationSpec, TimeStepWithType],
+    discriminator="type",
+    mapping={
+        "InfiniteOgrSourceDurationSpec": InfiniteOgrSourceDurationSpec,
+        "TimeStepWithType": TimeStepWithType,
+        "ZeroOgrSourceDurationSpec": ZeroOgrSourceDurationSpec,
+        "infinite": InfiniteOgrSourceDurationSpec,
+        "value": TimeStepWithType,
+        "zero": ZeroOgrSourceDurationSpec,
+    },
+)
+
 class OgrSourceDurationSpec(BaseModel):
     """
     OgrSourceDurationSpec
@@ -92,77 +109,14 @@ class OgrSourceDurationSpec(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> OgrSourceDurationSpec:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return OGRSOURCEDURATIONSPEC_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> OgrSourceDurationSpec:
         """Returns the object represented by the json string"""
-        instance = OgrSourceDurationSpec.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `InfiniteOgrSourceDurationSpec`
-        if _data_type == "InfiniteOgrSourceDurationSpec":
-            instance.actual_instance = InfiniteOgrSourceDurationSpec.from_json(json_str)
-            return instance
-
-        # check if data type is `TimeStepWithType`
-        if _data_type == "TimeStepWithType":
-            instance.actual_instance = TimeStepWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `ZeroOgrSourceDurationSpec`
-        if _data_type == "ZeroOgrSourceDurationSpec":
-            instance.actual_instance = ZeroOgrSourceDurationSpec.from_json(json_str)
-            return instance
-
-        # check if data type is `InfiniteOgrSourceDurationSpec`
-        if _data_type == "infinite":
-            instance.actual_instance = InfiniteOgrSourceDurationSpec.from_json(json_str)
-            return instance
-
-        # check if data type is `TimeStepWithType`
-        if _data_type == "value":
-            instance.actual_instance = TimeStepWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `ZeroOgrSourceDurationSpec`
-        if _data_type == "zero":
-            instance.actual_instance = ZeroOgrSourceDurationSpec.from_json(json_str)
-            return instance
-
-        # deserialize data into InfiniteOgrSourceDurationSpec
-        try:
-            instance.actual_instance = InfiniteOgrSourceDurationSpec.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into ZeroOgrSourceDurationSpec
-        try:
-            instance.actual_instance = ZeroOgrSourceDurationSpec.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into TimeStepWithType
-        try:
-            instance.actual_instance = TimeStepWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into OgrSourceDurationSpec with oneOf schemas: InfiniteOgrSourceDurationSpec, TimeStepWithType, ZeroOgrSourceDurationSpec. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into OgrSourceDurationSpec with oneOf schemas: InfiniteOgrSourceDurationSpec, TimeStepWithType, ZeroOgrSourceDurationSpec. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
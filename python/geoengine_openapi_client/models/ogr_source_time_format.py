@@ -26,9 +26,26 @@ from geoengine_openapi_client.models.custom_ogr_source_time_format import Custom
 from geoengine_openapi_client.models.unix_time_stamp_ogr_source_time_format import UnixTimeStampOgrSourceTimeFormat
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 OGRSOURCETIMEFORMAT_ONE_OF_SCHEMAS = ["AutoOgrSourceTimeFormat", "CustomOgrSourceTimeFormat", "UnixTimeStampOgrSourceTimeFormat"]
 
+# Note: lookup table for deserializing without trying every schema
+OGRSOURCETIMEFORMAT_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "OgrSourceTimeFormat",
+    [CustomOgrSourceTimeFormat, UnixTimeStampOgrSourceTimeFormat, AutoOgrSourceTimeFormat],
+    discriminator="format",
+    mapping={
+        "AutoOgrSourceTimeFormat": AutoOgrSourceTimeFormat,
+        "CustomOgrSourceTimeFormat": CustomOgrSourceTimeFormat,
+        "UnixTimeStampOgrSourceTimeFormat": UnixTimeStampOgrSourceTimeFormat,
+        "auto": AutoOgrSourceTimeFormat,
+        "custom": CustomOgrSourceTimeFormat,
+        "unixTimeStamp": UnixTimeStampOgrSourceTimeFormat,
+    },
+)
+
 class OgrSourceTimeFormat(BaseModel):
     """
     OgrSourceTimeFormat
@@ -92,77 +109,14 @@ class OgrSourceTimeFormat(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> OgrSourceTimeFormat:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return OGRSOURCETIMEFORMAT_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> OgrSourceTimeFormat:
         """Returns the object represented by the json string"""
-        instance = OgrSourceTimeFormat.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("format")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `format` in the input.")
-
-        # check if data type is `AutoOgrSourceTimeFormat`
-        if _data_type == "AutoOgrSourceTimeFormat":
-            instance.actual_instance = AutoOgrSourceTimeFormat.from_json(json_str)
-            return instance
-
-        # check if data type is `CustomOgrSourceTimeFormat`
-        if _data_type == "CustomOgrSourceTimeFormat":
-            instance.actual_instance = CustomOgrSourceTimeFormat.from_json(json_str)
-            return instance
-
-        # check if data type is `UnixTimeStampOgrSourceTimeFormat`
-        if _data_type == "UnixTimeStampOgrSourceTimeFormat":
-            instance.actual_instance = UnixTimeStampOgrSourceTimeFormat.from_json(json_str)
-            return instance
-
-        # check if data type is `AutoOgrSourceTimeFormat`
-        if _data_type == "auto":
-            instance.actual_instance = AutoOgrSourceTimeFormat.from_json(json_str)
-            return instance
-
-        # check if data type is `CustomOgrSourceTimeFormat`
-        if _data_type == "custom":
-            instance.actual_instance = CustomOgrSourceTimeFormat.from_json(json_str)
-            return instance
-
-        # check if data type is `UnixTimeStampOgrSourceTimeFormat`
-        if _data_type == "unixTimeStamp":
-            instance.actual_instance = UnixTimeStampOgrSourceTimeFormat.from_json(json_str)
-            return instance
-
-        # deserialize data into CustomOgrSourceTimeFormat
-        try:
-            instance.actual_instance = CustomOgrSourceTimeFormat.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into UnixTimeStampOgrSourceTimeFormat
-        try:
-            instance.actual_instance = UnixTimeStampOgrSourceTimeFormat.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AutoOgrSourceTimeFormat
-        try:
-            instance.actual_instance = AutoOgrSourceTimeFormat.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into OgrSourceTimeFormat with oneOf schemas: AutoOgrSourceTimeFormat, CustomOgrSourceTimeFormat, UnixTimeStampOgrSourceTimeFormat. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into OgrSourceTimeFormat with oneOf schemas: AutoOgrSourceTimeFormat, CustomOgrSourceTimeFormat, UnixTimeStampOgrSourceTimeFormat. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -25,9 +25,17 @@ from geoengine_openapi_client.models.plot import Plot
 from geoengine_openapi_client.models.project_update_token import ProjectUpdateToken
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 PLOTUPDATE_ONE_OF_SCHEMAS = ["Plot", "ProjectUpdateToken"]
 
+# Note: lookup table for deserializing without trying every schema
+PLOTUPDATE_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "PlotUpdate",
+    [ProjectUpdateToken, Plot],
+)
+
 class PlotUpdate(BaseModel):
     """
     PlotUpdate
@@ -81,36 +89,14 @@ class PlotUpdate(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> PlotUpdate:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return PLOTUPDATE_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> PlotUpdate:
         """Returns the object represented by the json string"""
-        instance = PlotUpdate.construct()
-        error_messages = []
-        match = 0
-
-        # deserialize data into ProjectUpdateToken
-        try:
-            instance.actual_instance = ProjectUpdateToken.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into Plot
-        try:
-            instance.actual_instance = Plot.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into PlotUpdate with oneOf schemas: Plot, ProjectUpdateToken. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into PlotUpdate with oneOf schemas: Plot, ProjectUpdateToken. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
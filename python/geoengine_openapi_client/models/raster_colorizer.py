@@ -24,9 +24,22 @@ from pydantic import BaseModel, Field, StrictStr, ValidationError, validator
 from geoengine_openapi_client.models.single_band_raster_colorizer import SingleBandRasterColorizer
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 RASTERCOLORIZER_ONE_OF_SCHEMAS = ["SingleBandRasterColorizer"]
 
+# Note: lookup table for deserializing without trying every schema
+RASTERCOLORIZER_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "RasterColorizer",
+    [SingleBandRasterColorizer],
+    discriminator="type",
+    mapping={
+        "SingleBandRasterColorizer": SingleBandRasterColorizer,
+        "singleBand": SingleBandRasterColorizer,
+    },
+)
+
 class RasterColorizer(BaseModel):
     """
     RasterColorizer
@@ -76,45 +89,14 @@ class RasterColorizer(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> RasterColorizer:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return RASTERCOLORIZER_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> RasterColorizer:
         """Returns the object represented by the json string"""
-        instance = RasterColorizer.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `SingleBandRasterColorizer`
-        if _data_type == "SingleBandRasterColorizer":
-            instance.actual_instance = SingleBandRasterColorizer.from_json(json_str)
-            return instance
-
-        # check if data type is `SingleBandRasterColorizer`
-        if _data_type == "singleBand":
-            instance.actual_instance = SingleBandRasterColorizer.from_json(json_str)
-            return instance
-
-        # deserialize data into SingleBandRasterColorizer
-        try:
-            instance.actual_instance = SingleBandRasterColorizer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into RasterColorizer with oneOf schemas: SingleBandRasterColorizer. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into RasterColorizer with oneOf schemas: SingleBandRasterColorizer. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -27,9 +27,28 @@ from geoengine_openapi_client.models.layer_resource import LayerResource
 from geoengine_openapi_client.models.project_resource import ProjectResource
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 RESOURCE_ONE_OF_SCHEMAS = ["DatasetResource", "LayerCollectionResource", "LayerResource", "ProjectResource"]
 
+# Note: lookup table for deserializing without trying every schema
+RESOURCE_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "Resource",
+    [LayerResource, LayerCollectionResource, ProjectResource, DatasetResource],
+    discriminator="type",
+    mapping={
+        "DatasetResource": DatasetResource,
+        "LayerCollectionResource": LayerCollectionResource,
+        "LayerResource": LayerResource,
+        "ProjectResource": ProjectResource,
+        "dataset": DatasetResource,
+        "layer": LayerResource,
+        "layerCollection": LayerCollectionResource,
+        "project": ProjectResource,
+    },
+)
+
 class Resource(BaseModel):
     """
     Resource
@@ -100,93 +119,14 @@ class Resource(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> Resource:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return RESOURCE_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> Resource:
         """Returns the object represented by the json string"""
-        instance = Resource.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `DatasetResource`
-        if _data_type == "DatasetResource":
-            instance.actual_instance = DatasetResource.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerCollectionResource`
-        if _data_type == "LayerCollectionResource":
-            instance.actual_instance = LayerCollectionResource.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerResource`
-        if _data_type == "LayerResource":
-            instance.actual_instance = LayerResource.from_json(json_str)
-            return instance
-
-        # check if data type is `ProjectResource`
-        if _data_type == "ProjectResource":
-            instance.actual_instance = ProjectResource.from_json(json_str)
-            return instance
-
-        # check if data type is `DatasetResource`
-        if _data_type == "dataset":
-            instance.actual_instance = DatasetResource.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerResource`
-        if _data_type == "layer":
-            instance.actual_instance = LayerResource.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerCollectionResource`
-        if _data_type == "layerCollection":
-            instance.actual_instance = LayerCollectionResource.from_json(json_str)
-            return instance
-
-        # check if data type is `ProjectResource`
-        if _data_type == "project":
-            instance.actual_instance = ProjectResource.from_json(json_str)
-            return instance
-
-        # deserialize data into LayerResource
-        try:
-            instance.actual_instance = LayerResource.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into LayerCollectionResource
-        try:
-            instance.actual_instance = LayerCollectionResource.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into ProjectResource
-        try:
-            instance.actual_instance = ProjectResource.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into DatasetResource
-        try:
-            instance.actual_instance = DatasetResource.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into Resource with oneOf schemas: DatasetResource, LayerCollectionResource, LayerResource, ProjectResource. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into Resource with oneOf schemas: DatasetResource, LayerCollectionResource, LayerResource, ProjectResource. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
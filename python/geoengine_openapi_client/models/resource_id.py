@@ -28,9 +28,30 @@ from geoengine_openapi_client.models.model_id_resource_id import ModelIdResource
 from geoengine_openapi_client.models.project_resource_id import ProjectResourceId
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 RESOURCEID_ONE_OF_SCHEMAS = ["DatasetIdResourceId", "LayerCollectionResourceId", "LayerResourceId", "ModelIdResourceId", "ProjectResourceId"]
 
+# Note: lookup table for deserializing without trying every schema
+RESOURCEID_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "ResourceId",
+    [LayerResourceId, LayerCollectionResourceId, ProjectResourceId, DatasetIdResourceId, ModelIdResourceId],
+    discriminator="type",
+    mapping={
+        "DatasetId": DatasetIdResourceId,
+        "DatasetIdResourceId": DatasetIdResourceId,
+        "Layer": LayerResourceId,
+        "LayerCollection": LayerCollectionResourceId,
+        "LayerCollectionResourceId": LayerCollectionResourceId,
+        "LayerResourceId": LayerResourceId,
+        "ModelId": ModelIdResourceId,
+        "ModelIdResourceId": ModelIdResourceId,
+        "Project": ProjectResourceId,
+        "ProjectResourceId": ProjectResourceId,
+    },
+)
+
 class ResourceId(BaseModel):
     """
     ResourceId
@@ -108,109 +129,14 @@ class ResourceId(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> ResourceId:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return RESOURCEID_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> ResourceId:
         """Returns the object represented by the json string"""
-        instance = ResourceId.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `DatasetIdResourceId`
-        if _data_type == "DatasetId":
-            instance.actual_instance = DatasetIdResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `DatasetIdResourceId`
-        if _data_type == "DatasetIdResourceId":
-            instance.actual_instance = DatasetIdResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerResourceId`
-        if _data_type == "Layer":
-            instance.actual_instance = LayerResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerCollectionResourceId`
-        if _data_type == "LayerCollection":
-            instance.actual_instance = LayerCollectionResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerCollectionResourceId`
-        if _data_type == "LayerCollectionResourceId":
-            instance.actual_instance = LayerCollectionResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `LayerResourceId`
-        if _data_type == "LayerResourceId":
-            instance.actual_instance = LayerResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `ModelIdResourceId`
-        if _data_type == "ModelId":
-            instance.actual_instance = ModelIdResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `ModelIdResourceId`
-        if _data_type == "ModelIdResourceId":
-            instance.actual_instance = ModelIdResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `ProjectResourceId`
-        if _data_type == "Project":
-            instance.actual_instance = ProjectResourceId.from_json(json_str)
-            return instance
-
-        # check if data type is `ProjectResourceId`
-        if _data_type == "ProjectResourceId":
-            instance.actual_instance = ProjectResourceId.from_json(json_str)
-            return instance
-
-        # deserialize data into LayerResourceId
-        try:
-            instance.actual_instance = LayerResourceId.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into LayerCollectionResourceId
-        try:
-            instance.actual_instance = LayerCollectionResourceId.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into ProjectResourceId
-        try:
-            instance.actual_instance = ProjectResourceId.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into DatasetIdResourceId
-        try:
-            instance.actual_instance = DatasetIdResourceId.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into ModelIdResourceId
-        try:
-            instance.actual_instance = ModelIdResourceId.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into ResourceId with oneOf schemas: DatasetIdResourceId, LayerCollectionResourceId, LayerResourceId, ModelIdResourceId, ProjectResourceId. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into ResourceId with oneOf schemas: DatasetIdResourceId, LayerCollectionResourceId, LayerResourceId, ModelIdResourceId, ProjectResourceId. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
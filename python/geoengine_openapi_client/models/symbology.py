@@ -27,9 +27,28 @@ from geoengine_openapi_client.models.polygon_symbology_with_type import PolygonS
 from geoengine_openapi_client.models.raster_symbology_with_type import RasterSymbologyWithType
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 SYMBOLOGY_ONE_OF_SCHEMAS = ["LineSymbologyWithType", "PointSymbologyWithType", "PolygonSymbologyWithType", "RasterSymbologyWithType"]
 
+# Note: lookup table for deserializing without trying every schema
+SYMBOLOGY_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "Symbology",
+    [RasterSymbologyWithType, PointSymbologyWithType, LineSymbologyWithType, PolygonSymbologyWithType],
+    discriminator="type",
+    mapping={
+        "LineSymbologyWithType": LineSymbologyWithType,
+        "PointSymbologyWithType": PointSymbologyWithType,
+        "PolygonSymbologyWithType": PolygonSymbologyWithType,
+        "RasterSymbologyWithType": RasterSymbologyWithType,
+        "line": LineSymbologyWithType,
+        "point": PointSymbologyWithType,
+        "polygon": PolygonSymbologyWithType,
+        "raster": RasterSymbologyWithType,
+    },
+)
+
 class Symbology(BaseModel):
     """
     Symbology
@@ -100,93 +119,14 @@ class Symbology(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> Symbology:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return SYMBOLOGY_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> Symbology:
         """Returns the object represented by the json string"""
-        instance = Symbology.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `LineSymbologyWithType`
-        if _data_type == "LineSymbologyWithType":
-            instance.actual_instance = LineSymbologyWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `PointSymbologyWithType`
-        if _data_type == "PointSymbologyWithType":
-            instance.actual_instance = PointSymbologyWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `PolygonSymbologyWithType`
-        if _data_type == "PolygonSymbologyWithType":
-            instance.actual_instance = PolygonSymbologyWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `RasterSymbologyWithType`
-        if _data_type == "RasterSymbologyWithType":
-            instance.actual_instance = RasterSymbologyWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `LineSymbologyWithType`
-        if _data_type == "line":
-            instance.actual_instance = LineSymbologyWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `PointSymbologyWithType`
-        if _data_type == "point":
-            instance.actual_instance = PointSymbologyWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `PolygonSymbologyWithType`
-        if _data_type == "polygon":
-            instance.actual_instance = PolygonSymbologyWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `RasterSymbologyWithType`
-        if _data_type == "raster":
-            instance.actual_instance = RasterSymbologyWithType.from_json(json_str)
-            return instance
-
-        # deserialize data into RasterSymbologyWithType
-        try:
-            instance.actual_instance = RasterSymbologyWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into PointSymbologyWithType
-        try:
-            instance.actual_instance = PointSymbologyWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into LineSymbologyWithType
-        try:
-            instance.actual_instance = LineSymbologyWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into PolygonSymbologyWithType
-        try:
-            instance.actual_instance = PolygonSymbologyWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into Symbology with oneOf schemas: LineSymbologyWithType, PointSymbologyWithType, PolygonSymbologyWithType, RasterSymbologyWithType. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into Symbology with oneOf schemas: LineSymbologyWithType, PointSymbologyWithType, PolygonSymbologyWithType, RasterSymbologyWithType. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -27,9 +27,28 @@ from geoengine_openapi_client.models.failed_task_status import FailedTaskStatus
 from geoengine_openapi_client.models.running_task_status import RunningTaskStatus
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 TASKSTATUS_ONE_OF_SCHEMAS = ["AbortedTaskStatus", "CompletedTaskStatus", "FailedTaskStatus", "RunningTaskStatus"]
 
+# Note: lookup table for deserializing without trying every schema
+TASKSTATUS_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "TaskStatus",
+    [RunningTaskStatus, CompletedTaskStatus, AbortedTaskStatus, FailedTaskStatus],
+    discriminator="status",
+    mapping={
+        "AbortedTaskStatus": AbortedTaskStatus,
+        "CompletedTaskStatus": CompletedTaskStatus,
+        "FailedTaskStatus": FailedTaskStatus,
+        "RunningTaskStatus": RunningTaskStatus,
+        "aborted": AbortedTaskStatus,
+        "completed": CompletedTaskStatus,
+        "failed": FailedTaskStatus,
+        "running": RunningTaskStatus,
+    },
+)
+
 class TaskStatus(BaseModel):
     """
     TaskStatus
@@ -101,98 +120,14 @@ class TaskStatus(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> TaskStatus:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return TASKSTATUS_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> TaskStatus:
         """Returns the object represented by the json string"""
-        instance = TaskStatus.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("status")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `status` in the input.")
-
-        # check if data type is `AbortedTaskStatus`
-        if _data_type == "AbortedTaskStatus":
-            instance.actual_instance = AbortedTaskStatus.from_json(json_str)
-            return instance
-
-        # check if data type is `CompletedTaskStatus`
-        if _data_type == "CompletedTaskStatus":
-            instance.actual_instance = CompletedTaskStatus.from_json(json_str)
-            return instance
-
-        # check if data type is `FailedTaskStatus`
-        if _data_type == "FailedTaskStatus":
-            instance.actual_instance = FailedTaskStatus.from_json(json_str)
-            return instance
-
-        # check if data type is `RunningTaskStatus`
-        if _data_type == "RunningTaskStatus":
-            instance.actual_instance = RunningTaskStatus.from_json(json_str)
-            return instance
-
-        # check if data type is `TaskStatusWithId`
-        if _data_type == "TaskStatusWithId":
-            instance.actual_instance = TaskStatusWithId.from_json(json_str)
-            return instance
-
-        # check if data type is `AbortedTaskStatus`
-        if _data_type == "aborted":
-            instance.actual_instance = AbortedTaskStatus.from_json(json_str)
-            return instance
-
-        # check if data type is `CompletedTaskStatus`
-        if _data_type == "completed":
-            instance.actual_instance = CompletedTaskStatus.from_json(json_str)
-            return instance
-
-        # check if data type is `FailedTaskStatus`
-        if _data_type == "failed":
-            instance.actual_instance = FailedTaskStatus.from_json(json_str)
-            return instance
-
-        # check if data type is `RunningTaskStatus`
-        if _data_type == "running":
-            instance.actual_instance = RunningTaskStatus.from_json(json_str)
-            return instance
-
-        # deserialize data into RunningTaskStatus
-        try:
-            instance.actual_instance = RunningTaskStatus.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into CompletedTaskStatus
-        try:
-            instance.actual_instance = CompletedTaskStatus.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AbortedTaskStatus
-        try:
-            instance.actual_instance = AbortedTaskStatus.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into FailedTaskStatus
-        try:
-            instance.actual_instance = FailedTaskStatus.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into TaskStatus with oneOf schemas: AbortedTaskStatus, CompletedTaskStatus, FailedTaskStatus, RunningTaskStatus. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into TaskStatus with oneOf schemas: AbortedTaskStatus, CompletedTaskStatus, FailedTaskStatus, RunningTaskStatus. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
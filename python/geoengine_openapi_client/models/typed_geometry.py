@@ -27,9 +27,17 @@ from geoengine_openapi_client.models.typed_geometry_one_of2 import TypedGeometry
 from geoengine_openapi_client.models.typed_geometry_one_of3 import TypedGeometryOneOf3
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 TYPEDGEOMETRY_ONE_OF_SCHEMAS = ["TypedGeometryOneOf", "TypedGeometryOneOf1", "TypedGeometryOneOf2", "TypedGeometryOneOf3"]
 
+# Note: lookup table for deserializing without trying every schema
+TYPEDGEOMETRY_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "TypedGeometry",
+    [TypedGeometryOneOf, TypedGeometryOneOf1, TypedGeometryOneOf2, TypedGeometryOneOf3],
+)
+
 class TypedGeometry(BaseModel):
     """
     TypedGeometry
@@ -97,48 +105,14 @@ class TypedGeometry(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> TypedGeometry:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return TYPEDGEOMETRY_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> TypedGeometry:
         """Returns the object represented by the json string"""
-        instance = TypedGeometry.construct()
-        error_messages = []
-        match = 0
-
-        # deserialize data into TypedGeometryOneOf
-        try:
-            instance.actual_instance = TypedGeometryOneOf.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into TypedGeometryOneOf1
-        try:
-            instance.actual_instance = TypedGeometryOneOf1.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into TypedGeometryOneOf2
-        try:
-            instance.actual_instance = TypedGeometryOneOf2.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into TypedGeometryOneOf3
-        try:
-            instance.actual_instance = TypedGeometryOneOf3.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into TypedGeometry with oneOf schemas: TypedGeometryOneOf, TypedGeometryOneOf1, TypedGeometryOneOf2, TypedGeometryOneOf3. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into TypedGeometry with oneOf schemas: TypedGeometryOneOf, TypedGeometryOneOf1, TypedGeometryOneOf2, TypedGeometryOneOf3. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
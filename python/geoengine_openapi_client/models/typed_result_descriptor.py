@@ -26,9 +26,26 @@ from geoengine_openapi_client.models.raster_result_descriptor_with_type import R
 from geoengine_openapi_client.models.vector_result_descriptor_with_type import VectorResultDescriptorWithType
 from typing import Union, Any, List, TYPE_CHECKING
 from pydantic import StrictStr, Field
+# Note: deserialize `oneOf` models with a dispatcher
+from geoengine_openapi_client.one_of import OneOfDispatcher
 
 TYPEDRESULTDESCRIPTOR_ONE_OF_SCHEMAS = ["PlotResultDescriptorWithType", "RasterResultDescriptorWithType", "VectorResultDescriptorWithType"]
 
+# Note: lookup table for deserializing without trying every schema
+TYPEDRESULTDESCRIPTOR_ONE_OF_DISPATCHER = OneOfDispatcher(
+    "TypedResultDescriptor",
+    [PlotResultDescriptorWithType, RasterResultDescriptorWithType, VectorResultDescriptorWithType],
+    discriminator="type",
+    mapping={
+        "PlotResultDescriptorWithType": PlotResultDescriptorWithType,
+        "RasterResultDescriptorWithType": RasterResultDescriptorWithType,
+        "VectorResultDescriptorWithType": VectorResultDescriptorWithType,
+        "plot": PlotResultDescriptorWithType,
+        "raster": RasterResultDescriptorWithType,
+        "vector": VectorResultDescriptorWithType,
+    },
+)
+
 class TypedResultDescriptor(BaseModel):
     """
     TypedResultDescriptor
@@ -92,77 +109,14 @@ class TypedResultDescriptor(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: dict) -> TypedResultDescriptor:
-        return cls.from_json(json.dumps(obj))
+        # Note: deserialize the dict directly with a precomputed dispatcher
+        return TYPEDRESULTDESCRIPTOR_ONE_OF_DISPATCHER.from_dict(cls, obj)
 
     @classmethod
     def from_json(cls, json_str: str) -> TypedResultDescriptor:
         """Returns the object represented by the json string"""
-        instance = TypedResultDescriptor.construct()
-        error_messages = []
-        match = 0
-
-        # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("type")
-        if not _data_type:
-            raise ValueError("Failed to lookup data type from the field `type` in the input.")
-
-        # check if data type is `PlotResultDescriptorWithType`
-        if _data_type == "PlotResultDescriptorWithType":
-            instance.actual_instance = PlotResultDescriptorWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `RasterResultDescriptorWithType`
-        if _data_type == "RasterResultDescriptorWithType":
-            instance.actual_instance = RasterResultDescriptorWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `VectorResultDescriptorWithType`
-        if _data_type == "VectorResultDescriptorWithType":
-            instance.actual_instance = VectorResultDescriptorWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `PlotResultDescriptorWithType`
-        if _data_type == "plot":
-            instance.actual_instance = PlotResultDescriptorWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `RasterResultDescriptorWithType`
-        if _data_type == "raster":
-            instance.actual_instance = RasterResultDescriptorWithType.from_json(json_str)
-            return instance
-
-        # check if data type is `VectorResultDescriptorWithType`
-        if _data_type == "vector":
-            instance.actual_instance = VectorResultDescriptorWithType.from_json(json_str)
-            return instance
-
-        # deserialize data into PlotResultDescriptorWithType
-        try:
-            instance.actual_instance = PlotResultDescriptorWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into RasterResultDescriptorWithType
-        try:
-            instance.actual_instance = RasterResultDescriptorWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into VectorResultDescriptorWithType
-        try:
-            instance.actual_instance = VectorResultDescriptorWithType.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if match > 1:
-            # more than 1 match
-            raise ValueError("Multiple matches found when deserializing the JSON string into TypedResultDescriptor with oneOf schemas: PlotResultDescriptorWithType, RasterResultDescriptorWithType, VectorResultDescriptorWithType. Details: " + ", ".join(error_messages))
-        elif match == 0:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into TypedResultDescriptor with oneOf schemas: PlotResultDescriptorWithType, RasterResultDescriptorWithType, VectorResultDescriptorWithType. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        # Note: decode once and dispatch on the dict
+        return cls.from_dict(json.loads(json_str))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
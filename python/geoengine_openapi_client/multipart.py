@@ -0,0 +1,163 @@
+# coding: utf-8
+
+"""
+    Streaming encoding of `multipart/form-data` request bodies.
+
+    `ApiClient.files_parameters` refers to files with `MultipartFile`s instead
+    of reading them. `MultipartEncoder` then reads the files in chunks while
+    the body is sent, so uploading large files, e.g. with
+    `UploadsApi.upload_handler`, does not load them into memory. The length
+    of the body is known up front and sent as `Content-Length`.
+
+    Upload progress is reported to `Configuration.upload_progress`, e.g.
+
+    >>> configuration.upload_progress = lambda sent, total: print(f"{sent / total:.0%}")
+"""  # noqa: E501
+
+
+import binascii
+import io
+import os
+from typing import Any, BinaryIO, Callable, List, Optional, Sequence, Tuple, Union
+
+from urllib3.fields import RequestField
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class MultipartFile:
+    """A file of a multipart body that is read when the body is sent.
+
+    :param path: path of the file.
+    """
+
+    def __init__(self, path: Union[str, bytes, os.PathLike]) -> None:
+        self.path = path
+        self.size = os.path.getsize(path)
+
+    def open(self) -> BinaryIO:
+        return open(self.path, 'rb')
+
+    def __repr__(self) -> str:
+        return f"MultipartFile({self.path!r})"
+
+
+class MultipartEncoder(io.RawIOBase):
+    """A readable and seekable `multipart/form-data` body.
+
+    :param fields: `(name, value)` pairs. A value is a string, bytes or a
+                   `(filename, data, content type)` tuple, where data is bytes
+                   or a `MultipartFile`.
+    :param boundary: the multipart boundary, random by default.
+    :param progress: called with the bytes read so far and the total bytes.
+    """
+
+    def __init__(self, fields: Sequence[Tuple[str, Any]],
+                 boundary: Optional[str] = None,
+                 progress: Optional[ProgressCallback] = None) -> None:
+        super().__init__()
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode('ascii')
+        self.progress = progress
+
+        self._segments: List[Union[bytes, MultipartFile]] = []
+        for (name, value) in fields:
+            field = RequestField.from_tuples(name, value)
+            self._append(f"--{self.boundary}\r\n".encode('latin-1') + field.render_headers().encode('utf-8'))
+
+            data = field.data
+            if isinstance(data, int):
+                data = str(data)
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            self._append(data)
+            self._append(b"\r\n")
+        self._append(f"--{self.boundary}--\r\n".encode('latin-1'))
+
+        self.content_length = sum(self._size(segment) for segment in self._segments)
+        self._position = 0
+        # the current segment, the offset within it and the open file of a `MultipartFile`
+        self._segment_index = 0
+        self._segment_offset = 0
+        self._file: Optional[BinaryIO] = None
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @staticmethod
+    def _size(segment: Union[bytes, MultipartFile]) -> int:
+        return segment.size if isinstance(segment, MultipartFile) else len(segment)
+
+    def _append(self, segment: Union[bytes, MultipartFile]) -> None:
+        if isinstance(segment, (bytes, bytearray)) and self._segments \
+                and isinstance(self._segments[-1], bytes):
+            self._segments[-1] += bytes(segment)
+        else:
+            self._segments.append(segment if isinstance(segment, MultipartFile) else bytes(segment))
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self.content_length
+        if offset < 0:
+            raise ValueError("negative seek position")
+
+        self._close_file()
+        self._position = min(offset, self.content_length)
+        self._segment_index = 0
+        self._segment_offset = self._position
+        while self._segment_index < len(self._segments) \
+                and self._segment_offset >= self._size(self._segments[self._segment_index]):
+            self._segment_offset -= self._size(self._segments[self._segment_index])
+            self._segment_index += 1
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast('B')
+        filled = 0
+        while filled < len(view) and self._segment_index < len(self._segments):
+            segment = self._segments[self._segment_index]
+            if self._segment_offset >= self._size(segment):
+                self._close_file()
+                self._segment_index += 1
+                self._segment_offset = 0
+                continue
+
+            remaining = min(len(view) - filled, self._size(segment) - self._segment_offset)
+            if isinstance(segment, MultipartFile):
+                if self._file is None:
+                    self._file = segment.open()
+                    self._file.seek(self._segment_offset)
+                read = self._file.readinto(view[filled:filled + remaining])
+                if not read:
+                    raise IOError(f"{segment.path!r} is shorter than {segment.size} bytes")
+            else:
+                view[filled:filled + remaining] = segment[self._segment_offset:self._segment_offset + remaining]
+                read = remaining
+
+            filled += read
+            self._segment_offset += read
+
+        self._position += filled
+        if filled and self.progress is not None:
+            self.progress(self._position, self.content_length)
+        return filled
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        self._close_file()
+        super().close()
@@ -0,0 +1,143 @@
+# coding: utf-8
+
+"""
+    Deserialization of `oneOf` models.
+
+    The generated `oneOf` models try every candidate schema on a JSON string
+    and count the matches. `OneOfDispatcher` picks the candidate from a
+    precomputed discriminator table instead and deserializes straight from the
+    dict. Unions without a discriminator are narrowed down by the properties
+    of their candidates before the remaining ones are tried.
+"""  # noqa: E501
+
+
+from typing import Dict, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+
+_DISPATCHERS: Dict[str, 'OneOfDispatcher'] = {}
+
+
+def dispatcher_for(model: Type[BaseModel]) -> Optional['OneOfDispatcher']:
+    """Returns the dispatcher of a `oneOf` model or None for other models."""
+    return _DISPATCHERS.get(model.__name__)
+
+
+def _deserialize(candidate: type, obj):
+    """Deserializes `obj` into a model or an enum."""
+    if issubclass(candidate, BaseModel):
+        return candidate.from_dict(obj)
+    return candidate(obj)
+
+
+class OneOfDispatcher:
+    """Deserializes a dict into one of several candidate models.
+
+    :param name: name of the `oneOf` model.
+    :param candidates: candidate models or enums, in the order they are validated.
+    :param discriminator: property that names the data type, if any.
+    :param mapping: discriminator value to candidate model.
+    """
+
+    def __init__(self, name: str, candidates: List[Type[BaseModel]],
+                 discriminator: Optional[str] = None,
+                 mapping: Optional[Dict[str, Type[BaseModel]]] = None) -> None:
+        self.name = name
+        self.candidates = candidates
+        self.discriminator = discriminator
+        self.mapping = mapping or {}
+        self.schema_names = ", ".join(sorted(c.__name__ for c in candidates))
+        # JSON properties that must be present (and non-null) for a model to validate
+        self.required_properties = {
+            candidate: frozenset(
+                field.alias for field in candidate.__fields__.values()
+                if field.required and not field.allow_none
+            )
+            for candidate in candidates
+            if issubclass(candidate, BaseModel)
+        }
+        # all JSON properties a model declares
+        self.properties = {
+            candidate: frozenset(field.alias for field in candidate.__fields__.values())
+            for candidate in self.required_properties
+        }
+        _DISPATCHERS[name] = self
+
+    def candidate_for(self, obj: dict) -> Optional[Type[BaseModel]]:
+        """Returns the candidate selected by the discriminator, if any.
+
+        Raises a `ValueError` if the discriminator property is missing.
+        """
+        if self.discriminator is None:
+            return None
+
+        data_type = obj.get(self.discriminator)
+        if not data_type:
+            raise ValueError(
+                f"Failed to lookup data type from the field `{self.discriminator}` in the input."
+            )
+
+        return self.mapping.get(data_type)
+
+    def possible_candidates(self, obj: dict) -> List[List[Type[BaseModel]]]:
+        """Returns the models that can deserialize `obj`, in groups to try in order.
+
+        Models whose declared properties match the keys of `obj` exactly come
+        first, then all other models whose required properties are present.
+        """
+        keys = obj.keys()
+        non_null_keys = {key for key, value in obj.items() if value is not None}
+        candidates = [
+            candidate for (candidate, required) in self.required_properties.items()
+            if required <= non_null_keys
+        ]
+        exact_candidates = [
+            candidate for candidate in candidates
+            if keys <= self.properties[candidate]
+        ]
+        other_candidates = [
+            candidate for candidate in candidates
+            if candidate not in exact_candidates
+        ]
+        return [group for group in (exact_candidates, other_candidates) if group]
+
+    def from_dict(self, model: Type[BaseModel], obj: dict) -> Optional[BaseModel]:
+        """Deserializes `obj` into an instance of the `oneOf` model.
+
+        Each candidate is validated at most once and no JSON round trip is
+        involved. The other candidates are only tried if none of the exact
+        candidates validates.
+        """
+        if obj is None:
+            return None
+
+        instance = model.construct()
+
+        if isinstance(obj, dict):
+            candidate = self.candidate_for(obj)
+            if candidate is not None:
+                instance.actual_instance = _deserialize(candidate, obj)
+                return instance
+            groups = self.possible_candidates(obj)
+        else:
+            groups = [self.candidates]
+
+        error_messages = []
+        for candidates in groups:
+            match = 0
+            for candidate in candidates:
+                try:
+                    instance.actual_instance = _deserialize(candidate, obj)
+                    match += 1
+                except (ValidationError, ValueError) as e:
+                    error_messages.append(str(e))
+
+            if match > 1:
+                # more than 1 match
+                raise ValueError(f"Multiple matches found when deserializing the JSON string into {self.name} with oneOf schemas: {self.schema_names}. Details: " + ", ".join(error_messages))
+            elif match == 1:
+                return instance
+
+        # no match
+        raise ValueError(f"No match found when deserializing the JSON string into {self.name} with oneOf schemas: {self.schema_names}. Details: " + ", ".join(error_messages))
@@ -0,0 +1,79 @@
+# coding: utf-8
+
+"""
+    Iteration over endpoints that are paginated with `offset` and `limit`.
+
+    `paginate` calls an API method page by page and yields the items of all
+    pages, e.g.
+
+    >>> for dataset in paginate(datasets_api.list_datasets_handler,
+    ...                         order=OrderBy.NAMEASC, page_size=100):
+    ...     print(dataset.name)
+
+    With `prefetch=True`, the next page is requested in the thread pool of the
+    `ApiClient` (`async_req=True`) while the items of the current page are
+    consumed.
+"""  # noqa: E501
+
+
+from typing import Any, Callable, Iterator, List
+
+DEFAULT_PAGE_SIZE = 20
+
+
+def page_items(page: Any) -> List[Any]:
+    """Returns the items of a page.
+
+    Endpoints either return a list or a model with an `items` list, e.g.
+    `LayerCollection`.
+    """
+    if page is None:
+        return []
+    if isinstance(page, list):
+        return page
+    return page.items
+
+
+def paginate(method: Callable[..., Any], *args,
+             page_size: int = DEFAULT_PAGE_SIZE,
+             prefetch: bool = False,
+             offset: int = 0,
+             **kwargs) -> Iterator[Any]:
+    """Yields the items of all pages of a paginated API method.
+
+    :param method: an API method with `offset` and `limit` parameters.
+    :param args: positional arguments of `method`.
+    :param page_size: the `limit` of each request.
+    :param prefetch: request the next page while the current one is consumed.
+    :param offset: offset of the first item.
+    :param kwargs: further keyword arguments of `method`.
+    :return: an iterator over the items of all pages.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+
+    def request(page_offset, **request_kwargs):
+        return method(*args, offset=page_offset, limit=page_size, **kwargs, **request_kwargs)
+
+    items = page_items(request(offset))
+    while True:
+        # a short page is the last one
+        has_next_page = len(items) >= page_size
+        offset += len(items)
+
+        next_page = None
+        if has_next_page and prefetch:
+            next_page = request(offset, async_req=True)
+
+        yield from items
+
+        if not has_next_page:
+            return
+
+        if next_page is not None:
+            items = page_items(next_page.get())
+        else:
+            items = page_items(request(offset))
+
+        if not items:
+            return
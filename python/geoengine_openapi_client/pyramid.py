@@ -0,0 +1,423 @@
+# coding: utf-8
+
+"""
+    Pre-rendering of XYZ tile pyramids with the WMS.
+
+    `TilePyramid` renders the web mercator tiles of a zoom range with
+    `OGCWMSApi.wms_map_handler`, with a bounded number of requests in flight,
+    and writes them into a `DirectoryTileStore` (`{z}/{x}/{y}.png`) or an
+    `MBTilesTileStore`, e.g.
+
+    >>> with MBTilesTileStore("ndvi.mbtiles") as store:
+    ...     pyramid = TilePyramid(wms_api, workflow_id, store, workers=16)
+    ...     report = pyramid.render(range(0, 8), bounds=(5.8, 47.2, 15.1, 55.1))
+
+    Tiles that already exist in the store are skipped, so an interrupted run
+    can simply be repeated. `render_pyramid` splits the tiles into shards and
+    renders them in a process pool. Tiles that cannot be written, e.g. because
+    another process keeps the MBTiles file locked, count as failed.
+"""  # noqa: E501
+
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import logging
+import math
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from geoengine_openapi_client.api.ogcwms_api import OGCWMSApi
+from geoengine_openapi_client.api_client import ApiClient
+from geoengine_openapi_client.configuration import Configuration
+from geoengine_openapi_client.models.get_map_format import GetMapFormat
+from geoengine_openapi_client.models.get_map_request import GetMapRequest
+from geoengine_openapi_client.models.wms_service import WmsService
+from geoengine_openapi_client.models.wms_version import WmsVersion
+
+logger = logging.getLogger(__name__)
+
+WEB_MERCATOR = "EPSG:3857"
+WEB_MERCATOR_EXTENT = 20037508.342789244
+MAX_LATITUDE = 85.0511287798066
+
+DEFAULT_TILE_SIZE = 256
+
+# lon/lat bounds as `west, south, east, north`
+LonLatBounds = Tuple[float, float, float, float]
+
+
+class Tile(NamedTuple):
+    """A tile of the XYZ scheme, with `y` counted from the north."""
+
+    z: int
+    x: int
+    y: int
+
+
+class PyramidReport(NamedTuple):
+    """The outcome of rendering a pyramid."""
+
+    rendered: int
+    skipped: int
+    failed: List[Tile]
+
+    def __add__(self, other: 'PyramidReport') -> 'PyramidReport':
+        return PyramidReport(self.rendered + other.rendered, self.skipped + other.skipped,
+                             self.failed + other.failed)
+
+
+def tile_bounds(tile: Tile) -> Tuple[float, float, float, float]:
+    """Returns `xmin, ymin, xmax, ymax` of a tile in web mercator."""
+    size = 2 * WEB_MERCATOR_EXTENT / 2**tile.z
+    xmin = -WEB_MERCATOR_EXTENT + tile.x * size
+    ymax = WEB_MERCATOR_EXTENT - tile.y * size
+    return (xmin, ymax - size, xmin + size, ymax)
+
+
+def _tile_index(z: int, lon: float, lat: float) -> Tuple[int, int]:
+    n = 2**z
+    lat = math.radians(max(-MAX_LATITUDE, min(MAX_LATITUDE, lat)))
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat)) / math.pi) / 2.0 * n)
+    return (max(0, min(n - 1, x)), max(0, min(n - 1, y)))
+
+
+def pyramid_tiles(zooms: Iterable[int], bounds: Optional[LonLatBounds] = None,
+                  shard: Optional[Tuple[int, int]] = None) -> Iterator[Tile]:
+    """Yields the tiles of the zoom levels that intersect `bounds`.
+
+    :param zooms: the zoom levels.
+    :param bounds: `west, south, east, north` in degrees, or None for the world.
+    :param shard: `(index, count)` to only yield every count-th tile,
+                  starting with the index-th.
+    """
+    (west, south, east, north) = bounds if bounds is not None else (-180.0, -90.0, 180.0, 90.0)
+    (index, count) = shard if shard is not None else (0, 1)
+    if not 0 <= index < count:
+        raise ValueError("expected 0 <= shard index < shard count")
+
+    position = 0
+    for z in zooms:
+        (xmin, ymin) = _tile_index(z, west, north)
+        (xmax, ymax) = _tile_index(z, east, south)
+        for x in range(xmin, xmax + 1):
+            for y in range(ymin, ymax + 1):
+                if position % count == index:
+                    yield Tile(z, x, y)
+                position += 1
+
+
+class DirectoryTileStore:
+    """Stores tiles as `{root}/{z}/{x}/{y}.{extension}`."""
+
+    def __init__(self, root: str, extension: str = 'png') -> None:
+        self.root = root
+        self.extension = extension
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def path(self, tile: Tile) -> str:
+        return os.path.join(self.root, str(tile.z), str(tile.x), f"{tile.y}.{self.extension}")
+
+    def exists(self, tile: Tile) -> bool:
+        return os.path.exists(self.path(tile))
+
+    def write(self, tile: Tile, data: bytes) -> None:
+        path = self.path(tile)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        (fd, temp_path) = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def set_metadata(self, **metadata: str) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class MBTilesTileStore:
+    """Stores tiles in an MBTiles (SQLite) file.
+
+    The connection is opened on first use, so the store can be passed to
+    other processes before that. Writes are committed in small batches, at
+    least every `commit_interval` seconds, so that concurrent writers of other
+    processes do not wait long for the write lock. Writes that still find the
+    file locked are retried.
+
+    :param path: the MBTiles file.
+    :param batch_size: maximum number of tiles per transaction.
+    :param commit_interval: maximum age of a transaction in seconds.
+    :param timeout: seconds to wait for the write lock of other connections.
+    :param lock_retries: number of retries of writes that time out waiting for the lock.
+    """
+
+    def __init__(self, path: str, batch_size: int = 50, commit_interval: float = 1.0,
+                 timeout: float = 10.0, lock_retries: int = 5) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self.timeout = timeout
+        self.lock_retries = lock_retries
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending = 0
+        self._transaction_started = 0.0
+
+    def __getstate__(self):
+        return {'path': self.path, 'batch_size': self.batch_size, 'commit_interval': self.commit_interval,
+                'timeout': self.timeout, 'lock_retries': self.lock_retries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout)
+            # readers do not block the writer and commits do not wait for fsync
+            self._retry_locked(self._connection.execute, "PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._retry_locked(self._connection.executescript, """
+                CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE IF NOT EXISTS tiles (
+                    zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB
+                );
+                CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles (zoom_level, tile_column, tile_row);
+            """)
+        return self._connection
+
+    @staticmethod
+    def _key(tile: Tile) -> Tuple[int, int, int]:
+        # MBTiles counts rows from the south
+        return (tile.z, tile.x, 2**tile.z - 1 - tile.y)
+
+    def exists(self, tile: Tile) -> bool:
+        cursor = self.connection.execute(
+            "SELECT 1 FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?", self._key(tile))
+        return cursor.fetchone() is not None
+
+    def read(self, tile: Tile) -> Optional[bytes]:
+        cursor = self.connection.execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?", self._key(tile))
+        row = cursor.fetchone()
+        return None if row is None else row[0]
+
+    def _retry_locked(self, operation, *args):
+        """Calls `operation`, retrying while the database is locked by other connections."""
+        for attempt in range(self.lock_retries + 1):
+            try:
+                return operation(*args)
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e) or attempt == self.lock_retries:
+                    raise
+                logger.debug("%s is locked, retrying: %s", self.path, e)
+                time.sleep(0.1 * 2**attempt)
+
+    def write(self, tile: Tile, data: bytes) -> None:
+        self._retry_locked(
+            self.connection.execute,
+            "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) VALUES (?, ?, ?, ?)",
+            self._key(tile) + (bytes(data),))
+        if self._pending == 0:
+            self._transaction_started = time.monotonic()
+        self._pending += 1
+        if self._pending >= self.batch_size \
+                or time.monotonic() - self._transaction_started >= self.commit_interval:
+            self.commit()
+
+    def set_metadata(self, **metadata: str) -> None:
+        self._retry_locked(
+            self.connection.executemany,
+            "INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)", list(metadata.items()))
+        self.commit()
+
+    def commit(self) -> None:
+        if self._connection is not None:
+            self._retry_locked(self._connection.commit)
+        self._pending = 0
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self.commit()
+            self._connection.close()
+            self._connection = None
+
+
+class TilePyramid:
+    """Renders the tiles of a workflow with the WMS.
+
+    :param wms_api: the `OGCWMSApi` to render the tiles with.
+    :param workflow_id: id of the raster workflow.
+    :param store: a `DirectoryTileStore`, an `MBTilesTileStore` or any object
+                  with `exists`, `write` and `set_metadata` methods.
+    :param styles: the WMS styles, e.g. `custom:{...}`.
+    :param time: the WMS time parameter, or None.
+    :param tile_size: width and height of the tiles in pixels.
+    :param workers: maximum number of tiles that are requested in parallel.
+    """
+
+    def __init__(self, wms_api: OGCWMSApi, workflow_id: str, store,
+                 styles: str = "",
+                 time: Optional[str] = None,
+                 tile_size: int = DEFAULT_TILE_SIZE,
+                 workers: int = 8) -> None:
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        self.wms_api = wms_api
+        self.workflow_id = workflow_id
+        self.store = store
+        self.styles = styles
+        self.time = time
+        self.tile_size = tile_size
+        self.workers = workers
+
+    def render_tile(self, tile: Tile) -> bytearray:
+        """Requests the image of a tile."""
+        (xmin, ymin, xmax, ymax) = tile_bounds(tile)
+        return self.wms_api.wms_map_handler(
+            workflow=self.workflow_id,
+            version=WmsVersion.ENUM_1_DOT_3_DOT_0,
+            service=WmsService.WMS,
+            request=GetMapRequest.GETMAP,
+            width=self.tile_size,
+            height=self.tile_size,
+            bbox=f"{xmin!r},{ymin!r},{xmax!r},{ymax!r}",
+            format=GetMapFormat.IMAGE_SLASH_PNG,
+            layers=self.workflow_id,
+            styles=self.styles,
+            crs=WEB_MERCATOR,
+            time=self.time,
+            transparent=True,
+        )
+
+    def render(self, zooms: Iterable[int], bounds: Optional[LonLatBounds] = None,
+               shard: Optional[Tuple[int, int]] = None) -> PyramidReport:
+        """Renders all missing tiles of the zoom levels that intersect `bounds`.
+
+        :param zooms: the zoom levels.
+        :param bounds: `west, south, east, north` in degrees, or None for the world.
+        :param shard: `(index, count)` to only render a part of the tiles.
+        :return: the numbers of rendered and skipped tiles and the failed tiles.
+        """
+        zooms = list(zooms)
+        if shard is None or shard[0] == 0:
+            self.store.set_metadata(name=self.workflow_id, format='png',
+                                    minzoom=str(min(zooms)), maxzoom=str(max(zooms)))
+
+        rendered = skipped = 0
+        failed = []
+        tiles = pyramid_tiles(zooms, bounds, shard)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            running = {}
+            exhausted = False
+            while running or not exhausted:
+                # keep at most two requests per worker in flight
+                while not exhausted and len(running) < 2 * self.workers:
+                    tile = next(tiles, None)
+                    if tile is None:
+                        exhausted = True
+                    elif self._exists(tile):
+                        skipped += 1
+                    else:
+                        running[executor.submit(self.render_tile, tile)] = tile
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    tile = running.pop(future)
+                    if future.exception() is not None:
+                        logger.warning("failed to render tile %s: %s", tile, future.exception())
+                        failed.append(tile)
+                        continue
+                    try:
+                        # the store is only used from this thread
+                        self.store.write(tile, future.result())
+                        rendered += 1
+                    except (OSError, sqlite3.Error) as e:
+                        logger.warning("failed to store tile %s: %s", tile, e)
+                        failed.append(tile)
+
+        return PyramidReport(rendered, skipped, failed)
+
+    def _exists(self, tile: Tile) -> bool:
+        try:
+            return self.store.exists(tile)
+        except (OSError, sqlite3.Error) as e:
+            # render the tile again, writing it replaces the stored one
+            logger.warning("failed to look up tile %s: %s", tile, e)
+            return False
+
+
+# the settings that `render_pyramid` passes to its processes
+WORKER_SETTINGS = (
+    'api_key', 'api_key_prefix', 'username', 'password', 'access_token',
+    'verify_ssl', 'ssl_ca_cert', 'cert_file', 'key_file', 'assert_hostname', 'tls_server_name',
+    'proxy', 'proxy_headers', 'connection_pool_maxsize', 'retries', 'socket_options',
+)
+
+
+def _worker_configuration(configuration: Configuration) -> Configuration:
+    """Copies the host, authentication and connection settings of a configuration.
+
+    Shared objects like caches, retry budgets, traffic recorders and metrics
+    hold locks and cannot be pickled for other processes.
+    """
+    worker_configuration = Configuration(host=configuration.host)
+    for name in WORKER_SETTINGS:
+        setattr(worker_configuration, name, getattr(configuration, name))
+    return worker_configuration
+
+
+def _render_shard(configuration: Configuration, workflow_id: str, store, zooms: List[int],
+                  bounds: Optional[LonLatBounds], shard: Tuple[int, int], options: dict) -> PyramidReport:
+    with ApiClient(configuration) as api_client, store:
+        pyramid = TilePyramid(OGCWMSApi(api_client), workflow_id, store, **options)
+        return pyramid.render(zooms, bounds, shard)
+
+
+def render_pyramid(configuration: Configuration, workflow_id: str, store,
+                   zooms: Iterable[int], bounds: Optional[LonLatBounds] = None,
+                   processes: Optional[int] = None, **options) -> PyramidReport:
+    """Renders a pyramid in a process pool, one shard of the tiles per process.
+
+    Each process uses its own `ApiClient` and its own connection to the
+    `store`. The processes only get the host, the authentication and the
+    connection settings of the `configuration` (see `WORKER_SETTINGS`), not
+    e.g. its `http_cache`, `retry_policy` or `instrumentation`.
+
+    :param configuration: the `Configuration` of the API clients.
+    :param workflow_id: id of the raster workflow.
+    :param store: a picklable store, e.g. a `DirectoryTileStore` or an `MBTilesTileStore`.
+    :param zooms: the zoom levels.
+    :param bounds: `west, south, east, north` in degrees, or None for the world.
+    :param processes: number of processes, defaults to the number of CPUs.
+    :param options: further arguments of `TilePyramid`, e.g. `workers`.
+    :return: the combined report of all processes.
+    """
+    processes = processes or os.cpu_count() or 1
+    zooms = list(zooms)
+    worker_configuration = _worker_configuration(configuration)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [
+            executor.submit(_render_shard, worker_configuration, workflow_id, store, zooms, bounds,
+                            (index, processes), options)
+            for index in range(processes)
+        ]
+        reports = [future.result() for future in futures]
+
+    return sum(reports, PyramidReport(0, 0, []))
@@ -0,0 +1,285 @@
+# coding: utf-8
+
+"""
+    Caching of immutable resources.
+
+    Workflows are immutable by id and spatial reference specifications by
+    their SRS string. `CachedWorkflowsApi` and `CachedSpatialReferencesApi`
+    answer repeated lookups of them from a `ResourceCache`, e.g.
+
+    >>> cache = ResourceCache(max_entries=10_000, path="~/.cache/geoengine-resources.sqlite",
+    ...                       max_disk_size=256 * 2**20)
+    >>> workflows_api = CachedWorkflowsApi(api_client, cache)
+    >>> spatial_references_api = CachedSpatialReferencesApi(api_client, cache)
+    >>> spatial_references_api.get_spatial_reference_specification_handler("EPSG:4326")
+    >>> cache.stats
+    CacheStats(hits=..., misses=..., memory_hits=..., disk_hits=..., evictions=...)
+
+    The cache keeps the response bodies of the cached operations:
+    `load_workflow_handler`, `get_workflow_metadata_handler`,
+    `get_workflow_provenance_handler` and
+    `get_spatial_reference_specification_handler`. Every hit is deserialized
+    anew, so the returned models can be modified. The memory tier is bounded
+    by its number of entries. The optional SQLite file is shared by all
+    processes that use the same path and is bounded by the size of the
+    bodies. Storing a body evicts the least recently used ones from the file.
+
+    `CachedWorkflowsApi.register_workflow_handler` also returns the id of a
+    workflow that was registered before from the cache. Workflows are
+    identified by the hash of their canonical JSON, see `workflow_hash`.
+"""  # noqa: E501
+
+
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from pydantic import BaseModel
+
+from geoengine_openapi_client.api.spatial_references_api import SpatialReferencesApi
+from geoengine_openapi_client.api.workflows_api import WorkflowsApi
+from geoengine_openapi_client.wms_cache import CacheStats
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_DISK_SIZE = 256 * 2**20
+
+
+class ResourceCache:
+    """A bounded LRU cache of response bodies with an optional SQLite file.
+
+    Each thread opens its own connection to the file on first use, so the
+    cache can be passed to other processes before that. The file is read and
+    written without holding the lock of the cache.
+
+    :param max_entries: maximum number of bodies kept in memory.
+    :param path: the SQLite file, or None to keep the bodies in memory only.
+    :param max_disk_size: maximum number of bytes of the bodies in the file.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 path: Optional[Union[str, os.PathLike]] = None,
+                 max_disk_size: int = DEFAULT_MAX_DISK_SIZE) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self.path = None if path is None else os.path.expanduser(path)
+        self.max_disk_size = max_disk_size
+
+        self._lock = threading.Lock()
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._counters = dict.fromkeys(CacheStats._fields, 0)
+
+    def __getstate__(self):
+        return {'max_entries': self.max_entries, 'path': self.path, 'max_disk_size': self.max_disk_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**self._counters)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection of the current thread to the file."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # closed by `close`, possibly from another thread
+            connection = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS resources (key TEXT PRIMARY KEY, body BLOB, size INTEGER, used REAL);
+                CREATE INDEX IF NOT EXISTS resources_used ON resources (used);
+            """)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the body of a key, or None."""
+        with self._lock:
+            body = self._memory.get(key)
+            if body is not None:
+                self._memory.move_to_end(key)
+                self._count('hits', 'memory_hits')
+                return body
+            if self.path is None:
+                self._count('misses')
+                return None
+
+        connection = self.connection
+        with connection:
+            row = connection.execute("SELECT body FROM resources WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                connection.execute("UPDATE resources SET used = ? WHERE key = ?", (time.time(), key))
+
+        with self._lock:
+            if row is None:
+                self._count('misses')
+                return None
+            body = bytes(row[0])
+            self._put_memory(key, body)
+            self._count('hits', 'disk_hits')
+            return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Stores the body of a key."""
+        body = bytes(body)
+        with self._lock:
+            self._put_memory(key, body)
+        if self.path is None or len(body) > self.max_disk_size:
+            return
+
+        evicted = self._put_disk(key, body)
+        with self._lock:
+            self._counters['evictions'] += evicted
+
+    def clear(self) -> None:
+        """Removes all bodies from memory and from the file."""
+        with self._lock:
+            self._memory.clear()
+        if self.path is not None:
+            with self.connection:
+                self.connection.execute("DELETE FROM resources")
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+            self._local = threading.local()
+
+    def _count(self, *counters: str) -> None:
+        for counter in counters:
+            self._counters[counter] += 1
+
+    def _put_memory(self, key: str, body: bytes) -> None:
+        self._memory[key] = body
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._count('evictions')
+
+    def _put_disk(self, key: str, body: bytes) -> int:
+        """Stores a body in the file and returns the number of evicted bodies."""
+        connection = self.connection
+        # the transaction holds the write lock of the file, so processes do
+        # not evict concurrently
+        with connection:
+            connection.execute("INSERT OR REPLACE INTO resources (key, body, size, used) VALUES (?, ?, ?, ?)",
+                               (key, body, len(body), time.time()))
+            (size,) = connection.execute("SELECT TOTAL(size) FROM resources").fetchone()
+            if size <= self.max_disk_size:
+                return 0
+
+            evicted = []
+            least_recently_used = connection.execute(
+                "SELECT key, size FROM resources WHERE key != ? ORDER BY used", (key,))
+            for (evicted_key, evicted_size) in least_recently_used:
+                if size <= self.max_disk_size:
+                    break
+                evicted.append((evicted_key,))
+                size -= evicted_size
+            connection.executemany("DELETE FROM resources WHERE key = ?", evicted)
+        return len(evicted)
+
+
+class _CachedResponse(NamedTuple):
+    """The part of a `RESTResponse` that `ApiClient.deserialize` reads."""
+
+    data: bytes
+
+
+def _without_none(document: Any) -> Any:
+    if isinstance(document, dict):
+        return {k: _without_none(v) for (k, v) in document.items() if v is not None}
+    if isinstance(document, (list, tuple)):
+        return [_without_none(v) for v in document]
+    return document
+
+
+def workflow_hash(workflow: Union[BaseModel, Dict[str, Any]]) -> str:
+    """Returns the SHA-256 of the canonical JSON of a `Workflow` or operator.
+
+    The canonical JSON has sorted keys, no whitespace and no null values,
+    so equal workflows have the same hash regardless of how they were built.
+    """
+    document = workflow.to_dict() if isinstance(workflow, BaseModel) else workflow
+    canonical = json.dumps(_without_none(document), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _cached(api, base: type, operation: str, argument: Any, response_type: str, kwargs: Dict[str, Any],
+            key: Optional[str] = None) -> Any:
+    """Calls an operation of `base` with a single immutable argument through `api.cache`.
+
+    The argument is part of the cache key, unless another `key` is given.
+    """
+    if kwargs:
+        # `async_req` and other special keyword arguments bypass the cache
+        return getattr(base, operation)(api, argument, **kwargs)
+
+    key = f"{api.api_client.configuration.host}/{operation}/{argument if key is None else key}"
+    body = api.cache.get(key)
+    if body is None:
+        response = getattr(base, f"{operation}_with_http_info")(api, argument, _preload_content=False)
+        with response.raw_data as stream:
+            body = stream.read()
+        api.cache.put(key, body)
+    return api.api_client.deserialize(_CachedResponse(body), response_type)
+
+
+class CachedWorkflowsApi(WorkflowsApi):
+    """A `WorkflowsApi` that caches workflows, their metadata, provenance and ids.
+
+    :param api_client: the `ApiClient` to request uncached resources with.
+    :param cache: the `ResourceCache` to store the resources in.
+    """
+
+    def __init__(self, api_client=None, cache: Optional[ResourceCache] = None) -> None:
+        super().__init__(api_client)
+        self.cache = cache if cache is not None else ResourceCache()
+
+    def load_workflow_handler(self, id, **kwargs):  # pylint: disable=redefined-builtin
+        """Retrieves an existing Workflow, from the cache if possible."""
+        return _cached(self, WorkflowsApi, 'load_workflow_handler', id, 'Workflow', kwargs)
+
+    def get_workflow_metadata_handler(self, id, **kwargs):  # pylint: disable=redefined-builtin
+        """Gets the metadata of a workflow, from the cache if possible."""
+        return _cached(self, WorkflowsApi, 'get_workflow_metadata_handler', id, 'TypedResultDescriptor', kwargs)
+
+    def get_workflow_provenance_handler(self, id, **kwargs):  # pylint: disable=redefined-builtin
+        """Gets the provenance of all datasets used in a workflow, from the cache if possible."""
+        return _cached(self, WorkflowsApi, 'get_workflow_provenance_handler', id, 'List[ProvenanceEntry]', kwargs)
+
+    def register_workflow_handler(self, workflow, **kwargs):
+        """Registers a new Workflow, or returns its id from the cache if it was registered before."""
+        return _cached(self, WorkflowsApi, 'register_workflow_handler', workflow, 'AddCollection200Response', kwargs,
+                       key=workflow_hash(workflow))
+
+
+class CachedSpatialReferencesApi(SpatialReferencesApi):
+    """A `SpatialReferencesApi` that caches spatial reference specifications.
+
+    :param api_client: the `ApiClient` to request uncached resources with.
+    :param cache: the `ResourceCache` to store the resources in.
+    """
+
+    def __init__(self, api_client=None, cache: Optional[ResourceCache] = None) -> None:
+        super().__init__(api_client)
+        self.cache = cache if cache is not None else ResourceCache()
+
+    def get_spatial_reference_specification_handler(self, srs_string, **kwargs):
+        """Gets a spatial reference specification, from the cache if possible."""
+        return _cached(self, SpatialReferencesApi, 'get_spatial_reference_specification_handler', srs_string,
+                       'SpatialReferenceSpecification', kwargs)
@@ -21,6 +21,12 @@ import ssl
 
 from urllib.parse import urlencode, quote_plus
 import urllib3
+# Note: stream files of multipart bodies instead of reading them
+from geoengine_openapi_client.multipart import MultipartEncoder
+# Note: compression of request and response bodies
+from geoengine_openapi_client.compression import compress_request_body
+# Note: per-operation metrics and instrumentation hooks
+from geoengine_openapi_client.instrumentation import observe_bytes_out
 
 from geoengine_openapi_client.exceptions import ApiException, UnauthorizedException, ForbiddenException, NotFoundException, ServiceException, ApiValueError, BadRequestException
 
@@ -54,6 +60,26 @@ class RESTClientObject:
         # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
         # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
 
+        # Note: pluggable json codec
+        self.json_codec = configuration.json_codec
+
+        # Note: stream files of multipart bodies instead of reading them
+        self.upload_progress = configuration.upload_progress
+
+        # Note: conditional requests for GET responses
+        self.http_cache = configuration.http_cache
+
+        # Note: compression of request and response bodies
+        self.accept_encoding = configuration.accept_encoding
+        self.request_compression = configuration.request_compression
+        self.request_compression_min_size = configuration.request_compression_min_size
+
+        # Note: pluggable transports
+        transport = self.create_transport(configuration, maxsize)
+        if transport is not None:
+            self.pool_manager = transport
+            return
+
         # cert_reqs
         if configuration.verify_ssl:
             cert_reqs = ssl.CERT_REQUIRED
@@ -104,6 +130,16 @@ class RESTClientObject:
                 **addition_pool_args
             )
 
+    # Note: pluggable transports
+    def create_transport(self, configuration, maxsize):
+        """Returns the transport that replaces the urllib3 pool manager, or None."""
+        return configuration.transport
+
+    # Note: close the connections when the `ApiClient` is closed
+    def close(self) -> None:
+        """Closes the connections of the transport."""
+        self.pool_manager.clear()
+
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
                 _request_timeout=None):
@@ -135,11 +171,23 @@ class RESTClientObject:
             )
 
         post_params = post_params or {}
-        headers = headers or {}
+        # Note: copy the headers, retries send them again
+        headers = dict(headers or {})
+        # Note: compression of request and response bodies
+        if self.accept_encoding and 'Accept-Encoding' not in headers:
+            headers['Accept-Encoding'] = self.accept_encoding
+
         # url already contains the URL query string
         # so reset query_params to empty dict
         query_params = {}
 
+        # Note: conditional requests for GET responses
+        use_http_cache = self.http_cache is not None and method == 'GET' and _preload_content
+        if use_http_cache:
+            cached_response = self.http_cache.before_request(url, headers)
+            if cached_response is not None:
+                return cached_response
+
         timeout = None
         if _request_timeout:
             if isinstance(_request_timeout, (int,float)):  # noqa: E501,F821
@@ -157,7 +205,13 @@ class RESTClientObject:
                 if not headers.get('Content-Type') or re.search('json', headers['Content-Type'], re.IGNORECASE):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        # Note: encode with the configured json codec
+                        request_body = self.json_codec.dumps(body)
+                        # Note: compression of request and response bodies
+                        request_body = compress_request_body(request_body, headers, self.request_compression,
+                                                             self.request_compression_min_size)
+                        # Note: per-operation metrics and instrumentation hooks
+                        observe_bytes_out(len(request_body))
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
@@ -173,14 +227,15 @@ class RESTClientObject:
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
+                    # Note: stream files of multipart bodies instead of reading them
+                    request_body = MultipartEncoder(post_params, progress=self.upload_progress)
+                    headers['Content-Type'] = request_body.content_type
+                    headers['Content-Length'] = str(request_body.content_length)
+                    # Note: per-operation metrics and instrumentation hooks
+                    observe_bytes_out(request_body.content_length)
                     r = self.pool_manager.request(
                         method, url,
-                        fields=post_params,
-                        encode_multipart=True,
+                        body=request_body,
                         preload_content=_preload_content,
                         timeout=timeout,
                         headers=headers)
@@ -218,6 +273,13 @@ class RESTClientObject:
             # log response body
             logger.debug("response body: %s", r.data)
 
+            # Note: conditional requests for GET responses
+            if use_http_cache:
+                r = self.http_cache.after_response(url, headers, r)
+                if r is None:
+                    return self.request(method, url, headers=self.http_cache.without_validators(headers),
+                                        _preload_content=_preload_content, _request_timeout=_request_timeout)
+
         if not 200 <= r.status <= 299:
             if r.status == 400:
                 raise BadRequestException(http_resp=r)
@@ -0,0 +1,230 @@
+# coding: utf-8
+
+"""
+    Retrying of failed requests.
+
+    `Configuration.retries` only configures the connection level retries of
+    urllib3. A `RetryPolicy` in `Configuration.retry_policy` additionally
+    retries requests that failed with a transient error status or a
+    connection error, with exponential backoff and full jitter, e.g.
+
+    >>> configuration.retry_policy = RetryPolicy(
+    ...     retries=5,
+    ...     budget=RetryBudget(100, per_seconds=60),
+    ...     overrides={"register_workflow_handler": RetryPolicy(methods={"POST"})},
+    ... )
+
+    Only idempotent methods are retried, except for `429 Too Many Requests`
+    which the server sends before processing a request. A `Retry-After`
+    header of the response is honored. Overrides apply to the operations
+    with the given names, i.e. the names of the api methods.
+"""  # noqa: E501
+
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from urllib3.exceptions import HTTPError
+
+from geoengine_openapi_client.exceptions import ApiException
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# statuses the server sends without processing the request
+UNPROCESSED_STATUSES = frozenset({429})
+CONNECTION_ERRORS = (HTTPError, ConnectionError)
+
+
+def connection_errors() -> Tuple[type, ...]:
+    """Returns the exceptions of failed connections.
+
+    The errors of `aiohttp` are only included once the asynchronous client has
+    imported it, so `aiohttp` is not imported with this module.
+    """
+    aiohttp = sys.modules.get('aiohttp')
+    if aiohttp is None:
+        return CONNECTION_ERRORS
+    return CONNECTION_ERRORS + (aiohttp.ClientConnectionError,)
+
+
+class RetryBudget:
+    """A token bucket that bounds the retries of all requests.
+
+    :param retries: the capacity of the bucket.
+    :param per_seconds: the time to refill an empty bucket, or None to never
+                        refill it, i.e. for a fixed total number of retries.
+    """
+
+    def __init__(self, retries: int, per_seconds: Optional[float] = None) -> None:
+        self.capacity = retries
+        self.per_seconds = per_seconds
+        self._tokens = float(retries)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        # copies of a `Configuration` share the state
+        return self
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            self._refill()
+            return int(self._tokens)
+
+    def try_acquire(self) -> bool:
+        """Takes a retry from the budget, if one is left."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if self.per_seconds:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.capacity / self.per_seconds)
+        self._updated = now
+
+
+def retry_after(exception: Exception) -> Optional[float]:
+    """Returns the seconds of the `Retry-After` header of an error response."""
+    headers = getattr(exception, 'headers', None)
+    value = headers.get('Retry-After') if headers else None
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """When and how long to wait before repeating a failed request.
+
+    :param retries: maximum number of retries per request.
+    :param backoff: the upper bound of the first delay in seconds. The bound
+                    doubles with each retry.
+    :param max_backoff: the maximum upper bound of the delays in seconds.
+    :param statuses: the error statuses to retry.
+    :param methods: the HTTP methods to retry after any error.
+    :param max_retry_after: the longest `Retry-After` in seconds to wait for.
+                            Requests with a longer one are not retried.
+    :param budget: bounds the retries of all requests, or None.
+    :param overrides: policies for operations by name, e.g. `wms_map_handler`.
+                      They share the budget of this policy if they have none.
+    """
+
+    def __init__(self, retries: int = 3,
+                 backoff: float = 0.5,
+                 max_backoff: float = 30.0,
+                 statuses: Iterable[int] = RETRY_STATUSES,
+                 methods: Iterable[str] = IDEMPOTENT_METHODS,
+                 max_retry_after: float = 120.0,
+                 budget: Optional[RetryBudget] = None,
+                 overrides: Optional[Dict[str, 'RetryPolicy']] = None) -> None:
+        if retries < 0 or backoff < 0 or max_backoff < 0:
+            raise ValueError("retries and backoff must not be negative")
+
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses: FrozenSet[int] = frozenset(statuses)
+        self.methods: FrozenSet[str] = frozenset(m.upper() for m in methods)
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.overrides = overrides or {}
+
+    def for_operation(self, operation: Optional[str]) -> 'RetryPolicy':
+        """Returns the policy of an operation."""
+        return self.overrides.get(operation, self) if operation is not None else self
+
+    def is_retryable(self, method: str, exception: Exception) -> bool:
+        """Whether a request may be repeated after an exception."""
+        if isinstance(exception, ApiException):
+            if exception.status not in self.statuses:
+                return False
+            return method.upper() in self.methods or exception.status in UNPROCESSED_STATUSES
+        if isinstance(exception, connection_errors()):
+            return method.upper() in self.methods
+        return False
+
+    def delay(self, attempt: int, exception: Exception) -> Optional[float]:
+        """Returns the seconds to wait before a retry, or None to give up.
+
+        :param attempt: the number of retries so far.
+        :param exception: the error of the last attempt.
+        """
+        if attempt >= self.retries:
+            return None
+
+        # full jitter
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+        server_delay = retry_after(exception)
+        if server_delay is not None:
+            if server_delay > self.max_retry_after:
+                return None
+            delay = max(delay, server_delay)
+        return delay
+
+    def next_delay(self, method: str, attempt: int, exception: Exception,
+                   budget: Optional[RetryBudget]) -> Optional[float]:
+        """Returns the seconds to wait before a retry and takes it from the budget."""
+        if not self.is_retryable(method, exception):
+            return None
+        delay = self.delay(attempt, exception)
+        budget = self.budget or budget
+        if delay is None or (budget is not None and not budget.try_acquire()):
+            return None
+        return delay
+
+
+def call_with_retries(policy: Optional[RetryPolicy], operation: Optional[str],
+                      request: Callable[..., Any], method: str, *args, **kwargs) -> Any:
+    """Calls `request(method, *args, **kwargs)` and repeats it according to `policy`."""
+    if policy is None:
+        return request(method, *args, **kwargs)
+
+    operation_policy = policy.for_operation(operation)
+    attempt = 0
+    while True:
+        try:
+            return request(method, *args, **kwargs)
+        except (ApiException,) + connection_errors() as e:
+            delay = operation_policy.next_delay(method, attempt, e, policy.budget)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+async def async_call_with_retries(policy: Optional[RetryPolicy], operation: Optional[str],
+                                  request: Callable[..., Any], method: str, *args, **kwargs) -> Any:
+    """Awaits `request(method, *args, **kwargs)` and repeats it according to `policy`."""
+    if policy is None:
+        return await request(method, *args, **kwargs)
+
+    operation_policy = policy.for_operation(operation)
+    attempt = 0
+    while True:
+        try:
+            return await request(method, *args, **kwargs)
+        except (ApiException,) + connection_errors() as e:
+            delay = operation_policy.next_delay(method, attempt, e, policy.budget)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
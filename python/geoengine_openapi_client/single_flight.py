@@ -0,0 +1,83 @@
+# coding: utf-8
+
+"""
+    Coalescing of identical concurrent requests.
+
+    If `Configuration.coalesce_requests` is set, identical GET requests that
+    are in flight at the same time from different threads are sent only once.
+    All callers receive the same deserialized result, or the same exception,
+    so results must not be modified, e.g.
+
+    >>> configuration.coalesce_requests = True
+    >>> api = WorkflowsApi(ApiClient(configuration))
+    >>> with ThreadPoolExecutor(64) as executor:
+    ...     workflows = list(executor.map(api.load_workflow_handler, [workflow_id] * 64))
+    >>> api.api_client.single_flight.coalesced
+    63
+
+    Requests with the same parameters that start after the first one has
+    finished are sent again, i.e. nothing is cached.
+"""  # noqa: E501
+
+
+from concurrent.futures import Future
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Runs a function once for all callers with the same key at the same time."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.coalesced = 0
+        """The number of calls that shared the result of another call."""
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Returns `function(*args, **kwargs)`, or the result of the call in flight with the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key)
+            call.set_exception(e)
+            raise
+        self._finish(key)
+        call.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+
+def coalesced_call_api(api_client, call_api: Callable[..., Any], resource_path, method,
+                       path_params=None, query_params=None, header_params=None,
+                       body=None, post_params=None, files=None, *args) -> Any:
+    """Calls `call_api` with the arguments of `ApiClient.__call_api`, once for
+    identical concurrent GET requests if `Configuration.coalesce_requests` is set.
+    """
+    (_, _, return_http_data_only, _, preload_content, _, host, request_auth, operation) = args
+    if not api_client.configuration.coalesce_requests or method != 'GET' \
+            or body is not None or post_params or files or not preload_content:
+        return call_api(resource_path, method, path_params, query_params, header_params,
+                        body, post_params, files, *args)
+
+    key = json.dumps([
+        host, resource_path, path_params, query_params, header_params,
+        return_http_data_only, request_auth, operation,
+    ], sort_keys=True, default=str)
+    return api_client.single_flight.do(key, call_api, resource_path, method, path_params, query_params,
+                                       header_params, body, post_params, files, *args)
@@ -0,0 +1,82 @@
+# coding: utf-8
+
+"""
+    Streaming access to response bodies.
+
+    Calling an `*_with_http_info` method with `_preload_content=False` returns
+    an `ApiResponse` whose `raw_data` is a `StreamingResponse`. The body is then
+    read from the socket in chunks instead of being buffered as a whole, e.g.
+
+    >>> response = ogc_wcs_api.wcs_get_coverage_handler_with_http_info(
+    ...     ..., _preload_content=False)
+    >>> with response.raw_data as stream:
+    ...     stream.write_to("coverage.tiff")
+"""  # noqa: E501
+
+
+import io
+import os
+from typing import BinaryIO, Iterator, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class StreamingResponse(io.IOBase):
+    """A response whose body has not been read yet.
+
+    :param resp: the unread `urllib3.HTTPResponse`.
+    """
+
+    def __init__(self, resp) -> None:
+        self.urllib3_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return self.urllib3_response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.urllib3_response.headers.get(name, default)
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to `size` bytes of the body, or the rest if `size` is negative."""
+        return self.urllib3_response.read(None if size < 0 else size)
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterates over the body in chunks of at most `chunk_size` bytes."""
+        return self.urllib3_response.stream(chunk_size)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.iter_chunks()
+
+    def write_to(self, target: Union[str, os.PathLike, BinaryIO],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Writes the body to a file path or a binary file object.
+
+        :param target: path of the output file or a writable binary file object.
+        :param chunk_size: maximum number of bytes held in memory at once.
+        :return: the number of bytes written.
+        """
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, 'wb') as f:
+                return self.write_to(f, chunk_size)
+
+        written = 0
+        for chunk in self.iter_chunks(chunk_size):
+            target.write(chunk)
+            written += len(chunk)
+        return written
+
+    def close(self) -> None:
+        """Releases the connection back to the pool."""
+        if not self.closed:
+            if not self.urllib3_response.closed:
+                # discard the unread rest of the body together with the connection
+                self.urllib3_response.close()
+            self.urllib3_response.release_conn()
+        super().close()
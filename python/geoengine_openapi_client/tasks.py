@@ -0,0 +1,144 @@
+# coding: utf-8
+
+"""
+    Waiting for the completion of tasks.
+
+    `wait_for_task` polls the status of a single task. `wait_for_tasks` watches
+    many tasks with one paginated `TasksApi.list_handler` request per round
+    instead of one `status_handler` request per task, e.g.
+
+    >>> responses = [workflows_api.dataset_from_workflow_handler(...) for ...]
+    >>> statuses = wait_for_tasks(tasks_api, responses, timeout=3600)
+    >>> failed = [s for s in statuses.values() if isinstance(s, FailedTaskStatus)]
+
+    Both poll with a delay that grows while the tasks make no progress.
+"""  # noqa: E501
+
+
+import time
+from typing import Dict, Iterable, Optional, Union
+
+from geoengine_openapi_client.api.tasks_api import TasksApi
+from geoengine_openapi_client.models.aborted_task_status import AbortedTaskStatus
+from geoengine_openapi_client.models.completed_task_status import CompletedTaskStatus
+from geoengine_openapi_client.models.failed_task_status import FailedTaskStatus
+from geoengine_openapi_client.models.running_task_status import RunningTaskStatus
+from geoengine_openapi_client.models.task_filter import TaskFilter
+from geoengine_openapi_client.models.task_response import TaskResponse
+from geoengine_openapi_client.pagination import paginate
+
+FinishedTaskStatus = Union[CompletedTaskStatus, FailedTaskStatus, AbortedTaskStatus]
+
+
+class AdaptiveBackoff:
+    """Polling delays that grow geometrically while nothing changes.
+
+    :param initial: first delay in seconds.
+    :param maximum: upper bound of the delay in seconds.
+    :param factor: growth of the delay after a round without progress.
+    """
+
+    def __init__(self, initial: float = 0.1, maximum: float = 10.0, factor: float = 1.5) -> None:
+        if initial <= 0 or maximum < initial or factor < 1:
+            raise ValueError("expected 0 < initial <= maximum and factor >= 1")
+
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.delay = initial
+
+    def next_delay(self, progress: bool) -> float:
+        """Returns the delay before the next poll.
+
+        :param progress: whether the last poll observed any change.
+        """
+        delay = self.delay
+        if not progress:
+            self.delay = min(self.delay * self.factor, self.maximum)
+        return delay
+
+
+def _task_id(task: Union[str, TaskResponse]) -> str:
+    return task.task_id if isinstance(task, TaskResponse) else task
+
+
+def _sleep(backoff: AdaptiveBackoff, progress: bool, deadline: Optional[float]) -> None:
+    delay = backoff.next_delay(progress)
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("timed out waiting for tasks")
+        delay = min(delay, remaining)
+    time.sleep(delay)
+
+
+def wait_for_task(tasks_api: TasksApi, task: Union[str, TaskResponse],
+                  timeout: Optional[float] = None,
+                  backoff: Optional[AdaptiveBackoff] = None) -> FinishedTaskStatus:
+    """Polls the status of a task until it is no longer running.
+
+    :param tasks_api: the `TasksApi` to poll with.
+    :param task: a task id or the `TaskResponse` that created the task.
+    :param timeout: seconds after which a `TimeoutError` is raised, or None.
+    :param backoff: the polling delays.
+    :return: the completed, failed or aborted status of the task.
+    """
+    task_id = _task_id(task)
+    backoff = backoff or AdaptiveBackoff()
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    last_progress = None
+    while True:
+        status = tasks_api.status_handler(task_id).actual_instance
+        if not isinstance(status, RunningTaskStatus):
+            return status
+
+        progress = status.pct_complete != last_progress
+        last_progress = status.pct_complete
+        _sleep(backoff, progress, deadline)
+
+
+def wait_for_tasks(tasks_api: TasksApi, tasks: Iterable[Union[str, TaskResponse]],
+                   timeout: Optional[float] = None,
+                   backoff: Optional[AdaptiveBackoff] = None,
+                   page_size: int = 100) -> Dict[str, FinishedTaskStatus]:
+    """Waits until none of the tasks is running anymore.
+
+    Each round lists all running tasks page by page. The status of a task is
+    requested once, after it disappeared from the running tasks.
+
+    :param tasks_api: the `TasksApi` to poll with.
+    :param tasks: task ids or the `TaskResponse`s that created the tasks.
+    :param timeout: seconds after which a `TimeoutError` is raised, or None.
+    :param backoff: the polling delays.
+    :param page_size: number of running tasks listed per request.
+    :return: the completed, failed or aborted status of each task by task id.
+    """
+    waiting = {_task_id(task) for task in tasks}
+    backoff = backoff or AdaptiveBackoff()
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    finished: Dict[str, FinishedTaskStatus] = {}
+    last_progress: Dict[str, str] = {}
+    while True:
+        running = {}
+        for task_status in paginate(tasks_api.list_handler, TaskFilter.RUNNING, page_size=page_size):
+            if task_status.task_id in waiting:
+                running[task_status.task_id] = task_status.actual_instance.pct_complete
+
+        progress = running != last_progress
+        for task_id in waiting - running.keys():
+            status = tasks_api.status_handler(task_id).actual_instance
+            if isinstance(status, RunningTaskStatus):
+                # started after the listing
+                running[task_id] = status.pct_complete
+            else:
+                finished[task_id] = status
+                progress = True
+        waiting = set(running)
+
+        if not waiting:
+            return finished
+
+        last_progress = running
+        _sleep(backoff, progress, deadline)
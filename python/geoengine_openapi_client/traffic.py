@@ -0,0 +1,337 @@
+# coding: utf-8
+
+"""
+    Recording and replaying of traffic.
+
+    A `TrafficRecorder` in `Configuration.traffic_recorder` writes every
+    request sent by an `ApiClient` to a log with one JSON object per line,
+    gzip compressed if the path ends with `.gz`. Each record has the
+    operation, the request, the response status, the duration and the
+    request and response sizes. Response bodies are only recorded with
+    `max_response_body_size`, e.g.
+
+    >>> with TrafficRecorder("traffic.jsonl.gz") as recorder:
+    ...     configuration.traffic_recorder = recorder
+    ...     run_workload(ApiClient(configuration))
+
+    `replay` sends the recorded requests again, e.g. against a local
+    Geo Engine instance, at the recorded or a scaled speed and reports the
+    latencies per operation
+
+    >>> records = read_traffic("traffic.jsonl.gz")
+    >>> replay(records, ApiClient(local_configuration), speed=2.0, concurrency=16)
+    {'wms_map_handler': LatencySummary(count=1200, errors=0, p50=0.041, p90=0.09, p99=0.2, max=0.31), ...}
+    >>> summarize(records)  # the recorded latencies, for comparison
+
+    Authentication headers are not recorded; `replay` uses the
+    authentication of its `ApiClient`. Uploaded files are recorded with
+    their sizes only and replayed with zero bytes of the same size. Requests
+    that cannot be recorded, e.g. with binary bodies, are logged and skipped.
+"""  # noqa: E501
+
+
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from geoengine_openapi_client.exceptions import ApiException
+from geoengine_openapi_client.multipart import MultipartFile
+from geoengine_openapi_client.retry import connection_errors
+
+SENSITIVE_HEADERS = frozenset({'authorization', 'cookie', 'proxy-authorization'})
+
+logger = logging.getLogger(__name__)
+
+
+class TrafficRecord(NamedTuple):
+    """A recorded request and its response.
+
+    The status is 0 for connection errors. The response size is the size
+    of the decoded body, or the `Content-Length` of streamed responses.
+    The response body is None unless it is a UTF-8 text within the
+    `max_response_body_size` of the `TrafficRecorder`.
+    """
+
+    # seconds since the recording started
+    start: float
+    operation: Optional[str]
+    method: str
+    # the url without the host
+    path: str
+    headers: Dict[str, str]
+    body: Any
+    form: List[Tuple[str, str]]
+    # `(field, filename, size, content type)` of uploaded files
+    files: List[Tuple[str, str, int, str]]
+    status: int
+    duration: float
+    request_size: int
+    response_size: Optional[int]
+    response_body: Optional[str] = None
+
+
+class TrafficRecorder:
+    """Writes the requests of `ApiClient`s to a log.
+
+    :param path: the log file, appended to and gzip compressed if it ends with `.gz`.
+    :param sensitive_headers: headers that are not recorded.
+    :param max_response_body_size: maximum size of recorded response bodies
+                                   in bytes, 0 to record none.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike],
+                 sensitive_headers: FrozenSet[str] = SENSITIVE_HEADERS, max_response_body_size: int = 0) -> None:
+        self.path = path
+        self.sensitive_headers = frozenset(header.lower() for header in sensitive_headers)
+        self.max_response_body_size = max_response_body_size
+        self._file = None
+        self._started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def recording(self, request: Callable, host: str, operation: Optional[str]) -> Callable:
+        """Wraps `ApiClient.request` to record its requests.
+
+        :param host: the host the urls of the requests start with.
+        """
+        self._start()
+
+        def recorded_request(method: str, url: str, **kwargs):
+            started = time.monotonic()
+            headers = dict(kwargs.get('headers') or {})
+            (response, error) = (None, None)
+            try:
+                response = request(method, url, **kwargs)
+                return response
+            except ApiException as e:
+                error = e
+                raise
+            finally:
+                self._record(started, operation, method, url[len(host):] if url.startswith(host) else url,
+                             headers, kwargs, response, error)
+
+        return recorded_request
+
+    def recording_async(self, request: Callable, host: str, operation: Optional[str]) -> Callable:
+        """Wraps `AsyncRESTClientObject.request` to record its requests.
+
+        :param host: the host the urls of the requests start with.
+        """
+        self._start()
+
+        async def recorded_request(method: str, url: str, **kwargs):
+            started = time.monotonic()
+            headers = dict(kwargs.get('headers') or {})
+            (response, error) = (None, None)
+            try:
+                response = await request(method, url, **kwargs)
+                return response
+            except ApiException as e:
+                error = e
+                raise
+            finally:
+                self._record(started, operation, method, url[len(host):] if url.startswith(host) else url,
+                             headers, kwargs, response, error)
+
+        return recorded_request
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+
+    def _record(self, started: float, operation: Optional[str], method: str, path: str, headers: Dict[str, str],
+                kwargs: Dict[str, Any], response, error: Optional[ApiException]) -> None:
+        # errors of the recording must not replace the outcome of the request
+        try:
+            self._write(started, operation, method, path, headers, kwargs, response, error)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("failed to record request %s %s: %s", method, path, e)
+
+    def _write(self, started: float, operation: Optional[str], method: str, path: str, headers: Dict[str, str],
+               kwargs: Dict[str, Any], response, error: Optional[ApiException]) -> None:
+        duration = time.monotonic() - started
+        (status, size, response_body) = (0, None, None)
+        if response is not None:
+            preload_content = kwargs.get('_preload_content', True)
+            (status, size) = (response.status, response_size(response, preload_content))
+            if preload_content:
+                response_body = self._response_body(response.data)
+        elif error is not None:
+            (status, size, response_body) = (error.status or 0, len(error.body or b""), self._response_body(error.body))
+
+        body = kwargs.get('body')
+        (form, files) = ([], [])
+        for (name, value) in kwargs.get('post_params') or []:
+            if isinstance(value, tuple):
+                (filename, data, content_type) = value
+                files.append((name, filename, data.size if isinstance(data, MultipartFile) else len(data),
+                              content_type))
+            else:
+                form.append((name, str(value)))
+
+        request_size = sum(len(value) for (_, value) in form) + sum(file[2] for file in files)
+        if body is not None:
+            request_size += len(body) if isinstance(body, (str, bytes)) else len(json.dumps(body))
+
+        with self._lock:
+            record = TrafficRecord(
+                start=round(started - self._started, 6),
+                operation=operation,
+                method=method,
+                path=path,
+                headers={k: v for (k, v) in headers.items() if k.lower() not in self.sensitive_headers},
+                body=body.decode('utf-8') if isinstance(body, bytes) else body,
+                form=form,
+                files=files,
+                status=status,
+                duration=round(duration, 6),
+                request_size=request_size,
+                response_size=size,
+                response_body=response_body,
+            )
+            if self._file is None:
+                self._file = _open(self.path, 'at')
+            self._file.write(json.dumps(record._asdict(), separators=(',', ':')) + '\n')
+
+    def _response_body(self, data: Union[str, bytes, None]) -> Optional[str]:
+        if not data or len(data) > self.max_response_body_size:
+            return None
+        if isinstance(data, str):
+            return data
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> 'TrafficRecorder':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __deepcopy__(self, memo) -> 'TrafficRecorder':
+        # copies of a `Configuration` share the log
+        return self
+
+
+def _open(path: Union[str, os.PathLike], mode: str):
+    if os.fspath(path).endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def response_size(response, preload_content: bool = True) -> Optional[int]:
+    """Returns the size of the decoded body, or the `Content-Length` of streamed responses."""
+    if preload_content:
+        return len(response.data) if response.data is not None else 0
+    content_length = response.headers.get('Content-Length')
+    return int(content_length) if content_length is not None else None
+
+
+def read_traffic(path: Union[str, os.PathLike]) -> List[TrafficRecord]:
+    """Reads the records of a log written by a `TrafficRecorder`."""
+    with _open(path, 'rt') as f:
+        return [TrafficRecord(**json.loads(line)) for line in f if line.strip()]
+
+
+class LatencySummary(NamedTuple):
+    """Latencies of the requests of an operation in seconds.
+
+    Errors are responses with an error status and connection errors.
+    """
+
+    count: int
+    errors: int
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    # nearest rank
+    rank = max(1, -(-len(sorted_values) * percentile // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(results: Iterable[Union[TrafficRecord, Tuple[Optional[str], int, float]]]) -> Dict[str, LatencySummary]:
+    """Summarizes latencies per operation.
+
+    :param results: `TrafficRecord`s or `(operation, status, duration)` tuples.
+    """
+    durations: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    for result in results:
+        if isinstance(result, TrafficRecord):
+            result = (result.operation, result.status, result.duration)
+        (operation, status, duration) = result
+        operation = operation or 'unknown'
+        durations.setdefault(operation, []).append(duration)
+        errors[operation] = errors.get(operation, 0) + (status == 0 or status >= 400)
+
+    summaries = {}
+    for (operation, values) in sorted(durations.items()):
+        values.sort()
+        summaries[operation] = LatencySummary(
+            count=len(values),
+            errors=errors[operation],
+            p50=_percentile(values, 50),
+            p90=_percentile(values, 90),
+            p99=_percentile(values, 99),
+            max=values[-1],
+        )
+    return summaries
+
+
+def replay(records: Iterable[TrafficRecord], api_client, speed: Optional[float] = 1.0,
+           concurrency: int = 8) -> Dict[str, LatencySummary]:
+    """Sends recorded requests again and summarizes their latencies per operation.
+
+    :param api_client: the `ApiClient` of the target host and its authentication.
+    :param speed: factor of the recorded request rate, or None to send the
+                  requests as fast as possible.
+    :param concurrency: maximum number of requests in flight. Requests are
+                        delayed when all of them are in flight.
+    """
+    auth_settings = list(api_client.configuration.auth_settings())
+
+    def send(record: TrafficRecord) -> Tuple[Optional[str], int, float]:
+        headers = dict(record.headers)
+        api_client.update_params_for_auth(headers, [], auth_settings, record.path, record.method, record.body)
+        post_params = list(record.form) + [
+            (name, (filename, bytes(size), content_type)) for (name, filename, size, content_type) in record.files
+        ]
+
+        started = time.monotonic()
+        try:
+            response = api_client.request(record.method, api_client.configuration.host + record.path,
+                                          headers=headers, body=record.body, post_params=post_params or None)
+            status = response.status
+        except ApiException as e:
+            status = e.status or 0
+        except connection_errors():
+            status = 0
+        return (record.operation, status, time.monotonic() - started)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(concurrency) as executor:
+        futures = []
+        for record in sorted(records, key=lambda record: record.start):
+            if speed:
+                delay = started + record.start / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append(executor.submit(send, record))
+
+        return summarize(future.result() for future in futures)
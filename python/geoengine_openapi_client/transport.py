@@ -0,0 +1,396 @@
+# coding: utf-8
+
+"""
+    Pluggable transports.
+
+    `RESTClientObject` encodes requests, handles errors, caching and
+    compression, and sends the encoded requests with its transport. By
+    default the transport is a `urllib3.PoolManager`, or an
+    `Http2PoolManager` with `Configuration.http2`. Any object implementing
+    `Transport` can be set as `Configuration.transport` instead, e.g. to
+    call an in-process app without sockets
+
+    >>> configuration.transport = WSGITransport(flask_app)
+    >>> WorkflowsApi(ApiClient(configuration)).load_workflow_handler(workflow_id)
+
+    or to measure the throughput of serialization and deserialization
+    without the network
+
+    >>> body = json.dumps(workflow)
+    >>> configuration.transport = MockTransport(lambda request: (200, {"Content-Type": "application/json"}, body))
+    >>> timeit.timeit(lambda: workflows_api.load_workflow_handler(workflow_id), number=10_000)
+
+    In-process transports ignore timeouts, TLS and proxy settings.
+"""  # noqa: E501
+
+
+import asyncio
+from http import HTTPStatus
+import io
+import sys
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import unquote, urlencode, urlsplit, parse_qs
+
+import urllib3
+try:
+    from urllib3 import HTTPHeaderDict
+except ImportError:  # urllib3 < 2
+    from urllib3._collections import HTTPHeaderDict
+try:
+    from typing import Protocol, runtime_checkable
+except ImportError:  # Python < 3.8
+    from typing_extensions import Protocol, runtime_checkable
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """Sends encoded requests, the interface of `urllib3.PoolManager`."""
+
+    def request(self, method: str, url: str, body=None, fields=None, encode_multipart: bool = True,
+                preload_content: bool = True, timeout: Optional[urllib3.Timeout] = None,
+                headers: Optional[Dict[str, str]] = None):
+        """Sends a request and returns a response like a `urllib3.HTTPResponse`.
+
+        :param body: the encoded body, `str`, `bytes` or a file-like object.
+        :param fields: form fields, urlencoded or as `multipart/form-data`.
+        :param preload_content: read the whole body before returning.
+        """
+
+    def clear(self) -> None:
+        """Closes all connections."""
+
+
+class TransportRequest(NamedTuple):
+    """A request sent with an in-process transport."""
+
+    method: str
+    url: str
+    headers: Dict[str, str]
+    body: bytes
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.url).path
+
+    @property
+    def query(self) -> Dict[str, str]:
+        return {k: v[0] for (k, v) in parse_qs(urlsplit(self.url).query, keep_blank_values=True).items()}
+
+
+class TransportResponse(io.IOBase):
+    """A response with the interface of a `urllib3.HTTPResponse`.
+
+    :param chunks: the body, read lazily unless `preload_content` is set.
+    """
+
+    def __init__(self, status: int, headers, chunks: Iterable[bytes], reason: Optional[str] = None,
+                 preload_content: bool = True) -> None:
+        self.status = status
+        self.reason = reason if reason is not None else _reason(status)
+        self.headers = HTTPHeaderDict(headers)
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = b""
+        self._data: Optional[bytes] = None
+        if preload_content:
+            self._data = self.read()
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None:
+            self._data = self.read()
+        return self._data
+
+    def getheaders(self) -> HTTPHeaderDict:
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Reads up to `amt` bytes of the body, or the rest if `amt` is None."""
+        if amt is None:
+            (data, self._buffer) = (self._buffer + b"".join(self._chunks), b"")
+            self.close()
+            return data
+
+        while len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        (data, self._buffer) = (self._buffer[:amt], self._buffer[amt:])
+        if not data:
+            self.close()
+        return data
+
+    def stream(self, amt: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        while True:
+            data = self.read(amt)
+            if not data:
+                return
+            yield data
+
+    def release_conn(self) -> None:
+        self.close()
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+
+def encode_body(body=None, fields=None, encode_multipart: bool = True,
+                headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Dict[str, str]]:
+    """Encodes the body of a `Transport.request` to bytes.
+
+    :return: the body and the headers, with the content type of encoded fields.
+    """
+    headers = dict(headers or {})
+    if fields:
+        if encode_multipart:
+            (body, headers['Content-Type']) = urllib3.encode_multipart_formdata(fields)
+        else:
+            body = urlencode(fields)
+            headers.setdefault('Content-Type', 'application/x-www-form-urlencoded')
+
+    if body is None:
+        return (b"", headers)
+    if isinstance(body, str):
+        return (body.encode('utf-8'), headers)
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return (bytes(body), headers)
+    if hasattr(body, 'read'):
+        # e.g. a `MultipartEncoder`
+        return (b"".join(iter(lambda: body.read(DEFAULT_CHUNK_SIZE), b"")), headers)
+    return (b"".join(body), headers)
+
+
+Handler = Callable[[TransportRequest], Tuple[int, Dict[str, str], Union[str, bytes]]]
+
+
+class MockTransport:
+    """An in-memory transport that answers requests with a handler.
+
+    :param handler: called with a `TransportRequest`, returns the status, the
+                    headers and the body of the response.
+    :param record: keep the requests in `requests`, disable for benchmarks.
+    """
+
+    def __init__(self, handler: Handler, record: bool = True) -> None:
+        self.handler = handler
+        self.record = record
+        self.requests: List[TransportRequest] = []
+
+    def request(self, method: str, url: str, body=None, fields=None, encode_multipart: bool = True,
+                preload_content: bool = True, timeout: Optional[urllib3.Timeout] = None,
+                headers: Optional[Dict[str, str]] = None) -> TransportResponse:
+        (body, headers) = encode_body(body, fields, encode_multipart, headers)
+        request = TransportRequest(method, url, headers, body)
+        if self.record:
+            self.requests.append(request)
+
+        (status, response_headers, response_body) = self.handler(request)
+        if isinstance(response_body, str):
+            response_body = response_body.encode('utf-8')
+        return TransportResponse(status, response_headers, [response_body], preload_content=preload_content)
+
+    def clear(self) -> None:
+        pass
+
+    def __deepcopy__(self, memo) -> 'MockTransport':
+        # copies of a `Configuration` share the transport
+        return self
+
+
+def _split_url(url: str) -> Tuple[str, str, int, str, str]:
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    return (parts.scheme or 'http', parts.hostname or 'localhost', port, parts.path or '/', parts.query)
+
+
+class WSGITransport:
+    """Calls a WSGI app in-process, e.g. a Flask or Django app.
+
+    :param app: the WSGI application.
+    :param script_name: the path prefix the app is mounted at.
+    """
+
+    def __init__(self, app: Callable, script_name: str = '') -> None:
+        self.app = app
+        self.script_name = script_name
+
+    def request(self, method: str, url: str, body=None, fields=None, encode_multipart: bool = True,
+                preload_content: bool = True, timeout: Optional[urllib3.Timeout] = None,
+                headers: Optional[Dict[str, str]] = None) -> TransportResponse:
+        (body, headers) = encode_body(body, fields, encode_multipart, headers)
+        (scheme, host, port, path, query) = _split_url(url)
+        path = unquote(path)
+        if self.script_name and path.startswith(self.script_name):
+            path = path[len(self.script_name):]
+
+        environ = {
+            'REQUEST_METHOD': method,
+            'SCRIPT_NAME': self.script_name,
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'SERVER_NAME': host,
+            'SERVER_PORT': str(port),
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': scheme,
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for (name, value) in headers.items():
+            key = name.upper().replace('-', '_')
+            if key not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                key = 'HTTP_' + key
+            environ[key] = value
+
+        started: Dict[str, Any] = {}
+
+        def start_response(status: str, response_headers, exc_info=None):
+            if exc_info is not None and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            started['status'] = status
+            started['headers'] = response_headers
+            return started.setdefault('body', []).append
+
+        result = self.app(environ, start_response)
+        chunks = self._chunks(result)
+        # apps may call `start_response` when their body is iterated
+        first_chunk = b""
+        while 'status' not in started:
+            first_chunk = next(chunks, None)
+            if first_chunk is None:
+                raise RuntimeError("the WSGI app returned without calling start_response")
+
+        status = started['status']
+        return TransportResponse(int(status.split(' ', 1)[0]), started['headers'],
+                                 self._prepend(first_chunk, started, chunks),
+                                 reason=status.partition(' ')[2], preload_content=preload_content)
+
+    @staticmethod
+    def _chunks(result: Iterable[bytes]) -> Iterator[bytes]:
+        try:
+            for chunk in result:
+                if chunk:
+                    yield chunk
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+
+    @staticmethod
+    def _prepend(first_chunk: bytes, started: Dict[str, Any], chunks: Iterator[bytes]) -> Iterator[bytes]:
+        # data passed to the legacy `write` callable precedes the body
+        yield from started.pop('body', [])
+        yield first_chunk
+        yield from chunks
+
+    def clear(self) -> None:
+        pass
+
+    def __deepcopy__(self, memo) -> 'WSGITransport':
+        # copies of a `Configuration` share the transport
+        return self
+
+
+class ASGITransport:
+    """Calls an ASGI app in-process, e.g. a Starlette or FastAPI app.
+
+    The app runs on an event loop in a background thread. Responses are
+    buffered completely, lifespan events are not sent.
+
+    :param app: the ASGI application.
+    :param root_path: the path prefix the app is mounted at.
+    """
+
+    def __init__(self, app: Callable, root_path: str = '') -> None:
+        self.app = app
+        self.root_path = root_path
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, body=None, fields=None, encode_multipart: bool = True,
+                preload_content: bool = True, timeout: Optional[urllib3.Timeout] = None,
+                headers: Optional[Dict[str, str]] = None) -> TransportResponse:
+        (body, headers) = encode_body(body, fields, encode_multipart, headers)
+        headers.setdefault('Content-Length', str(len(body)))
+        (scheme, host, port, path, query) = _split_url(url)
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0', 'spec_version': '2.3'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': scheme,
+            'path': unquote(path),
+            'raw_path': path.encode('ascii'),
+            'query_string': query.encode('ascii'),
+            'root_path': self.root_path,
+            'headers': [(name.lower().encode('latin-1'), str(value).encode('latin-1'))
+                        for (name, value) in headers.items()],
+            'client': ('127.0.0.1', 0),
+            'server': (host, port),
+        }
+
+        future = asyncio.run_coroutine_threadsafe(self._call(scope, body), self._event_loop())
+        (status, response_headers, response_body) = future.result()
+        return TransportResponse(status, response_headers, [response_body], preload_content=preload_content)
+
+    async def _call(self, scope: Dict[str, Any], body: bytes) -> Tuple[int, List[Tuple[str, str]], bytes]:
+        response: Dict[str, Any] = {'body': []}
+        complete = asyncio.Event()
+        received = False
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal received
+            if not received:
+                received = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await complete.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message: Dict[str, Any]) -> None:
+            if message['type'] == 'http.response.start':
+                response['status'] = message['status']
+                response['headers'] = [(name.decode('latin-1'), value.decode('latin-1'))
+                                       for (name, value) in message.get('headers', [])]
+            elif message['type'] == 'http.response.body':
+                response['body'].append(message.get('body', b""))
+                if not message.get('more_body', False):
+                    complete.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            complete.set()
+
+        if 'status' not in response:
+            raise RuntimeError("the ASGI app returned without sending a response")
+        return (response['status'], response['headers'], b"".join(response['body']))
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, daemon=True).start()
+            return self._loop
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+
+    def __deepcopy__(self, memo) -> 'ASGITransport':
+        # copies of a `Configuration` share the transport
+        return self
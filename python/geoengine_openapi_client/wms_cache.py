@@ -0,0 +1,311 @@
+# coding: utf-8
+
+"""
+    Caching of WMS images.
+
+    Workflows are immutable by id, so a WMS image is fully determined by the
+    parameters of its request. `CachedOGCWMSApi` is an opt-in `OGCWMSApi`
+    that answers repeated `wms_map_handler` and `wms_legend_graphic_handler`
+    calls from a `WmsCache`, e.g.
+
+    >>> cache = WmsCache(memory_size=64 * 2**20, directory="~/.cache/geoengine-wms",
+    ...                  disk_size=2**30, ttl=3600)
+    >>> wms_api = CachedOGCWMSApi(api_client, cache)
+    >>> image = wms_api.wms_map_handler(workflow_id, ...)
+    >>> cache.stats
+    CacheStats(hits=..., misses=..., memory_hits=..., disk_hits=..., evictions=...)
+
+    The cache has a memory tier and an optional disk tier. Both are bounded
+    in bytes and evict the least recently used images first. Images on disk
+    are stored under the hash of their normalized request and session, so
+    images are only shared between api clients of the same session.
+"""  # noqa: E501
+
+
+from collections import OrderedDict
+from enum import Enum
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from geoengine_openapi_client.api.ogcwms_api import OGCWMSApi
+
+DEFAULT_MEMORY_SIZE = 64 * 2**20
+DEFAULT_DISK_SIZE = 2**30
+
+
+class CacheStats(NamedTuple):
+    """Counters of a `WmsCache`."""
+
+    hits: int
+    misses: int
+    memory_hits: int
+    disk_hits: int
+    evictions: int
+
+
+class WmsCache:
+    """A size-bounded LRU cache of images with a memory and a disk tier.
+
+    :param memory_size: maximum number of bytes kept in memory.
+    :param directory: directory of the disk tier, or None for no disk tier.
+    :param disk_size: maximum number of bytes kept on disk.
+    :param ttl: seconds after which an image expires, or None.
+    """
+
+    def __init__(self, memory_size: int = DEFAULT_MEMORY_SIZE,
+                 directory: Optional[Union[str, os.PathLike]] = None,
+                 disk_size: int = DEFAULT_DISK_SIZE,
+                 ttl: Optional[float] = None) -> None:
+        self.memory_size = memory_size
+        self.directory = None if directory is None else os.path.expanduser(directory)
+        self.disk_size = disk_size
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        # key -> (image, time stored)
+        self._memory: 'OrderedDict[str, Tuple[bytes, float]]' = OrderedDict()
+        self._memory_bytes = 0
+        # key -> (size, time stored)
+        self._disk: 'OrderedDict[str, Tuple[int, float]]' = OrderedDict()
+        self._disk_bytes = 0
+        self._counters = dict.fromkeys(CacheStats._fields, 0)
+
+        if self.directory is not None:
+            self._load_disk_index()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**self._counters)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the image of a key, or None."""
+        expired = []
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[1]):
+                self._memory.move_to_end(key)
+                self._count('hits', 'memory_hits')
+                return entry[0]
+            if entry is not None:
+                self._remove_memory(key)
+
+            disk_entry = self._disk.get(key)
+            if disk_entry is not None and self._expired(disk_entry[1]):
+                expired.append(self._remove_disk(key))
+                disk_entry = None
+            if disk_entry is None:
+                self._count('misses')
+
+        if disk_entry is None:
+            _remove_files(expired)
+            return None
+
+        # the file is read without holding the lock, so it may be replaced or
+        # removed meanwhile
+        try:
+            with open(self._path(key), 'rb') as f:
+                image = f.read()
+        except OSError:
+            image = None
+
+        with self._lock:
+            if image is None:
+                if self._disk.get(key) == disk_entry:
+                    self._remove_disk(key)
+                self._count('misses')
+                return None
+            if key in self._disk:
+                self._disk.move_to_end(key)
+            self._put_memory(key, image, disk_entry[1])
+            self._count('hits', 'disk_hits')
+            return image
+
+    def put(self, key: str, image: bytes) -> None:
+        """Stores the image of a key."""
+        image = bytes(image)
+        stored_at = time.time()
+        with self._lock:
+            self._put_memory(key, image, stored_at)
+        if self.directory is None or len(image) > self.disk_size:
+            return
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        (fd, temp_path) = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(image)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            evicted = self._put_disk(key, len(image), stored_at)
+        _remove_files(evicted)
+
+    def clear(self) -> None:
+        """Removes all images from both tiers."""
+        with self._lock:
+            for key in list(self._memory):
+                self._remove_memory(key)
+            paths = [self._remove_disk(key) for key in list(self._disk)]
+        _remove_files(paths)
+
+    def _count(self, *counters: str) -> None:
+        for counter in counters:
+            self._counters[counter] += 1
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _put_memory(self, key: str, image: bytes, stored_at: float) -> None:
+        if key in self._memory:
+            self._remove_memory(key)
+        if len(image) > self.memory_size:
+            return
+
+        self._memory[key] = (image, stored_at)
+        self._memory_bytes += len(image)
+        while self._memory_bytes > self.memory_size:
+            self._remove_memory(next(iter(self._memory)))
+            self._count('evictions')
+
+    def _remove_memory(self, key: str) -> None:
+        (image, _) = self._memory.pop(key)
+        self._memory_bytes -= len(image)
+
+    def _put_disk(self, key: str, size: int, stored_at: float) -> List[str]:
+        """Indexes a stored image and returns the paths of the evicted images."""
+        if key in self._disk:
+            (old_size, _) = self._disk.pop(key)
+            self._disk_bytes -= old_size
+
+        self._disk[key] = (size, stored_at)
+        self._disk_bytes += size
+        evicted = []
+        while self._disk_bytes > self.disk_size:
+            evicted.append(self._remove_disk(next(iter(self._disk))))
+            self._count('evictions')
+        return evicted
+
+    def _remove_disk(self, key: str) -> str:
+        """Removes an image from the index and returns the path of its file."""
+        (size, _) = self._disk.pop(key)
+        self._disk_bytes -= size
+        return self._path(key)
+
+    def _load_disk_index(self) -> None:
+        """Indexes the images on disk, the least recently stored first."""
+        entries = []
+        os.makedirs(self.directory, exist_ok=True)
+        for prefix in os.scandir(self.directory):
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                if entry.is_file() and entry.name.startswith(prefix.name) and len(entry.name) == 64:
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for (stored_at, key, size) in sorted(entries):
+            self._disk[key] = (size, stored_at)
+            self._disk_bytes += size
+
+
+def _remove_files(paths: List[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _normalize(name: str, value: Any) -> Any:
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, str):
+        value = value.strip()
+        if name == 'bbox':
+            try:
+                return ",".join(repr(float(v)) for v in value.split(","))
+            except ValueError:
+                return value
+        if name == 'format':
+            return value.lower()
+    return value
+
+
+def wms_cache_key(host: str, operation: str, arguments: Dict[str, Any],
+                  credentials: Sequence[str] = ()) -> str:
+    """Returns the hash of the normalized parameters of a WMS request.
+
+    :param credentials: the session of the request, e.g. its `Authorization`
+                        header, since images of one session must not be
+                        served to another.
+    """
+    parameters = {
+        name: _normalize(name, value)
+        for (name, value) in arguments.items()
+        if value is not None
+    }
+    document = json.dumps([host, sorted(credentials), operation, parameters], sort_keys=True, default=str)
+    return hashlib.sha256(document.encode('utf-8')).hexdigest()
+
+
+class CachedOGCWMSApi(OGCWMSApi):
+    """An `OGCWMSApi` that caches maps and legend graphics.
+
+    Calls with `async_req` or other special keyword arguments bypass the
+    cache, as do the `*_with_http_info` methods.
+
+    :param api_client: the `ApiClient` to request uncached images with.
+    :param cache: the `WmsCache` to store images in.
+    """
+
+    def __init__(self, api_client=None, cache: Optional[WmsCache] = None) -> None:
+        super().__init__(api_client)
+        self.cache = cache if cache is not None else WmsCache()
+
+    def wms_map_handler(self, *args, **kwargs) -> bytearray:  # pylint: disable=arguments-differ
+        """Get WMS Map, from the cache if possible. See `OGCWMSApi.wms_map_handler`."""
+        return self._cached('wms_map_handler', super().wms_map_handler, args, kwargs)
+
+    def wms_legend_graphic_handler(self, *args, **kwargs) -> bytearray:  # pylint: disable=arguments-differ
+        """Get WMS Legend Graphic, from the cache if possible.
+
+        Unlike `OGCWMSApi.wms_legend_graphic_handler`, this returns the image.
+        """
+        def fetch(*args, **kwargs) -> bytearray:
+            response = super(CachedOGCWMSApi, self).wms_legend_graphic_handler_with_http_info(
+                *args, _preload_content=False, **kwargs)
+            with response.raw_data as stream:
+                return bytearray(stream.read())
+
+        return self._cached('wms_legend_graphic_handler', fetch, args, kwargs)
+
+    def _cached(self, operation: str, fetch, args: tuple, kwargs: Dict[str, Any]) -> bytearray:
+        if any(name.startswith('_') or name == 'async_req' for name in kwargs):
+            return fetch(*args, **kwargs)
+
+        signature = inspect.signature(getattr(OGCWMSApi, operation))
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        arguments.pop('self')
+        arguments.pop('kwargs', None)
+        credentials = [setting['value'] for setting in self.api_client.configuration.auth_settings().values()]
+        if self.api_client.cookie:
+            credentials.append(self.api_client.cookie)
+        key = wms_cache_key(self.api_client.configuration.host, operation, arguments, credentials)
+
+        image = self.cache.get(key)
+        if image is None:
+            image = fetch(*args, **kwargs)
+            self.cache.put(key, image)
+        return bytearray(image)
@@ -31,6 +31,17 @@ REQUIRES = [
     "aenum"
 ]
 
+# Note: optional dependencies
+EXTRAS_REQUIRE = {
+    "asyncio": ["aiohttp >= 3.8"],
+    "orjson": ["orjson >= 3.6"],
+    "arrow": ["pyarrow >= 8"],
+    "geotiff": ["rasterio >= 1.2"],
+    "zstd": ["zstandard >= 0.18"],
+    "http2": ["httpx[http2] >= 0.26"],
+    "opentelemetry": ["opentelemetry-api >= 1.12"],
+}
+
 setup(
     name=NAME,
     version=VERSION,
@@ -40,6 +51,7 @@ setup(
     url="https://github.com/geo-engine/openapi-client",
     keywords=["OpenAPI", "OpenAPI-Generator", "Geo Engine Pro API"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     license="Apache-2.0",
@@ -0,0 +1,68 @@
+# coding: utf-8
+
+"""A minimal threaded HTTP server for tests that need real sockets."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+from urllib.parse import urlsplit, parse_qs
+
+
+class LocalServer:
+    """Serves requests with `handler(request) -> (status, headers, body)`.
+
+    `request` is a dict with `method`, `path`, `query`, `headers` and `body`.
+    All requests are recorded in `requests`.
+    """
+
+    def __init__(self, handler) -> None:
+        self.handler = handler
+        self.requests = []
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+            def handle_request(self):
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                request = {
+                    "method": self.command,
+                    "path": url.path,
+                    "query": {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()},
+                    "headers": self.headers,
+                    "body": self.rfile.read(length) if length else b"",
+                }
+                server.requests.append(request)
+
+                status, headers, body = server.handler(request)
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = handle_request
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def host(self) -> str:
+        """The API base url of the server."""
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/api"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.httpd.shutdown()
+        self.httpd.server_close()
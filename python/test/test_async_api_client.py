@@ -0,0 +1,156 @@
+# coding: utf-8
+
+import asyncio
+import json
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.exceptions import ApiValueError, NotFoundException
+from geoengine_openapi_client.retry import RetryPolicy
+
+try:
+    from aiohttp import web
+    from geoengine_openapi_client.aio import AsyncApiClient, AsyncWorkflowsApi, AsyncOGCWMSApi
+except ImportError:
+    web = None
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncApiClient(unittest.IsolatedAsyncioTestCase):
+    """AsyncApiClient tests against an in-process aiohttp server"""
+
+    async def asyncSetUp(self) -> None:
+        self.requests = []
+        self.too_many_requests = 0
+
+        async def load_workflow(request):
+            self.requests.append(request)
+            if request.match_info["id"] != WORKFLOW_ID:
+                return web.json_response({"error": "NotFound", "message": "unknown"}, status=404)
+            await asyncio.sleep(0.01)
+            return web.json_response(WORKFLOW)
+
+        async def register_workflow(request):
+            self.requests.append(request)
+            body = await request.json()
+            if self.too_many_requests > 0:
+                self.too_many_requests -= 1
+                return web.json_response({"error": "TooManyRequests", "message": "slow down"}, status=429,
+                                         headers={"Retry-After": "0"})
+            self.assertEqual(body["type"], "Vector")
+            return web.json_response({"id": WORKFLOW_ID})
+
+        async def wms(request):
+            self.requests.append(request)
+            return web.Response(body=b"\x89PNG", content_type="image/png")
+
+        app = web.Application()
+        app.router.add_get("/api/workflow/{id}", load_workflow)
+        app.router.add_post("/api/workflow", register_workflow)
+        app.router.add_get("/api/wms/{workflow}", wms)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        self.configuration = geoengine_openapi_client.Configuration(
+            host=f"http://127.0.0.1:{port}/api",
+            access_token="e327d9c3-a4f3-4bd7-a5e1-30b26cae8064",
+        )
+        self.api_client = AsyncApiClient(self.configuration)
+
+    async def asyncTearDown(self) -> None:
+        await self.api_client.close()
+        await self.runner.cleanup()
+
+    async def test_load_workflow(self) -> None:
+        workflow = await AsyncWorkflowsApi(self.api_client).load_workflow_handler(WORKFLOW_ID)
+
+        self.assertIsInstance(workflow, geoengine_openapi_client.Workflow)
+        self.assertEqual(workflow.to_dict(), WORKFLOW)
+        self.assertEqual(
+            self.requests[0].headers["Authorization"],
+            "Bearer e327d9c3-a4f3-4bd7-a5e1-30b26cae8064",
+        )
+
+    async def test_concurrent_requests(self) -> None:
+        api = AsyncWorkflowsApi(self.api_client)
+
+        workflows = await asyncio.gather(*[
+            api.load_workflow_handler(WORKFLOW_ID) for _ in range(20)
+        ])
+
+        self.assertEqual(len(workflows), 20)
+        self.assertEqual(len(self.requests), 20)
+
+    async def test_register_workflow(self) -> None:
+        workflow = geoengine_openapi_client.Workflow.from_dict(WORKFLOW)
+
+        response = await AsyncWorkflowsApi(self.api_client).register_workflow_handler(workflow)
+
+        self.assertEqual(response.id, WORKFLOW_ID)
+
+    async def test_compressed_retries(self) -> None:
+        self.too_many_requests = 2
+        self.configuration.request_compression = "gzip"
+        self.configuration.request_compression_min_size = 0
+        self.configuration.retry_policy = RetryPolicy(backoff=0.01)
+        workflow = geoengine_openapi_client.Workflow.from_dict(WORKFLOW)
+
+        async with AsyncApiClient(self.configuration) as api_client:
+            response = await AsyncWorkflowsApi(api_client).register_workflow_handler(workflow)
+
+        self.assertEqual(response.id, WORKFLOW_ID)
+        self.assertEqual([request.headers["Content-Encoding"] for request in self.requests], ["gzip"] * 3)
+
+    async def test_bytearray_response(self) -> None:
+        response = await AsyncOGCWMSApi(self.api_client).wms_map_handler(
+            WORKFLOW_ID,
+            version="1.3.0",
+            service="WMS",
+            request="GetMap",
+            width=256,
+            height=256,
+            bbox="-90,-180,90,180",
+            format="image/png",
+            layers=WORKFLOW_ID,
+            styles="",
+        )
+
+        self.assertEqual(response, b"\x89PNG")
+        self.assertEqual(self.requests[0].query["request"], "GetMap")
+
+    async def test_error_response(self) -> None:
+        with self.assertRaises(NotFoundException) as context:
+            await AsyncWorkflowsApi(self.api_client).load_workflow_handler(
+                "ffffffff-89ab-cdef-0123-456789abcdef"
+            )
+
+        self.assertEqual(context.exception.status, 404)
+        self.assertEqual(json.loads(context.exception.body)["error"], "NotFound")
+
+    async def test_streamed_response(self) -> None:
+        response = await AsyncWorkflowsApi(self.api_client).load_workflow_handler_with_http_info(
+            WORKFLOW_ID, _preload_content=False)
+
+        async with response.raw_data as stream:
+            self.assertEqual(json.loads(await stream.read()), WORKFLOW)
+        self.assertIsNone(response.data)
+
+    async def test_async_req_is_rejected(self) -> None:
+        with self.assertRaises(ApiValueError):
+            await AsyncWorkflowsApi(self.api_client).load_workflow_handler(
+                WORKFLOW_ID, async_req=True
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# coding: utf-8
+
+import gzip
+import json
+import unittest
+import zlib
+
+import geoengine_openapi_client
+from geoengine_openapi_client.compression import compress, compress_request_body, default_accept_encoding
+from geoengine_openapi_client.retry import RetryPolicy
+
+from test.local_server import LocalServer
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": float(i), "y": 0.1} for i in range(1000)]}},
+}
+
+
+class TestCompress(unittest.TestCase):
+    """compress unit tests"""
+
+    def test_round_trips(self) -> None:
+        data = json.dumps(WORKFLOW)
+
+        self.assertEqual(gzip.decompress(compress(data, "gzip")), data.encode("utf-8"))
+        self.assertEqual(zlib.decompress(compress(data, "deflate")), data.encode("utf-8"))
+        with self.assertRaises(ValueError):
+            compress(data, "br")
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd(self) -> None:
+        self.assertEqual(zstandard.ZstdDecompressor().decompress(compress(b"{}", "zstd")), b"{}")
+
+    @unittest.skipIf(zstandard is not None, "zstandard is installed")
+    def test_zstd_requires_zstandard(self) -> None:
+        with self.assertRaises(ImportError):
+            compress(b"{}", "zstd")
+
+    def test_min_size(self) -> None:
+        headers = {}
+        self.assertEqual(compress_request_body("{}", headers, "gzip", min_size=3), "{}")
+        self.assertNotIn("Content-Encoding", headers)
+
+        self.assertEqual(compress_request_body("{}", headers, None, min_size=0), "{}")
+        self.assertNotIn("Content-Encoding", headers)
+
+        self.assertEqual(gzip.decompress(compress_request_body("{}", headers, "gzip", min_size=2)), b"{}")
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+
+
+class TestCompressedTransfers(unittest.TestCase):
+    """Compression of requests and responses"""
+
+    def setUp(self) -> None:
+        self.too_many_requests = 0
+
+        def handler(request):
+            if request["method"] == "POST" and self.too_many_requests > 0:
+                self.too_many_requests -= 1
+                return 429, {"Content-Type": "application/json", "Retry-After": "0"}, \
+                    '{"error": "TooManyRequests", "message": "slow down"}'
+            if request["method"] == "POST":
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": WORKFLOW_ID})
+            body = json.dumps(WORKFLOW).encode("utf-8")
+            if "gzip" in (request["headers"].get("Accept-Encoding") or ""):
+                return 200, {"Content-Type": "application/json", "Content-Encoding": "gzip"}, gzip.compress(body)
+            return 200, {"Content-Type": "application/json"}, body
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+
+        self.configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        self.api = geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(self.configuration))
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def test_decodes_responses(self) -> None:
+        workflow = self.api.load_workflow_handler(WORKFLOW_ID)
+
+        self.assertEqual(self.server.requests[0]["headers"]["Accept-Encoding"], default_accept_encoding())
+        self.assertEqual(len(workflow.to_dict()["operator"]["params"]["points"]), 1000)
+
+    def test_decodes_streamed_responses(self) -> None:
+        response = self.api.load_workflow_handler_with_http_info(WORKFLOW_ID, _preload_content=False)
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        with response.raw_data as stream:
+            chunks = list(stream.iter_chunks(1024))
+        self.assertEqual(json.loads(b"".join(chunks)), WORKFLOW)
+
+    def test_no_negotiation(self) -> None:
+        self.configuration.accept_encoding = None
+        api = geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(self.configuration))
+
+        api.load_workflow_handler(WORKFLOW_ID)
+
+        self.assertNotIn("gzip", self.server.requests[0]["headers"].get("Accept-Encoding") or "")
+
+    def test_compresses_large_requests(self) -> None:
+        self.configuration.request_compression = "gzip"
+        self.configuration.request_compression_min_size = 1024
+        api = geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(self.configuration))
+
+        api.register_workflow_handler(geoengine_openapi_client.Workflow.from_dict(WORKFLOW))
+        api.register_workflow_handler(geoengine_openapi_client.Workflow.from_dict({**WORKFLOW, "operator": {
+            "type": "MockPointSource", "params": {"points": []},
+        }}))
+
+        (large, small) = self.server.requests
+        self.assertEqual(large["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(large["body"]))["type"], "Vector")
+        self.assertIsNone(small["headers"].get("Content-Encoding"))
+        self.assertEqual(json.loads(small["body"])["operator"]["params"], {"points": []})
+
+    def test_compresses_retried_requests(self) -> None:
+        self.too_many_requests = 2
+        self.configuration.request_compression = "gzip"
+        self.configuration.request_compression_min_size = 1024
+        self.configuration.retry_policy = RetryPolicy(backoff=0.01)
+        headers = {"X-Request-Id": "1"}
+        api = geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(self.configuration))
+
+        api.register_workflow_handler(geoengine_openapi_client.Workflow.from_dict(WORKFLOW), _headers=headers)
+
+        self.assertEqual(len(self.server.requests), 3)
+        for request in self.server.requests:
+            self.assertEqual(request["headers"]["Content-Encoding"], "gzip")
+            self.assertEqual(json.loads(gzip.decompress(request["body"]))["type"], "Vector")
+        self.assertEqual(headers, {"X-Request-Id": "1"})
+
+    def test_caller_content_encoding(self) -> None:
+        self.configuration.request_compression = "gzip"
+        self.configuration.request_compression_min_size = 1024
+        api = geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(self.configuration))
+
+        api.register_workflow_handler(geoengine_openapi_client.Workflow.from_dict(WORKFLOW),
+                                      _headers={"Content-Encoding": "identity"})
+
+        self.assertEqual(self.server.requests[0]["headers"]["Content-Encoding"], "identity")
+        self.assertEqual(json.loads(self.server.requests[0]["body"])["type"], "Vector")
+
+
+if __name__ == '__main__':
+    unittest.main()
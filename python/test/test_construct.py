@@ -0,0 +1,134 @@
+# coding: utf-8
+
+import datetime
+import json
+import unittest
+from unittest import mock
+
+import geoengine_openapi_client
+from geoengine_openapi_client.construct import construct_model
+from geoengine_openapi_client.models.layer_collection import LayerCollection
+from geoengine_openapi_client.models.layer_collection_listing_with_type import LayerCollectionListingWithType
+from geoengine_openapi_client.models.layer_listing_with_type import LayerListingWithType
+from geoengine_openapi_client.models.layer_update import LayerUpdate
+from geoengine_openapi_client.models.project_listing import ProjectListing
+from geoengine_openapi_client.models.raster_data_type import RasterDataType
+from geoengine_openapi_client.models.raster_result_descriptor import RasterResultDescriptor
+from geoengine_openapi_client.models.task_status_with_id import TaskStatusWithId
+from geoengine_openapi_client.models.typed_geometry import TypedGeometry
+
+from test.local_server import LocalServer
+
+PROVIDER_ID = "ce5e84db-cbf9-48a2-9a32-d4b7cc56ea74"
+LAYER_COLLECTION = {
+    "description": "Root collection",
+    "id": {"collectionId": "root", "providerId": PROVIDER_ID},
+    "items": [
+        {
+            "type": "collection",
+            "description": "Sub collection",
+            "id": {"collectionId": "sub", "providerId": PROVIDER_ID},
+            "name": "Sub",
+        },
+        {
+            "type": "layer",
+            "description": "A layer",
+            "id": {"layerId": "layer", "providerId": PROVIDER_ID},
+            "name": "Layer",
+            "properties": [["key", "value"]],
+        },
+    ],
+    "name": "Root",
+    "properties": [],
+}
+
+
+class TestConstructModel(unittest.TestCase):
+    """construct_model unit tests"""
+
+    def assert_same_as_from_dict(self, klass, obj) -> None:
+        constructed = construct_model(klass, obj)
+
+        self.assertEqual(constructed, klass.from_dict(obj))
+        self.assertEqual(constructed.to_dict(), klass.from_dict(obj).to_dict())
+
+    def test_nested_models_and_one_of(self) -> None:
+        with mock.patch.object(LayerCollection, "parse_obj") as parse_obj:
+            layer_collection = construct_model(LayerCollection, LAYER_COLLECTION)
+
+        parse_obj.assert_not_called()
+        self.assertIsInstance(layer_collection.items[0].actual_instance, LayerCollectionListingWithType)
+        self.assertIsInstance(layer_collection.items[1].actual_instance, LayerListingWithType)
+        self.assertEqual(layer_collection.items[1].actual_instance.id.layer_id, "layer")
+        self.assert_same_as_from_dict(LayerCollection, LAYER_COLLECTION)
+
+    def test_datetime_and_enum_fields(self) -> None:
+        project_listing = {
+            "changed": "2023-01-01T12:00:00Z",
+            "description": "",
+            "id": "df4ad02e-0d61-4e29-90eb-dc1259c1f5b9",
+            "layerNames": ["a"],
+            "name": "Project",
+            "plotNames": [],
+        }
+        self.assertIsInstance(construct_model(ProjectListing, project_listing).changed, datetime.datetime)
+        self.assert_same_as_from_dict(ProjectListing, project_listing)
+
+        descriptor = {
+            "bands": [{"measurement": {"type": "unitless"}, "name": "band"}],
+            "dataType": "U8",
+            "spatialReference": "EPSG:4326",
+        }
+        self.assertEqual(construct_model(RasterResultDescriptor, descriptor).data_type, RasterDataType.U8)
+
+    def test_extended_one_of_model(self) -> None:
+        self.assert_same_as_from_dict(TaskStatusWithId, {
+            "status": "completed",
+            "taskId": "1e6bba7a-1b68-4b2f-9d34-0c1f4e7d2a31",
+            "taskType": "dummy",
+            "description": "test",
+            "info": None,
+            "timeTotal": "00:00:01",
+            "timeStarted": "2023-01-01T00:00:00Z",
+        })
+
+    def test_structural_one_of(self) -> None:
+        self.assert_same_as_from_dict(TypedGeometry, {"MultiPoint": {"coordinates": [{"x": 1.0, "y": 2.0}]}})
+
+    def test_enum_one_of(self) -> None:
+        self.assert_same_as_from_dict(LayerUpdate, "none")
+
+    def test_none(self) -> None:
+        self.assertIsNone(construct_model(LayerCollection, None))
+
+
+class TestTrustedResponses(unittest.TestCase):
+    """Trusted responses against a local HTTP server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer(
+            lambda request: (200, {"Content-Type": "application/json"}, json.dumps(LAYER_COLLECTION))
+        )
+        self.server.__enter__()
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def layers_api(self, trusted_responses: bool):
+        configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        configuration.trusted_responses = trusted_responses
+        return geoengine_openapi_client.LayersApi(geoengine_openapi_client.ApiClient(configuration))
+
+    def test_trusted_responses(self) -> None:
+        with mock.patch.object(LayerCollection, "parse_obj") as parse_obj:
+            collection = self.layers_api(True).list_root_collections_handler(offset=0, limit=20)
+
+        parse_obj.assert_not_called()
+        self.assertEqual(collection, self.layers_api(False).list_root_collections_handler(offset=0, limit=20))
+
+    def test_validation_by_default(self) -> None:
+        self.assertFalse(geoengine_openapi_client.Configuration().trusted_responses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# coding: utf-8
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.coverage import CoverageDownloader, CoverageDownloadError, CoverageGrid
+from geoengine_openapi_client.models.raster_data_type import RasterDataType
+from geoengine_openapi_client.tasks import AdaptiveBackoff
+
+from test.local_server import LocalServer
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+CRS = "urn:ogc:def:crs:EPSG::32632"
+BOUNDS = (1000.0, 2000.0, 1100.0, 2060.0)
+RESOLUTION = (2.0, 3.0)
+
+
+def pixel(x: int, y: int) -> int:
+    return (x + 7 * y) % 251
+
+
+def raw_samples(data, tile, data_type):
+    return data
+
+
+class TestCoverageGrid(unittest.TestCase):
+    """CoverageGrid unit tests"""
+
+    def test_tiles(self) -> None:
+        grid = CoverageGrid(BOUNDS, RESOLUTION, tile_size=16)
+
+        self.assertEqual(grid.shape, (20, 50))
+        tiles = list(grid.tiles())
+        self.assertEqual(len(tiles), 8)
+        self.assertEqual(sum(t.width * t.height for t in tiles), 20 * 50)
+        self.assertEqual((tiles[-1].width, tiles[-1].height), (2, 4))
+        self.assertEqual(grid.tile_bounds(tiles[-1]), (1096.0, 2000.0, 1100.0, 2012.0))
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            CoverageGrid((1.0, 0.0, 0.0, 1.0), RESOLUTION)
+
+
+class TestCoverageDownloader(unittest.TestCase):
+    """CoverageDownloader tests against a local HTTP server"""
+
+    def setUp(self) -> None:
+        self.lock = threading.Lock()
+        self.failing = {}
+        self.concurrent = self.max_concurrent = 0
+
+        def handler(request):
+            query = request["query"]
+            (xmin, ymin, xmax, ymax) = (float(v) for v in query["boundingbox"].split(",")[:4])
+            (resx, resy) = (float(v) for v in query["gridoffsets"].split(","))
+            self.assertEqual(query["gridorigin"], f"{xmin!r},{ymax!r}")
+            self.assertEqual(query["gridbasecrs"], CRS)
+
+            with self.lock:
+                if self.failing.get((xmin, ymax), 0) > 0:
+                    self.failing[(xmin, ymax)] -= 1
+                    return 503, {"Content-Type": "application/json"}, '{"error": "Busy", "message": "busy"}'
+                self.concurrent += 1
+                self.max_concurrent = max(self.max_concurrent, self.concurrent)
+            time.sleep(0.01)
+            with self.lock:
+                self.concurrent -= 1
+
+            x_offset = round((xmin - BOUNDS[0]) / resx)
+            y_offset = round((BOUNDS[3] - ymax) / -resy)
+            width = round((xmax - xmin) / resx)
+            height = round((ymax - ymin) / -resy)
+            body = bytes(pixel(x_offset + x, y_offset + y) for y in range(height) for x in range(width))
+            return 200, {"Content-Type": "image/tiff"}, body
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        self.wcs_api = geoengine_openapi_client.OGCWCSApi(geoengine_openapi_client.ApiClient(
+            geoengine_openapi_client.Configuration(host=self.server.host)
+        ))
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "coverage.raw")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        self.server.__exit__(None, None, None)
+
+    def downloader(self, **kwargs) -> CoverageDownloader:
+        return CoverageDownloader(self.wcs_api, WORKFLOW_ID, CRS, RasterDataType.U8, tile_size=16,
+                                  decode=raw_samples, backoff=lambda: AdaptiveBackoff(initial=0.01), **kwargs)
+
+    def assert_coverage(self, grid: CoverageGrid) -> None:
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        self.assertEqual(data, bytes(pixel(x, y) for y in range(grid.height) for x in range(grid.width)))
+
+    def test_download(self) -> None:
+        grid = self.downloader(workers=3).download(self.path, BOUNDS, RESOLUTION, time="2014-04-01T12:00:00.000Z")
+
+        self.assert_coverage(grid)
+        self.assertEqual(len(self.server.requests), 8)
+        self.assertEqual(self.server.requests[0]["query"]["time"], "2014-04-01T12:00:00.000Z")
+
+    def test_workers_limited_by_pool(self) -> None:
+        self.wcs_api.api_client.configuration.connection_pool_maxsize = 2
+
+        grid = self.downloader(workers=8).download(self.path, BOUNDS, RESOLUTION)
+
+        self.assert_coverage(grid)
+        self.assertLessEqual(self.max_concurrent, 2)
+
+    def test_retry_failed_tiles(self) -> None:
+        self.failing[(1032.0, 2060.0)] = 2
+
+        grid = self.downloader(retries=2).download(self.path, BOUNDS, RESOLUTION)
+
+        self.assert_coverage(grid)
+        # only the failing tile is requested again
+        self.assertEqual(len(self.server.requests), 10)
+
+    def test_resume_failed_tiles(self) -> None:
+        self.failing[(1032.0, 2060.0)] = 3
+
+        with self.assertRaises(CoverageDownloadError) as context:
+            self.downloader(retries=1).download(self.path, BOUNDS, RESOLUTION)
+        self.assertEqual([(t.column, t.row) for t in context.exception.failures], [(1, 0)])
+
+        grid = self.downloader(retries=1).download(self.path, BOUNDS, RESOLUTION,
+                                                   tiles=context.exception.failures)
+
+        self.assert_coverage(grid)
+
+    def test_swap_axes(self) -> None:
+        def zero_samples(data, tile, data_type):
+            return bytes(tile.width * tile.height)
+
+        downloader = CoverageDownloader(self.wcs_api, WORKFLOW_ID, "urn:ogc:def:crs:EPSG::4326",
+                                        RasterDataType.U8, decode=zero_samples, retries=0)
+        with self.assertRaises(CoverageDownloadError):
+            # the local server expects the x/y order of the projected CRS
+            downloader.download(self.path, (-180.0, -90.0, 180.0, 90.0), (1.0, 1.0))
+
+        query = self.server.requests[0]["query"]
+        self.assertEqual(query["boundingbox"], "-90.0,-180.0,90.0,180.0,urn:ogc:def:crs:EPSG::4326")
+        self.assertEqual(query["gridorigin"], "90.0,-180.0")
+        self.assertEqual(query["gridoffsets"], "-1.0,1.0")
+
+if __name__ == '__main__':
+    unittest.main()
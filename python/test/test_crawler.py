@@ -0,0 +1,142 @@
+# coding: utf-8
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.crawler import LayerCollectionCrawler
+from geoengine_openapi_client.models.provider_layer_collection_id import ProviderLayerCollectionId
+
+from test.local_server import LocalServer
+
+PROVIDER_ID = "ce5e84db-cbf9-48a2-9a32-d4b7cc56ea74"
+
+# collection -> child collections, `shared` is reachable by two paths
+TREE = {
+    "root": ["a", "b", "c"],
+    "a": ["a1", "shared"],
+    "b": ["shared", "root"],
+    "c": [],
+    "a1": [],
+    "shared": ["s1"],
+    "s1": [],
+}
+LAYERS_PER_COLLECTION = 5
+
+
+def collection_items(collection_id: str) -> list:
+    items = [
+        {
+            "type": "collection",
+            "description": "",
+            "id": {"collectionId": child, "providerId": PROVIDER_ID},
+            "name": child,
+        }
+        for child in TREE[collection_id]
+    ]
+    items += [
+        {
+            "type": "layer",
+            "description": "",
+            "id": {"layerId": f"{collection_id}-layer{i}", "providerId": PROVIDER_ID},
+            "name": f"{collection_id} layer {i}",
+        }
+        for i in range(LAYERS_PER_COLLECTION)
+    ]
+    return items
+
+
+class TestLayerCollectionCrawler(unittest.TestCase):
+    """LayerCollectionCrawler tests against a local HTTP server"""
+
+    def setUp(self) -> None:
+        self.lock = threading.Lock()
+        self.concurrent_requests = 0
+        self.max_concurrent_requests = 0
+
+        def handler(request):
+            with self.lock:
+                self.concurrent_requests += 1
+                self.max_concurrent_requests = max(self.max_concurrent_requests, self.concurrent_requests)
+
+            path = request["path"].split("/")
+            collection_id = "root" if path[-1] == "collections" else path[-1]
+            offset = int(request["query"]["offset"])
+            limit = int(request["query"]["limit"])
+            time.sleep(0.02)
+
+            with self.lock:
+                self.concurrent_requests -= 1
+
+            return 200, {"Content-Type": "application/json"}, json.dumps({
+                "description": "",
+                "id": {"collectionId": collection_id, "providerId": PROVIDER_ID},
+                "items": collection_items(collection_id)[offset:offset + limit],
+                "name": collection_id,
+                "properties": [],
+            })
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        self.layers_api = geoengine_openapi_client.LayersApi(geoengine_openapi_client.ApiClient(
+            geoengine_openapi_client.Configuration(host=self.server.host)
+        ))
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def collection_requests(self):
+        return [r["path"] for r in self.server.requests if r["query"]["offset"] == "0"]
+
+    def test_crawl(self) -> None:
+        crawler = LayerCollectionCrawler(self.layers_api, workers=3, page_size=4)
+
+        crawled = {c.collection.id.collection_id: c for c in crawler.crawl()}
+
+        self.assertEqual(set(crawled), set(TREE))
+        # every collection is requested once
+        self.assertEqual(len(self.collection_requests()), len(TREE))
+        self.assertEqual(len(crawled["a"].collection.items), len(collection_items("a")))
+        self.assertEqual(crawled["a1"].parent.collection_id, "a")
+        self.assertEqual(crawled["a1"].depth, 2)
+        self.assertIsNone(crawled["root"].parent)
+        self.assertLessEqual(self.max_concurrent_requests, 3)
+        self.assertGreater(self.max_concurrent_requests, 1)
+
+    def test_crawl_from_start(self) -> None:
+        crawler = LayerCollectionCrawler(self.layers_api, workers=2)
+
+        crawled = [c.collection.id.collection_id
+                   for c in crawler.crawl(ProviderLayerCollectionId(provider_id=PROVIDER_ID, collection_id="a"))]
+
+        self.assertEqual(sorted(crawled), ["a", "a1", "s1", "shared"])
+
+    def test_resume_from_checkpoint(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "checkpoint.json")
+
+            first_run = []
+            for crawled in LayerCollectionCrawler(self.layers_api, workers=2, checkpoint_path=checkpoint_path).crawl():
+                first_run.append(crawled.collection.id.collection_id)
+                if len(first_run) == 3:
+                    break
+            self.assertTrue(os.path.exists(checkpoint_path))
+
+            second_run = [
+                crawled.collection.id.collection_id
+                for crawled in LayerCollectionCrawler(self.layers_api, workers=2, checkpoint_path=checkpoint_path).crawl()
+            ]
+
+            # the last collection of the first run was not acknowledged
+            self.assertEqual(set(first_run[:2]) | set(second_run), set(TREE))
+            self.assertFalse(set(first_run[:2]) & set(second_run))
+            self.assertIn(first_run[2], second_run)
+            self.assertFalse(os.path.exists(checkpoint_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
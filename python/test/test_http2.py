@@ -0,0 +1,137 @@
+# coding: utf-8
+
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import json
+import os
+import socket
+import tempfile
+import unittest
+
+import urllib3
+
+import geoengine_openapi_client
+from geoengine_openapi_client.exceptions import NotFoundException
+
+from test.local_server import LocalServer
+
+try:
+    import httpx
+    from geoengine_openapi_client.http2 import Http2PoolManager, Http2RESTClientObject
+except ImportError:
+    httpx = None
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+UPLOAD_ID = "fedcba98-7654-3210-fedc-ba9876543210"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestHttp2Transport(unittest.TestCase):
+    """Http2RESTClientObject tests"""
+
+    def setUp(self) -> None:
+        def handler(request):
+            if request["path"] == "/api/upload":
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": UPLOAD_ID})
+            if request["method"] == "POST":
+                self.assertEqual(json.loads(request["body"]), WORKFLOW)
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": WORKFLOW_ID})
+            if request["path"] != f"/api/workflow/{WORKFLOW_ID}":
+                return 404, {}, json.dumps({"error": "NotFound", "message": "unknown workflow"})
+            return 200, {"Content-Type": "application/json", "Content-Encoding": "gzip"}, \
+                gzip.compress(json.dumps(WORKFLOW).encode("utf-8"))
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+
+        self.configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        self.configuration.http2 = True
+        self.api_client = geoengine_openapi_client.ApiClient(self.configuration)
+        self.api = geoengine_openapi_client.WorkflowsApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def test_selected_by_configuration(self) -> None:
+        self.assertIsInstance(self.api_client.rest_client, Http2RESTClientObject)
+        self.assertIsInstance(self.api_client.rest_client.pool_manager, Http2PoolManager)
+
+    def test_close(self) -> None:
+        self.api.load_workflow_handler(WORKFLOW_ID)
+        client = self.api_client.rest_client.pool_manager.client
+
+        self.api_client.close()
+
+        self.assertTrue(client.is_closed)
+        self.api.load_workflow_handler(WORKFLOW_ID)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_configuration(self) -> None:
+        self.configuration.socket_options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+        self.configuration.tls_server_name = "geoengine.example"
+        pool_manager = Http2RESTClientObject(self.configuration).pool_manager
+
+        self.assertEqual(pool_manager.client._transport._pool._socket_options, self.configuration.socket_options)
+        self.assertEqual(pool_manager.extensions, {"sni_hostname": "geoengine.example"})
+        pool_manager.clear()
+
+    def test_unsupported_configuration(self) -> None:
+        self.configuration.retries = 3
+        with self.assertRaises(ValueError):
+            Http2RESTClientObject(self.configuration)
+
+        self.configuration.retries = None
+        self.configuration.assert_hostname = "geoengine.example"
+        with self.assertRaises(ValueError):
+            Http2RESTClientObject(self.configuration)
+
+    def test_json(self) -> None:
+        workflow = self.api.load_workflow_handler(WORKFLOW_ID)
+        self.assertEqual(workflow.to_dict()["type"], "Vector")
+
+        response = self.api.register_workflow_handler(geoengine_openapi_client.Workflow.from_dict(WORKFLOW))
+        self.assertEqual(response.id, WORKFLOW_ID)
+
+    def test_concurrent_requests(self) -> None:
+        with ThreadPoolExecutor(8) as executor:
+            workflows = list(executor.map(lambda _: self.api.load_workflow_handler(WORKFLOW_ID), range(32)))
+
+        self.assertEqual(len(workflows), 32)
+        self.assertEqual(len(self.server.requests), 32)
+
+    def test_streaming(self) -> None:
+        response = self.api.load_workflow_handler_with_http_info(WORKFLOW_ID, _preload_content=False)
+
+        with response.raw_data as stream:
+            body = b"".join(stream.iter_chunks(7))
+        self.assertEqual(json.loads(body), WORKFLOW)
+
+    def test_multipart(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "points.csv")
+            with open(path, "wb") as f:
+                f.write(b"x,y\n" * 10_000)
+
+            response = geoengine_openapi_client.UploadsApi(self.api_client).upload_handler([path])
+
+        self.assertEqual(response.id, UPLOAD_ID)
+        self.assertEqual(int(self.server.requests[0]["headers"]["Content-Length"]), len(self.server.requests[0]["body"]))
+        self.assertIn(b"x,y\n" * 10_000, self.server.requests[0]["body"])
+
+    def test_errors(self) -> None:
+        with self.assertRaises(NotFoundException):
+            self.api.load_workflow_handler("unknown")
+
+        self.configuration.host = "http://127.0.0.1:1/api"
+        api = geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(self.configuration))
+        with self.assertRaises(urllib3.exceptions.HTTPError):
+            api.load_workflow_handler(WORKFLOW_ID)
+
+
+if __name__ == '__main__':
+    unittest.main()
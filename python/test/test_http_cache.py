@@ -0,0 +1,138 @@
+# coding: utf-8
+
+import copy
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import json
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.http_cache import HttpCache, cache_control, freshness_lifetime
+
+from test.local_server import LocalServer
+
+VOLUMES = [{"name": "upload", "path": "/data/upload"}, {"name": "test_data", "path": "/data/test"}]
+ETAG = '"volumes-1"'
+
+
+class TestFreshness(unittest.TestCase):
+    """Cache-Control and Expires parsing tests"""
+
+    def test_cache_control(self) -> None:
+        self.assertEqual(cache_control({"Cache-Control": 'public, max-age=60, no-cache="Set-Cookie"'}),
+                         {"public": "", "max-age": "60", "no-cache": "Set-Cookie"})
+        self.assertEqual(cache_control({}), {})
+
+    def test_freshness_lifetime(self) -> None:
+        self.assertEqual(freshness_lifetime({"Cache-Control": "max-age=60"}), 60)
+        self.assertEqual(freshness_lifetime({"Cache-Control": "max-age=60", "Age": "10"}), 50)
+        self.assertEqual(freshness_lifetime({"Cache-Control": "no-cache, max-age=60"}), 0)
+        self.assertEqual(freshness_lifetime({"ETag": ETAG}), 0)
+
+        now = datetime.now(timezone.utc)
+        self.assertEqual(freshness_lifetime({
+            "Date": format_datetime(now, usegmt=True),
+            "Expires": format_datetime(now + timedelta(seconds=30), usegmt=True),
+        }), 30)
+
+
+class TestConditionalRequests(unittest.TestCase):
+    """HttpCache tests with a server"""
+
+    def setUp(self) -> None:
+        self.response_headers = {"ETag": ETAG}
+        self.evict_on_revalidation = False
+
+        def handler(request):
+            headers = {"Content-Type": "application/json", **self.response_headers}
+            if self.evict_on_revalidation and request["headers"].get("If-None-Match") is not None:
+                # e.g. by concurrent requests of other resources
+                self.configuration.http_cache.clear()
+            validators = [("If-None-Match", "ETag"), ("If-Modified-Since", "Last-Modified")]
+            if any(request["headers"].get(condition) is not None
+                   and request["headers"].get(condition) == self.response_headers.get(validator)
+                   for (condition, validator) in validators):
+                return 304, headers, b""
+            return 200, headers, json.dumps(VOLUMES)
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+
+        self.configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        self.configuration.http_cache = HttpCache()
+        self.api = geoengine_openapi_client.DatasetsApi(geoengine_openapi_client.ApiClient(self.configuration))
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def test_revalidates_with_etag(self) -> None:
+        for _ in range(3):
+            volumes = self.api.list_volumes_handler()
+            self.assertEqual([volume.name for volume in volumes], ["upload", "test_data"])
+
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertIsNone(self.server.requests[0]["headers"].get("If-None-Match"))
+        self.assertEqual(self.server.requests[2]["headers"].get("If-None-Match"), ETAG)
+        self.assertEqual(self.configuration.http_cache.stats.revalidations, 2)
+        self.assertEqual(self.configuration.http_cache.stats.misses, 1)
+
+    def test_revalidates_with_last_modified(self) -> None:
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        self.response_headers = {"Last-Modified": last_modified}
+
+        self.api.list_volumes_handler()
+        self.assertEqual(len(self.api.list_volumes_handler()), 2)
+
+        self.assertEqual(self.server.requests[1]["headers"].get("If-Modified-Since"), last_modified)
+        self.assertEqual(self.configuration.http_cache.stats.revalidations, 1)
+
+    def test_fresh_responses_are_not_requested(self) -> None:
+        self.response_headers = {"ETag": ETAG, "Cache-Control": "max-age=60"}
+
+        for _ in range(3):
+            self.assertEqual(len(self.api.list_volumes_handler()), 2)
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.configuration.http_cache.stats.hits, 2)
+
+    def test_no_store(self) -> None:
+        self.response_headers = {"ETag": ETAG, "Cache-Control": "no-store"}
+
+        self.api.list_volumes_handler()
+        self.api.list_volumes_handler()
+
+        self.assertIsNone(self.server.requests[1]["headers"].get("If-None-Match"))
+        self.assertEqual(self.configuration.http_cache.stats.misses, 2)
+
+    def test_changed_resource(self) -> None:
+        self.api.list_volumes_handler()
+        self.response_headers = {"ETag": '"volumes-2"'}
+
+        self.assertEqual(len(self.api.list_volumes_handler()), 2)
+        self.assertEqual(self.configuration.http_cache.stats.revalidations, 0)
+
+    def test_evicted_during_revalidation(self) -> None:
+        self.api.list_volumes_handler()
+        self.evict_on_revalidation = True
+
+        self.assertEqual(len(self.api.list_volumes_handler()), 2)
+
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.server.requests[1]["headers"].get("If-None-Match"), ETAG)
+        self.assertIsNone(self.server.requests[2]["headers"].get("If-None-Match"))
+        self.assertEqual(self.configuration.http_cache.stats.misses, 2)
+
+    def test_varies_by_authorization(self) -> None:
+        self.response_headers = {"Cache-Control": "max-age=60"}
+
+        self.api.list_volumes_handler()
+        self.api.list_volumes_handler(_headers={"Authorization": "Bearer other"})
+
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_shared_by_configuration_copies(self) -> None:
+        self.assertIs(copy.deepcopy(self.configuration).http_cache, self.configuration.http_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
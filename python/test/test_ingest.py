@@ -0,0 +1,131 @@
+# coding: utf-8
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.ingest import BulkIngester, IngestItem
+
+from test.local_server import LocalServer
+
+NUMBER_OF_FILES = 8
+
+SUGGESTION = {
+    "layerName": "layer",
+    "mainFile": "main",
+    "metaData": {
+        "type": "OgrMetaData",
+        "loadingInfo": {
+            "fileName": "points.csv",
+            "layerName": "points",
+            "time": {"type": "none"},
+            "onError": "abort",
+        },
+        "resultDescriptor": {"dataType": "MultiPoint", "spatialReference": "EPSG:4326", "columns": {}},
+    },
+}
+
+
+def upload_id(i: int) -> str:
+    return f"00000000-0000-0000-0000-{i:012d}"
+
+
+class TestBulkIngester(unittest.TestCase):
+    """BulkIngester tests against a local HTTP server"""
+
+    def setUp(self) -> None:
+        self.lock = threading.Lock()
+        self.active = {"upload": 0, "create": 0}
+        self.max_active = {"upload": 0, "create": 0}
+        self.overlapped = False
+        self.created = []
+
+        def handler(request):
+            stage = "upload" if request["path"] == "/api/upload" else "create"
+            with self.lock:
+                self.active[stage] += 1
+                self.max_active[stage] = max(self.max_active[stage], self.active[stage])
+                self.overlapped = self.overlapped or all(self.active.values())
+            time.sleep(0.03)
+            with self.lock:
+                self.active[stage] -= 1
+
+            if stage == "upload":
+                number = int(re.search(rb'filename="file(\d+)\.csv"', request["body"]).group(1))
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": upload_id(number)})
+
+            body = json.loads(request["body"])
+            if request["path"] == "/api/dataset/suggest":
+                if body["dataPath"]["upload"] == upload_id(3):
+                    return 400, {"Content-Type": "application/json"}, \
+                        json.dumps({"error": "NoMainFileCandidateFound", "message": "no main file"})
+                return 200, {"Content-Type": "application/json"}, json.dumps(SUGGESTION)
+
+            if request["path"] == "/api/dataset":
+                name = body["definition"]["properties"]["name"]
+                self.assertEqual(body["definition"]["properties"]["sourceOperator"], "OgrSource")
+            else:
+                name = body["datasetName"]
+                self.assertEqual(body["tags"], ["scenes"])
+            with self.lock:
+                self.created.append(name)
+            return 200, {"Content-Type": "application/json"}, json.dumps({"datasetName": f"ns:{name}"})
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        api_client = geoengine_openapi_client.ApiClient(geoengine_openapi_client.Configuration(host=self.server.host))
+        self.uploads_api = geoengine_openapi_client.UploadsApi(api_client)
+        self.datasets_api = geoengine_openapi_client.DatasetsApi(api_client)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(NUMBER_OF_FILES):
+            path = os.path.join(self.directory.name, f"file{i}.csv")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("x,y\n1,2\n")
+            self.paths.append(path)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        self.server.__exit__(None, None, None)
+
+    def test_ingest(self) -> None:
+        missing = os.path.join(self.directory.name, "missing.csv")
+        ingester = BulkIngester(self.uploads_api, self.datasets_api, upload_workers=2, create_workers=3)
+
+        report = ingester.ingest(self.paths + [missing])
+
+        self.assertEqual(len(report.results), NUMBER_OF_FILES + 1)
+        self.assertEqual(report.created[self.paths[0]], "ns:file0")
+        self.assertEqual(len(report.created), NUMBER_OF_FILES - 1)
+        failures = {r.item.files[0]: r for r in report.failures}
+        self.assertEqual(failures[self.paths[3]].stage, "create")
+        self.assertEqual(failures[self.paths[3]].upload_id, upload_id(3))
+        self.assertEqual(failures[missing].stage, "upload")
+
+        # uploads overlap with the creation of datasets, in bounded pools
+        self.assertTrue(self.overlapped)
+        self.assertLessEqual(self.max_active["upload"], 2)
+        self.assertLessEqual(self.max_active["create"], 3)
+
+        document = json.loads(report.to_json())
+        self.assertEqual(len(document["created"]), NUMBER_OF_FILES - 1)
+        self.assertEqual({f["stage"] for f in document["failures"]}, {"create", "upload"})
+
+    def test_auto_create(self) -> None:
+        ingester = BulkIngester(self.uploads_api, self.datasets_api, auto_create=True, tags=["scenes"])
+
+        results = list(ingester.ingest_iter([IngestItem([self.paths[0], self.paths[1]], "pair")]))
+
+        self.assertEqual([r.dataset_name for r in results], ["ns:pair"])
+        self.assertEqual(self.created, ["pair"])
+        self.assertFalse(any(r["path"] == "/api/dataset/suggest" for r in self.server.requests))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+# coding: utf-8
+
+import json
+import threading
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.exceptions import NotFoundException
+from geoengine_openapi_client.instrumentation import (
+    CombinedInstrumentation, Histogram, Instrumentation, MetricsCollector, OpenTelemetryInstrumentation,
+)
+from geoengine_openapi_client.retry import RetryPolicy
+
+from test.local_server import LocalServer
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.trace import StatusCode
+except ImportError:
+    TracerProvider = None
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+NOT_FOUND = json.dumps({"error": "NotFound", "message": "unknown workflow"})
+
+
+class Calls(Instrumentation):
+    """Records the hooks that were called."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def pre_request(self, metrics):
+        self.calls.append(("pre_request", metrics.attempt))
+
+    def post_response(self, metrics):
+        self.calls.append(("post_response", metrics.attempt, metrics.status))
+
+    def pre_deserialize(self, metrics):
+        self.calls.append(("pre_deserialize", metrics.operation))
+
+    def post_deserialize(self, metrics):
+        self.calls.append(("post_deserialize", metrics.operation))
+
+
+class InstrumentationTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.statuses = []
+        self.release = threading.Event()
+        self.release.set()
+
+        def handler(request):
+            self.release.wait()
+            if self.statuses:
+                return self.statuses.pop(0), {}, b""
+            if request["method"] == "POST":
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": WORKFLOW_ID})
+            if request["path"] != f"/api/workflow/{WORKFLOW_ID}":
+                return 404, {}, NOT_FOUND
+            return 200, {"Content-Type": "application/json"}, json.dumps(WORKFLOW)
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+
+        self.configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+
+    def tearDown(self) -> None:
+        self.release.set()
+        self.server.__exit__(None, None, None)
+
+    def api(self, **kwargs):
+        return geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(self.configuration, **kwargs))
+
+
+class TestHooks(InstrumentationTestCase):
+    """Instrumentation hook tests"""
+
+    def test_order(self) -> None:
+        self.configuration.instrumentation = Calls()
+
+        self.api().load_workflow_handler(WORKFLOW_ID)
+
+        self.assertEqual(self.configuration.instrumentation.calls, [
+            ("pre_request", 1),
+            ("post_response", 1, 200),
+            ("pre_deserialize", "load_workflow_handler"),
+            ("post_deserialize", "load_workflow_handler"),
+        ])
+
+    def test_retries_and_errors(self) -> None:
+        self.configuration.instrumentation = Calls()
+        self.configuration.retry_policy = RetryPolicy(retries=1, backoff=0)
+        self.statuses = [503]
+
+        self.api().load_workflow_handler(WORKFLOW_ID)
+        with self.assertRaises(NotFoundException):
+            self.api().load_workflow_handler("unknown")
+
+        self.assertEqual([call for call in self.configuration.instrumentation.calls if call[0] == "post_response"], [
+            ("post_response", 1, 503),
+            ("post_response", 2, 200),
+            ("post_response", 1, 404),
+        ])
+
+    def test_combined(self) -> None:
+        (first, second) = (Calls(), Calls())
+        self.configuration.instrumentation = CombinedInstrumentation(first, second)
+
+        self.api().load_workflow_handler(WORKFLOW_ID)
+
+        self.assertEqual(len(first.calls), 4)
+        self.assertEqual(first.calls, second.calls)
+
+
+class TestMetricsCollector(InstrumentationTestCase):
+    """MetricsCollector tests"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.metrics = MetricsCollector()
+        self.configuration.instrumentation = self.metrics
+
+    def test_counts_per_operation(self) -> None:
+        api = self.api()
+        for _ in range(3):
+            api.load_workflow_handler(WORKFLOW_ID)
+        api.register_workflow_handler(geoengine_openapi_client.Workflow.from_dict(WORKFLOW))
+        with self.assertRaises(NotFoundException):
+            api.load_workflow_handler("unknown")
+
+        self.assertEqual(self.metrics.requests(), {
+            ("load_workflow_handler", 200): 3,
+            ("load_workflow_handler", 404): 1,
+            ("register_workflow_handler", 200): 1,
+        })
+        self.assertEqual(self.metrics.histogram("network_seconds", "load_workflow_handler").count, 4)
+        self.assertEqual(self.metrics.histogram("validation_seconds", "load_workflow_handler").count, 3)
+        self.assertGreater(self.metrics.histogram("decode_seconds", "load_workflow_handler").sum, 0)
+        self.assertEqual(self.metrics.histogram("response_bytes", "load_workflow_handler").sum,
+                         3 * len(json.dumps(WORKFLOW)) + len(NOT_FOUND))
+        self.assertEqual(self.metrics.histogram("request_bytes", "register_workflow_handler").sum,
+                         len(self.server.requests[3]["body"]))
+
+    def test_pool_wait(self) -> None:
+        self.release.clear()
+        api = self.api(pool_threads=1)
+
+        results = [api.load_workflow_handler(WORKFLOW_ID, async_req=True) for _ in range(2)]
+        threading.Timer(0.1, self.release.set).start()
+        for result in results:
+            result.get()
+
+        histogram = self.metrics.histogram("pool_wait_seconds", "load_workflow_handler")
+        self.assertEqual(histogram.count, 2)
+        self.assertGreaterEqual(histogram.sum, 0.1)
+
+    def test_prometheus(self) -> None:
+        self.api().load_workflow_handler(WORKFLOW_ID)
+
+        text = self.metrics.to_prometheus()
+
+        self.assertIn('geoengine_client_requests_total{operation="load_workflow_handler",status="200"} 1\n', text)
+        self.assertIn("# TYPE geoengine_client_network_seconds histogram\n", text)
+        self.assertIn('geoengine_client_network_seconds_bucket{operation="load_workflow_handler",le="+Inf"} 1\n', text)
+        self.assertIn('geoengine_client_network_seconds_count{operation="load_workflow_handler"} 1\n', text)
+
+    def test_histogram(self) -> None:
+        histogram = Histogram([1.0, 2.0])
+        for value in (0.5, 1.0, 1.5, 3.0):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative_counts(), [(1.0, 2), (2.0, 3), (float("inf"), 4)])
+        self.assertEqual((histogram.count, histogram.sum), (4, 6.0))
+
+
+@unittest.skipIf(TracerProvider is None, "opentelemetry-sdk is not installed")
+class TestOpenTelemetryInstrumentation(InstrumentationTestCase):
+    """OpenTelemetryInstrumentation tests"""
+
+    def test_spans(self) -> None:
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        self.configuration.instrumentation = OpenTelemetryInstrumentation(provider.get_tracer(__name__))
+
+        self.api().load_workflow_handler(WORKFLOW_ID)
+        with self.assertRaises(NotFoundException):
+            self.api().load_workflow_handler("unknown")
+
+        (request, deserialize, failed_request) = exporter.get_finished_spans()
+        self.assertEqual(request.name, "GET")
+        self.assertEqual(request.attributes["http.response.status_code"], 200)
+        self.assertEqual(request.attributes["geoengine.operation"], "load_workflow_handler")
+        self.assertEqual(deserialize.name, "deserialize load_workflow_handler")
+        self.assertIn("geoengine.validation_time", deserialize.attributes)
+        self.assertEqual(failed_request.status.status_code, StatusCode.ERROR)
+        self.assertEqual(failed_request.attributes["error.type"], "404")
+
+
+if __name__ == '__main__':
+    unittest.main()
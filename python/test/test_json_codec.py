@@ -0,0 +1,117 @@
+# coding: utf-8
+
+import copy
+import json
+import math
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.json_codec import OrjsonCodec, StdlibJsonCodec, orjson
+
+from test.local_server import LocalServer
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+
+
+class RecordingCodec(StdlibJsonCodec):
+    """Records the types of all decoded documents."""
+
+    def __init__(self) -> None:
+        self.loaded_types = []
+
+    def loads(self, data):
+        self.loaded_types.append(type(data))
+        return super().loads(data)
+
+
+class TestJsonCodecs(unittest.TestCase):
+    """JsonCodec unit tests"""
+
+    def check_codec(self, codec) -> None:
+        encoded = codec.dumps(WORKFLOW)
+        self.assertEqual(json.loads(encoded), WORKFLOW)
+        self.assertEqual(codec.loads(json.dumps(WORKFLOW).encode("utf-8")), WORKFLOW)
+        self.assertEqual(codec.loads(json.dumps(WORKFLOW)), WORKFLOW)
+        with self.assertRaises(ValueError):
+            codec.loads(b"<xml/>")
+
+    def test_stdlib_codec(self) -> None:
+        self.check_codec(StdlibJsonCodec())
+
+    def test_stdlib_semantics(self) -> None:
+        codec = geoengine_openapi_client.Configuration().json_codec
+
+        self.assertEqual(codec.dumps([math.nan, math.inf, -math.inf]), "[NaN, Infinity, -Infinity]")
+        values = codec.loads(b"[NaN, Infinity, -Infinity]")
+        self.assertTrue(math.isnan(values[0]))
+        self.assertEqual(values[1:], [math.inf, -math.inf])
+
+        self.assertEqual(codec.loads(codec.dumps({"id": 2 ** 70})), {"id": 2 ** 70})
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_codec(self) -> None:
+        self.check_codec(OrjsonCodec())
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_semantics(self) -> None:
+        codec = OrjsonCodec()
+
+        self.assertEqual(codec.dumps([math.nan, math.inf]), b"[null,null]")
+        with self.assertRaises(ValueError):
+            codec.loads(b"[NaN]")
+        with self.assertRaises(TypeError):
+            codec.dumps({"id": 2 ** 70})
+
+    def test_configuration_default(self) -> None:
+        configuration = geoengine_openapi_client.Configuration()
+        self.assertIsInstance(configuration.json_codec, StdlibJsonCodec)
+        self.assertIs(copy.deepcopy(configuration).json_codec, configuration.json_codec)
+
+class TestJsonCodecRequests(unittest.TestCase):
+    """Tests of the configured codec against a local HTTP server"""
+
+    def setUp(self) -> None:
+        def handler(request):
+            if request["method"] == "POST":
+                self.assertEqual(json.loads(request["body"]), WORKFLOW)
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": WORKFLOW_ID})
+            return 200, {"Content-Type": "application/json; charset=utf-8"}, json.dumps(WORKFLOW)
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+
+        self.codec = RecordingCodec()
+        configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        configuration.json_codec = self.codec
+        self.api = geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(configuration))
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def test_decodes_bytes_directly(self) -> None:
+        workflow = self.api.load_workflow_handler(WORKFLOW_ID)
+
+        self.assertEqual(workflow.to_dict()["type"], "Vector")
+        self.assertEqual(self.codec.loaded_types, [bytes])
+
+    def test_raw_data_is_text(self) -> None:
+        response = self.api.load_workflow_handler_with_http_info(WORKFLOW_ID)
+
+        self.assertEqual(response.raw_data, json.dumps(WORKFLOW))
+        self.assertEqual(response.data.to_dict()["type"], "Vector")
+
+    def test_encodes_request_body(self) -> None:
+        workflow = geoengine_openapi_client.Workflow.from_dict(WORKFLOW)
+
+        response = self.api.register_workflow_handler(workflow)
+
+        self.assertEqual(response.id, WORKFLOW_ID)
+        self.assertEqual(len(self.server.requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# coding: utf-8
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+import geoengine_openapi_client
+import geoengine_openapi_client.api
+import geoengine_openapi_client.models
+from geoengine_openapi_client.models.workflow import Workflow
+
+
+def run_python(code: str):
+    """Runs `code` in a fresh interpreter and returns its JSON output."""
+    package_root = os.path.dirname(os.path.dirname(geoengine_openapi_client.__file__))
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=package_root)
+    return json.loads(output)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Lazy attribute loading of the package, the apis and the models"""
+
+    def test_import_loads_no_models_or_apis(self) -> None:
+        loaded = run_python(
+            "import json, sys\n"
+            "import geoengine_openapi_client\n"
+            "geoengine_openapi_client.ApiClient(geoengine_openapi_client.Configuration())\n"
+            "print(json.dumps([m for m in sys.modules if m.startswith(("
+            "'geoengine_openapi_client.models.', 'geoengine_openapi_client.api.'))]))\n"
+        )
+
+        self.assertEqual(loaded, [])
+
+    def test_import_loads_no_optional_dependencies(self) -> None:
+        loaded = run_python(
+            "import json, sys\n"
+            "import geoengine_openapi_client\n"
+            "import geoengine_openapi_client.retry, geoengine_openapi_client.traffic\n"
+            "geoengine_openapi_client.ApiClient(geoengine_openapi_client.Configuration())\n"
+            "print(json.dumps([m for m in ('aiohttp', 'httpx') if m in sys.modules]))\n"
+        )
+
+        self.assertEqual(loaded, [])
+
+    def test_public_names(self) -> None:
+        self.assertIs(geoengine_openapi_client.Workflow, Workflow)
+        self.assertIs(geoengine_openapi_client.models.Workflow, Workflow)
+        self.assertIs(geoengine_openapi_client.WorkflowsApi, geoengine_openapi_client.api.WorkflowsApi)
+        self.assertIn("Workflow", dir(geoengine_openapi_client.models))
+        self.assertIn("WorkflowsApi", geoengine_openapi_client.__all__)
+        self.assertIn("ApiClient", geoengine_openapi_client.__all__)
+
+        for name in geoengine_openapi_client.models.__all__:
+            self.assertIsNotNone(getattr(geoengine_openapi_client.models, name))
+
+    def test_unknown_name(self) -> None:
+        with self.assertRaises(AttributeError):
+            geoengine_openapi_client.models.NoSuchModel  # noqa: B018
+
+        with self.assertRaises(ImportError):
+            from geoengine_openapi_client import NoSuchApi  # noqa: F401
+
+    def test_deserialize_by_class_name(self) -> None:
+        api_client = geoengine_openapi_client.ApiClient()
+        data = {"type": "Vector", "operator": {"type": "MockPointSource", "params": {}}}
+
+        workflow = api_client._ApiClient__deserialize(data, "Workflow")
+
+        self.assertIsInstance(workflow, Workflow)
+
+    def test_import_time_benchmark(self) -> None:
+        """Guards against regressions to eagerly importing all models"""
+        timings = run_python(
+            "import json, time\n"
+            "start = time.perf_counter()\n"
+            "import geoengine_openapi_client\n"
+            "lazy = time.perf_counter() - start\n"
+            "for name in geoengine_openapi_client.__all__:\n"
+            "    getattr(geoengine_openapi_client, name)\n"
+            "print(json.dumps({'lazy': lazy, 'eager': time.perf_counter() - start}))\n"
+        )
+
+        self.assertLess(timings["lazy"], timings["eager"] / 2, timings)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from urllib3.filepost import encode_multipart_formdata
+
+import geoengine_openapi_client
+from geoengine_openapi_client.multipart import MultipartEncoder, MultipartFile
+
+from test.local_server import LocalServer
+
+BOUNDARY = "0123456789abcdef"
+UPLOAD_ID = "01234567-89ab-cdef-0123-456789abcdef"
+
+
+class TestMultipartEncoder(unittest.TestCase):
+    """MultipartEncoder unit tests"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.content = os.urandom(100_000)
+        self.path = os.path.join(self.directory.name, "raster.tif")
+        with open(self.path, 'wb') as f:
+            f.write(self.content)
+        self.empty_path = os.path.join(self.directory.name, "empty.txt")
+        open(self.empty_path, 'wb').close()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def fields(self, lazy: bool):
+        def data(path):
+            if lazy:
+                return MultipartFile(path)
+            with open(path, 'rb') as f:
+                return f.read()
+
+        return [
+            ("name", "ndvi"),
+            ("files[]", ("raster.tif", data(self.path), "image/tiff")),
+            ("files[]", ("empty.txt", data(self.empty_path), "text/plain")),
+        ]
+
+    def test_matches_urllib3(self) -> None:
+        (expected, content_type) = encode_multipart_formdata(self.fields(lazy=False), boundary=BOUNDARY)
+
+        with MultipartEncoder(self.fields(lazy=True), boundary=BOUNDARY) as encoder:
+            self.assertEqual(encoder.content_type, content_type)
+            self.assertEqual(encoder.content_length, len(expected))
+
+            chunks = []
+            while True:
+                chunk = encoder.read(4096)
+                if not chunk:
+                    break
+                self.assertLessEqual(len(chunk), 4096)
+                chunks.append(chunk)
+
+        self.assertEqual(b"".join(chunks), expected)
+
+    def test_seek(self) -> None:
+        (expected, _) = encode_multipart_formdata(self.fields(lazy=False), boundary=BOUNDARY)
+        encoder = MultipartEncoder(self.fields(lazy=True), boundary=BOUNDARY)
+
+        encoder.read(50_000)
+        self.assertEqual(encoder.tell(), 50_000)
+
+        encoder.seek(1000)
+        self.assertEqual(encoder.read(100), expected[1000:1100])
+        encoder.seek(-10, io.SEEK_END)
+        self.assertEqual(encoder.read(), expected[-10:])
+        encoder.seek(0)
+        self.assertEqual(encoder.read(), expected)
+
+    def test_progress(self) -> None:
+        progress = []
+        encoder = MultipartEncoder(self.fields(lazy=True), progress=lambda sent, total: progress.append((sent, total)))
+
+        while encoder.read(16384):
+            pass
+
+        self.assertEqual(progress[-1], (encoder.content_length, encoder.content_length))
+        self.assertEqual(len(progress), -(-encoder.content_length // 16384))
+
+
+class TestUploadHandler(unittest.TestCase):
+    """Streaming uploads of UploadsApi.upload_handler against a local HTTP server"""
+
+    def setUp(self) -> None:
+        def handler(request):
+            return 200, {"Content-Type": "application/json"}, json.dumps({"id": UPLOAD_ID})
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        self.progress = []
+        configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        configuration.upload_progress = lambda sent, total: self.progress.append((sent, total))
+        self.api_client = geoengine_openapi_client.ApiClient(configuration)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "points.bin")
+        with open(self.path, 'wb') as f:
+            f.write(os.urandom(200_000))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        self.server.__exit__(None, None, None)
+
+    def test_files_are_not_read(self) -> None:
+        [(name, (filename, data, mimetype))] = self.api_client.files_parameters({"files[]": [self.path]})
+
+        self.assertEqual((name, filename), ("files[]", "points.bin"))
+        self.assertIsInstance(data, MultipartFile)
+        self.assertEqual(data.size, 200_000)
+
+    def test_upload(self) -> None:
+        response = geoengine_openapi_client.UploadsApi(self.api_client).upload_handler([self.path])
+
+        self.assertEqual(response.id, UPLOAD_ID)
+
+        request = self.server.requests[0]
+        content_type = request["headers"]["Content-Type"]
+        self.assertTrue(content_type.startswith("multipart/form-data; boundary="))
+        self.assertEqual(int(request["headers"]["Content-Length"]), len(request["body"]))
+        self.assertNotIn("Transfer-Encoding", request["headers"])
+
+        with open(self.path, 'rb') as f:
+            (expected, _) = encode_multipart_formdata(
+                [("files[]", ("points.bin", f.read(), "application/octet-stream"))],
+                boundary=content_type.partition("boundary=")[2])
+        self.assertEqual(request["body"], expected)
+        self.assertEqual(self.progress[-1], (len(expected), len(expected)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# coding: utf-8
+
+import json
+from typing import Any, Optional
+import unittest
+from unittest import mock
+
+from pydantic import BaseModel, StrictInt, StrictStr
+
+from geoengine_openapi_client.models.layer_update import LayerUpdate
+from geoengine_openapi_client.models.point_symbology_with_type import PointSymbologyWithType
+from geoengine_openapi_client.models.project_update_token import ProjectUpdateToken
+from geoengine_openapi_client.models.raster_symbology_with_type import RasterSymbologyWithType
+from geoengine_openapi_client.models.symbology import Symbology
+from geoengine_openapi_client.models.task_status import TaskStatus
+from geoengine_openapi_client.models.task_status_with_id import TaskStatusWithId
+from geoengine_openapi_client.models.typed_geometry import TypedGeometry
+from geoengine_openapi_client.models.typed_geometry_one_of import TypedGeometryOneOf
+from geoengine_openapi_client.models.typed_geometry_one_of1 import TypedGeometryOneOf1
+from geoengine_openapi_client.one_of import OneOfDispatcher, dispatcher_for
+
+POINT_SYMBOLOGY = {
+    "type": "point",
+    "fillColor": {"type": "static", "color": [255, 255, 255, 255]},
+    "radius": {"type": "static", "value": 10},
+    "stroke": {
+        "width": {"type": "static", "value": 1},
+        "color": {"type": "static", "color": [0, 0, 0, 255]},
+    },
+}
+
+
+
+class _Model(BaseModel):
+    @classmethod
+    def from_dict(cls, obj: dict):
+        return cls.parse_obj(obj)
+
+
+class _Exact(_Model):
+    a: StrictInt
+    b: Optional[StrictStr] = None
+
+
+class _Loose(_Model):
+    a: StrictStr
+
+
+class _AlsoLoose(_Model):
+    a: StrictStr
+
+
+class _Union(BaseModel):
+    actual_instance: Any = None
+
+
+class TestOneOfDispatcher(unittest.TestCase):
+    """OneOfDispatcher unit tests"""
+
+    def test_discriminator_lookup(self) -> None:
+        with mock.patch.object(RasterSymbologyWithType, "from_dict") as raster_from_dict:
+            symbology = Symbology.from_dict(POINT_SYMBOLOGY)
+
+        raster_from_dict.assert_not_called()
+        self.assertIsInstance(symbology.actual_instance, PointSymbologyWithType)
+        self.assertEqual(symbology.actual_instance.radius.to_dict(), POINT_SYMBOLOGY["radius"])
+
+    def test_from_json_matches_from_dict(self) -> None:
+        self.assertEqual(
+            Symbology.from_json(json.dumps(POINT_SYMBOLOGY)),
+            Symbology.from_dict(POINT_SYMBOLOGY),
+        )
+
+    def test_missing_discriminator(self) -> None:
+        with self.assertRaisesRegex(ValueError, "from the field `status`"):
+            TaskStatus.from_dict({"info": None})
+
+    def test_invalid_discriminated_candidate(self) -> None:
+        with self.assertRaises(ValueError):
+            Symbology.from_dict({"type": "point"})
+
+    def test_structural_lookup(self) -> None:
+        geometry = {"MultiPoint": {"coordinates": [{"x": 1.0, "y": 2.0}]}}
+
+        with mock.patch.object(TypedGeometryOneOf, "from_dict") as data_from_dict:
+            typed_geometry = TypedGeometry.from_dict(geometry)
+
+        data_from_dict.assert_not_called()
+        self.assertIsInstance(typed_geometry.actual_instance, TypedGeometryOneOf1)
+        self.assertEqual(typed_geometry.to_dict(), geometry)
+
+    def test_structural_fallback(self) -> None:
+        # `TypedGeometryOneOf` has no required properties and ignores the others
+        typed_geometry = TypedGeometry.from_dict({"MultiPoint": {"coordinates": "invalid"}})
+
+        self.assertIsInstance(typed_geometry.actual_instance, TypedGeometryOneOf)
+
+    def test_structural_no_match(self) -> None:
+        with self.assertRaisesRegex(ValueError, "No match found .* into TypedGeometry"):
+            TypedGeometry.from_dict([{"x": 1.0, "y": 2.0}])
+
+    def test_exact_candidate_fails(self) -> None:
+        dispatcher = OneOfDispatcher("_TestUnion", [_Exact, _Loose])
+
+        union = dispatcher.from_dict(_Union, {"a": "x", "b": "y"})
+
+        self.assertIsInstance(union.actual_instance, _Loose)
+        self.assertEqual(union.actual_instance.a, "x")
+
+    def test_exact_candidate_preferred(self) -> None:
+        dispatcher = OneOfDispatcher("_TestUnion", [_Exact, _Loose, _AlsoLoose])
+
+        with mock.patch.object(_Loose, "from_dict") as loose_from_dict:
+            union = dispatcher.from_dict(_Union, {"a": 1, "b": "y"})
+
+        loose_from_dict.assert_not_called()
+        self.assertIsInstance(union.actual_instance, _Exact)
+
+    def test_multiple_matches(self) -> None:
+        dispatcher = OneOfDispatcher("_TestUnion", [_Exact, _Loose, _AlsoLoose])
+
+        with self.assertRaisesRegex(ValueError, "Multiple matches found .* into _TestUnion"):
+            dispatcher.from_dict(_Union, {"a": "x", "b": "y"})
+
+    def test_enum_candidate(self) -> None:
+        layer_update = LayerUpdate.from_dict("none")
+
+        self.assertEqual(layer_update.actual_instance, ProjectUpdateToken.NONE)
+
+    def test_nested_one_of(self) -> None:
+        task_status = TaskStatusWithId.from_dict({
+            "status": "completed",
+            "taskId": "1e6bba7a-1b68-4b2f-9d34-0c1f4e7d2a31",
+            "taskType": "dummy",
+            "description": "test",
+            "info": None,
+            "timeTotal": "00:00:01",
+            "timeStarted": "2023-01-01T00:00:00Z",
+        })
+
+        self.assertEqual(task_status.task_id, "1e6bba7a-1b68-4b2f-9d34-0c1f4e7d2a31")
+
+    def test_dispatcher_registry(self) -> None:
+        self.assertEqual(dispatcher_for(Symbology).discriminator, "type")
+        self.assertIsNone(dispatcher_for(PointSymbologyWithType))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# coding: utf-8
+
+import json
+import threading
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.models.order_by import OrderBy
+from geoengine_openapi_client.models.search_type import SearchType
+from geoengine_openapi_client.pagination import paginate
+
+from test.local_server import LocalServer
+
+try:
+    from geoengine_openapi_client.aio import AsyncApiClient, AsyncLayersApi, paginate as async_paginate
+except ImportError:
+    AsyncApiClient = None
+
+PROVIDER_ID = "ce5e84db-cbf9-48a2-9a32-d4b7cc56ea74"
+NUMBER_OF_ITEMS = 45
+
+
+def layer_listing(i: int) -> dict:
+    return {
+        "type": "layer",
+        "description": "",
+        "id": {"layerId": f"layer{i}", "providerId": PROVIDER_ID},
+        "name": f"Layer {i}",
+    }
+
+
+class TestPaginate(unittest.TestCase):
+    """paginate tests against a local HTTP server"""
+
+    def setUp(self) -> None:
+        self.release_last_page = threading.Event()
+        self.release_last_page.set()
+        self.last_page_requested = threading.Event()
+
+        def handler(request):
+            offset = int(request["query"]["offset"])
+            limit = int(request["query"]["limit"])
+            indices = range(offset, min(offset + limit, NUMBER_OF_ITEMS))
+            if offset + limit >= NUMBER_OF_ITEMS:
+                self.last_page_requested.set()
+                self.release_last_page.wait(5)
+
+            if "autocomplete" in request["path"]:
+                body = [f"Layer {i}" for i in indices]
+            elif "projects" in request["path"]:
+                body = []
+            else:
+                body = {
+                    "description": "",
+                    "id": {"collectionId": "root", "providerId": PROVIDER_ID},
+                    "items": [layer_listing(i) for i in indices],
+                    "name": "Root",
+                    "properties": [],
+                }
+            return 200, {"Content-Type": "application/json"}, json.dumps(body)
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        self.api_client = geoengine_openapi_client.ApiClient(
+            geoengine_openapi_client.Configuration(host=self.server.host)
+        )
+        self.layers_api = geoengine_openapi_client.LayersApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.release_last_page.set()
+        self.api_client.close()
+        self.server.__exit__(None, None, None)
+
+    def requested_pages(self):
+        return [(int(r["query"]["offset"]), int(r["query"]["limit"])) for r in self.server.requests]
+
+    def test_model_pages(self) -> None:
+        layers = list(paginate(self.layers_api.list_root_collections_handler, page_size=20))
+
+        self.assertEqual([layer.actual_instance.name for layer in layers],
+                         [f"Layer {i}" for i in range(NUMBER_OF_ITEMS)])
+        self.assertEqual(self.requested_pages(), [(0, 20), (20, 20), (40, 20)])
+
+    def test_list_pages(self) -> None:
+        names = list(paginate(
+            self.layers_api.autocomplete_handler, PROVIDER_ID, "root",
+            search_type=SearchType.FULLTEXT, search_string="Layer", page_size=15,
+        ))
+
+        self.assertEqual(names, [f"Layer {i}" for i in range(NUMBER_OF_ITEMS)])
+        # the last page is full, so an empty page ends the iteration
+        self.assertEqual(self.requested_pages(), [(0, 15), (15, 15), (30, 15), (45, 15)])
+
+    def test_parameters_without_placeholder(self) -> None:
+        projects_api = geoengine_openapi_client.ProjectsApi(self.api_client)
+
+        projects = list(paginate(projects_api.list_projects_handler, OrderBy.NAMEASC, page_size=20))
+
+        self.assertEqual(projects, [])
+        self.assertEqual(self.requested_pages(), [(0, 20)])
+        self.assertTrue(self.server.requests[0]["path"].endswith("/projects"))
+        self.assertEqual(self.server.requests[0]["query"]["order"], "NameAsc")
+
+    def test_offset(self) -> None:
+        layers = list(paginate(self.layers_api.list_root_collections_handler, page_size=20, offset=30))
+
+        self.assertEqual(len(layers), NUMBER_OF_ITEMS - 30)
+
+    def test_prefetch(self) -> None:
+        self.release_last_page.clear()
+        layers = paginate(self.layers_api.list_root_collections_handler, page_size=20, prefetch=True)
+
+        for _ in range(21):
+            next(layers)
+        # the last page is requested while the second one is consumed
+        self.assertTrue(self.last_page_requested.wait(5))
+        self.assertEqual(self.requested_pages(), [(0, 20), (20, 20), (40, 20)])
+
+        self.release_last_page.set()
+        self.assertEqual(len(list(layers)), NUMBER_OF_ITEMS - 21)
+
+    def test_invalid_page_size(self) -> None:
+        with self.assertRaises(ValueError):
+            next(paginate(self.layers_api.list_root_collections_handler, page_size=0))
+
+
+@unittest.skipIf(AsyncApiClient is None, "aiohttp is not installed")
+class TestAsyncPaginate(unittest.IsolatedAsyncioTestCase):
+    """paginate tests for the asynchronous client"""
+
+    async def test_prefetch(self) -> None:
+        with LocalServer(lambda request: (200, {"Content-Type": "application/json"}, json.dumps([
+            f"Layer {i}" for i in range(
+                int(request["query"]["offset"]),
+                min(int(request["query"]["offset"]) + int(request["query"]["limit"]), NUMBER_OF_ITEMS),
+            )
+        ]))) as server:
+            async with AsyncApiClient(geoengine_openapi_client.Configuration(host=server.host)) as api_client:
+                names = [name async for name in async_paginate(
+                    AsyncLayersApi(api_client).autocomplete_handler, PROVIDER_ID, "root",
+                    search_type=SearchType.FULLTEXT, search_string="Layer", page_size=20, prefetch=True,
+                )]
+
+        self.assertEqual(names, [f"Layer {i}" for i in range(NUMBER_OF_ITEMS)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+# coding: utf-8
+
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.http_cache import HttpCache
+from geoengine_openapi_client.instrumentation import MetricsCollector
+from geoengine_openapi_client.pyramid import (
+    DirectoryTileStore, MBTilesTileStore, Tile, TilePyramid, pyramid_tiles, render_pyramid, tile_bounds,
+)
+
+from test.local_server import LocalServer
+
+ACCESS_TOKEN = "e327d9c3-a4f3-4bd7-a5e1-30b26cae8064"
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+GERMANY = (5.8, 47.2, 15.1, 55.1)
+
+
+class TestPyramidTiles(unittest.TestCase):
+    """Tile grid unit tests"""
+
+    def test_tile_bounds(self) -> None:
+        (xmin, ymin, xmax, ymax) = tile_bounds(Tile(1, 0, 0))
+
+        self.assertAlmostEqual(xmin, -20037508.342789244)
+        self.assertAlmostEqual(ymin, 0.0)
+        self.assertAlmostEqual(xmax, 0.0)
+        self.assertAlmostEqual(ymax, 20037508.342789244)
+
+    def test_world(self) -> None:
+        self.assertEqual(len(list(pyramid_tiles(range(0, 4)))), 1 + 4 + 16 + 64)
+
+    def test_bounds(self) -> None:
+        self.assertEqual(list(pyramid_tiles([5], GERMANY)),
+                         [Tile(5, x, y) for x in range(16, 18) for y in range(10, 12)])
+
+    def test_shards(self) -> None:
+        tiles = list(pyramid_tiles(range(0, 4)))
+        shards = [list(pyramid_tiles(range(0, 4), shard=(i, 3))) for i in range(3)]
+
+        self.assertEqual(sorted(sum(shards, [])), sorted(tiles))
+        self.assertLessEqual(max(map(len, shards)) - min(map(len, shards)), 1)
+
+
+class TestTilePyramid(unittest.TestCase):
+    """TilePyramid tests against a local HTTP server"""
+
+    def setUp(self) -> None:
+        def handler(request):
+            if request["query"]["bbox"].startswith("-20037508"):
+                return 500, {"Content-Type": "application/json"}, '{"error": "Boom", "message": "boom"}'
+            return 200, {"Content-Type": "image/png"}, request["query"]["bbox"].encode()
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        self.configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        self.wms_api = geoengine_openapi_client.OGCWMSApi(geoengine_openapi_client.ApiClient(self.configuration))
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        self.server.__exit__(None, None, None)
+
+    def test_directory_store(self) -> None:
+        store = DirectoryTileStore(self.directory.name)
+        pyramid = TilePyramid(self.wms_api, WORKFLOW_ID, store, workers=3)
+
+        report = pyramid.render(range(5, 7), GERMANY)
+
+        self.assertEqual(report.rendered, 4 + 6)
+        self.assertEqual(report.failed, [])
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, "5", "16", "10.png")))
+        query = self.server.requests[0]["query"]
+        self.assertEqual(query["crs"], "EPSG:3857")
+        self.assertEqual(query["width"], "256")
+
+        # existing tiles are skipped
+        report = pyramid.render(range(5, 8), GERMANY)
+
+        self.assertEqual((report.rendered, report.skipped), (len(list(pyramid_tiles([7], GERMANY))), 10))
+
+    def test_mbtiles_store(self) -> None:
+        path = os.path.join(self.directory.name, "pyramid.mbtiles")
+        with MBTilesTileStore(path, batch_size=2) as store:
+            report = TilePyramid(self.wms_api, WORKFLOW_ID, store).render(range(0, 2))
+
+            # tiles touching the west border fail
+            self.assertEqual(report.rendered, 2)
+            self.assertEqual(sorted(report.failed), [Tile(0, 0, 0), Tile(1, 0, 0), Tile(1, 0, 1)])
+            self.assertIsNone(store.read(Tile(1, 0, 0)))
+            self.assertEqual(store.read(Tile(1, 1, 0)).decode(), ",".join(repr(v) for v in tile_bounds(Tile(1, 1, 0))))
+
+        with MBTilesTileStore(path) as store:
+            row = store.connection.execute(
+                "SELECT tile_row FROM tiles WHERE zoom_level = 1 AND tile_column = 1 ORDER BY tile_row").fetchall()
+            metadata = dict(store.connection.execute("SELECT name, value FROM metadata").fetchall())
+
+        # MBTiles rows are counted from the south
+        self.assertEqual(row, [(0,), (1,)])
+        self.assertEqual(metadata["maxzoom"], "1")
+
+    def test_mbtiles_commit_interval(self) -> None:
+        path = os.path.join(self.directory.name, "pyramid.mbtiles")
+        with MBTilesTileStore(path, commit_interval=0) as store:
+            store.write(Tile(0, 0, 0), b"tile")
+
+            # committed, so other connections see it and can write
+            with MBTilesTileStore(path, timeout=0, lock_retries=0) as other:
+                self.assertEqual(other.read(Tile(0, 0, 0)), b"tile")
+                other.write(Tile(1, 0, 0), b"other")
+
+    def test_mbtiles_lock_retries(self) -> None:
+        path = os.path.join(self.directory.name, "pyramid.mbtiles")
+        with MBTilesTileStore(path) as store:
+            store.set_metadata(name=WORKFLOW_ID)
+
+        # another writer holds the lock
+        writer = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            with MBTilesTileStore(path, timeout=0, lock_retries=0) as store:
+                with self.assertRaisesRegex(sqlite3.OperationalError, "locked"):
+                    store.write(Tile(0, 0, 0), b"tile")
+
+            # released while the store retries
+            threading.Timer(0.15, writer.execute, ["COMMIT"]).start()
+            with MBTilesTileStore(path, timeout=0, lock_retries=5) as store:
+                store.write(Tile(0, 0, 0), b"tile")
+        finally:
+            writer.close()
+
+        with MBTilesTileStore(path) as store:
+            self.assertEqual(store.read(Tile(0, 0, 0)), b"tile")
+
+    def test_store_errors(self) -> None:
+        path = os.path.join(self.directory.name, "pyramid.mbtiles")
+        with MBTilesTileStore(path, commit_interval=60) as store:
+            store.write(Tile(0, 0, 0), b"tile")
+
+            with MBTilesTileStore(path, timeout=0, lock_retries=0) as other:
+                # the second shard does not write the metadata
+                report = TilePyramid(self.wms_api, WORKFLOW_ID, other).render([2], shard=(1, 2))
+
+        # the tiles are reported instead of aborting the run
+        self.assertEqual(report.rendered, 0)
+        self.assertEqual(sorted(report.failed), sorted(pyramid_tiles([2], shard=(1, 2))))
+
+    def test_process_pool(self) -> None:
+        self.configuration.access_token = ACCESS_TOKEN
+        # not picklable, not passed to the processes
+        self.configuration.http_cache = HttpCache()
+        self.configuration.instrumentation = MetricsCollector()
+
+        report = render_pyramid(self.configuration, WORKFLOW_ID, DirectoryTileStore(self.directory.name),
+                                 [6], GERMANY, processes=2, workers=2)
+
+        self.assertEqual(report.rendered, 6)
+        self.assertEqual(len(self.server.requests), 6)
+        self.assertEqual(self.server.requests[0]["headers"]["Authorization"], f"Bearer {ACCESS_TOKEN}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+# coding: utf-8
+
+import json
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+from urllib.parse import unquote
+
+import geoengine_openapi_client
+from geoengine_openapi_client.resource_cache import (
+    CachedSpatialReferencesApi, CachedWorkflowsApi, ResourceCache, workflow_hash
+)
+
+from test.local_server import LocalServer
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+METADATA = {"type": "vector", "dataType": "MultiPoint", "spatialReference": "EPSG:4326", "columns": {}}
+PROVENANCE = [{
+    "data": [{"type": "internal", "datasetId": WORKFLOW_ID}],
+    "provenance": {"citation": "Geo Engine", "license": "MIT", "uri": "https://www.geoengine.io"},
+}]
+SPATIAL_REFERENCE = {
+    "name": "WGS 84",
+    "spatialReference": "EPSG:4326",
+    "projString": "+proj=longlat +datum=WGS84 +no_defs +type=crs",
+    "extent": {"lowerLeftCoordinate": {"x": -180, "y": -90}, "upperRightCoordinate": {"x": 180, "y": 90}},
+    "axisLabels": ["Geodetic latitude", "Geodetic longitude"],
+    "axisOrder": "northEast",
+}
+
+
+class TestResourceCache(unittest.TestCase):
+    """ResourceCache unit tests"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "resources.sqlite")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_memory_is_bounded(self) -> None:
+        cache = ResourceCache(max_entries=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        self.assertEqual(cache.get("a"), b"1")
+        cache.put("c", b"3")
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertEqual(cache.get("c"), b"3")
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual(cache.stats.hits, 3)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_file_is_shared(self) -> None:
+        cache = ResourceCache(max_entries=1, path=self.path)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+
+        other = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(other.get("a"), b"1")
+        self.assertEqual(other.stats.disk_hits, 1)
+        self.assertEqual(other.get("a"), b"1")
+        self.assertEqual(other.stats.memory_hits, 1)
+
+        cache.clear()
+        self.assertIsNone(ResourceCache(path=self.path).get("b"))
+        cache.close()
+        other.close()
+
+    def test_file_is_bounded(self) -> None:
+        cache = ResourceCache(max_entries=1, path=self.path, max_disk_size=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"5678")
+        # reading "a" from the file makes "b" the least recently used body
+        cache.put("c", b"0")
+        self.assertEqual(cache.get("a"), b"1234")
+        cache.put("d", b"9012")
+
+        other = ResourceCache(path=self.path, max_disk_size=10)
+        self.assertIsNone(other.get("b"))
+        self.assertEqual([other.get(key) for key in "acd"], [b"1234", b"0", b"9012"])
+        self.assertEqual(cache.stats.evictions, 4 + 1)
+
+        # bodies larger than the file are only kept in memory
+        cache.put("e", b"too large for the file")
+        self.assertIsNone(other.get("e"))
+        self.assertEqual(other.get("a"), b"1234")
+        cache.close()
+        other.close()
+
+    def test_threads(self) -> None:
+        cache = ResourceCache(max_entries=5, path=self.path, max_disk_size=100)
+
+        def put_and_get(i: int) -> bool:
+            cache.put(str(i), b"%03d" % i)
+            return cache.get(str(i)) == b"%03d" % i
+
+        with ThreadPoolExecutor(8) as executor:
+            self.assertTrue(all(executor.map(put_and_get, range(200))))
+        cache.close()
+
+    def test_workflow_hash(self) -> None:
+        reordered = {
+            "operator": {"params": {"points": [{"y": 0.1, "x": 0.0}]}, "type": "MockPointSource", "sources": None},
+            "type": "Vector",
+        }
+
+        self.assertEqual(workflow_hash(WORKFLOW), workflow_hash(reordered))
+        self.assertEqual(workflow_hash(WORKFLOW), workflow_hash(geoengine_openapi_client.Workflow.from_dict(reordered)))
+        self.assertNotEqual(workflow_hash(WORKFLOW), workflow_hash({**WORKFLOW, "type": "Raster"}))
+
+
+class TestCachedApis(unittest.TestCase):
+    """CachedWorkflowsApi and CachedSpatialReferencesApi tests"""
+
+    def setUp(self) -> None:
+        def handler(request):
+            if request["method"] == "POST":
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": WORKFLOW_ID})
+            documents = {
+                f"/api/workflow/{WORKFLOW_ID}": WORKFLOW,
+                f"/api/workflow/{WORKFLOW_ID}/metadata": METADATA,
+                f"/api/workflow/{WORKFLOW_ID}/provenance": PROVENANCE,
+                "/api/spatialReferenceSpecification/EPSG:4326": SPATIAL_REFERENCE,
+            }
+            path = unquote(request["path"])
+            if path not in documents:
+                return 404, {}, json.dumps({"error": "NotFound", "message": "not found"})
+            return 200, {"Content-Type": "application/json"}, json.dumps(documents[path])
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+
+        api_client = geoengine_openapi_client.ApiClient(geoengine_openapi_client.Configuration(host=self.server.host))
+        self.cache = ResourceCache()
+        self.workflows_api = CachedWorkflowsApi(api_client, self.cache)
+        self.spatial_references_api = CachedSpatialReferencesApi(api_client, self.cache)
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def test_workflows(self) -> None:
+        for _ in range(3):
+            workflow = self.workflows_api.load_workflow_handler(WORKFLOW_ID)
+            metadata = self.workflows_api.get_workflow_metadata_handler(WORKFLOW_ID)
+            provenance = self.workflows_api.get_workflow_provenance_handler(WORKFLOW_ID)
+
+        self.assertIsInstance(workflow, geoengine_openapi_client.Workflow)
+        self.assertEqual(workflow.to_dict()["type"], "Vector")
+        self.assertIsInstance(metadata.actual_instance, geoengine_openapi_client.VectorResultDescriptorWithType)
+        self.assertEqual(provenance[0].provenance.license, "MIT")
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.cache.stats.hits, 6)
+        self.assertEqual(self.cache.stats.misses, 3)
+
+    def test_hits_are_new_models(self) -> None:
+        first = self.spatial_references_api.get_spatial_reference_specification_handler("EPSG:4326")
+        second = self.spatial_references_api.get_spatial_reference_specification_handler("EPSG:4326")
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.name, "WGS 84")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_registered_workflows(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "resources.sqlite")
+        workflow = geoengine_openapi_client.Workflow.from_dict(WORKFLOW)
+
+        for _ in range(2):
+            cache = ResourceCache(path=path)
+            workflows_api = CachedWorkflowsApi(self.workflows_api.api_client, cache)
+            self.assertEqual(workflows_api.register_workflow_handler(workflow).id, WORKFLOW_ID)
+            self.assertEqual(workflows_api.register_workflow_handler(workflow).id, WORKFLOW_ID)
+            cache.close()
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_errors_are_not_cached(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(geoengine_openapi_client.ApiException):
+                self.workflows_api.load_workflow_handler("unknown")
+
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_special_arguments_bypass_cache(self) -> None:
+        self.workflows_api.load_workflow_handler(WORKFLOW_ID)
+        response = self.workflows_api.load_workflow_handler(WORKFLOW_ID, _request_timeout=5)
+
+        self.assertEqual(response.to_dict()["type"], "Vector")
+        self.assertEqual(len(self.server.requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
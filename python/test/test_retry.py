@@ -0,0 +1,180 @@
+# coding: utf-8
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import json
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.exceptions import ApiException
+from geoengine_openapi_client.retry import RetryBudget, RetryPolicy, retry_after
+
+from test.local_server import LocalServer
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+
+
+def error(status: int, headers=None) -> ApiException:
+    exception = ApiException(status=status)
+    exception.headers = headers
+    return exception
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """RetryPolicy unit tests"""
+
+    def test_full_jitter(self) -> None:
+        policy = RetryPolicy(retries=10, backoff=0.5, max_backoff=4)
+
+        for attempt in range(10):
+            bound = min(4, 0.5 * 2**attempt)
+            for _ in range(20):
+                self.assertTrue(0 <= policy.delay(attempt, error(503)) <= bound)
+        self.assertIsNone(policy.delay(10, error(503)))
+
+    def test_retry_after(self) -> None:
+        self.assertEqual(retry_after(error(503, {"Retry-After": "7"})), 7.0)
+        date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+        self.assertAlmostEqual(retry_after(error(503, {"Retry-After": date})), 60, delta=2)
+        self.assertIsNone(retry_after(error(503, {"Retry-After": "soon"})))
+        self.assertIsNone(retry_after(error(503)))
+
+        policy = RetryPolicy(backoff=0, max_retry_after=10)
+        self.assertEqual(policy.delay(0, error(429, {"Retry-After": "3"})), 3.0)
+        self.assertIsNone(policy.delay(0, error(429, {"Retry-After": "11"})))
+
+    def test_idempotency(self) -> None:
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable("GET", error(503)))
+        self.assertTrue(policy.is_retryable("DELETE", error(502)))
+        self.assertFalse(policy.is_retryable("POST", error(503)))
+        self.assertTrue(policy.is_retryable("POST", error(429)))
+        self.assertFalse(policy.is_retryable("GET", error(500)))
+        self.assertFalse(policy.is_retryable("GET", ValueError()))
+
+    def test_connection_errors(self) -> None:
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable("GET", ConnectionResetError()))
+        self.assertFalse(policy.is_retryable("POST", ConnectionResetError()))
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+    def test_aiohttp_connection_errors(self) -> None:
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable("GET", aiohttp.ServerDisconnectedError()))
+
+    def test_budget(self) -> None:
+        budget = RetryBudget(2)
+
+        self.assertTrue(budget.try_acquire())
+        self.assertTrue(budget.try_acquire())
+        self.assertFalse(budget.try_acquire())
+        self.assertEqual(budget.remaining, 0)
+
+    def test_budget_refills(self) -> None:
+        budget = RetryBudget(1000, per_seconds=0.001)
+
+        for _ in range(1000):
+            budget.try_acquire()
+        self.assertGreater(budget.remaining, 0)
+
+
+class TestRetries(unittest.TestCase):
+    """Retries of api requests"""
+
+    def setUp(self) -> None:
+        self.failures = []
+
+        def handler(request):
+            if self.failures:
+                (status, headers) = self.failures.pop(0)
+                return status, headers, json.dumps({"error": "Unavailable", "message": "try again"})
+            if request["method"] == "POST":
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": WORKFLOW_ID})
+            return 200, {"Content-Type": "application/json"}, json.dumps(WORKFLOW)
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+
+        self.configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        self.api = geoengine_openapi_client.WorkflowsApi(geoengine_openapi_client.ApiClient(self.configuration))
+        self.workflow = geoengine_openapi_client.Workflow.from_dict(WORKFLOW)
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def test_no_policy(self) -> None:
+        self.failures = [(503, {})]
+
+        with self.assertRaises(ApiException) as context:
+            self.api.load_workflow_handler(WORKFLOW_ID)
+        self.assertEqual(context.exception.status, 503)
+
+    def test_retries_get(self) -> None:
+        self.configuration.retry_policy = RetryPolicy(retries=3, backoff=0.01)
+        self.failures = [(503, {"Retry-After": "0"}), (502, {}), (504, {})]
+
+        workflow = self.api.load_workflow_handler(WORKFLOW_ID)
+
+        self.assertEqual(workflow.to_dict()["type"], "Vector")
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_gives_up(self) -> None:
+        self.configuration.retry_policy = RetryPolicy(retries=1, backoff=0.01)
+        self.failures = [(503, {}), (503, {}), (503, {})]
+
+        with self.assertRaises(ApiException) as context:
+            self.api.load_workflow_handler(WORKFLOW_ID)
+        self.assertEqual(context.exception.status, 503)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_post_only_on_too_many_requests(self) -> None:
+        self.configuration.retry_policy = RetryPolicy(retries=3, backoff=0.01)
+
+        self.failures = [(429, {"Retry-After": "0"})]
+        self.assertEqual(self.api.register_workflow_handler(self.workflow).id, WORKFLOW_ID)
+        self.assertEqual(len(self.server.requests), 2)
+
+        self.failures = [(503, {})]
+        with self.assertRaises(ApiException):
+            self.api.register_workflow_handler(self.workflow)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_operation_override(self) -> None:
+        self.configuration.retry_policy = RetryPolicy(retries=3, backoff=0.01, overrides={
+            "register_workflow_handler": RetryPolicy(retries=3, backoff=0.01, methods={"POST"}),
+            "load_workflow_handler": RetryPolicy(retries=0),
+        })
+
+        self.failures = [(503, {})]
+        self.assertEqual(self.api.register_workflow_handler(self.workflow).id, WORKFLOW_ID)
+        self.assertEqual(len(self.server.requests), 2)
+
+        self.failures = [(503, {})]
+        with self.assertRaises(ApiException):
+            self.api.load_workflow_handler(WORKFLOW_ID)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_budget_is_shared(self) -> None:
+        self.configuration.retry_policy = RetryPolicy(retries=3, backoff=0.01, budget=RetryBudget(2))
+        self.failures = [(503, {})] * 3
+
+        with self.assertRaises(ApiException):
+            self.api.load_workflow_handler(WORKFLOW_ID)
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.configuration.retry_policy.budget.remaining, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# coding: utf-8
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+import time
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.exceptions import ApiException
+from geoengine_openapi_client.single_flight import SingleFlight
+
+from test.local_server import LocalServer
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+
+
+class TestSingleFlight(unittest.TestCase):
+    """SingleFlight unit tests"""
+
+    def test_sequential_calls_are_not_shared(self) -> None:
+        single_flight = SingleFlight()
+
+        self.assertEqual(single_flight.do("key", lambda: 1), 1)
+        self.assertEqual(single_flight.do("key", lambda: 2), 2)
+        self.assertEqual(single_flight.coalesced, 0)
+
+    def test_exception_is_shared(self) -> None:
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def fail():
+            release.wait(5)
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(single_flight.do, "key", fail) for _ in range(4)]
+            while single_flight.coalesced < 3:
+                time.sleep(0.001)
+            release.set()
+
+        for future in futures:
+            self.assertIsInstance(future.exception(), ValueError)
+
+
+class TestCoalescedRequests(unittest.TestCase):
+    """Coalescing of api requests"""
+
+    def setUp(self) -> None:
+        self.release = threading.Event()
+        self.status = 200
+
+        def handler(request):
+            self.release.wait(5)
+            if self.status != 200:
+                return self.status, {}, json.dumps({"error": "NotFound", "message": "unknown workflow"})
+            if request["method"] == "POST":
+                return 200, {"Content-Type": "application/json"}, json.dumps({"id": WORKFLOW_ID})
+            return 200, {"Content-Type": "application/json"}, json.dumps(WORKFLOW)
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+
+        self.configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        self.configuration.coalesce_requests = True
+        self.configuration.connection_pool_maxsize = 8
+        self.api_client = geoengine_openapi_client.ApiClient(self.configuration)
+        self.api = geoengine_openapi_client.WorkflowsApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.release.set()
+        self.server.__exit__(None, None, None)
+
+    def call_concurrently(self, function, calls: int):
+        with ThreadPoolExecutor(calls) as executor:
+            futures = [executor.submit(function) for _ in range(calls)]
+            deadline = time.monotonic() + 5
+            while self.api_client.single_flight.coalesced < calls - 1 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.release.set()
+        return futures
+
+    def test_shares_result(self) -> None:
+        futures = self.call_concurrently(lambda: self.api.load_workflow_handler(WORKFLOW_ID), 8)
+
+        results = [future.result() for future in futures]
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(results[0].to_dict()["type"], "Vector")
+        for result in results:
+            self.assertIs(result, results[0])
+
+    def test_shares_error(self) -> None:
+        self.status = 404
+
+        futures = self.call_concurrently(lambda: self.api.load_workflow_handler(WORKFLOW_ID), 4)
+
+        self.assertEqual(len(self.server.requests), 1)
+        for future in futures:
+            self.assertEqual(future.exception().status, 404)
+            self.assertIsInstance(future.exception(), ApiException)
+
+    def test_only_get(self) -> None:
+        self.release.set()
+        workflow = geoengine_openapi_client.Workflow.from_dict(WORKFLOW)
+
+        with ThreadPoolExecutor(4) as executor:
+            for _ in executor.map(lambda _: self.api.register_workflow_handler(workflow), range(4)):
+                pass
+
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(self.api_client.single_flight.coalesced, 0)
+
+    def test_disabled(self) -> None:
+        self.configuration.coalesce_requests = False
+        self.release.set()
+
+        with ThreadPoolExecutor(4) as executor:
+            for _ in executor.map(lambda _: self.api.load_workflow_handler(WORKFLOW_ID), range(4)):
+                pass
+
+        self.assertEqual(len(self.server.requests), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+import io
+import os
+import tempfile
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.streaming import StreamingResponse
+
+from test.local_server import LocalServer
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+BODY = bytes(range(256)) * 4096  # 1 MiB
+
+
+class TestStreamingResponse(unittest.TestCase):
+    """StreamingResponse tests against a local HTTP server"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer(lambda request: (200, {"Content-Type": "application/zip"}, BODY))
+        self.server.__enter__()
+        configuration = geoengine_openapi_client.Configuration(host=self.server.host)
+        self.api_client = geoengine_openapi_client.ApiClient(configuration)
+        self.api = geoengine_openapi_client.WorkflowsApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def stream(self) -> StreamingResponse:
+        response = self.api.get_workflow_all_metadata_zip_handler_with_http_info(
+            WORKFLOW_ID, _preload_content=False
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data)
+        return response.raw_data
+
+    def test_iter_chunks(self) -> None:
+        with self.stream() as stream:
+            self.assertIsInstance(stream, StreamingResponse)
+            self.assertEqual(stream.getheader("Content-Type"), "application/zip")
+
+            chunks = list(stream.iter_chunks(chunk_size=64 * 1024))
+
+        self.assertEqual(len(chunks), 16)
+        self.assertTrue(all(len(chunk) <= 64 * 1024 for chunk in chunks))
+        self.assertEqual(b"".join(chunks), BODY)
+
+    def test_write_to_file_object(self) -> None:
+        target = io.BytesIO()
+
+        with self.stream() as stream:
+            written = stream.write_to(target)
+
+        self.assertEqual(written, len(BODY))
+        self.assertEqual(target.getvalue(), BODY)
+
+    def test_write_to_path(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metadata.zip")
+
+            with self.stream() as stream:
+                stream.write_to(path)
+
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), BODY)
+
+    def test_close_unread_stream(self) -> None:
+        stream = self.stream()
+        self.assertEqual(stream.read(10), BODY[:10])
+        stream.close()
+
+        # the connection pool is still usable afterwards
+        self.assertEqual(self.api.get_workflow_all_metadata_zip_handler(WORKFLOW_ID), BODY)
+
+    def test_return_http_data_only(self) -> None:
+        response = self.api.get_workflow_all_metadata_zip_handler_with_http_info(
+            WORKFLOW_ID, _preload_content=False, _return_http_data_only=True
+        )
+        self.assertIsNone(response.data)
+
+        with response.raw_data as stream:
+            self.assertEqual(stream.read(), BODY)
+
+    def test_preloaded_response(self) -> None:
+        self.assertEqual(self.api.get_workflow_all_metadata_zip_handler(WORKFLOW_ID), BODY)
+
+
+if __name__ == '__main__':
+    unittest.main()
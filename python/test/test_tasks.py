@@ -0,0 +1,115 @@
+# coding: utf-8
+
+import json
+import threading
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.models.completed_task_status import CompletedTaskStatus
+from geoengine_openapi_client.models.failed_task_status import FailedTaskStatus
+from geoengine_openapi_client.models.task_response import TaskResponse
+from geoengine_openapi_client.tasks import AdaptiveBackoff, wait_for_task, wait_for_tasks
+
+from test.local_server import LocalServer
+
+NUMBER_OF_TASKS = 30
+
+
+def task_id(i: int) -> str:
+    return f"00000000-0000-0000-0000-{i:012d}"
+
+
+class TestAdaptiveBackoff(unittest.TestCase):
+    """AdaptiveBackoff unit tests"""
+
+    def test_delays(self) -> None:
+        backoff = AdaptiveBackoff(initial=1.0, maximum=3.0, factor=2.0)
+
+        self.assertEqual(backoff.next_delay(progress=False), 1.0)
+        self.assertEqual(backoff.next_delay(progress=False), 2.0)
+        self.assertEqual(backoff.next_delay(progress=True), 3.0)
+        self.assertEqual(backoff.next_delay(progress=True), 3.0)
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            AdaptiveBackoff(initial=2.0, maximum=1.0)
+
+
+class TestWaitForTasks(unittest.TestCase):
+    """wait_for_task(s) tests against a local HTTP server"""
+
+    def setUp(self) -> None:
+        self.lock = threading.Lock()
+        # remaining polls until each task finishes
+        self.remaining = {task_id(i): 1 + i % 4 for i in range(NUMBER_OF_TASKS)}
+        self.remaining["other"] = 100
+
+        def running(tid):
+            return {
+                "status": "running",
+                "taskId": tid,
+                "taskType": "dummy",
+                "description": "",
+                "pctComplete": f"{100 - 10 * self.remaining[tid]}%",
+                "estimatedTimeRemaining": "1s",
+                "timeStarted": "2023-01-01T00:00:00Z",
+            }
+
+        def finished(tid):
+            if tid.endswith("7"):
+                return {"status": "failed", "error": "boom", "cleanUp": None}
+            return {"status": "completed", "taskType": "dummy", "info": None,
+                    "timeTotal": "00:00:01", "timeStarted": "2023-01-01T00:00:00Z"}
+
+        def handler(request):
+            with self.lock:
+                if request["path"] == "/api/tasks/list":
+                    self.assertEqual(request["query"]["filter"], "running")
+                    offset = int(request["query"]["offset"])
+                    limit = int(request["query"]["limit"])
+                    if offset == 0:
+                        for tid in self.remaining:
+                            self.remaining[tid] -= 1
+                    tasks = [running(tid) for (tid, remaining) in sorted(self.remaining.items()) if remaining > 0]
+                    body = tasks[offset:offset + limit]
+                else:
+                    tid = request["path"].split("/")[-2]
+                    self.remaining[tid] -= 1
+                    body = running(tid) if self.remaining[tid] > 0 else finished(tid)
+            return 200, {"Content-Type": "application/json"}, json.dumps(body)
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        self.tasks_api = geoengine_openapi_client.TasksApi(geoengine_openapi_client.ApiClient(
+            geoengine_openapi_client.Configuration(host=self.server.host)
+        ))
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def status_requests(self):
+        return [r for r in self.server.requests if r["path"].endswith("/status")]
+
+    def test_wait_for_task(self) -> None:
+        status = wait_for_task(self.tasks_api, TaskResponse(task_id=task_id(3)),
+                               backoff=AdaptiveBackoff(initial=0.01))
+
+        self.assertIsInstance(status, CompletedTaskStatus)
+
+    def test_wait_for_tasks(self) -> None:
+        statuses = wait_for_tasks(self.tasks_api, [task_id(i) for i in range(NUMBER_OF_TASKS)],
+                                  backoff=AdaptiveBackoff(initial=0.01), page_size=20)
+
+        self.assertEqual(set(statuses), {task_id(i) for i in range(NUMBER_OF_TASKS)})
+        self.assertIsInstance(statuses[task_id(7)], FailedTaskStatus)
+        self.assertIsInstance(statuses[task_id(8)], CompletedTaskStatus)
+        # one status request per task, once it finished
+        self.assertEqual(len(self.status_requests()), NUMBER_OF_TASKS)
+
+    def test_timeout(self) -> None:
+        with self.assertRaises(TimeoutError):
+            wait_for_tasks(self.tasks_api, ["other"], timeout=0.05, backoff=AdaptiveBackoff(initial=0.01))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+# coding: utf-8
+
+import json
+import os
+import tempfile
+import time
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.exceptions import NotFoundException
+from geoengine_openapi_client.traffic import TrafficRecord, TrafficRecorder, read_traffic, replay, summarize
+from geoengine_openapi_client.transport import MockTransport
+
+from test.local_server import LocalServer
+
+try:
+    from aiohttp import web
+    from geoengine_openapi_client.aio import AsyncApiClient, AsyncWorkflowsApi
+except ImportError:
+    web = None
+
+ACCESS_TOKEN = "e327d9c3-a4f3-4bd7-a5e1-30b26cae8064"
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+UPLOAD_ID = "fedcba98-7654-3210-fedc-ba9876543210"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+
+
+def handler(request):
+    if request["path"] == "/api/upload":
+        return 200, {"Content-Type": "application/json"}, json.dumps({"id": UPLOAD_ID})
+    if request["method"] == "POST":
+        return 200, {"Content-Type": "application/json"}, json.dumps({"id": WORKFLOW_ID})
+    if request["path"] != f"/api/workflow/{WORKFLOW_ID}":
+        return 404, {}, json.dumps({"error": "NotFound", "message": "unknown workflow"})
+    return 200, {"Content-Type": "application/json"}, json.dumps(WORKFLOW)
+
+
+def record(start, operation, status=200, duration=0.01, path=f"/workflow/{WORKFLOW_ID}"):
+    return TrafficRecord(start=start, operation=operation, method="GET", path=path, headers={}, body=None,
+                         form=[], files=[], status=status, duration=duration, request_size=0, response_size=0)
+
+
+class TestTrafficRecorder(unittest.TestCase):
+    """TrafficRecorder tests"""
+
+    def setUp(self) -> None:
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.configuration = geoengine_openapi_client.Configuration(host=self.server.host, access_token=ACCESS_TOKEN)
+        self.api_client = geoengine_openapi_client.ApiClient(self.configuration)
+        self.api = geoengine_openapi_client.WorkflowsApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+        self.directory.cleanup()
+
+    def record_workload(self, path):
+        with TrafficRecorder(path) as recorder:
+            self.configuration.traffic_recorder = recorder
+            self.api.load_workflow_handler(WORKFLOW_ID)
+            self.api.register_workflow_handler(geoengine_openapi_client.Workflow.from_dict(WORKFLOW))
+            with self.assertRaises(NotFoundException):
+                self.api.load_workflow_handler("unknown")
+
+            upload = os.path.join(self.directory.name, "points.csv")
+            with open(upload, "wb") as f:
+                f.write(b"x,y\n0,1\n")
+            geoengine_openapi_client.UploadsApi(self.api_client).upload_handler([upload])
+
+        return read_traffic(path)
+
+    def test_records_requests(self) -> None:
+        (load, register, not_found, upload) = self.record_workload(os.path.join(self.directory.name, "traffic.jsonl"))
+
+        self.assertEqual((load.operation, load.method, load.path, load.status),
+                         ("load_workflow_handler", "GET", f"/workflow/{WORKFLOW_ID}", 200))
+        self.assertEqual(load.response_size, len(json.dumps(WORKFLOW)))
+        self.assertNotIn("Authorization", load.headers)
+        self.assertLessEqual(load.start, register.start)
+
+        self.assertEqual(register.body, WORKFLOW)
+        self.assertEqual(register.request_size, len(json.dumps(WORKFLOW)))
+
+        self.assertEqual((not_found.operation, not_found.status), ("load_workflow_handler", 404))
+
+        self.assertEqual(upload.files, [["files[]", "points.csv", 8, "text/csv"]])
+        self.assertEqual(upload.headers["Content-Type"], "multipart/form-data")
+
+    def test_gzip(self) -> None:
+        path = os.path.join(self.directory.name, "traffic.jsonl.gz")
+
+        self.assertEqual(len(self.record_workload(path)), 4)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(2), b"\x1f\x8b")
+
+    def test_response_bodies(self) -> None:
+        path = os.path.join(self.directory.name, "traffic.jsonl")
+        with TrafficRecorder(path, max_response_body_size=len(json.dumps(WORKFLOW))) as recorder:
+            self.configuration.traffic_recorder = recorder
+            self.api.load_workflow_handler(WORKFLOW_ID)
+            with self.assertRaises(NotFoundException):
+                self.api.load_workflow_handler("unknown")
+
+        (load, not_found) = read_traffic(path)
+        self.assertEqual(json.loads(load.response_body), WORKFLOW)
+        self.assertEqual(json.loads(not_found.response_body)["error"], "NotFound")
+
+        (load, *_) = self.record_workload(os.path.join(self.directory.name, "without_bodies.jsonl"))
+        self.assertIsNone(load.response_body)
+
+    def test_recording_errors(self) -> None:
+        response = MockTransport(lambda request: (200, {}, b"\x89PNG")).request("GET", "http://geoengine.test/api")
+        path = os.path.join(self.directory.name, "traffic.jsonl")
+
+        with TrafficRecorder(path, max_response_body_size=1024) as recorder:
+            request = recorder.recording(lambda method, url, **kwargs: response, "http://geoengine.test/api", "op")
+            with self.assertLogs("geoengine_openapi_client.traffic", "WARNING"):
+                self.assertIs(request("POST", "http://geoengine.test/api/upload", body=b"\xff\xfe"), response)
+            self.assertIs(request("GET", "http://geoengine.test/api/wms"), response)
+
+        (wms,) = read_traffic(path)
+        self.assertEqual((wms.path, wms.status, wms.response_size, wms.response_body), ("/wms", 200, 4, None))
+
+        def not_found(method, url, **kwargs):
+            raise NotFoundException(status=404, reason="Not Found")
+
+        with TrafficRecorder(os.path.join(self.directory.name, "missing", "traffic.jsonl")) as recorder:
+            request = recorder.recording(not_found, "http://geoengine.test/api", "op")
+            with self.assertLogs("geoengine_openapi_client.traffic", "WARNING"), self.assertRaises(NotFoundException):
+                request("GET", "http://geoengine.test/api/workflow")
+
+    def test_replays_requests(self) -> None:
+        records = self.record_workload(os.path.join(self.directory.name, "traffic.jsonl"))
+
+        transport = MockTransport(lambda request: handler({"method": request.method, "path": request.path}))
+        target = geoengine_openapi_client.Configuration(host="http://geoengine.test/api", access_token="other")
+        target.transport = transport
+        latencies = replay(records, geoengine_openapi_client.ApiClient(target), speed=None)
+
+        self.assertEqual(set(latencies), {"load_workflow_handler", "register_workflow_handler", "upload_handler"})
+        self.assertEqual((latencies["load_workflow_handler"].count, latencies["load_workflow_handler"].errors), (2, 1))
+        self.assertEqual([request.url for request in transport.requests],
+                         ["http://geoengine.test/api" + record.path for record in records])
+        self.assertEqual(json.loads(transport.requests[1].body), WORKFLOW)
+        self.assertEqual(transport.requests[0].headers["Authorization"], "Bearer other")
+        self.assertIn(b"\x00" * 8, transport.requests[3].body)
+
+
+class TestReplay(unittest.TestCase):
+    """replay and summarize tests"""
+
+    def test_scaled_speed(self) -> None:
+        records = [record(0.0, "load_workflow_handler"), record(0.2, "load_workflow_handler")]
+        configuration = geoengine_openapi_client.Configuration(host="http://geoengine.test/api")
+        configuration.transport = MockTransport(lambda request: (200, {}, b"{}"))
+        api_client = geoengine_openapi_client.ApiClient(configuration)
+
+        started = time.monotonic()
+        replay(records, api_client, speed=2.0)
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
+
+        started = time.monotonic()
+        replay(records, api_client, speed=None)
+        self.assertLess(time.monotonic() - started, 0.1)
+
+    def test_summarize(self) -> None:
+        records = [record(i, "wms_map_handler", duration=(i + 1) / 100) for i in range(100)]
+        records.append(record(100, None, status=0))
+
+        latencies = summarize(records)
+
+        self.assertEqual(latencies["wms_map_handler"].count, 100)
+        self.assertEqual(latencies["wms_map_handler"].errors, 0)
+        self.assertEqual((latencies["wms_map_handler"].p50, latencies["wms_map_handler"].p99), (0.5, 0.99))
+        self.assertEqual(latencies["wms_map_handler"].max, 1.0)
+        self.assertEqual(latencies["unknown"].errors, 1)
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncTrafficRecorder(unittest.IsolatedAsyncioTestCase):
+    """TrafficRecorder tests with the AsyncApiClient"""
+
+    async def test_records_requests(self) -> None:
+        async def load_workflow(request):
+            return web.json_response(WORKFLOW)
+
+        app = web.Application()
+        app.router.add_get("/api/workflow/{id}", load_workflow)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traffic.jsonl")
+            configuration = geoengine_openapi_client.Configuration(host=f"http://127.0.0.1:{port}/api")
+            with TrafficRecorder(path) as recorder:
+                configuration.traffic_recorder = recorder
+                async with AsyncApiClient(configuration) as api_client:
+                    await AsyncWorkflowsApi(api_client).load_workflow_handler(WORKFLOW_ID)
+            await runner.cleanup()
+
+            (load,) = read_traffic(path)
+
+        self.assertEqual((load.operation, load.path, load.status), ("load_workflow_handler", f"/workflow/{WORKFLOW_ID}", 200))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+# coding: utf-8
+
+import copy
+import json
+import os
+import tempfile
+import unittest
+
+import urllib3
+
+import geoengine_openapi_client
+from geoengine_openapi_client.exceptions import NotFoundException
+from geoengine_openapi_client.transport import (
+    ASGITransport, MockTransport, Transport, TransportResponse, WSGITransport,
+)
+
+HOST = "http://geoengine.test/api"
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+UPLOAD_ID = "fedcba98-7654-3210-fedc-ba9876543210"
+WORKFLOW = {
+    "type": "Vector",
+    "operator": {"type": "MockPointSource", "params": {"points": [{"x": 0.0, "y": 0.1}]}},
+}
+
+
+def handle(method, path, query, body):
+    """The app behind all transports, returns the status and the JSON body."""
+    if path == "/api/upload":
+        return 200, {"id": UPLOAD_ID}
+    if path == "/api/projects":
+        return 200, [] if query == "order=NameAsc&offset=0&limit=10" else None
+    if method == "POST":
+        return 200, {"id": WORKFLOW_ID} if json.loads(body) == WORKFLOW else None
+    if path == f"/api/workflow/{WORKFLOW_ID}":
+        return 200, WORKFLOW
+    return 404, {"error": "NotFound", "message": "unknown workflow"}
+
+
+def wsgi_app(environ, start_response):
+    body = environ["wsgi.input"].read(int(environ["CONTENT_LENGTH"] or 0))
+    (status, response) = handle(environ["REQUEST_METHOD"], environ["SCRIPT_NAME"] + environ["PATH_INFO"],
+                                environ["QUERY_STRING"], body)
+    # start the response lazily, like a generator based app
+    start_response(f"{status} Status", [("Content-Type", "application/json")])
+    yield json.dumps(response).encode("utf-8")
+
+
+async def asgi_app(scope, receive, send):
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+    # unlike `PATH_INFO`, `path` includes the `root_path`
+    (status, response) = handle(scope["method"], scope["path"], scope["query_string"].decode("ascii"), body)
+    await send({"type": "http.response.start", "status": status,
+                "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": json.dumps(response).encode("utf-8")})
+
+
+class TransportTests:
+    """Tests of the api with an in-process transport"""
+
+    def transport(self):
+        raise NotImplementedError
+
+    def setUp(self) -> None:
+        self.configuration = geoengine_openapi_client.Configuration(host=HOST)
+        self.configuration.transport = self.transport()
+        self.api_client = geoengine_openapi_client.ApiClient(self.configuration)
+        self.api = geoengine_openapi_client.WorkflowsApi(self.api_client)
+
+    def tearDown(self) -> None:
+        self.configuration.transport.clear()
+
+    def test_is_transport(self) -> None:
+        self.assertIsInstance(self.configuration.transport, Transport)
+        self.assertIs(self.api_client.rest_client.pool_manager, self.configuration.transport)
+
+    def test_json(self) -> None:
+        self.assertEqual(self.api.load_workflow_handler(WORKFLOW_ID).to_dict()["type"], "Vector")
+
+        response = self.api.register_workflow_handler(geoengine_openapi_client.Workflow.from_dict(WORKFLOW))
+        self.assertEqual(response.id, WORKFLOW_ID)
+
+    def test_query(self) -> None:
+        projects = geoengine_openapi_client.ProjectsApi(self.api_client).list_projects_handler("NameAsc", 0, 10)
+
+        self.assertEqual(projects, [])
+
+    def test_streaming(self) -> None:
+        response = self.api.load_workflow_handler_with_http_info(WORKFLOW_ID, _preload_content=False)
+
+        with response.raw_data as stream:
+            body = b"".join(stream.iter_chunks(7))
+        self.assertEqual(json.loads(body), WORKFLOW)
+
+    def test_multipart(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "points.csv")
+            with open(path, "wb") as f:
+                f.write(b"x,y\n")
+
+            response = geoengine_openapi_client.UploadsApi(self.api_client).upload_handler([path])
+
+        self.assertEqual(response.id, UPLOAD_ID)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(NotFoundException):
+            self.api.load_workflow_handler("unknown")
+
+
+class TestMockTransport(TransportTests, unittest.TestCase):
+    """MockTransport tests"""
+
+    def transport(self):
+        def handler(request):
+            (status, response) = handle(request.method, request.path, request.url.partition("?")[2], request.body)
+            return status, {"Content-Type": "application/json"}, json.dumps(response)
+
+        return MockTransport(handler)
+
+    def test_records_requests(self) -> None:
+        self.api.load_workflow_handler(WORKFLOW_ID, _headers={"X-Request-Id": "1"})
+
+        (request,) = self.configuration.transport.requests
+        self.assertEqual(request.method, "GET")
+        self.assertEqual(request.url, f"{HOST}/workflow/{WORKFLOW_ID}")
+        self.assertEqual(request.headers["X-Request-Id"], "1")
+        self.assertEqual(request.body, b"")
+
+    def test_shared_by_configuration_copies(self) -> None:
+        self.assertIs(copy.deepcopy(self.configuration).transport, self.configuration.transport)
+
+
+class TestWSGITransport(TransportTests, unittest.TestCase):
+    """WSGITransport tests"""
+
+    def transport(self):
+        return WSGITransport(wsgi_app, script_name="/api")
+
+
+class TestASGITransport(TransportTests, unittest.TestCase):
+    """ASGITransport tests"""
+
+    def transport(self):
+        return ASGITransport(asgi_app, root_path="/api")
+
+
+class TestTransportResponse(unittest.TestCase):
+    """TransportResponse tests"""
+
+    def test_reads_chunks(self) -> None:
+        response = TransportResponse(200, {"Content-Type": "text/plain"}, [b"ab", b"cde", b"f"], preload_content=False)
+
+        self.assertEqual(response.reason, "OK")
+        self.assertEqual(list(response.stream(4)), [b"abcd", b"ef"])
+        self.assertTrue(response.closed)
+
+    def test_urllib3_is_a_transport(self) -> None:
+        self.assertIsInstance(urllib3.PoolManager(), Transport)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# coding: utf-8
+
+import os
+import tempfile
+import time
+import unittest
+
+import geoengine_openapi_client
+from geoengine_openapi_client.models.get_legend_graphic_request import GetLegendGraphicRequest
+from geoengine_openapi_client.models.get_map_format import GetMapFormat
+from geoengine_openapi_client.models.get_map_request import GetMapRequest
+from geoengine_openapi_client.models.wms_service import WmsService
+from geoengine_openapi_client.models.wms_version import WmsVersion
+from geoengine_openapi_client.wms_cache import CachedOGCWMSApi, CacheStats, WmsCache
+
+from test.local_server import LocalServer
+
+WORKFLOW_ID = "01234567-89ab-cdef-0123-456789abcdef"
+
+
+def key(i: int) -> str:
+    return f"{i:064x}"
+
+
+class TestWmsCache(unittest.TestCase):
+    """WmsCache unit tests"""
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_memory_lru(self) -> None:
+        cache = WmsCache(memory_size=30)
+        cache.put(key(1), b"a" * 10)
+        cache.put(key(2), b"b" * 10)
+        cache.put(key(3), b"c" * 10)
+        self.assertEqual(cache.get(key(1)), b"a" * 10)
+
+        cache.put(key(4), b"d" * 10)
+
+        self.assertIsNone(cache.get(key(2)))
+        self.assertEqual(cache.get(key(1)), b"a" * 10)
+        self.assertEqual(cache.stats, CacheStats(hits=2, misses=1, memory_hits=2, disk_hits=0, evictions=1))
+
+    def test_disk_tier(self) -> None:
+        cache = WmsCache(memory_size=10, directory=self.directory.name, disk_size=25)
+        cache.put(key(1), b"a" * 10)
+        cache.put(key(2), b"b" * 10)
+        cache.put(key(3), b"c" * 10)
+
+        # evicted from both tiers
+        self.assertIsNone(cache.get(key(1)))
+        self.assertEqual(cache.get(key(2)), b"b" * 10)
+        self.assertEqual(cache.stats.disk_hits, 1)
+
+        # the disk tier survives the cache
+        reopened = WmsCache(directory=self.directory.name)
+        self.assertEqual(reopened.get(key(3)), b"c" * 10)
+        self.assertEqual(reopened.get(key(2)), b"b" * 10)
+
+        reopened.clear()
+        self.assertIsNone(WmsCache(directory=self.directory.name).get(key(3)))
+
+    def test_ttl(self) -> None:
+        cache = WmsCache(directory=self.directory.name, ttl=0.05)
+        cache.put(key(1), b"a")
+        self.assertEqual(cache.get(key(1)), b"a")
+
+        time.sleep(0.1)
+
+        self.assertIsNone(cache.get(key(1)))
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "00", key(1))))
+
+
+class TestCachedOGCWMSApi(unittest.TestCase):
+    """CachedOGCWMSApi tests against a local HTTP server"""
+
+    def setUp(self) -> None:
+        def handler(request):
+            return 200, {"Content-Type": "image/png"}, b"\x89PNG" + str(len(self.server.requests)).encode()
+
+        self.server = LocalServer(handler)
+        self.server.__enter__()
+        self.wms_api = CachedOGCWMSApi(geoengine_openapi_client.ApiClient(
+            geoengine_openapi_client.Configuration(host=self.server.host)
+        ), WmsCache())
+
+    def tearDown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+    def get_map(self, bbox: str, **kwargs) -> bytearray:
+        return self.wms_api.wms_map_handler(
+            WORKFLOW_ID, WmsVersion.ENUM_1_DOT_3_DOT_0, WmsService.WMS, GetMapRequest.GETMAP,
+            256, 256, bbox, GetMapFormat.IMAGE_SLASH_PNG, f"{WORKFLOW_ID}", "", **kwargs)
+
+    def test_map(self) -> None:
+        first = self.get_map("-90,-180,90,180", time="2014-04-01T12:00:00.000Z")
+        second = self.get_map(" -90.0,-180,90.0,180 ", time="2014-04-01T12:00:00.000Z")
+        other_time = self.get_map("-90,-180,90,180", time="2015-04-01T12:00:00.000Z")
+
+        self.assertEqual(first, b"\x89PNG1")
+        self.assertEqual(second, first)
+        self.assertEqual(other_time, b"\x89PNG2")
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.wms_api.cache.stats.hits, 1)
+
+    def test_sessions(self) -> None:
+        self.get_map("-90,-180,90,180")
+        self.wms_api.api_client.configuration.access_token = "e327d9c3-a4f3-4bd7-a5e1-30b26cae8064"
+        other_session = self.get_map("-90,-180,90,180")
+
+        self.assertEqual(other_session, b"\x89PNG2")
+        self.assertEqual(self.get_map("-90,-180,90,180"), other_session)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_bypass(self) -> None:
+        self.get_map("-90,-180,90,180")
+        self.get_map("-90,-180,90,180", _request_timeout=10)
+
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_legend_graphic(self) -> None:
+        for _ in range(2):
+            legend = self.wms_api.wms_legend_graphic_handler(
+                WORKFLOW_ID, WmsVersion.ENUM_1_DOT_3_DOT_0, WmsService.WMS,
+                GetLegendGraphicRequest.GETLEGENDGRAPHIC, WORKFLOW_ID)
+
+        self.assertEqual(legend, b"\x89PNG1")
+        self.assertEqual(len(self.server.requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()